@@ -18,11 +18,11 @@ def _():
     import marimo as mo
     import polars as pl
 
+    from h2a.fuzzy import best_fuzzy_matches, reference_digest
     from h2a.paths import CACHE, INTERMEDIATE, RAW
 
     DC_STATEHOOD = 1  # Enables DC to be included in the state list
 
-    import rapidfuzz
     import us
 
     return (
@@ -31,11 +31,12 @@ def _():
         Path,
         RAW,
         addfips,
+        best_fuzzy_matches,
         json,
         mo,
         pl,
-        rapidfuzz,
         re,
+        reference_digest,
         us,
     )
 
@@ -258,33 +259,15 @@ def _(census_code_path, pl, read_census_file):
 
 
 @app.cell
-def _(pl):
-    # Helper to create a state-based lookup with parallel lists
-    def create_ref_lookup(df, name_col):
-        lookup = {}
-        # Group by state and get lists of names and fips
-        grouped = (
-            df.group_by("state")
-            .agg([pl.col(name_col).alias("names"), pl.col("fips")])
-            .to_dicts()
-        )
-
-        for row in grouped:
-            lookup[row["state"]] = {"names": row["names"], "fips": row["fips"]}
-        return lookup
-
-    return (create_ref_lookup,)
-
-
-@app.cell
-def _(census_county_2010, census_place_agg_2010, create_ref_lookup):
-    # Create state-based maps for rapidfuzz to match
-    census_county_ref_map_2010 = create_ref_lookup(census_county_2010, "county")
-    census_place_ref_map_2010 = create_ref_lookup(census_place_agg_2010, "place")
-
-    census_county_ref_map_2020 = create_ref_lookup(census_county_2010, "county")
-    census_place_ref_map_2020 = create_ref_lookup(census_place_agg_2010, "place")
-    return census_county_ref_map_2010, census_place_ref_map_2010
+def _(census_county_2010, census_place_agg_2010, pl):
+    # State-tagged name lists for rapidfuzz to match
+    census_county_reference_2010 = census_county_2010.select(
+        "state", pl.col("county").alias("name"), "fips"
+    )
+    census_place_reference_2010 = census_place_agg_2010.select(
+        "state", pl.col("place").alias("name"), "fips"
+    )
+    return census_county_reference_2010, census_place_reference_2010
 
 
 @app.cell(hide_code=True)
@@ -777,35 +760,15 @@ def _(pl):
 
 
 @app.cell
-def _(rapidfuzz):
-    # Uses rapidfuzz.process.extractOne and name maps to quickly find locality with best name match
-    def fuzz_search(state, query, ref_map):
-        # Sanity checks
-        if not state or not query or state not in ref_map:
-            return ("", 0.0, "")
-
-        state_data = ref_map[state]
-        choices = state_data["names"]
-
-        # Rapidfuzz handles strings directly now
-        # processor=utils.default_process handles lowercasing/stripping/whitespace
-        match = rapidfuzz.process.extractOne(
-            query,
-            choices,
-            processor=rapidfuzz.utils.default_process,
-            scorer=rapidfuzz.fuzz.partial_ratio,
+def _(best_fuzzy_matches, json_path, reference_digest):
+    # Finds the locality in the same state with the best rapidfuzz partial_ratio name match
+    # Distinct queries are scored in batches and cached per reference vintage
+    def fuzz_search(df, state_col, query_col, reference, label):
+        cache_file = json_path / f"fuzzy_{label}_{reference_digest(reference)}.parquet"
+        return best_fuzzy_matches(
+            df, state_col, query_col, reference, cache_file=cache_file
         )
 
-        if match:
-            # match is (found_string, score, index)
-            _, score, index = match
-            best_fips = state_data["fips"][index]
-            best_name = state_data["names"][index]
-            return (str(best_fips), float(score), str(best_name))
-
-        else:
-            return ("", 0.0, "")
-
     return (fuzz_search,)
 
 
@@ -852,8 +815,8 @@ def _(
         state_col,
         zip_col,
         census_zip_df,
-        census_county_map,
-        census_place_map,
+        census_county_reference,
+        census_place_reference,
     ):
         # Initialize helper columns
         df = df.with_columns(
@@ -885,56 +848,23 @@ def _(
         ).with_columns(pl.col("county_fips_from_census_zip").fill_null(""))
 
         # 3. Fuzzy Matching
-        # Apply fuzzy logic
-        df = df.with_columns(
-            [
-                pl.struct(["county_list", "xstate"])
-                .map_elements(
-                    lambda x: fuzz_search(
-                        x["xstate"], x["county_list"], census_county_map
-                    ),
-                    return_dtype=pl.Object,
-                )
-                .alias("county_fuzzy_raw"),
-                pl.struct(["xcity", "xstate"])
-                .map_elements(
-                    lambda x: fuzz_search(x["xstate"], x["xcity"], census_place_map),
-                    return_dtype=pl.Object,
-                )
-                .alias("city_fuzzy_raw"),
-                pl.struct(["county_list", "xstate"])
-                .map_elements(
-                    lambda x: fuzz_search(
-                        x["xstate"], x["county_list"], census_place_map
-                    ),
-                    return_dtype=pl.Object,
-                )
-                .alias("ne_fuzzy_raw"),
-            ]
+        county_fuzzy = fuzz_search(
+            df, "xstate", "county_list", census_county_reference, "county"
+        )
+        city_fuzzy = fuzz_search(df, "xstate", "xcity", census_place_reference, "place")
+        ne_fuzzy = fuzz_search(
+            df, "xstate", "county_list", census_place_reference, "place"
         )
-        # Expand the fuzzy results into individual columns
         df = df.with_columns(
             [
-                pl.col("county_fuzzy_raw")
-                .map_elements(lambda x: x[0], return_dtype=pl.String)
-                .alias("fips_from_fuzzy_county"),
-                pl.col("county_fuzzy_raw")
-                .map_elements(lambda x: x[1], return_dtype=pl.Float64)
-                .alias("fuzzy_county_score"),
-                pl.col("city_fuzzy_raw")
-                .map_elements(lambda x: x[0], return_dtype=pl.String)
-                .alias("fips_from_fuzzy_city"),
-                pl.col("city_fuzzy_raw")
-                .map_elements(lambda x: x[1], return_dtype=pl.Float64)
-                .alias("fuzzy_city_score"),
-                pl.col("ne_fuzzy_raw")
-                .map_elements(lambda x: x[0], return_dtype=pl.String)
-                .alias("fips_from_fuzzy_ne"),
-                pl.col("ne_fuzzy_raw")
-                .map_elements(lambda x: x[1], return_dtype=pl.Float64)
-                .alias("fuzzy_ne_score"),
+                county_fuzzy["fips"].alias("fips_from_fuzzy_county"),
+                county_fuzzy["score"].alias("fuzzy_county_score"),
+                city_fuzzy["fips"].alias("fips_from_fuzzy_city"),
+                city_fuzzy["score"].alias("fuzzy_city_score"),
+                ne_fuzzy["fips"].alias("fips_from_fuzzy_ne"),
+                ne_fuzzy["score"].alias("fuzzy_ne_score"),
             ]
-        ).drop(["county_fuzzy_raw", "city_fuzzy_raw", "ne_fuzzy_raw"])
+        )
 
         return df
 
@@ -1008,8 +938,8 @@ def _(pl):
 def _(
     add_b_worksite_locations,
     add_fips_with_addfips_and_fuzzy_matching,
-    census_county_ref_map_2010,
-    census_place_ref_map_2010,
+    census_county_reference_2010,
+    census_place_reference_2010,
     census_zip_agg_2010,
     h2a_worksite_locations,
     pick_best_fips,
@@ -1022,8 +952,8 @@ def _(
         "worksite_state",
         "worksite_zip",
         census_zip_agg_2010,
-        census_county_ref_map_2010,
-        census_place_ref_map_2010,
+        census_county_reference_2010,
+        census_place_reference_2010,
     )
     h2a_worksite_locations_added_fips = pick_best_fips(
         h2a_worksite_locations_added_fips, 80
@@ -1036,8 +966,8 @@ def _(
         "worksite_state",
         "worksite_zip",
         census_zip_agg_2010,
-        census_county_ref_map_2010,
-        census_place_ref_map_2010,
+        census_county_reference_2010,
+        census_place_reference_2010,
     )
     add_b_worksite_locations_added_fips = pick_best_fips(
         add_b_worksite_locations_added_fips, 80
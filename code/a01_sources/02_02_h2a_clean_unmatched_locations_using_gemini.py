@@ -10,38 +10,41 @@ app = marimo.App(width="full")
 
 @app.cell
 def _():
-    import hashlib
-    import json
     import os
     import time
     from pathlib import Path
-    from typing import Optional, get_args, get_origin
+    from typing import get_args, get_origin
 
     import dotenv
     import polars as pl
     from google import genai
     from google.genai import types
-    from pydantic import BaseModel, Field, ValidationError
 
+    from h2a.gemini_batch import (
+        CleanedLocation,
+        append_batch_responses,
+        load_cleaned_locations,
+        location_hash,
+        write_batch_request_jsonl,
+    )
     from h2a.paths import CACHE
 
     return (
-        BaseModel,
         CACHE,
-        Field,
-        Optional,
+        CleanedLocation,
         Path,
-        ValidationError,
+        append_batch_responses,
         dotenv,
         genai,
         get_args,
         get_origin,
-        hashlib,
-        json,
+        load_cleaned_locations,
+        location_hash,
         os,
         pl,
         time,
         types,
+        write_batch_request_jsonl,
     )
 
 
@@ -54,41 +57,9 @@ def _(CACHE, dotenv, os):
 
 
 @app.cell
-def _(hashlib):
-    # Define a stable hash function
-    def get_location_hash(city, county, state, zip_code):
-        # Ensure all parts are strings and handle nulls
-        city = str(city) if city else ""
-        county = str(county) if county else ""
-        state = str(state) if state else ""
-        zip_code = str(zip_code) if zip_code else ""
-
-        raw = f"{city}|{county}|{state}|{zip_code}".lower()
-        return hashlib.md5(raw.encode("utf-8")).hexdigest()
-
-    return (get_location_hash,)
-
-
-@app.cell
-def _(BaseModel, Field, Optional, get_args, get_origin):
-    # Define the Structured Output schema we will use for Gemini
+def _(CleanedLocation, get_args, get_origin):
+    # Structured Output schema for Gemini, from the CleanedLocation model
     # This ensures Gemini returns valid JSON matching our DataFrame structure
-    class CleanedLocation(BaseModel):
-        location_hash: str = Field(
-            ..., description="The unique hash ID of the row from the input data."
-        )
-        city: Optional[str] = Field(None, description="Corrected city name.")
-        county: Optional[str] = Field(
-            None, description="County name if present or easily inferable."
-        )
-        state: Optional[str] = Field(
-            None, description="Two-letter state abbreviation (e.g., NY, CA)."
-        )
-        zipcode: Optional[str] = Field(None, description="5-digit zipcode as a string.")
-        confidence: str = Field(
-            ..., description="High/Medium/Low confidence in the correction."
-        )
-
     try:
         from types import UnionType
     except ImportError:
@@ -147,77 +118,7 @@ def _(BaseModel, Field, Optional, get_args, get_origin):
         }
 
     genai_schema = to_gemini_schema(CleanedLocation)
-    return CleanedLocation, genai_schema
-
-
-@app.cell
-def _(json, pd):
-    # This function generates the batch request in the form of a JSONL file
-    # chunk_size = # of rows in each request
-    def write_batch_request_jsonl(
-        df: pd.DataFrame,
-        df_original_id: str,
-        response_schema: dict,
-        jsonl_file_path: str,
-        chunk_size: int,
-    ):
-
-        if df_original_id not in df.columns:
-            raise Exception(
-                "Missing ID in input dataframe for matching rows with output"
-            )
-
-        total_chunks = (len(df) // chunk_size) + 1
-        print(f"Writing {total_chunks} requests (chunks) to {jsonl_file_path}")
-
-        jsonl_entries_list = []
-        for i in range(0, len(df), chunk_size):
-            # chunk = df.slice(i, chunk_size) # This gets added to our prompt as json
-            # chunk_in_json = chunk.to_json(orient='records')
-
-            chunk = df.slice(i, chunk_size)  # This gets added to our prompt as json
-            chunk_in_json = json.dumps(chunk.to_dicts())
-
-            # Define prompt here
-            prompt_string = f"""
-            You are an expert data cleaning assistant.
-            I have a list of US locations that contain errors such as typos, swapped columns, blank entries, or formatting issues.
-            Your goal is to clean these locations so they can be successfully queried against the Google Places API to find the County and FIPS code.
-
-            Instruction:
-            1. Fix typos in City and County names.
-            2. Move data to the correct field if swapped.
-            3. Ensure Zipcode is a 5-digit string.
-            4. If a field is missing, leave it null.
-            5. Return a list of CleanedLocation objects.
-            6. EXTREMELY IMPORTANT: Preserve the '{df_original_id}' for each row exactly.
-
-            Input Data (JSON): {chunk_in_json}
-            """
-
-            # Construct a batch request in the JSONL file
-            # Each line should be a GenerateContentRequest object, though documented examples don't specify model
-            # REMEMBER TO USE DOUBLE QUOTES BCOS JSON
-            request_entry = {
-                "key": f"request_chunk_{i}",
-                "request": {
-                    "contents": [{"parts": [{"text": prompt_string}], "role": "user"}],
-                    "generation_config": {
-                        "response_mime_type": "application/json",
-                        "response_schema": response_schema,
-                        "temperature": 0.1,
-                    },
-                },
-            }
-
-            jsonl_entries_list.append(request_entry)
-
-        # Write list of requests to JSONL file
-        with open(jsonl_file_path, "w", encoding="utf-8") as f:
-            for req in jsonl_entries_list:
-                f.write(json.dumps(req) + "\n")
-
-    return (write_batch_request_jsonl,)
+    return (genai_schema,)
 
 
 @app.cell
@@ -311,9 +212,10 @@ def _(client, time):
 @app.cell
 def _(
     Path,
+    append_batch_responses,
     genai_schema,
     initiate_genai_batch,
-    parse_results,
+    load_cleaned_locations,
     pl,
     poll_genai_job,
     upload_jsonl_using_files_api,
@@ -331,11 +233,8 @@ def _(
         sleep_duration: int = 10,
     ):
         # 1. Parse existing cache
-        existing_results_df = parse_results(cache_file)
-        if len(existing_results_df) > 0:
-            already_processed_hashes = existing_results_df[hash_col].to_list()
-        else:
-            already_processed_hashes = []
+        existing_results_df = load_cleaned_locations(cache_file)
+        already_processed_hashes = existing_results_df[hash_col].implode()
 
         # 2. Filter the dataframe to ONLY hashes we haven't processed yet
         new_df = df_to_clean.filter(~pl.col(hash_col).is_in(already_processed_hashes))
@@ -374,109 +273,18 @@ def _(
             with open(temp_output_file, "r", encoding="utf-8") as temp_f:
                 new_content = temp_f.read()
 
-            # Append to cache
-            with open(cache_file, "a", encoding="utf-8") as cache_f:
-                # Ensure there's a newline before appending in case the file didn't end with one
-                cache_f.write("\n" + new_content.strip())
-
-            print(f"Successfully appended new results to {cache_file.name}")
+            # Append to cache; only the new content is parsed
+            combined_results_df = append_batch_responses(cache_file, new_content)
             temp_output_file.unlink()  # Delete the temp file to keep workspace clean
-        else:
-            print("Job did not succeed or no output file was created.")
+            return combined_results_df
 
-        # 7. Re-parse the updated cache file and return the combined results
-        return parse_results(cache_file)
+        print("Job did not succeed or no output file was created.")
+        # 7. Return the cached results
+        return existing_results_df
 
     return
 
 
-@app.cell
-def _(CleanedLocation, Path, ValidationError, json, pl):
-    # Define a function to merge results together into a coherent dataframe
-    def parse_results(response_string_file):
-        # If the cache file doesn't exist yet, return an empty DataFrame with the expected schema
-        if not Path(response_string_file).exists():
-            return pl.DataFrame(
-                schema={
-                    "location_hash": pl.String,
-                    "city": pl.String,
-                    "county": pl.String,
-                    "state": pl.String,
-                    "zipcode": pl.String,
-                    "confidence": pl.String,
-                }
-            )
-
-        all_cleaned_locations = []
-
-        # Load results string from saved local file
-        with open(response_string_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        for l in lines:
-            # Strip all leading/trailing whitespace and newlines
-            clean_line = l.strip()
-
-            # Skip completely empty lines
-            if not clean_line:
-                continue
-
-            try:
-                batch_item = json.loads(clean_line)
-            except json.JSONDecodeError as e:
-                print(f"Skipping invalid JSON line. Error: {e}")
-                continue
-
-            chunk_key = batch_item.get("key", "Unknown Key")
-
-            # Check if batch item request was successful
-            if "response" not in batch_item:
-                print(
-                    f"Skipping {chunk_key}: No response found (Status: {batch_item.get('status')})"
-                )
-                continue
-
-            # Extract the model's text output
-            # Standard Gemini response structure: response -> candidates -> content -> parts -> text
-            candidates = batch_item["response"].get("candidates", [])
-            if not candidates:
-                print(f"Skipping {chunk_key}: No candidates returned.")
-                continue
-            model_text = candidates[0]["content"]["parts"][0]["text"]
-
-            # Parse the Inner JSON (array of locations)
-            # Because schema was an ARRAY, model_text is '[{...}, {...}]'
-            locations_data = json.loads(model_text)
-
-            # Validate and convert to Pydantic models
-            for loc_dict in locations_data:
-                try:
-                    validated_locations_data = CleanedLocation(**loc_dict).model_dump()
-                    all_cleaned_locations.append(validated_locations_data)
-                except ValidationError as e:
-                    print(f"Validation error for ID {loc_dict.get('original_id')}: {e}")
-
-        if not all_cleaned_locations:
-            return pl.DataFrame(
-                schema={
-                    "location_hash": pl.String,
-                    "city": pl.String,
-                    "county": pl.String,
-                    "state": pl.String,
-                    "zipcode": pl.String,
-                    "confidence": pl.String,
-                }
-            )
-
-        # Change null to ''
-        combined_results = pl.DataFrame(all_cleaned_locations).with_columns(
-            pl.selectors.string().str.replace_all("null", "")
-        )
-        return combined_results
-
-    return (parse_results,)
-
-
 @app.cell
 def _(gemini_api_key, genai):
     # Initiate GenAI client here
@@ -508,8 +316,8 @@ def _(
     Path,
     genai_schema,
     initiate_genai_batch,
+    load_cleaned_locations,
     load_job_id,
-    parse_results,
     pl,
     save_job_id,
     upload_jsonl_using_files_api,
@@ -535,11 +343,8 @@ def _(
             return existing_job_id
 
         # 2. Parse cache and filter for new locations
-        existing_results_df = parse_results(cache_file)
-        if len(existing_results_df) > 0:
-            already_processed_hashes = existing_results_df[hash_col].to_list()
-        else:
-            already_processed_hashes = []
+        existing_results_df = load_cleaned_locations(cache_file)
+        already_processed_hashes = existing_results_df[hash_col].implode()
 
         new_df = df_to_clean.filter(~pl.col(hash_col).is_in(already_processed_hashes))
 
@@ -569,7 +374,15 @@ def _(
 
 
 @app.cell
-def _(Path, clear_job_id, client, load_job_id, parse_results, pl):
+def _(
+    Path,
+    append_batch_responses,
+    clear_job_id,
+    client,
+    load_cleaned_locations,
+    load_job_id,
+    pl,
+):
     def check_and_retrieve_gemini_batch(
         cache_file: Path, tracking_file: Path
     ) -> pl.DataFrame:
@@ -578,7 +391,7 @@ def _(Path, clear_job_id, client, load_job_id, parse_results, pl):
 
         if not job_name:
             print("No pending jobs tracked. Returning currently cached results.")
-            return parse_results(cache_file)
+            return load_cleaned_locations(cache_file)
 
         # Ask Google for the current status of the job
         batch_job = client.batches.get(name=job_name)
@@ -593,7 +406,7 @@ def _(Path, clear_job_id, client, load_job_id, parse_results, pl):
             print(
                 f"Job {job_name} is currently: {batch_job.state.name}. Check back later."
             )
-            return parse_results(cache_file)
+            return load_cleaned_locations(cache_file)
 
         print(f"Job {job_name} finished with state: {batch_job.state.name}")
 
@@ -606,10 +419,8 @@ def _(Path, clear_job_id, client, load_job_id, parse_results, pl):
                     "utf-8"
                 )
 
-                # Append to master cache file
-                with open(cache_file, "a", encoding="utf-8") as cache_f:
-                    cache_f.write("\n" + file_content.strip())
-                print(f"Successfully appended new results to {cache_file.name}")
+                # Append to master cache file; only the new content is parsed
+                append_batch_responses(cache_file, file_content)
 
             # Clear the tracking file so we are ready for future jobs
             clear_job_id(tracking_file)
@@ -620,22 +431,15 @@ def _(Path, clear_job_id, client, load_job_id, parse_results, pl):
             clear_job_id(tracking_file)
 
         # Return the newly updated cache
-        return parse_results(cache_file)
+        return load_cleaned_locations(cache_file)
 
     return (check_and_retrieve_gemini_batch,)
 
 
 @app.cell
-def _(Path, get_location_hash, json_path, pl):
+def _(Path, json_path, location_hash, pl):
     h2a_df = pl.read_csv(json_path / "unmatched_h2a_locations.csv").fill_null("")
-    h2a_df_copy = h2a_df.with_columns(
-        pl.struct(["city", "county", "state", "zip"])
-        .map_elements(
-            lambda x: get_location_hash(x["city"], x["county"], x["state"], x["zip"]),
-            return_dtype=pl.String,
-        )
-        .alias("location_hash")
-    )
+    h2a_df_copy = h2a_df.with_columns(location_hash(h2a_df))
 
     # File Paths
     h2a_cache_file = Path(json_path / "cleaned_h2a_locations_response_string.txt")
@@ -699,16 +503,9 @@ def _(
 
 
 @app.cell
-def _(Path, get_location_hash, json_path, pl):
+def _(Path, json_path, location_hash, pl):
     add_b_df = pl.read_csv(json_path / "unmatched_add_b_locations.csv").fill_null("")
-    add_b_df_copy = add_b_df.with_columns(
-        pl.struct(["city", "county", "state", "zip"])
-        .map_elements(
-            lambda x: get_location_hash(x["city"], x["county"], x["state"], x["zip"]),
-            return_dtype=pl.String,
-        )
-        .alias("location_hash")
-    )
+    add_b_df_copy = add_b_df.with_columns(location_hash(add_b_df))
 
     # File Paths
     add_b_cache_file = Path(json_path / "cleaned_add_b_locations_response_string.txt")
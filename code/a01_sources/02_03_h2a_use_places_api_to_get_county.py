@@ -13,34 +13,35 @@ def _():
     import marimo as mo
     from pathlib import Path
     from h2a.paths import CODE, RAW, INTERMEDIATE, CACHE
+    from h2a.places import (
+        GooglePlacesBackend,
+        PlacesCache,
+        resolve_places,
+        searchable_query,
+    )
     import dotenv, os
     import json
     import polars as pl
     from google import genai
     from google.genai import types
     from google.genai._transformers import process_schema
-    from google.maps import places_v1
-    from google.protobuf.json_format import MessageToJson, MessageToDict
     from typing import Optional, List, get_args, get_origin
     from pydantic import BaseModel, Field
-    import time
     import os
     import us
-    from ratelimit import limits, sleep_and_retry
 
     return (
         CACHE,
+        GooglePlacesBackend,
         INTERMEDIATE,
-        MessageToDict,
+        PlacesCache,
         dotenv,
         json,
-        limits,
         mo,
         os,
         pl,
-        places_v1,
-        sleep_and_retry,
-        time,
+        resolve_places,
+        searchable_query,
         us,
     )
 
@@ -52,7 +53,12 @@ def _(CACHE, INTERMEDIATE, dotenv, os):
 
     binary_path = INTERMEDIATE
     json_path = CACHE
-    return api_key, json_path
+    places_cache_path = CACHE / "places_api_cache.sqlite"
+
+    # Places quotas, in requests per minute
+    SEARCH_QPM = 600
+    DETAILS_QPM = 540
+    return DETAILS_QPM, SEARCH_QPM, api_key, json_path, places_cache_path
 
 
 @app.cell
@@ -130,7 +136,18 @@ def _(mo):
 
 
 @app.cell
-def _(CACHE, client, json, json_path, pl, places_v1, process_df, time):
+async def _(
+    CACHE,
+    PlacesCache,
+    SEARCH_QPM,
+    backend,
+    json_path,
+    pl,
+    places_cache_path,
+    process_df,
+    resolve_places,
+    searchable_query,
+):
     # Load cleaned unmatched locations, clean state names, and concat place names to get location name
     h2a_df = pl.read_csv(
         json_path / "unmatched_h2a_with_suggestions.csv", infer_schema=False
@@ -141,111 +158,47 @@ def _(CACHE, client, json, json_path, pl, places_v1, process_df, time):
     h2a_df = process_df(h2a_df)
     add_b_df = process_df(add_b_df)
 
-    search_cache_file = json_path / "placeid_search_queries_cache.json"
-    if search_cache_file.exists():
-        with open(search_cache_file, "r") as _fp:
-            search_query_cache = json.load(_fp)
-    else:
-        search_query_cache = {}
-
-
-    def rate_limited_queries(queries, qpm, save_frequency=50):
-        response_list = []
-        # Calculate delay in seconds
-        delay = (60 / qpm) + 0.01
-
-        new_calls_since_last_save = 0
-
-        for query in queries:
-            # Polars might pass None for null values, so check for truthiness
-            if not query or "," not in query:
-                response_list.append([])
-                continue
-
-            # Check if query was previously executed ---
-            if query in search_query_cache:
-                response_list.append(search_query_cache[query])
-                continue
+    # Every original and suggested name across both files is searched once
+    location_columns = {
+        "original_location_name": "original_location_placeid",
+        "suggested_location_name": "suggested_location_placeid",
+    }
+    queries = [
+        query
+        for df in (h2a_df, add_b_df)
+        for column in location_columns
+        for query in df[column].to_list()
+        if searchable_query(query)
+    ]
+    with PlacesCache(
+        places_cache_path,
+        "search_queries",
+        legacy_json=json_path / "placeid_search_queries_cache.json",
+    ) as search_cache:
+        search_results = await resolve_places(
+            queries,
+            backend.search_text,
+            search_cache,
+            requests_per_minute=SEARCH_QPM,
+        )
 
-            # Create request
-            request = places_v1.SearchTextRequest(text_query=query)
 
-            # Call API
-            response = client.search_text(
-                request=request, metadata=[("x-goog-fieldmask", "places.id")]
+    def add_placeid_candidates(df: pl.DataFrame) -> pl.DataFrame:
+        return df.with_columns(
+            pl.Series(
+                name=placeid_column,
+                values=[
+                    search_results.get(query, [])
+                    for query in df[name_column].to_list()
+                ],
+                dtype=pl.List(pl.String),
             )
+            for name_column, placeid_column in location_columns.items()
+        )
 
-            placeid_candidates = [place.id for place in response.places]
-
-            # Add to cache
-            search_query_cache[query] = placeid_candidates
-            response_list.append(placeid_candidates)
-
-            new_calls_since_last_save += 1
-
-            # Save to disk periodically
-            if new_calls_since_last_save >= save_frequency:
-                with open(search_cache_file, "w") as _fp:
-                    json.dump(search_query_cache, _fp)
-                print(f"Checkpoint: Saved {len(search_query_cache)} queries to cache.")
-                new_calls_since_last_save = 0
-
-            # Actually sleep to respect the rate limit
-            time.sleep(delay)
-
-        # =Final save to catch any remaining queries
-        if new_calls_since_last_save > 0:
-            with open(search_cache_file, "w") as _fp:
-                json.dump(search_query_cache, _fp)
-        if new_calls_since_last_save == 0:
-            print("No new locations so no new PlaceIDs")
-
-        return response_list
 
-
-    # --- Process h2a_df ---
-    h2a_original_locations_list = h2a_df["original_location_name"].to_list()
-    h2a_original_locations_candidate_list = rate_limited_queries(
-        h2a_original_locations_list, 600
-    )
-    h2a_suggested_locations_list = h2a_df["suggested_location_name"].to_list()
-    h2a_suggested_locations_candidate_list = rate_limited_queries(
-        h2a_suggested_locations_list, 600
-    )
-    h2a_df = h2a_df.with_columns(
-        [
-            pl.Series(
-                name="original_location_placeid",
-                values=h2a_original_locations_candidate_list,
-            ),
-            pl.Series(
-                name="suggested_location_placeid",
-                values=h2a_suggested_locations_candidate_list,
-            ),
-        ]
-    )
-
-    # --- Process add_b_df ---
-    add_b_original_locations_list = add_b_df["original_location_name"].to_list()
-    add_b_original_locations_candidate_list = rate_limited_queries(
-        add_b_original_locations_list, 600
-    )
-    add_b_suggested_locations_list = add_b_df["suggested_location_name"].to_list()
-    add_b_suggested_locations_candidate_list = rate_limited_queries(
-        add_b_suggested_locations_list, 600
-    )
-    add_b_df = add_b_df.with_columns(
-        [
-            pl.Series(
-                name="original_location_placeid",
-                values=add_b_original_locations_candidate_list,
-            ),
-            pl.Series(
-                name="suggested_location_placeid",
-                values=add_b_suggested_locations_candidate_list,
-            ),
-        ]
-    )
+    h2a_df = add_placeid_candidates(h2a_df)
+    add_b_df = add_placeid_candidates(add_b_df)
 
     # # Save to Parquet using Polars write method
     h2a_df.write_parquet(CACHE / "h2a_location_placeids.parquet")
@@ -284,75 +237,41 @@ def _(add_b_df, h2a_df, pl):
 
 
 @app.cell
-def _(api_key, limits, places_v1, sleep_and_retry):
-    client = places_v1.PlacesClient(client_options={"api_key": api_key})
-
-
-    @sleep_and_retry
-    @limits(calls=9, period=1)
-    def get_address_components_from_placeid(placeid):
-        # Place ID format for Places API
-        name = "places/" + placeid
-
-        # We only request 'addressComponents' to minimize latency/cost
-        # This corresponds to the X-Goog-FieldMask header
-        field_mask = [("x-goog-fieldmask", "addressComponents")]
-
-        # Construct request
-        request = places_v1.GetPlaceRequest(name=name)
-
-        # Send request
-        # We pass the field_mask via the metadata argument in the new SDK
-        response = client.get_place(request=request, metadata=field_mask)
-
-        return response
-
-    return client, get_address_components_from_placeid
+def _(GooglePlacesBackend, api_key):
+    backend = GooglePlacesBackend(api_key)
+    return (backend,)
 
 
 @app.cell
-def _(
-    MessageToDict,
-    get_address_components_from_placeid,
-    json,
+async def _(
+    DETAILS_QPM,
+    PlacesCache,
+    backend,
     json_path,
     placeid_list,
+    places_cache_path,
+    resolve_places,
 ):
-    # 1. Load existing JSON responses if available
-    json_file_path = json_path / "placeid_address_components_mapping.json"
-
-    if json_file_path.exists():
-        with open(json_file_path, "r") as _fp:
-            placeid_address_components_dict = json.load(_fp)
-        print(
-            f"Loaded {len(placeid_address_components_dict)} pre-existing Place API responses from JSON."
+    # Place details are appended to the SQLite cache as they arrive
+    with PlacesCache(
+        places_cache_path,
+        "address_components",
+        legacy_json=json_path / "placeid_address_components_mapping.json",
+    ) as details_cache:
+        await resolve_places(
+            placeid_list,
+            backend.address_components,
+            details_cache,
+            requests_per_minute=DETAILS_QPM,
         )
-    else:
-        placeid_address_components_dict = {}
-
-    new_calls = 0
-
-    for _placeid in placeid_list:
-        # 2. Only fetch if we haven't seen this PlaceID before
-        if _placeid not in placeid_address_components_dict:
-            _response = get_address_components_from_placeid(_placeid)
+        placeid_address_components_dict = details_cache.to_dict()
+    return (placeid_address_components_dict,)
 
-            # Convert the Protobuf response immediately to a standard Python dictionary
-            placeid_address_components_dict[_placeid] = MessageToDict(_response._pb)
 
-            new_calls += 1
-
-            # 3. Periodically backup to JSON so you don't lose progress
-            if new_calls % 50 == 0:
-                with open(json_file_path, "w") as _fp:
-                    json.dump(placeid_address_components_dict, _fp, indent=2)
-                print(
-                    f"Checkpoint: Saved {len(placeid_address_components_dict)} responses to JSON."
-                )
-
-    print(f"Made {new_calls} new API calls for Place Details.")
-
-    # 4. Final save of the JSON mapping
+@app.cell
+def _(json, json_path, placeid_address_components_dict):
+    # Export the JSON mapping read by 02_01_h2a_match_locations.py
+    json_file_path = json_path / "placeid_address_components_mapping.json"
     with open(json_file_path, "w") as _fp:
         json.dump(placeid_address_components_dict, _fp, indent=2)
     return
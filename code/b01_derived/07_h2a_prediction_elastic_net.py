@@ -10,11 +10,13 @@ app = marimo.App(width="full")
 
 @app.cell
 def _():
+    import inspect
     import itertools
     import json
     import os
     import time
-    from functools import partial
+    from functools import cache, partial
+    from pathlib import Path
 
     import jax
     import jax.numpy as jnp
@@ -25,17 +27,33 @@ def _():
     import polars as pl
     from jax.flatten_util import ravel_pytree
 
+    from h2a.checkpoints import CheckpointWriter, read_checkpoint, write_checkpoint
+    from h2a.exported import export_path, load_or_export
     from h2a.geography import assert_geo_columns
-    from h2a.paths import CODE, INTERMEDIATE
+    from h2a.paths import CACHE, CODE, INTERMEDIATE
+    from h2a.ppml import compute_patch_log_worker
+
+    # Persist compiled XLA executables across runs. Entries are keyed by the
+    # lowered computation, so argument shapes and static arguments are part of
+    # the key. This has to be set before the first compilation in the process.
+    jax.config.update("jax_compilation_cache_dir", str(CACHE / "jax" / "xla"))
 
     return (
+        CACHE,
         CODE,
+        CheckpointWriter,
         INTERMEDIATE,
+        Path,
         assert_geo_columns,
+        cache,
+        compute_patch_log_worker,
+        export_path,
+        inspect,
         itertools,
         jax,
         jnp,
         json,
+        load_or_export,
         lx,
         mo,
         np,
@@ -44,7 +62,9 @@ def _():
         partial,
         pl,
         ravel_pytree,
+        read_checkpoint,
         time,
+        write_checkpoint,
     )
 
 
@@ -59,29 +79,66 @@ def _(CODE, INTERMEDIATE):
 def _(os):
     model_spec = "climate_norm_static_v1"
     _raw_cutoff_year = os.environ.get("H2A_CUTOFF_YEAR")
-    cutoff_year_was_explicit = _raw_cutoff_year is not None
-    if cutoff_year_was_explicit:
+    _raw_cutoff_years = os.environ.get("H2A_CUTOFF_YEARS")
+    if _raw_cutoff_year is not None and _raw_cutoff_years is not None:
+        raise ValueError("Set either H2A_CUTOFF_YEAR or H2A_CUTOFF_YEARS, not both.")
+    cutoff_year_was_explicit = (
+        _raw_cutoff_year is not None or _raw_cutoff_years is not None
+    )
+    if _raw_cutoff_years is not None:
+        # A sweep such as "2008-2025" or "2011,2014,2017" is fitted in one
+        # process, shortest training window first.
+        try:
+            _cutoff_years = set()
+            for _part in _raw_cutoff_years.split(","):
+                _first, _, _last = _part.strip().partition("-")
+                _cutoff_years.update(range(int(_first), int(_last or _first) + 1))
+        except ValueError as exc:
+            raise ValueError(
+                "H2A_CUTOFF_YEARS must list years or year ranges such as "
+                f"'2008-2025' or '2011,2014'; received {_raw_cutoff_years!r}."
+            ) from exc
+        cutoff_years = sorted(_cutoff_years)
+    elif _raw_cutoff_year is not None:
         try:
-            cutoff_year = int(_raw_cutoff_year)
+            cutoff_years = [int(_raw_cutoff_year)]
         except ValueError as exc:
             raise ValueError(
                 "H2A_CUTOFF_YEAR must be an integer from 2008 through 2025; "
                 f"received {_raw_cutoff_year!r}."
             ) from exc
     else:
-        cutoff_year = 2011
+        cutoff_years = [2011]
 
-    if not 2008 <= cutoff_year <= 2025:
+    if not cutoff_years or not all(2008 <= year <= 2025 for year in cutoff_years):
         raise ValueError(
-            f"H2A_CUTOFF_YEAR must be from 2008 through 2025; received {cutoff_year}."
+            f"Cutoff years must be from 2008 through 2025; received {cutoff_years}."
         )
+    cutoff_year = cutoff_years[0]
 
     print(
         f"H-2A model training window: 2008-{cutoff_year} "
         f"(cutoff explicitly supplied: {cutoff_year_was_explicit}); "
         f"model spec: {model_spec}"
     )
-    return cutoff_year, model_spec
+    if len(cutoff_years) > 1:
+        print(f"Warm-started sweep over cutoffs: {cutoff_years}")
+    return cutoff_year, cutoff_years, model_spec
+
+
+@app.cell
+def _(jax):
+    def progress_print(fmt, **kwargs):
+        """jax.debug.print, unless switched off while tracing a kernel for export.
+
+        Host callbacks cannot be serialized, so exported kernels are traced with
+        ``progress_print.enabled = False``.
+        """
+        if progress_print.enabled:
+            jax.debug.print(fmt, **kwargs)
+
+    progress_print.enabled = True
+    return (progress_print,)
 
 
 @app.cell
@@ -114,14 +171,16 @@ def _(assert_geo_columns, binary_path, pl):
 
 
 @app.cell
-def _(assert_geo_columns, binary_path, cutoff_year, pl):
-    h2a = pl.read_parquet(binary_path / "h2a_aggregated.parquet")
+def _(assert_geo_columns, binary_path, cutoff_year, cutoff_years, pl):
+    h2a_panel = pl.read_parquet(binary_path / "h2a_aggregated.parquet")
     assert_geo_columns(
-        h2a,
+        h2a_panel,
         ["state_fips", "county_code", "county_fips"],
     )
-    h2a = (
-        h2a.with_columns(
+    # The panel covers the longest training window in the sweep; each cutoff
+    # trains on its nested 2008-cutoff slice.
+    h2a_panel = (
+        h2a_panel.with_columns(
             pl.col("year").cast(pl.Int32).alias("year"),
         )
         .rename({"nbr_workers_certified_start_year": "h2a_certified"})
@@ -132,46 +191,56 @@ def _(assert_geo_columns, binary_path, cutoff_year, pl):
                 "h2a_certified",
             ]
         )
-        .filter(pl.col("year") >= 2008, pl.col("year") <= cutoff_year)
+        .filter(pl.col("year") >= 2008, pl.col("year") <= cutoff_years[-1])
     )
-    return (h2a,)
+    h2a = h2a_panel.filter(pl.col("year") <= cutoff_year)
+    return h2a, h2a_panel
 
 
 @app.cell
-def _(assert_geo_columns, binary_path, cutoff_year, pl):
+def _(assert_geo_columns, binary_path, cutoff_year, cutoff_years, pl):
     # Climate normals are time-invariant county primitives. Repeating them over
     # the training years aligns them with the county-year outcome without
     # introducing realized annual weather into either fitting or scoring.
-    climate = pl.read_parquet(
+    climate_panel = pl.read_parquet(
         binary_path / "county_h2a_prediction_climate_basis_annual.parquet"
     )
-    assert_geo_columns(climate, ["county_fips"])
-    climate = climate.select("year", "county_fips", pl.col("^normal_cb_.*$")).filter(
+    assert_geo_columns(climate_panel, ["county_fips"])
+    # Checks on the longest window in the sweep also hold for every nested one.
+    climate_panel = climate_panel.select(
+        "year", "county_fips", pl.col("^normal_cb_.*$")
+    ).filter(
         pl.col("year") >= 2008,
-        pl.col("year") <= cutoff_year,
+        pl.col("year") <= cutoff_years[-1],
     )
-    if climate.select("county_fips", "year").unique().height != climate.height:
+    if (
+        climate_panel.select("county_fips", "year").unique().height
+        != climate_panel.height
+    ):
         raise ValueError("Climate inputs must be unique by county_fips and year.")
     if not all(
-        climate.select(pl.all().exclude("county_fips", "year").is_finite().all()).row(0)
+        climate_panel.select(
+            pl.all().exclude("county_fips", "year").is_finite().all()
+        ).row(0)
     ):
         raise ValueError("Climate-normal inputs must be finite.")
     normal_columns = [
-        column for column in climate.columns if column.startswith("normal_cb_")
+        column for column in climate_panel.columns if column.startswith("normal_cb_")
     ]
-    if not normal_columns or len(normal_columns) != len(climate.columns) - 2:
+    if not normal_columns or len(normal_columns) != len(climate_panel.columns) - 2:
         raise ValueError("The PPML county design must contain climate normals only.")
     if (
-        climate.select("county_fips", *normal_columns).unique().height
-        != climate["county_fips"].n_unique()
+        climate_panel.select("county_fips", *normal_columns).unique().height
+        != climate_panel["county_fips"].n_unique()
     ):
         raise ValueError("Climate normals must be constant within county.")
+    climate = climate_panel.filter(pl.col("year") <= cutoff_year)
 
     print(
         f"Climate design contains {len(normal_columns)} time-invariant normal "
         f"features repeated over 2008-{cutoff_year}."
     )
-    return (climate,)
+    return climate, climate_panel
 
 
 @app.cell
@@ -509,50 +578,6 @@ def _(jax, jnp):
     return (initialize_params,)
 
 
-@app.cell
-def _(jnp):
-    def compute_patch_log_worker(
-        params: dict,
-        feature_ids: dict,
-        X_county_cont: jnp.ndarray,
-        X_patch_cont: jnp.ndarray,
-        group_ids,
-    ) -> jnp.ndarray:
-        """
-        Computes log(worker) for EACH specific soil group in a county.
-        """
-        num_county = X_county_cont.shape[1]
-        X_county_by_patch = X_county_cont[group_ids]
-
-        log_mu = jnp.full(
-            (group_ids.shape[0],),
-            params["bias"],
-            dtype=jnp.float32,
-        )
-
-        for order in sorted(feature_ids):
-            ids_for_order = feature_ids[order]
-            w_order = params["weights"][order]
-
-            for combo_idx in range(ids_for_order.shape[1]):
-                ids = ids_for_order[:, combo_idx]
-                gathered = w_order[ids]
-
-                log_mu += gathered[:, 0]
-                log_mu += jnp.sum(
-                    gathered[:, 1 : 1 + num_county] * X_county_by_patch,
-                    axis=1,
-                )
-                log_mu += jnp.sum(
-                    gathered[:, 1 + num_county :] * X_patch_cont,
-                    axis=1,
-                )
-
-        return jnp.clip(log_mu, max=15.0)  # Clipped per-acre rates to prevent overflow
-
-    return (compute_patch_log_worker,)
-
-
 @app.cell
 def _(compute_patch_log_worker, heredity_multiplier, jax, jnp):
     def ppml_objective_compositional(
@@ -733,10 +758,12 @@ def _(heredity_multiplier, jnp):
 
 @app.cell
 def _(
+    heredity_multiplier,
     jax,
     jnp,
     ppml_objective_compositional,
     ppml_objective_compositional_smooth_only,
+    progress_print,
     prox_g,
     ravel_pytree,
 ):
@@ -756,12 +783,20 @@ def _(
         l2_rates,
         inner_iters,
         inner_tol,
+        screen_l1_rates=None,
+        kkt_rounds=4,
     ):  # note smaller tol, we are using FISTA
-        X_county_cont.shape[1] + X_patch_cont.shape[1]
+        """
+        FISTA with backtracking for the elastic-net PPML problem.
+
+        With screen_l1_rates, the L1 rates at which init_params was solved, the
+        solve runs in active-set mode: the sequential strong rule screens out
+        weights, FISTA runs with those weights pinned at zero, and a KKT check
+        over every weight re-admits violators for up to kkt_rounds solves, the
+        last of which covers every weight.
+        """
 
-        # FISTA initializations
-        p = init_params  # Current parameters
-        y_mom = init_params  # Momentum point (y_k)
+        # FISTA initializations (each solve starts with y_k at its initial point)
         t = jnp.array(1.0, dtype=jnp.float32)  # Nesterov momentum scalar
         L = jnp.array(
             1.0, dtype=jnp.float32
@@ -789,16 +824,31 @@ def _(
         prev_max_param_change = jnp.array(jnp.inf, dtype=jnp.float32)
 
         def cond_fn_outer(carry):
-            i, _, _, _, _, mpc, _, _ = carry
+            i, _, _, _, _, mpc, _, _, _ = carry
             # Loop continues if max_iter not reached AND not converged
             return jnp.logical_and(i < inner_iters, mpc > inner_tol)
 
         def body_fn_outer(carry):
-            (i, p, y_mom, t, L, _prev_max_param_change, best_p, best_loss) = carry
+            (
+                i,
+                p,
+                y_mom,
+                t,
+                L,
+                _prev_max_param_change,
+                best_p,
+                best_loss,
+                grad_mask,
+            ) = carry
 
             # --- Backtracking Line Search (Nested While Loop) ---
             # The line search requires the smooth part of the objective only
             loss_y_val, grad_y_val = val_and_grad_smooth_fn(y_mom)
+            # Screened-out weights start at zero and get no gradient, so the
+            # prox step keeps them at zero.
+            grad_y_val = jax.tree_util.tree_map(
+                lambda g, keep: jnp.where(keep, g, 0.0), grad_y_val, grad_mask
+            )
 
             def cond_fn_bt(carry_bt):
                 (k_bt, _, _loss_p_next_candidate, L_bt_current) = carry_bt
@@ -927,7 +977,7 @@ def _(
                     l1_rates,
                     l2_rates,
                 )
-                jax.debug.print(
+                progress_print(
                     "      Iter {iter}: Loss = {loss:.4f}, MaxParamChange = {mpc:.6f}, L = {L:.4f}, BT_iters={k_bt}",
                     iter=i + 1,
                     loss=full_loss,
@@ -949,25 +999,110 @@ def _(
                 max_param_change,
                 best_p,
                 best_loss,
+                grad_mask,
             )  # Pass best_p/best_loss along, though not used in FISTA logic for now
 
-        # Initial carry state for FISTA outer while_loop
-        init_carry = (
-            0,  # i (iteration index)
-            p,  # p (current parameters)
-            y_mom,  # y_mom (momentum point)
-            t,  # t (Nesterov momentum scalar)
-            L,  # L (Lipschitz constant)
-            prev_max_param_change,  # prev_max_param_change (for convergence check)
-            p,  # best_p (not directly used by FISTA, but useful to pass along)
-            jnp.array(jnp.inf, dtype=jnp.float32),  # best_loss (not directly used)
-        )
-        # Run the while loop
-        final_i, final_params, _, _, _, final_mpc, _, _ = jax.lax.while_loop(
-            cond_fn_outer, body_fn_outer, init_carry
-        )
-        jax.debug.print(
-            "  ->[Inner FISTA] Completed at Iter {i}. Final Max Param Change = {mpc:.6f}",
+        def fista(p, grad_mask):
+            # Initial carry state for FISTA outer while_loop
+            init_carry = (
+                0,  # i (iteration index)
+                p,  # p (current parameters)
+                p,  # y_mom (momentum point)
+                t,  # t (Nesterov momentum scalar)
+                L,  # L (Lipschitz constant)
+                prev_max_param_change,  # prev_max_param_change (for convergence check)
+                p,  # best_p (not directly used by FISTA, but useful to pass along)
+                jnp.array(jnp.inf, dtype=jnp.float32),  # best_loss (not directly used)
+                grad_mask,  # grad_mask (False for screened-out weights)
+            )
+            # Run the while loop
+            final_i, final_params, _, _, _, final_mpc, _, _, _ = jax.lax.while_loop(
+                cond_fn_outer, body_fn_outer, init_carry
+            )
+            return final_i, final_params, final_mpc
+
+        if screen_l1_rates is None:
+            final_i, final_params, final_mpc = fista(
+                init_params,
+                jax.tree_util.tree_map(lambda x: jnp.ones(x.shape, bool), init_params),
+            )
+            progress_print(
+                "  ->[Inner FISTA] Completed at Iter {i}. Final Max Param Change = {mpc:.6f}",
+                i=final_i,
+                mpc=final_mpc,
+            )
+            return final_params
+
+        # Sequential strong rule: keep a weight that is nonzero at the warm
+        # start or whose smooth gradient there reaches (2 * l1 - previous l1)
+        # times its heredity multiplier.
+        _, grad_init = val_and_grad_smooth_fn(init_params)
+        strong_mask = {"bias": jnp.array(True), "weights": {}}
+        for order, w_matrix in init_params["weights"].items():
+            multiplier = heredity_multiplier(init_params, order, parent_ids)
+            strong_threshold = (
+                2.0 * l1_rates[order] - screen_l1_rates[order]
+            ) * multiplier
+            strong_mask["weights"][order] = (w_matrix != 0.0) | (
+                jnp.abs(grad_init["weights"][order]) >= strong_threshold
+            )
+
+        def kkt_violations(params, active_mask):
+            # A zero weight is optimal when its smooth gradient stays within its
+            # L1 threshold; screened-out weights beyond it are re-admitted.
+            _, grad = val_and_grad_smooth_fn(params)
+            violations = {"bias": jnp.array(False), "weights": {}}
+            for order, keep in active_mask["weights"].items():
+                threshold = l1_rates[order] * heredity_multiplier(
+                    params, order, parent_ids
+                )
+                violations["weights"][order] = ~keep & (
+                    jnp.abs(grad["weights"][order]) > threshold * (1.0 + 1e-3)
+                )
+            return violations
+
+        def cond_fn_kkt(carry):
+            kkt_round, _, _, violated, _, _ = carry
+            return jnp.logical_and(violated, kkt_round < kkt_rounds)
+
+        def body_fn_kkt(carry):
+            kkt_round, params, active_mask, _, _, _ = carry
+            # The last round solves over every weight, so the result is always
+            # checked against the full problem.
+            active_mask = jax.tree_util.tree_map(
+                lambda keep: keep | (kkt_round == kkt_rounds - 1), active_mask
+            )
+            final_i, params, final_mpc = fista(params, active_mask)
+            violations = kkt_violations(params, active_mask)
+            violated = jnp.any(
+                jnp.array([jnp.any(v) for v in jax.tree_util.tree_leaves(violations)])
+            )
+            active_mask = jax.tree_util.tree_map(
+                jnp.logical_or, active_mask, violations
+            )
+            return kkt_round + 1, params, active_mask, violated, final_i, final_mpc
+
+        kkt_round, final_params, active_mask, _, final_i, final_mpc = (
+            jax.lax.while_loop(
+                cond_fn_kkt,
+                body_fn_kkt,
+                (
+                    0,
+                    init_params,
+                    strong_mask,
+                    jnp.array(True),
+                    0,
+                    prev_max_param_change,
+                ),
+            )
+        )
+        progress_print(
+            "  ->[Inner FISTA] Active set: {active} of {total} weights after "
+            "{rounds} KKT round(s); last solve at Iter {i}, "
+            "Max Param Change = {mpc:.6f}",
+            active=sum(jnp.sum(keep) for keep in active_mask["weights"].values()),
+            total=sum(w.size for w in init_params["weights"].values()),
+            rounds=kkt_round,
             i=final_i,
             mpc=final_mpc,
         )
@@ -983,6 +1118,7 @@ def _(
     jnp,
     lx,
     ppml_objective_compositional_smooth_only,
+    progress_print,
     ravel_pytree,
     train_model_inner,
 ):
@@ -1004,6 +1140,7 @@ def _(
         l2_rates,
         inner_iters,
         inner_tol,
+        screen_l1_rates,
     ):
         return train_model_inner(
             init_params,
@@ -1020,6 +1157,7 @@ def _(
             l2_rates,
             inner_iters,
             inner_tol,
+            screen_l1_rates=screen_l1_rates,
         )
 
     # Forwards pass is just solving the inner loop
@@ -1038,6 +1176,7 @@ def _(
         l2_rates,
         inner_iters,
         inner_tol,
+        screen_l1_rates,
     ):
         opt_params = train_model_inner(
             init_params,
@@ -1054,6 +1193,7 @@ def _(
             l2_rates,
             inner_iters=inner_iters,
             inner_tol=inner_tol,
+            screen_l1_rates=screen_l1_rates,
         )
 
         # Calculate active mask at the optimum
@@ -1171,7 +1311,7 @@ def _(
             tags=lx.positive_semidefinite_tag,
         )
 
-        jax.debug.print(
+        progress_print(
             "  ->[Implicit VJP] Solving Hessian linear system for backward pass..."
         )
 
@@ -1187,7 +1327,7 @@ def _(
         safe_solution_value = jnp.where(jnp.isnan(solution.value), 0.0, solution.value)
         w_pytree = unravel_fn(safe_solution_value)
 
-        jax.debug.print("  -> [Implicit VJP] Linear solve completed.")
+        progress_print("  -> [Implicit VJP] Linear solve completed.")
 
         # 5. Algebraic KKT Output
         grad_l1 = {}
@@ -1236,6 +1376,7 @@ def _(
             grad_l2,  # l2_rates,
             None,  # inner_iters
             None,  # inner_tols
+            None,  # screen_l1_rates
         )
 
     train_model_cpu.defvjp(train_fwd, train_bwd)
@@ -1432,6 +1573,7 @@ def _(
     jnp,
     lx,
     ppml_objective_compositional_smooth_only,
+    progress_print,
     ravel_pytree,
 ):
     def compute_alo_compositional(
@@ -1565,7 +1707,7 @@ def _(
         group_nlls = all_groups_nll(flat_p)
         alo_score = jnp.mean(group_nlls) + (sum_leverages / (num_groups**2))
 
-        jax.debug.print(
+        progress_print(
             "  -> [ALO-CV] Stochastic ALO: {alo:.4f} | Active Params: {k}",
             alo=alo_score,
             k=jnp.sum(flat_active_mask),
@@ -1600,6 +1742,7 @@ def _(compute_alo_compositional, jax, parent_ids, train_model_cpu):
     def meta_loss_fn(
         raw_l1,
         raw_l2,
+        screen_raw_l1,
         init_params,
         feature_ids,
         X_county_cont,
@@ -1618,10 +1761,17 @@ def _(compute_alo_compositional, jax, parent_ids, train_model_cpu):
     ):
         """
         Compute ALO-CV score given L1 and L2 params
+
+        screen_raw_l1 holds the raw L1 params init_params was solved at; the
+        inner solve screens its active set from them.
         """
         # Enforce strict positivity constraints
         l1_rates = {k: jax.nn.softplus(v) for k, v in raw_l1.items()}
         l2_rates = {k: jax.nn.softplus(v) + 1e-4 for k, v in raw_l2.items()}
+        screen_l1_rates = {
+            k: jax.lax.stop_gradient(jax.nn.softplus(v))
+            for k, v in screen_raw_l1.items()
+        }
 
         # 1. Train Inner Model
         opt_params = train_model_cpu(
@@ -1639,6 +1789,7 @@ def _(compute_alo_compositional, jax, parent_ids, train_model_cpu):
             l2_rates,
             inner_iters,
             inner_tol,
+            screen_l1_rates,
         )
 
         # 2. Evaluate with ALO-CV
@@ -1679,13 +1830,12 @@ def _(compute_alo_compositional, jax, parent_ids, train_model_cpu):
 
 
 @app.cell
-def _(jax, jnp, meta_val_and_grad, optax, partial):
+def _(jax, jnp, meta_val_and_grad, optax, partial, progress_print):
     @partial(
         jax.jit,
         static_argnames=[
             "num_groups",
             "feature_sizes_tup",
-            "target_iters",
             "patience",
             "outer_tol",
             "meta_optimizer",
@@ -1699,6 +1849,7 @@ def _(jax, jnp, meta_val_and_grad, optax, partial):
     )
     def compiled_meta_loop(
         carry_init,
+        target_iters,
         feature_ids,
         X_county_cont,
         X_patch_cont,
@@ -1707,7 +1858,6 @@ def _(jax, jnp, meta_val_and_grad, optax, partial):
         y_county_year,
         num_groups,
         feature_sizes_tup,
-        target_iters,
         patience,
         outer_tol,
         meta_optimizer,
@@ -1720,11 +1870,14 @@ def _(jax, jnp, meta_val_and_grad, optax, partial):
     ):
         """
         Natively compiled XLA outer While Loop. Runs entirely on GPU.
+
+        target_iters is traced rather than static, so every chunk of a run
+        reuses one executable.
         """
 
         def cond_fn(carry):
             # 1. Unpack the exact state we need to check
-            i, _chunk_i, _, _, _, _, wait, _, _ = carry
+            i, _chunk_i, _, _, _, _, wait, _, _, _ = carry
 
             # 2. Loop continues ONLY if both conditions are True
             not_max_iter = i < target_iters
@@ -1744,14 +1897,17 @@ def _(jax, jnp, meta_val_and_grad, optax, partial):
                 wait,
                 history_buffer,
                 inner_params,
+                screen_raw_l1,
             ) = carry
             raw_l1, raw_l2 = hparams
 
             # 2. Execute the Inner Bilevel Step (Computes Loss & Gradients)
-            # Passes previous opt_params as initial inner_params
+            # Passes previous opt_params as initial inner_params, and the L1
+            # params they were solved at for strong-rule screening
             (alo, new_inner_params), (gl1, gl2) = meta_val_and_grad(
                 raw_l1,
                 raw_l2,
+                screen_raw_l1,
                 inner_params,
                 feature_ids,
                 X_county_cont,
@@ -1803,8 +1959,8 @@ def _(jax, jnp, meta_val_and_grad, optax, partial):
             # Insert the vector into the history buffer matrix at the current chunk index
             new_history_buffer = history_buffer.at[chunk_i].set(new_metric_row)
 
-            # jax.debug.print does not break JIT; it streams to stdout asynchronously
-            jax.debug.print(
+            # progress_print does not break JIT; it streams to stdout asynchronously
+            progress_print(
                 "Step {i} | ALO-CV: {alo} | Mean L1: {l1} | Wait: {w}/{p}",
                 i=i,
                 alo=alo,
@@ -1824,6 +1980,7 @@ def _(jax, jnp, meta_val_and_grad, optax, partial):
                 new_wait,
                 new_history_buffer,
                 new_inner_params,
+                raw_l1,
             )
 
         # Execute the loop
@@ -1834,8 +1991,11 @@ def _(jax, jnp, meta_val_and_grad, optax, partial):
 
 
 @app.cell
-def _(optax):
-    # We want to use ADAM as our hyperparameter optimizer
+def _(cache, optax):
+    # We want to use ADAM as our hyperparameter optimizer. compiled_meta_loop
+    # takes the optimizer as a static argument, which hashes by identity, so
+    # one object per setting lets later calls reuse the compiled loop.
+    @cache
     def make_meta_optimizer(meta_lr=0.01, clip_norm=1.0):
         return optax.chain(
             optax.clip_by_global_norm(clip_norm),
@@ -1845,11 +2005,69 @@ def _(optax):
     return (make_meta_optimizer,)
 
 
+@app.cell
+def _(
+    Path,
+    compiled_meta_loop,
+    compute_patch_log_worker,
+    export_path,
+    inspect,
+    jax,
+    load_or_export,
+    partial,
+    progress_print,
+):
+    def load_or_export_meta_loop(
+        export_dir, dynamic_args, static_args, *, meta_lr, clip_norm
+    ):
+        """
+        compiled_meta_loop for one feature layout, served from a jax.export file.
+
+        The file name hashes this notebook's and h2a.ppml's source, the JAX
+        version and backend, the traced argument shapes and dtypes, and the
+        static arguments, so a changed kernel or layout is exported afresh.
+        """
+        path = export_path(
+            export_dir,
+            "meta_loop",
+            dynamic_args,
+            sources=(Path(__file__), Path(inspect.getfile(compute_patch_log_worker))),
+            static_key=(
+                sorted(
+                    (name, value)
+                    for name, value in static_args.items()
+                    if name != "meta_optimizer"
+                ),
+                meta_lr,
+                clip_norm,
+            ),
+        )
+        exported = path.exists()
+        progress_print.enabled = False
+        try:
+            # The loop returns a carry shaped like the one it was given.
+            meta_loop = load_or_export(
+                partial(compiled_meta_loop, **static_args),
+                dynamic_args,
+                path,
+                out_tree=jax.tree_util.tree_structure(dynamic_args[0]),
+            )
+        finally:
+            progress_print.enabled = True
+        if exported:
+            print(f"Loaded exported meta loop {path.name}")
+        else:
+            print(f"Exported meta loop to {path.name}")
+        return meta_loop
+
+    return (load_or_export_meta_loop,)
+
+
 @app.cell
 def _(jnp):
     def restore_leaves(loaded_leaves, template_leaves):
         restored = []
-        for loaded, template in zip(loaded_leaves, template_leaves):
+        for loaded, template in zip(loaded_leaves, template_leaves, strict=True):
             if hasattr(template, "dtype"):
                 restored.append(jnp.array(loaded, dtype=template.dtype))
             else:
@@ -1859,17 +2077,9 @@ def _(jnp):
     return (restore_leaves,)
 
 
-@app.function
-def to_serializable(x):
-    if hasattr(x, "tolist"):
-        return x.tolist()
-    if hasattr(x, "item"):
-        return x.item()
-    return x
-
-
 @app.cell
 def _(
+    CheckpointWriter,
     compiled_meta_loop,
     get_hparam_templates,
     initialize_params,
@@ -1877,6 +2087,7 @@ def _(
     jax_inv_softplus,
     jnp,
     load_meta_checkpoint,
+    load_or_export_meta_loop,
     make_meta_optimizer,
     save_meta_checkpoint,
     time,
@@ -1903,9 +2114,13 @@ def _(
         alo_cg_max_steps=50,
         checkpoint_path=None,
         log_path=None,
+        legacy_checkpoint_path=None,
         meta_lr=0.01,  # ADAM params
         clip_norm=1.0,
         reset=False,
+        warm_start_path=None,
+        warm_start_params=None,
+        export_dir=None,
     ):
         if checkpoint_path is None or log_path is None:
             raise ValueError(
@@ -1917,12 +2132,75 @@ def _(
         # ---------------------------------------------------------
         # STATE INITIALIZATION & ROBUST DESERIALIZATION
         # ---------------------------------------------------------
-        if checkpoint_path.exists() and not reset:
-            hparams_template, state_template = get_hparam_templates(
-                meta_optimizer, jax_inv_softplus
+        hparams_template, state_template = get_hparam_templates(
+            meta_optimizer, jax_inv_softplus
+        )
+        num_continuous = X_county_cont.shape[1] + X_patch_cont.shape[1]
+        inner_params_template = initialize_params(feature_sizes_tup, num_continuous)
+
+        def same_shapes(params):
+            leaves, treedef = jax.tree_util.tree_flatten(params)
+            template_leaves, template_treedef = jax.tree_util.tree_flatten(
+                inner_params_template
+            )
+            return treedef == template_treedef and all(
+                jnp.shape(leaf) == jnp.shape(template)
+                for leaf, template in zip(leaves, template_leaves)
+            )
+
+        if (
+            legacy_checkpoint_path is not None
+            and legacy_checkpoint_path.exists()
+            and not checkpoint_path.exists()
+            and not reset
+        ):
+            # Runs from before the .npz format checkpointed to JSON; convert
+            # the last one so the run resumes instead of starting over.
+            print(
+                f"Converting legacy checkpoint {legacy_checkpoint_path.name} "
+                f"to {checkpoint_path.name}"
+            )
+            legacy = load_meta_checkpoint(
+                legacy_checkpoint_path,
+                expected_model_spec=model_spec,
+                hparams_template=hparams_template,
+                state_template=state_template,
+                inner_params_template=inner_params_template,
             )
-            num_continuous = X_county_cont.shape[1] + X_patch_cont.shape[1]
-            inner_params_template = initialize_params(feature_sizes_tup, num_continuous)
+            save_meta_checkpoint(
+                checkpoint_path,
+                model_spec=model_spec,
+                iteration=legacy["iter"],
+                hparams=legacy["hparams"],
+                opt_state=legacy["opt_state"],
+                best_hparams=legacy["best_hparams"],
+                best_alo=legacy["best_alo"],
+                wait=legacy["wait"],
+                inner_params=legacy["inner_params"],
+            )
+
+        resume = checkpoint_path.exists() and not reset
+        warm_start = None
+        if warm_start_path is not None and not resume:
+            warm_start = load_meta_checkpoint(
+                warm_start_path,
+                expected_model_spec=model_spec,
+                hparams_template=hparams_template,
+                state_template=state_template,
+                inner_params_template=inner_params_template,
+            )
+            if warm_start_params is not None:
+                warm_start["inner_params"] = warm_start_params
+            if not same_shapes(warm_start["inner_params"]):
+                # Penalties do not depend on the feature sizes, so only the
+                # inner weights start from scratch.
+                print(
+                    f"Feature sizes differ from {warm_start_path.name}; "
+                    "keeping its penalties but cold-starting the inner weights."
+                )
+                warm_start["inner_params"] = inner_params_template
+
+        if resume:
             checkpoint = load_meta_checkpoint(
                 checkpoint_path,
                 expected_model_spec=model_spec,
@@ -1946,18 +2224,77 @@ def _(
             )
 
         else:
-            print("\n--- Starting Bilevel Hyperparameter Tuning from Scratch ---")
-            hparams, state = get_hparam_templates(meta_optimizer, jax_inv_softplus)
+            if warm_start is None:
+                print("\n--- Starting Bilevel Hyperparameter Tuning from Scratch ---")
+                hparams, state = hparams_template, state_template
+                # Generate initial weights from scratch if not previously logged
+                inner_params = inner_params_template
+            else:
+                # Start from the previous cutoff's best penalties and weights, but
+                # with fresh Adam moments and no best ALO: ALO-CV scores are not
+                # comparable across training windows.
+                print(
+                    "\n--- Warm-starting Bilevel Hyperparameter Tuning from "
+                    f"{warm_start_path.name} ---"
+                )
+                hparams = warm_start["best_hparams"]
+                state = meta_optimizer.init(hparams)
+                inner_params = warm_start["inner_params"]
             best_hparams = hparams
             best_alo = jnp.array(jnp.inf, dtype=jnp.float32)
             wait = jnp.array(0, dtype=jnp.int32)
             start_iter = 0
-            # Generate initial weights from scratch if not previously logged
-            num_continuous = X_county_cont.shape[1] + X_patch_cont.shape[1]
-            inner_params = initialize_params(feature_sizes_tup, num_continuous)
 
+        # Compile and run seconds are per step, so each column sums to the total.
+        log_header = (
+            "Step,ALO_CV_Score,Mean_L1_Penalty,Wait,Compile_Seconds,Run_Seconds\n"
+        )
+        if not resume or not log_path.exists():
             with open(log_path, "w") as f:
-                f.write("Step,ALO_CV_Score,Mean_L1_Penalty,Wait\n")
+                f.write(log_header)
+        else:
+            with open(log_path, "r") as f:
+                log_lines = f.readlines()
+            if log_lines and log_lines[0] != log_header:
+                # Logs written before the timing columns leave them blank.
+                with open(log_path, "w") as f:
+                    f.write(log_header)
+                    f.writelines(line.rstrip("\n") + ",,\n" for line in log_lines[1:])
+
+        # The executable accepts exactly the avals it was lowered for, so pin
+        # every carry leaf to a concrete (non-weak) dtype once.
+        hparams, state, best_hparams, best_alo, wait, inner_params = (
+            jax.tree_util.tree_map(
+                lambda x: jnp.asarray(x, dtype=jnp.asarray(x).dtype),
+                (hparams, state, best_hparams, best_alo, wait, inner_params),
+            )
+        )
+        # L1 params the current inner_params were solved at, for the inner
+        # solver's strong-rule screening. Checkpoints do not store them; the
+        # current L1 params are close, and the KKT check covers the difference.
+        screen_raw_l1 = hparams[0]
+        dynamic_args = (
+            feature_ids,
+            X_county_cont,
+            X_patch_cont,
+            acreage,
+            group_ids,
+            y_county_year,
+        )
+        static_args = {
+            "num_groups": num_groups,
+            "feature_sizes_tup": feature_sizes_tup,
+            "patience": patience,
+            "outer_tol": outer_tol,
+            "meta_optimizer": meta_optimizer,
+            "inner_iters": inner_iters,
+            "inner_tol": inner_tol,
+            "alo_k": alo_k,
+            "alo_cg_rtol": alo_cg_rtol,
+            "alo_cg_atol": alo_cg_atol,
+            "alo_cg_max_steps": alo_cg_max_steps,
+        }
+        meta_step = None
 
         print(
             f"--- Chunked XLA Meta-Optimization (Chunk Size: {chunk_size}, Total Target: {outer_iters}) ---"
@@ -1966,90 +2303,108 @@ def _(
         # CHUNKING loop starts here
         current_iter = start_iter
 
-        # wait defensively wrapped with int()
-        while current_iter < outer_iters and int(wait) < patience:
-            iters_this_chunk = min(chunk_size, outer_iters - current_iter)
-            target_iter = current_iter + iters_this_chunk
-
-            # Pre-allocate telemetry buffer
-            history_buffer = jnp.zeros((chunk_size, 4), dtype=jnp.float32)
-            chunk_idx_start = jnp.array(0, dtype=jnp.int32)
-
-            carry_init = (
-                jnp.array(current_iter, dtype=jnp.int32),
-                chunk_idx_start,
-                hparams,
-                state,
-                best_hparams,
-                best_alo,
-                wait,
-                history_buffer,
-                inner_params,
-            )
-
-            # Dispatch to GPU for 20 loop chunk
-            t0 = time.time()
-            final_carry = compiled_meta_loop(
-                carry_init,
-                feature_ids,
-                X_county_cont,
-                X_patch_cont,
-                acreage,
-                group_ids,
-                y_county_year,
-                num_groups,
-                feature_sizes_tup,
-                target_iters=target_iter,
-                patience=patience,
-                outer_tol=outer_tol,
-                meta_optimizer=meta_optimizer,
-                inner_iters=inner_iters,
-                inner_tol=inner_tol,
-                alo_k=alo_k,
-                alo_cg_rtol=alo_cg_rtol,
-                alo_cg_atol=alo_cg_atol,
-                alo_cg_max_steps=alo_cg_max_steps,
-            )
-            final_carry = jax.block_until_ready(final_carry)
-            t1 = time.time()
-
-            # Unpack carry
-            (
-                current_iter_jax,
-                chunk_steps_completed,
-                hparams,
-                state,
-                best_hparams,
-                best_alo,
-                wait,
-                finished_history,
-                inner_params,
-            ) = final_carry
-            current_iter = int(current_iter_jax)
+        # Checkpoints are written on a background thread while the next chunk
+        # runs; leaving the block waits for the last one to reach disk.
+        with CheckpointWriter() as checkpoint_writer:
+            # wait defensively wrapped with int()
+            while current_iter < outer_iters and int(wait) < patience:
+                iters_this_chunk = min(chunk_size, outer_iters - current_iter)
+                target_iter = current_iter + iters_this_chunk
+
+                # Pre-allocate telemetry buffer
+                history_buffer = jnp.zeros((chunk_size, 4), dtype=jnp.float32)
+                chunk_idx_start = jnp.array(0, dtype=jnp.int32)
+
+                carry_init = (
+                    jnp.array(current_iter, dtype=jnp.int32),
+                    chunk_idx_start,
+                    hparams,
+                    state,
+                    best_hparams,
+                    best_alo,
+                    wait,
+                    history_buffer,
+                    inner_params,
+                    screen_raw_l1,
+                )
+                target_iters = jnp.array(target_iter, dtype=jnp.int32)
+
+                # Compile once per run: from the persistent cache when this layout
+                # was compiled before, and from the exported module when enabled.
+                compile_seconds = 0.0
+                if meta_step is None:
+                    t0 = time.time()
+                    if export_dir is None:
+                        meta_step = compiled_meta_loop.lower(
+                            carry_init, target_iters, *dynamic_args, **static_args
+                        ).compile()
+                    else:
+                        meta_loop = load_or_export_meta_loop(
+                            export_dir,
+                            (carry_init, target_iters, *dynamic_args),
+                            static_args,
+                            meta_lr=meta_lr,
+                            clip_norm=clip_norm,
+                        )
+                        meta_step = (
+                            jax.jit(meta_loop)
+                            .lower(carry_init, target_iters, *dynamic_args)
+                            .compile()
+                        )
+                    compile_seconds = time.time() - t0
+                    print(
+                        f"  [Host Sync] Meta loop compiled in {compile_seconds:.2f}s."
+                    )
 
-            print(
-                f"  [Host Sync] Chunk completed in {t1 - t0:.2f}s. Global Iter: {current_iter}. Best ALO: {float(best_alo):.4f}"
-            )
+                # Dispatch to GPU for 20 loop chunk
+                t0 = time.time()
+                final_carry = meta_step(carry_init, target_iters, *dynamic_args)
+                final_carry = jax.block_until_ready(final_carry)
+                t1 = time.time()
+
+                # Unpack carry
+                (
+                    current_iter_jax,
+                    chunk_steps_completed,
+                    hparams,
+                    state,
+                    best_hparams,
+                    best_alo,
+                    wait,
+                    finished_history,
+                    inner_params,
+                    screen_raw_l1,
+                ) = final_carry
+                current_iter = int(current_iter_jax)
+
+                print(
+                    f"  [Host Sync] Chunk completed in {t1 - t0:.2f}s. Global Iter: {current_iter}. Best ALO: {float(best_alo):.4f}"
+                )
 
-            # Write telemetry to CSV, async after each GPU chunk
-            with open(log_path, "a") as f:
-                for row in range(int(chunk_steps_completed)):
-                    step_val, alo_val, l1_val, wait_val = finished_history[row]
-                    f.write(
-                        f"{int(step_val)},{float(alo_val):.4f},{float(l1_val):.6f},{int(wait_val)}\n"
-                    )
+                # Write telemetry to CSV, async after each GPU chunk
+                steps_completed = int(chunk_steps_completed)
+                run_seconds = (t1 - t0) / max(steps_completed, 1)
+                with open(log_path, "a") as f:
+                    for row in range(steps_completed):
+                        step_val, alo_val, l1_val, wait_val = finished_history[row]
+                        row_compile_seconds = compile_seconds if row == 0 else 0.0
+                        f.write(
+                            f"{int(step_val)},{float(alo_val):.4f},{float(l1_val):.6f},{int(wait_val)},"
+                            f"{row_compile_seconds:.3f},{run_seconds:.3f}\n"
+                        )
 
-            save_meta_checkpoint(
-                checkpoint_path,
-                model_spec=model_spec,
-                iteration=current_iter,
-                hparams=hparams,
-                opt_state=state,
-                best_hparams=best_hparams,
-                best_alo=best_alo,
-                wait=wait,
-                inner_params=inner_params,
-            )
+                save_meta_checkpoint(
+                    checkpoint_path,
+                    model_spec=model_spec,
+                    iteration=current_iter,
+                    hparams=hparams,
+                    opt_state=state,
+                    best_hparams=best_hparams,
+                    best_alo=best_alo,
+                    wait=wait,
+                    inner_params=inner_params,
+                    writer=checkpoint_writer,
+                )
 
         # Final extraction (defensively wrapped with int())
         if int(wait) >= patience:
@@ -2077,7 +2432,7 @@ def _(mo):
 
 
 @app.cell
-def _(jax, json):
+def _(jax, write_checkpoint):
     def save_meta_checkpoint(
         path,
         *,
@@ -2089,35 +2444,37 @@ def _(jax, json):
         best_alo,
         wait,
         inner_params,
+        writer=None,
+        keep=3,
     ):
-        tmp_path = path.with_suffix(path.suffix + ".tmp")
-        data = {
+        """Write an .npz checkpoint, on ``writer``'s thread when one is given.
+
+        The leaves are handed over as device arrays; the writer copies them
+        to the host, writes the file atomically, and keeps the ``keep``
+        latest iteration snapshots next to it.
+        """
+        header = {
             "model_spec": model_spec,
             "iter": int(iteration),
-            "hparams_leaves": [
-                to_serializable(x) for x in jax.tree_util.tree_leaves(hparams)
-            ],
-            "state_leaves": [
-                to_serializable(x) for x in jax.tree_util.tree_leaves(opt_state)
-            ],
-            "best_hparams_leaves": [
-                to_serializable(x) for x in jax.tree_util.tree_leaves(best_hparams)
-            ],
             "best_alo": float(best_alo),
             "wait": int(wait),
-            "inner_params_leaves": [
-                to_serializable(x) for x in jax.tree_util.tree_leaves(inner_params)
-            ],
         }
-        with open(tmp_path, "w") as f:
-            json.dump(data, f, indent=4)
-        tmp_path.replace(path)
+        groups = {
+            "hparams": jax.tree_util.tree_leaves(hparams),
+            "state": jax.tree_util.tree_leaves(opt_state),
+            "best_hparams": jax.tree_util.tree_leaves(best_hparams),
+            "inner_params": jax.tree_util.tree_leaves(inner_params),
+        }
+        if writer is None:
+            write_checkpoint(path, header, groups, keep=keep)
+        else:
+            writer.submit(path, header, groups, keep=keep)
 
     return (save_meta_checkpoint,)
 
 
 @app.cell
-def _(jax, jnp, json, restore_leaves):
+def _(jax, jnp, json, read_checkpoint, restore_leaves):
     def load_meta_checkpoint(
         path,
         *,
@@ -2126,13 +2483,23 @@ def _(jax, jnp, json, restore_leaves):
         state_template,
         inner_params_template,
     ):
-        with open(path, "r") as f:
-            chkpt = json.load(f)
-        if chkpt.get("model_spec") != expected_model_spec:
+        if path.suffix == ".json":
+            # Checkpoints written before the .npz format. A tuning run
+            # converts the one at its legacy path; any other can be passed as
+            # the source of create_restart_from_best_checkpoint.
+            with open(path, "r") as f:
+                header = json.load(f)
+            leaves = {
+                name: header[f"{name}_leaves"]
+                for name in ("hparams", "state", "best_hparams", "inner_params")
+            }
+        else:
+            header, leaves = read_checkpoint(path)
+        if header.get("model_spec") != expected_model_spec:
             raise ValueError(
                 f"Stale or incompatible checkpoint {path.name}: expected "
                 f"model_spec={expected_model_spec!r}, observed "
-                f"{chkpt.get('model_spec')!r}. Delete it or use a checkpoint "
+                f"{header.get('model_spec')!r}. Delete it or use a checkpoint "
                 "created by the current specification."
             )
 
@@ -2148,28 +2515,28 @@ def _(jax, jnp, json, restore_leaves):
 
         hparams = jax.tree_util.tree_unflatten(
             hparams_treedef,
-            restore_leaves(chkpt["hparams_leaves"], hparams_template_leaves),
+            restore_leaves(leaves["hparams"], hparams_template_leaves),
         )
         opt_state = jax.tree_util.tree_unflatten(
             state_treedef,
-            restore_leaves(chkpt["state_leaves"], state_template_leaves),
+            restore_leaves(leaves["state"], state_template_leaves),
         )
         best_hparams = jax.tree_util.tree_unflatten(
             hparams_treedef,
-            restore_leaves(chkpt["best_hparams_leaves"], hparams_template_leaves),
+            restore_leaves(leaves["best_hparams"], hparams_template_leaves),
         )
         inner_params = jax.tree_util.tree_unflatten(
             inner_treedef,
-            restore_leaves(chkpt["inner_params_leaves"], inner_template_leaves),
+            restore_leaves(leaves["inner_params"], inner_template_leaves),
         )
 
         return {
-            "iter": int(chkpt["iter"]),
+            "iter": int(header["iter"]),
             "hparams": hparams,
             "opt_state": opt_state,
             "best_hparams": best_hparams,
-            "best_alo": jnp.array(chkpt["best_alo"], dtype=jnp.float32),
-            "wait": jnp.array(chkpt["wait"], dtype=jnp.int32),
+            "best_alo": jnp.array(header["best_alo"], dtype=jnp.float32),
+            "wait": jnp.array(header["wait"], dtype=jnp.int32),
             "inner_params": inner_params,
         }
 
@@ -2399,25 +2766,157 @@ def _(mo):
     return
 
 
+@app.cell
+def _(CACHE, binary_path, code_path, os):
+    # Settings shared by the single-cutoff cells below and the cutoff sweep.
+    # H2A_JAX_EXPORT=1 serializes the meta loop per feature layout, so a resumed
+    # run skips tracing; the exported loop does not print per-step progress.
+    meta_tuning_settings = {
+        "outer_iters": 1000,
+        "patience": 50,
+        "chunk_size": 10,
+        "inner_iters": 500,
+        "inner_tol": 1e-4,
+        "alo_k": 2,
+        "alo_cg_rtol": 5e-2,
+        "alo_cg_atol": 5e-2,
+        "alo_cg_max_steps": 50,
+        "meta_lr": 0.01,
+        "clip_norm": 1.0,
+        "export_dir": (
+            CACHE / "jax" / "export"
+            if os.environ.get("H2A_JAX_EXPORT") == "1"
+            else None
+        ),
+    }
+    best_check_settings = {
+        "inner_iters": 1000,
+        "inner_tol": 1e-6,
+        "alo_k": 2,
+        "alo_cg_rtol": 1e-2,
+        "alo_cg_atol": 1e-2,
+        "alo_cg_max_steps": 150,
+    }
+
+    def cutoff_artifact_paths(cutoff):
+        """Tuning checkpoint, tuning log, and fitted-model paths for one cutoff.
+
+        Checkpoints get their own directory, next to their iteration snapshots.
+        """
+        return (
+            binary_path
+            / "meta_ppml_checkpoints"
+            / f"meta_ppml_opt_checkpoint_cutoff_{cutoff}.npz",
+            code_path / "json" / f"meta_ppml_opt_log_cutoff_{cutoff}.csv",
+            binary_path / f"h2a_prediction_elastic_net_model_cutoff_{cutoff}.parquet",
+        )
+
+    def legacy_cutoff_checkpoint_path(cutoff):
+        """JSON tuning checkpoint written for ``cutoff`` before the .npz format."""
+        return code_path / "json" / f"meta_ppml_opt_checkpoint_cutoff_{cutoff}.json"
+
+    return (
+        best_check_settings,
+        cutoff_artifact_paths,
+        legacy_cutoff_checkpoint_path,
+        meta_tuning_settings,
+    )
+
+
 @app.cell
 def _(
     bea,
     cat_cols,
-    climate,
     county_cont_cols,
-    cutoff_year,
-    h2a,
     np,
     patch_cont_cols,
     pl,
     prep_jax_composition_arrays,
     soil,
 ):
+    def prep_cutoff_arrays(h2a, climate, cutoff):
+        """Training arrays for the 2008-cutoff window, with input checks."""
+        (
+            feature_ids,
+            feature_sizes,
+            _feature_names,
+            categorical_feature_metadata,
+            parent_ids,
+            X_county_cont,
+            X_patch_cont,
+            patch_exposure,
+            group_ids,
+            y_target_count,
+            num_groups,
+            merged_df,
+            continuous_transforms,
+        ) = prep_jax_composition_arrays(
+            h2a,
+            bea,
+            soil,
+            climate,
+            county_cont_cols,
+            patch_cont_cols,
+            cat_cols,
+            max_order=3,
+        )
+        feature_sizes_tup = tuple(sorted(feature_sizes.items()))
+
+        training_year_min, training_year_max = merged_df.select(
+            pl.min("year").alias("year_min"),
+            pl.max("year").alias("year_max"),
+        ).row(0)
+        if training_year_min != 2008 or training_year_max != cutoff:
+            raise ValueError(
+                "Unexpected fitted-model training window: "
+                f"expected 2008-{cutoff}, observed "
+                f"{training_year_min}-{training_year_max}."
+            )
+        print(
+            f"Fitted-model training sample spans "
+            f"{training_year_min}-{training_year_max} (inclusive)."
+        )
+
+        # Check for any remaining NaNs or Infs
+        assert not np.isnan(y_target_count).any(), "NaNs detected in target count!"
+        assert not np.isinf(y_target_count).any(), "Infs detected in target count!"
+        print(f"Target Max Count: {np.max(y_target_count):.4f}")
+        print(f"Target Min Count: {np.min(y_target_count):.4f}")
+
+        # Check inheritance parent lookup
+        for order in sorted(k for k in feature_sizes if k > 1):
+            assert order in parent_ids, f"Missing parent_ids[{order}]"
+            assert int(parent_ids[order].min()) >= 0
+            assert int(parent_ids[order].max()) < feature_sizes[order - 1]
+            print(
+                f"Order {order}: parent_ids shape={parent_ids[order].shape}, "
+                f"max parent id={int(parent_ids[order].max())}, "
+                f"parent feature size={feature_sizes[order - 1]}"
+            )
+        return (
+            feature_ids,
+            feature_sizes_tup,
+            categorical_feature_metadata,
+            parent_ids,
+            X_county_cont,
+            X_patch_cont,
+            patch_exposure,
+            group_ids,
+            y_target_count,
+            num_groups,
+            merged_df,
+            continuous_transforms,
+        )
+
+    return (prep_cutoff_arrays,)
+
+
+@app.cell
+def _(climate, cutoff_year, h2a, prep_cutoff_arrays):
     # Prep input data
     (
         feature_ids,
-        feature_sizes,
-        _feature_names,
+        feature_sizes_tup,
         categorical_feature_metadata,
         parent_ids,
         X_county_cont,
@@ -2428,49 +2927,7 @@ def _(
         num_groups,
         merged_df,
         continuous_transforms,
-    ) = prep_jax_composition_arrays(
-        h2a,
-        bea,
-        soil,
-        climate,
-        county_cont_cols,
-        patch_cont_cols,
-        cat_cols,
-        max_order=3,
-    )
-    feature_sizes_tup = tuple(sorted(feature_sizes.items()))
-
-    _training_year_min, _training_year_max = merged_df.select(
-        pl.min("year").alias("year_min"),
-        pl.max("year").alias("year_max"),
-    ).row(0)
-    if _training_year_min != 2008 or _training_year_max != cutoff_year:
-        raise ValueError(
-            "Unexpected fitted-model training window: "
-            f"expected 2008-{cutoff_year}, observed "
-            f"{_training_year_min}-{_training_year_max}."
-        )
-    print(
-        f"Fitted-model training sample spans "
-        f"{_training_year_min}-{_training_year_max} (inclusive)."
-    )
-
-    # Check for any remaining NaNs or Infs
-    assert not np.isnan(y_target_count).any(), "NaNs detected in target count!"
-    assert not np.isinf(y_target_count).any(), "Infs detected in target count!"
-    print(f"Target Max Count: {np.max(y_target_count):.4f}")
-    print(f"Target Min Count: {np.min(y_target_count):.4f}")
-
-    # Check inheritance parent lookup
-    for order in sorted(k for k in feature_sizes if k > 1):
-        assert order in parent_ids, f"Missing parent_ids[{order}]"
-        assert int(parent_ids[order].min()) >= 0
-        assert int(parent_ids[order].max()) < feature_sizes[order - 1]
-        print(
-            f"Order {order}: parent_ids shape={parent_ids[order].shape}, "
-            f"max parent id={int(parent_ids[order].max())}, "
-            f"parent feature size={feature_sizes[order - 1]}"
-        )
+    ) = prep_cutoff_arrays(h2a, climate, cutoff_year)
     return (
         X_county_cont,
         X_patch_cont,
@@ -2491,11 +2948,13 @@ def _(
 def _(
     X_county_cont,
     X_patch_cont,
-    code_path,
+    cutoff_artifact_paths,
     cutoff_year,
     feature_ids,
     feature_sizes_tup,
     group_ids,
+    legacy_cutoff_checkpoint_path,
+    meta_tuning_settings,
     model_spec,
     num_groups,
     patch_exposure,
@@ -2505,10 +2964,7 @@ def _(
 ):
     start_time = time.perf_counter()
     # Tune L1 and L2 (full GPU dispatch)
-    checkpoint_path = (
-        code_path / "json" / f"meta_ppml_opt_checkpoint_cutoff_{cutoff_year}.json"
-    )
-    log_path = code_path / "json" / f"meta_ppml_opt_log_cutoff_{cutoff_year}.csv"
+    checkpoint_path, log_path, _ = cutoff_artifact_paths(cutoff_year)
     _best_l1, _best_l2, _final_inner_param = run_meta_optimization_chunked(
         feature_ids,
         X_county_cont,
@@ -2519,20 +2975,11 @@ def _(
         num_groups,
         feature_sizes_tup,
         model_spec=model_spec,
-        outer_iters=1000,
-        patience=50,
-        chunk_size=10,
-        inner_iters=500,
-        inner_tol=1e-4,
-        alo_k=2,
-        alo_cg_rtol=5e-2,
-        alo_cg_atol=5e-2,
-        alo_cg_max_steps=50,
         checkpoint_path=checkpoint_path,
         log_path=log_path,
-        meta_lr=0.01,
-        clip_norm=1.0,
+        legacy_checkpoint_path=legacy_cutoff_checkpoint_path(cutoff_year),
         reset=False,
+        **meta_tuning_settings,
     )
     return checkpoint_path, start_time
 
@@ -2556,6 +3003,7 @@ def _(mo):
 def _(
     X_county_cont,
     X_patch_cont,
+    best_check_settings,
     checkpoint_path,
     compute_alo_compositional,
     evaluate_checkpoint_best_hparams,
@@ -2565,6 +3013,7 @@ def _(
     initialize_params,
     jax_inv_softplus,
     make_meta_optimizer,
+    meta_tuning_settings,
     model_spec,
     num_groups,
     parent_ids,
@@ -2572,7 +3021,10 @@ def _(
     train_model_inner,
     y_target_count,
 ):
-    meta_optimizer = make_meta_optimizer(meta_lr=0.01, clip_norm=1.0)
+    meta_optimizer = make_meta_optimizer(
+        meta_lr=meta_tuning_settings["meta_lr"],
+        clip_norm=meta_tuning_settings["clip_norm"],
+    )
     alo_check, trained_params, _best_l1, _best_l2 = evaluate_checkpoint_best_hparams(
         checkpoint_path,
         model_spec=model_spec,
@@ -2590,12 +3042,7 @@ def _(
         num_groups=num_groups,
         feature_sizes_tup=feature_sizes_tup,
         jax_inv_softplus=jax_inv_softplus,
-        inner_iters=1000,
-        inner_tol=1e-6,
-        alo_k=2,
-        alo_cg_rtol=1e-2,
-        alo_cg_atol=1e-2,
-        alo_cg_max_steps=150,
+        **best_check_settings,
     )
     print("\n--- Model Estimation with Optimized Penalty Parameters ---")
     print(f"Best-check ALO-CV: {float(alo_check):.4f}")
@@ -2742,10 +3189,10 @@ def _(np, pl):
 
 @app.cell
 def _(
-    binary_path,
     categorical_feature_metadata,
     continuous_transforms,
     county_cont_cols,
+    cutoff_artifact_paths,
     cutoff_year,
     flatten_fitted_model,
     model_spec,
@@ -2762,9 +3209,7 @@ def _(
         cutoff_year,
         model_spec,
     )
-    model_parameters_path = (
-        binary_path / f"h2a_prediction_elastic_net_model_cutoff_{cutoff_year}.parquet"
-    )
+    _, _, model_parameters_path = cutoff_artifact_paths(cutoff_year)
     model_parameters_df.write_parquet(model_parameters_path)
     _coefficient_count = model_parameters_df.filter(
         pl.col("record_type").is_in(["global_bias", "weight"])
@@ -2776,6 +3221,121 @@ def _(
     return (model_parameters_path,)
 
 
+@app.cell
+def _(
+    best_check_settings,
+    checkpoint_path,
+    climate_panel,
+    compute_alo_compositional,
+    county_cont_cols,
+    cutoff_artifact_paths,
+    cutoff_years,
+    evaluate_checkpoint_best_hparams,
+    flatten_fitted_model,
+    h2a_panel,
+    initialize_params,
+    jax_inv_softplus,
+    legacy_cutoff_checkpoint_path,
+    make_meta_optimizer,
+    meta_tuning_settings,
+    model_parameters_path,
+    model_spec,
+    patch_cont_cols,
+    pl,
+    prep_cutoff_arrays,
+    run_meta_optimization_chunked,
+    time,
+    train_model_inner,
+    trained_params,
+):
+    # Remaining cutoffs of an H2A_CUTOFF_YEARS sweep. Training windows are
+    # nested, so each cutoff starts from the previous cutoff's best penalties
+    # and refit weights instead of from scratch. Checkpoints, logs, and fitted
+    # models keep their per-cutoff paths, so an interrupted sweep resumes. The
+    # first cutoff was fitted and written to model_parameters_path above.
+    _warm_start_path = checkpoint_path
+    _warm_start_params = trained_params
+    for _cutoff in cutoff_years[1:]:
+        _start = time.perf_counter()
+        print(f"\n=== Training window 2008-{_cutoff} ===")
+        (
+            _feature_ids,
+            _feature_sizes_tup,
+            _categorical_feature_metadata,
+            _parent_ids,
+            _X_county_cont,
+            _X_patch_cont,
+            _patch_exposure,
+            _group_ids,
+            _y_target_count,
+            _num_groups,
+            _merged_df,
+            _continuous_transforms,
+        ) = prep_cutoff_arrays(
+            h2a_panel.filter(pl.col("year") <= _cutoff),
+            climate_panel.filter(pl.col("year") <= _cutoff),
+            _cutoff,
+        )
+        _checkpoint_path, _log_path, _model_path = cutoff_artifact_paths(_cutoff)
+        run_meta_optimization_chunked(
+            _feature_ids,
+            _X_county_cont,
+            _X_patch_cont,
+            _patch_exposure,
+            _group_ids,
+            _y_target_count,
+            _num_groups,
+            _feature_sizes_tup,
+            model_spec=model_spec,
+            checkpoint_path=_checkpoint_path,
+            log_path=_log_path,
+            legacy_checkpoint_path=legacy_cutoff_checkpoint_path(_cutoff),
+            reset=False,
+            warm_start_path=_warm_start_path,
+            warm_start_params=_warm_start_params,
+            **meta_tuning_settings,
+        )
+        _alo, _params, _, _ = evaluate_checkpoint_best_hparams(
+            _checkpoint_path,
+            model_spec=model_spec,
+            meta_optimizer=make_meta_optimizer(
+                meta_lr=meta_tuning_settings["meta_lr"],
+                clip_norm=meta_tuning_settings["clip_norm"],
+            ),
+            initialize_params=initialize_params,
+            train_model_inner=train_model_inner,
+            compute_alo_compositional=compute_alo_compositional,
+            feature_ids=_feature_ids,
+            parent_ids=_parent_ids,
+            X_county_cont=_X_county_cont,
+            X_patch_cont=_X_patch_cont,
+            patch_exposure=_patch_exposure,
+            group_ids=_group_ids,
+            y_target_count=_y_target_count,
+            num_groups=_num_groups,
+            feature_sizes_tup=_feature_sizes_tup,
+            jax_inv_softplus=jax_inv_softplus,
+            **best_check_settings,
+        )
+        _model_df = flatten_fitted_model(
+            _params,
+            _categorical_feature_metadata,
+            _continuous_transforms,
+            county_cont_cols,
+            patch_cont_cols,
+            _cutoff,
+            model_spec,
+        )
+        _model_df.write_parquet(_model_path)
+        print(
+            f"Cutoff {_cutoff}: best-check ALO-CV {float(_alo):.4f}; saved "
+            f"{_model_path.name} in {time.perf_counter() - _start:.1f} seconds."
+        )
+        _warm_start_path = _checkpoint_path
+        _warm_start_params = _params
+    return
+
+
 @app.cell(hide_code=True)
 def _(mo):
     mo.md(r"""
@@ -16,8 +16,18 @@ def _():
 
     from h2a.geography import assert_geo_columns
     from h2a.paths import INTERMEDIATE
+    from h2a.prediction_scoring import categorical_design, pack_weights, score_cutoffs
 
-    return INTERMEDIATE, assert_geo_columns, mo, np, pl
+    return (
+        INTERMEDIATE,
+        assert_geo_columns,
+        categorical_design,
+        mo,
+        np,
+        pack_weights,
+        pl,
+        score_cutoffs,
+    )
 
 
 @app.cell(hide_code=True)
@@ -511,7 +521,7 @@ def _(np, pl):
 
 
 @app.cell
-def _(np, pl):
+def _(categorical_design, np, pack_weights, pl, score_cutoffs):
     def apply_saved_transforms(frame, scope, covariates, transform_rows):
         transform_lookup = {
             (row["covariate_scope"], row["covariate"]): row
@@ -535,12 +545,26 @@ def _(np, pl):
 
         return values
 
-    def score_saved_model(
-        cutoff_year,
+    def transform_arrays(scope, covariates, transform_rows):
+        transform_lookup = {
+            (row["covariate_scope"], row["covariate"]): row
+            for row in transform_rows.iter_rows(named=True)
+        }
+        return np.array(
+            [
+                [
+                    transform_lookup[(scope, covariate)][field]
+                    for covariate in covariates
+                ]
+                for field in ("imputation_value", "center", "scale")
+            ],
+            dtype=np.float32,
+        )
+
+    def score_saved_models(
+        cutoff_years,
         model_spec,
-        bias,
-        weight_matrices,
-        transforms,
+        models,
         feature_ids,
         county_scoring,
         soil_scoring,
@@ -548,84 +572,86 @@ def _(np, pl):
         patch_covariates,
         chunk_size=50_000,
     ):
-        X_county = apply_saved_transforms(
-            county_scoring, "county", county_covariates, transforms
+        # Every cutoff is scored in the same pass over the soil patches.
+        X_county = np.stack(
+            [
+                apply_saved_transforms(
+                    county_scoring, "county", county_covariates, transforms
+                )
+                for _, _, transforms in models
+            ]
         )
-        X_patch = apply_saved_transforms(
-            soil_scoring, "patch", patch_covariates, transforms
+        patch_values = soil_scoring.select(patch_covariates).to_numpy()
+        patch_values = patch_values.astype(np.float32)
+        for column_index, covariate in enumerate(patch_covariates):
+            if np.isinf(patch_values[:, column_index]).any():
+                raise ValueError(
+                    f"Non-finite scoring value for patch covariate {covariate!r}."
+                )
+        weight_matrices = [matrices for _, matrices, _ in models]
+        design = categorical_design(
+            feature_ids,
+            {order: matrix.shape[0] for order, matrix in weight_matrices[0].items()},
+        )
+        predicted_counts = score_cutoffs(
+            design,
+            pack_weights(weight_matrices),
+            np.array([bias for bias, _, _ in models], dtype=np.float32),
+            X_county,
+            patch_values,
+            np.stack(
+                [
+                    transform_arrays("patch", patch_covariates, transforms)
+                    for _, _, transforms in models
+                ]
+            ),
+            soil_scoring["_county_index"].to_numpy().astype(np.int64),
+            soil_scoring["_patch_exposure"].to_numpy().astype(np.float32),
+            chunk_size=chunk_size,
         )
-        county_index = soil_scoring["_county_index"].to_numpy().astype(np.int32)
-        patch_exposure = soil_scoring["_patch_exposure"].to_numpy().astype(np.float32)
-        predicted_count = np.zeros(county_scoring.height, dtype=np.float32)
-        county_width = len(county_covariates)
-
-        for chunk_start in range(0, soil_scoring.height, chunk_size):
-            chunk_end = min(chunk_start + chunk_size, soil_scoring.height)
-            chunk = slice(chunk_start, chunk_end)
-            chunk_count = chunk_end - chunk_start
-            patch_log_rate = np.full(chunk_count, bias, dtype=np.float32)
-            county_slopes = np.zeros((chunk_count, county_width), dtype=np.float32)
-
-            for order in sorted(weight_matrices):
-                matrix = weight_matrices[order]
-                ids_for_order = feature_ids[order][chunk]
-                for combo_index in range(ids_for_order.shape[1]):
-                    gathered = matrix[ids_for_order[:, combo_index]]
-                    patch_log_rate += gathered[:, 0]
-                    county_slopes += gathered[:, 1 : 1 + county_width]
-                    patch_log_rate += np.sum(
-                        gathered[:, 1 + county_width :] * X_patch[chunk],
-                        axis=1,
-                        dtype=np.float32,
-                    )
-
-            chunk_county_index = county_index[chunk]
-            log_rate = patch_log_rate + np.sum(
-                county_slopes * X_county[chunk_county_index],
-                axis=1,
-                dtype=np.float32,
-            )
-            np.minimum(log_rate, np.float32(15.0), out=log_rate)
-            predicted_patch_count = patch_exposure[chunk] * np.exp(log_rate)
-            np.add.at(predicted_count, chunk_county_index, predicted_patch_count)
 
-        if not np.isfinite(predicted_count).all() or (predicted_count < 0).any():
-            raise ValueError(
-                f"Cutoff-{cutoff_year} predictions must be finite and nonnegative."
-            )
+        results = []
+        for cutoff_year, predicted_count in zip(
+            cutoff_years, predicted_counts, strict=True
+        ):
+            if not np.isfinite(predicted_count).all() or (predicted_count < 0).any():
+                raise ValueError(
+                    f"Cutoff-{cutoff_year} predictions must be finite and nonnegative."
+                )
 
-        result = (
-            county_scoring.select("county_fips", "bea_farm_emp_2011")
-            .with_columns(
-                pl.lit(cutoff_year, dtype=pl.Int32).alias("cutoff_year"),
-                pl.lit(model_spec).alias("model_spec"),
-                pl.Series("predicted_h2a_count", predicted_count),
-            )
-            .with_columns(
-                (pl.col("predicted_h2a_count") / pl.col("bea_farm_emp_2011"))
-                .cast(pl.Float32)
-                .alias("predicted_h2a_share_2011")
-            )
-            .select(
-                "cutoff_year",
-                "model_spec",
-                "county_fips",
-                "predicted_h2a_count",
-                "bea_farm_emp_2011",
-                "predicted_h2a_share_2011",
+            result = (
+                county_scoring.select("county_fips", "bea_farm_emp_2011")
+                .with_columns(
+                    pl.lit(cutoff_year, dtype=pl.Int32).alias("cutoff_year"),
+                    pl.lit(model_spec).alias("model_spec"),
+                    pl.Series("predicted_h2a_count", predicted_count),
+                )
+                .with_columns(
+                    (pl.col("predicted_h2a_count") / pl.col("bea_farm_emp_2011"))
+                    .cast(pl.Float32)
+                    .alias("predicted_h2a_share_2011")
+                )
+                .select(
+                    "cutoff_year",
+                    "model_spec",
+                    "county_fips",
+                    "predicted_h2a_count",
+                    "bea_farm_emp_2011",
+                    "predicted_h2a_share_2011",
+                )
             )
-        )
-        if not np.allclose(
-            result["predicted_h2a_share_2011"].to_numpy(),
-            result["predicted_h2a_count"].to_numpy()
-            / result["bea_farm_emp_2011"].to_numpy(),
-            rtol=2e-6,
-            atol=2e-7,
-        ):
-            raise ValueError("Predicted H-2A share normalization is inconsistent.")
-        return result
+            if not np.allclose(
+                result["predicted_h2a_share_2011"].to_numpy(),
+                result["predicted_h2a_count"].to_numpy()
+                / result["bea_farm_emp_2011"].to_numpy(),
+                rtol=2e-6,
+                atol=2e-7,
+            ):
+                raise ValueError("Predicted H-2A share normalization is inconsistent.")
+            results.append(result)
+        return results
 
-    return (score_saved_model,)
+    return (score_saved_models,)
 
 
 @app.cell
@@ -644,14 +670,12 @@ def _(
     pl,
     reference_categorical_metadata,
     reference_transforms,
-    score_saved_model,
+    score_saved_models,
     soil_scoring,
 ):
     feature_ids = build_feature_ids(soil_scoring, reference_categorical_metadata)
-    prediction_frames = []
-
-    for cutoff_year, model_path in zip(model_cutoff_years, model_paths, strict=True):
-        bias, weight_matrices, transforms = load_saved_model(
+    saved_models = [
+        load_saved_model(
             model_path,
             cutoff_year,
             model_spec,
@@ -661,19 +685,22 @@ def _(
             county_covariates,
             patch_covariates,
         )
-        cutoff_predictions = score_saved_model(
-            cutoff_year,
-            model_spec,
-            bias,
-            weight_matrices,
-            transforms,
-            feature_ids,
-            county_scoring,
-            soil_scoring,
-            county_covariates,
-            patch_covariates,
-        )
-        prediction_frames.append(cutoff_predictions)
+        for cutoff_year, model_path in zip(model_cutoff_years, model_paths, strict=True)
+    ]
+    prediction_frames = score_saved_models(
+        model_cutoff_years,
+        model_spec,
+        saved_models,
+        feature_ids,
+        county_scoring,
+        soil_scoring,
+        county_covariates,
+        patch_covariates,
+    )
+
+    for cutoff_year, cutoff_predictions in zip(
+        model_cutoff_years, prediction_frames, strict=True
+    ):
         print(
             f"Scored cutoff {cutoff_year}: "
             f"{cutoff_predictions.height:,} counties, predicted count range "
@@ -0,0 +1,123 @@
+"""Micro-benchmark the nested fixed-effect annihilator against ``np.add.at``.
+
+Run from the repository root, for example::
+
+    python code/designs/mundlak_chamberlain/benchmarks/within_projector.py \
+        --counties 3000 --columns 400
+
+The reference is the original scatter-add implementation. Every timed kernel
+is checked against it before timings are printed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+BRANCH_DIR = Path(__file__).resolve().parents[1]
+if str(BRANCH_DIR) not in sys.path:
+    sys.path.insert(0, str(BRANCH_DIR))
+
+from mcw.fwl import WITHIN_BLOCK_COLUMNS, NestedFixedEffectProjector
+
+
+def add_at_within(
+    projector: NestedFixedEffectProjector, matrix: np.ndarray
+) -> np.ndarray:
+    """The original scatter-add annihilator, also the oracle in ``tests``."""
+
+    width = matrix.shape[1]
+    parent_year_codes = (
+        projector.parent_codes * projector.n_years + projector.year_codes
+    )
+    unit_sums = np.zeros((projector.n_units, width))
+    np.add.at(unit_sums, projector.unit_codes, matrix)
+    parent_year_sums = np.zeros((projector.n_parents * projector.n_years, width))
+    np.add.at(parent_year_sums, parent_year_codes, matrix)
+    parent_sums = np.zeros((projector.n_parents, width))
+    np.add.at(parent_sums, projector.parent_codes, matrix)
+    parent_year_counts = np.repeat(projector.units_per_parent, projector.n_years)
+    return (
+        matrix
+        - (unit_sums / projector.n_years)[projector.unit_codes]
+        - (parent_year_sums / parent_year_counts[:, None])[parent_year_codes]
+        + (parent_sums / (projector.units_per_parent[:, None] * projector.n_years))[
+            projector.parent_codes
+        ]
+    )
+
+
+def _best_seconds(function: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counties", type=int, default=3000)
+    parser.add_argument("--years", type=int, default=11)
+    parser.add_argument("--parents", type=int, default=50)
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(20260901)
+    unit = np.repeat(np.arange(arguments.counties), arguments.years)
+    year = np.tile(np.arange(arguments.years), arguments.counties)
+    parent = unit % arguments.parents
+    matrix = rng.normal(size=(unit.size, arguments.columns))
+    order = rng.permutation(unit.size)
+    sorted_projector = NestedFixedEffectProjector.from_arrays(
+        np.char.zfill(unit.astype(str), 5), year, parent
+    )
+    shuffled_projector = NestedFixedEffectProjector.from_arrays(
+        np.char.zfill(unit[order].astype(str), 5), year[order], parent[order]
+    )
+    shuffled = matrix[order]
+    reference = add_at_within(sorted_projector, matrix)
+    scratch = np.empty_like(matrix)
+
+    def in_place() -> np.ndarray:
+        np.copyto(scratch, matrix)
+        return sorted_projector.within(
+            scratch, out=scratch, block_columns=WITHIN_BLOCK_COLUMNS
+        )
+
+    cases: dict[str, tuple[Callable[[], np.ndarray], np.ndarray]] = {
+        "np.add.at reference": (
+            lambda: add_at_within(sorted_projector, matrix),
+            reference,
+        ),
+        "sorted reshape": (lambda: sorted_projector.within(matrix), reference),
+        f"sorted in place, {WITHIN_BLOCK_COLUMNS}-column blocks": (
+            in_place,
+            reference,
+        ),
+        "unsorted sparse indicator": (
+            lambda: shuffled_projector.within(shuffled),
+            reference[order],
+        ),
+    }
+    print(
+        f"N={unit.size:,} rows, K={arguments.columns:,} columns, "
+        f"{arguments.parents} parents; best of {arguments.repeat}."
+    )
+    baseline = None
+    for label, (function, expected) in cases.items():
+        np.testing.assert_allclose(function(), expected, atol=1e-10)
+        seconds = _best_seconds(function, arguments.repeat)
+        baseline = seconds if baseline is None else baseline
+        print(f"{label:>40}: {seconds:8.4f} s  ({baseline / seconds:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -201,6 +201,8 @@ INFERENCE_METHODS: Final = (
     "hc3_full_model_leverage",
     "cr0_cluster_sandwich",
     "cr1_cluster_sandwich",
+    "cr2_bell_mccaffrey_cluster_sandwich",
+    "cv3_cluster_jackknife",
     "ccv_hc3_scalar_mixture_experimental",
     "ccv_hc3_cr1_scalar_mixture_experimental",
     "hc3_full_model_leverage_joint_delta",
@@ -9,13 +9,22 @@ leverage required by HC3.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from typing import Protocol
 
 import numpy as np
 import scipy.linalg
+import scipy.linalg.blas
+import scipy.linalg.lapack
+import scipy.sparse
 
-from .resources import guard_fit_working_set
+from .resources import STREAMING_BLOCK_ROWS, guard_fit_working_set
+
+# Columns residualized per pass, bounding projector temporaries to N x 64.
+WITHIN_BLOCK_COLUMNS = 64
+# Relative gap below which two nuisance pivots are a tie, kept in column order.
+PIVOT_TIE_TOLERANCE = 1e-8
 
 
 def _as_2d(values: np.ndarray) -> tuple[np.ndarray, bool]:
@@ -42,10 +51,28 @@ class OLSProjector(Protocol):
     @property
     def rank(self) -> int: ...
 
-    def within(self, values: np.ndarray) -> np.ndarray: ...
+    def within(
+        self,
+        values: np.ndarray,
+        *,
+        out: np.ndarray | None = None,
+        block_columns: int | None = None,
+    ) -> np.ndarray: ...
+
+    def group_means(self, values: np.ndarray) -> tuple[np.ndarray, ...]: ...
+
+    def within_rows(
+        self,
+        block: np.ndarray,
+        means: tuple[np.ndarray, ...],
+        rows: slice,
+        columns: np.ndarray | None = None,
+    ) -> np.ndarray: ...
 
     def leverage_diagonal(self) -> np.ndarray: ...
 
+    def hat_terms(self) -> tuple[tuple[np.ndarray, np.ndarray], ...]: ...
+
 
 @dataclass(frozen=True, slots=True)
 class NoFixedEffectProjector:
@@ -76,19 +103,49 @@ class NoFixedEffectProjector:
     def rank(self) -> int:
         return 0
 
-    def within(self, values: np.ndarray) -> np.ndarray:
+    def within(
+        self,
+        values: np.ndarray,
+        *,
+        out: np.ndarray | None = None,
+        block_columns: int | None = None,
+    ) -> np.ndarray:
         """Return values unchanged after enforcing the declared row count."""
 
         matrix, was_vector = _as_2d(values)
         if matrix.shape[0] != self.n_rows:
             raise ValueError("Matrix row count does not match pooled design.")
+        if out is not None:
+            np.copyto(out, matrix[:, 0] if was_vector else matrix)
+            return out
         return matrix[:, 0] if was_vector else matrix
 
+    def group_means(self, values: np.ndarray) -> tuple[np.ndarray, ...]:
+        """Return no means because this backend absorbs no columns."""
+
+        return ()
+
+    def within_rows(
+        self,
+        block: np.ndarray,
+        means: tuple[np.ndarray, ...],
+        rows: slice,
+        columns: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Return a float64 copy of one row block."""
+
+        return np.array(_as_2d(block)[0], dtype=np.float64)
+
     def leverage_diagonal(self) -> np.ndarray:
         """Return zero because this backend absorbs no columns."""
 
         return np.zeros(self.n_rows, dtype=np.float64)
 
+    def hat_terms(self) -> tuple[tuple[np.ndarray, np.ndarray], ...]:
+        """Return no indicator terms because this backend absorbs no columns."""
+
+        return ()
+
 
 @dataclass(frozen=True, slots=True)
 class NestedFixedEffectProjector:
@@ -101,6 +158,8 @@ class NestedFixedEffectProjector:
     parent_levels: np.ndarray
     year_levels: np.ndarray
     units_per_parent: np.ndarray
+    unit_parents: np.ndarray
+    unit_year_layout: bool
 
     @classmethod
     def from_arrays(
@@ -156,6 +215,11 @@ class NestedFixedEffectProjector:
                 "Every parent component must contain the same counties in every year."
             )
 
+        # Rows sorted by unit and then year, as in every version-4 sample, let
+        # group sums run as reshapes of a (units, years, columns) array.
+        unit_year_layout = bool(
+            np.array_equal(combined, np.arange(unit.size, dtype=np.int64))
+        )
         return cls(
             unit_codes=unit_codes,
             parent_codes=parent_codes,
@@ -164,6 +228,8 @@ class NestedFixedEffectProjector:
             parent_levels=parent_levels,
             year_levels=year_levels,
             units_per_parent=units_per_parent,
+            unit_parents=unit_parent_min,
+            unit_year_layout=unit_year_layout,
         )
 
     @property
@@ -186,37 +252,133 @@ class NestedFixedEffectProjector:
     def rank(self) -> int:
         return self.n_units + self.n_parents * (self.n_years - 1)
 
-    def within(self, values: np.ndarray) -> np.ndarray:
-        """Apply the exact annihilator for county and parent-by-year FEs."""
+    def _parent_indicator(self, codes: np.ndarray) -> scipy.sparse.csr_array:
+        return scipy.sparse.csr_array(
+            (np.ones(codes.size), (codes, np.arange(codes.size))),
+            shape=(self.n_parents, codes.size),
+        )
 
-        matrix, was_vector = _as_2d(values)
+    def group_means(
+        self, values: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return unit, parent-by-year, and parent means of each column.
+
+        The shapes are ``(units, K)``, ``(parents, years, K)``, and
+        ``(parents, K)``; :meth:`within_rows` expands them for any row block.
+        """
+
+        matrix, _ = _as_2d(values)
         if matrix.shape[0] != self.n_rows:
             raise ValueError("Matrix row count does not match fixed-effect panel.")
         width = matrix.shape[1]
+        if self.unit_year_layout:
+            cube = matrix.reshape(self.n_units, self.n_years, width)
+            unit_means = cube.mean(axis=1)
+            if self.n_parents == 1:
+                parent_year_sums = cube.sum(axis=0)[None]
+            else:
+                parent_year_sums = (
+                    self._parent_indicator(self.unit_parents)
+                    @ cube.reshape(self.n_units, self.n_years * width)
+                ).reshape(self.n_parents, self.n_years, width)
+        else:
+            unit_indicator = scipy.sparse.csr_array(
+                (np.ones(self.n_rows), (self.unit_codes, np.arange(self.n_rows))),
+                shape=(self.n_units, self.n_rows),
+            )
+            unit_means = (unit_indicator @ matrix) / self.n_years
+            parent_year_indicator = scipy.sparse.csr_array(
+                (
+                    np.ones(self.n_rows),
+                    (
+                        self.parent_codes * self.n_years + self.year_codes,
+                        np.arange(self.n_rows),
+                    ),
+                ),
+                shape=(self.n_parents * self.n_years, self.n_rows),
+            )
+            parent_year_sums = (parent_year_indicator @ matrix).reshape(
+                self.n_parents, self.n_years, width
+            )
+        parent_year_means = parent_year_sums / self.units_per_parent[:, None, None]
+        return unit_means, parent_year_means, parent_year_means.mean(axis=1)
+
+    def within_rows(
+        self,
+        block: np.ndarray,
+        means: tuple[np.ndarray, ...],
+        rows: slice,
+        columns: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Residualize the raw values of ``rows`` using :meth:`group_means`.
+
+        ``block`` holds only those rows, restricted to ``columns`` of the
+        matrix the means were taken from.
+        """
+
+        unit_means, parent_year_means, parent_means = means
+        index = slice(None) if columns is None else columns
+        parents = self.parent_codes[rows]
+        result = np.array(_as_2d(block)[0], dtype=np.float64)
+        result -= unit_means[self.unit_codes[rows]][:, index]
+        result -= parent_year_means[parents, self.year_codes[rows]][:, index]
+        result += parent_means[parents][:, index]
+        return result
+
+    def _within_unit_year(self, block: np.ndarray, out: np.ndarray) -> None:
+        unit_means, parent_year_means, parent_means = self.group_means(block)
+        cube = block.reshape(self.n_units, self.n_years, block.shape[1])
+        result = out.reshape(cube.shape)
+        np.subtract(cube, unit_means[:, None, :], out=result)
+        result -= parent_year_means[self.unit_parents]
+        result += parent_means[self.unit_parents][:, None, :]
+
+    def _within_indexed(self, block: np.ndarray, out: np.ndarray) -> None:
+        means = self.group_means(block)
+        out[...] = self.within_rows(block, means, slice(None))
+
+    def within(
+        self,
+        values: np.ndarray,
+        *,
+        out: np.ndarray | None = None,
+        block_columns: int | None = None,
+    ) -> np.ndarray:
+        """Apply the exact annihilator for county and parent-by-year FEs.
+
+        Group sums are reshapes on a unit-by-year sorted panel and sparse
+        indicator products otherwise.  ``out`` may be ``values`` itself, and
+        ``block_columns`` bounds the temporaries to ``N x block_columns``, so a
+        wide dictionary can be residualized in place.
+        """
 
-        unit_sums = np.zeros((self.n_units, width), dtype=np.float64)
-        np.add.at(unit_sums, self.unit_codes, matrix)
-        unit_means = unit_sums / self.n_years
-
-        parent_year_codes = self.parent_codes * self.n_years + self.year_codes
-        parent_year_sums = np.zeros(
-            (self.n_parents * self.n_years, width), dtype=np.float64
-        )
-        np.add.at(parent_year_sums, parent_year_codes, matrix)
-        parent_year_counts = np.repeat(self.units_per_parent, self.n_years)
-        parent_year_means = parent_year_sums / parent_year_counts[:, None]
-
-        parent_sums = np.zeros((self.n_parents, width), dtype=np.float64)
-        np.add.at(parent_sums, self.parent_codes, matrix)
-        parent_means = parent_sums / (self.units_per_parent[:, None] * self.n_years)
-
-        result = (
-            matrix
-            - unit_means[self.unit_codes]
-            - parent_year_means[parent_year_codes]
-            + parent_means[self.parent_codes]
+        matrix, was_vector = _as_2d(values)
+        if matrix.shape[0] != self.n_rows:
+            raise ValueError("Matrix row count does not match fixed-effect panel.")
+        width = matrix.shape[1]
+        if out is None:
+            out = np.empty((self.n_rows, width), dtype=np.float64)
+        elif out.ndim == 1:
+            out = out[:, None]
+        if out.shape != matrix.shape or out.dtype != np.float64:
+            raise ValueError("Output must be a float64 array shaped like the input.")
+        step = max(width, 1) if block_columns is None else int(block_columns)
+        if step < 1:
+            raise ValueError("Column block width must be positive.")
+        kernel = (
+            self._within_unit_year if self.unit_year_layout else self._within_indexed
         )
-        return result[:, 0] if was_vector else result
+        for start in range(0, width, step):
+            columns = slice(start, min(start + step, width))
+            block = np.ascontiguousarray(matrix[:, columns])
+            result = out[:, columns]
+            if result.flags.c_contiguous:
+                kernel(block, result)
+            else:
+                staged = np.empty_like(block)
+                kernel(block, staged)
+                result[...] = staged
+        return out[:, 0] if was_vector else out
 
     def leverage_diagonal(self) -> np.ndarray:
         """Return diag(P_FE), including both absorbed fixed-effect sets."""
@@ -225,6 +387,24 @@ class NestedFixedEffectProjector:
         years = float(self.n_years)
         return 1.0 / years + 1.0 / parent_size - 1.0 / (years * parent_size)
 
+    def hat_terms(self) -> tuple[tuple[np.ndarray, np.ndarray], ...]:
+        """Return ``P_FE`` as weighted group indicators ``sum_k S_k W_k S_k'``.
+
+        Each term is ``(row group codes, one weight per group)``: unit means,
+        parent-by-year means, and the subtracted parent means.
+        """
+
+        years = float(self.n_years)
+        parent_size = self.units_per_parent.astype(np.float64)
+        return (
+            (self.unit_codes, np.full(self.n_units, 1.0 / years)),
+            (
+                self.parent_codes * self.n_years + self.year_codes,
+                np.repeat(1.0 / parent_size, self.n_years),
+            ),
+            (self.parent_codes, -1.0 / (years * parent_size)),
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class SelectedDesign:
@@ -235,6 +415,14 @@ class SelectedDesign:
     dropped_nuisance_names: tuple[str, ...]
 
 
+def _absorbed_columns(raw_norm: np.ndarray, within_norm: np.ndarray) -> np.ndarray:
+    """Mask columns whose within norm is rounding residue of their raw norm."""
+
+    return (raw_norm == 0.0) | (
+        within_norm <= 1e-12 * np.maximum(raw_norm, np.finfo(float).tiny)
+    )
+
+
 def _rank_from_qr(diagonal: np.ndarray, n_rows: int, n_cols: int) -> int:
     if diagonal.size == 0:
         return 0
@@ -242,22 +430,18 @@ def _rank_from_qr(diagonal: np.ndarray, n_rows: int, n_cols: int) -> int:
     return int(np.count_nonzero(diagonal > threshold))
 
 
-def causal_first_full_rank_design(
+def _causal_first_selection(
     causal: np.ndarray,
     nuisance: np.ndarray,
     causal_names: tuple[str, ...],
-    nuisance_names: tuple[str, ...],
-) -> SelectedDesign:
-    """Keep all named causal columns, then a maximal nuisance complement."""
+    n_rows: int,
+) -> tuple[int, ...]:
+    """Return nuisance indices completing a full-rank causal-first design.
 
-    causal, _ = _as_2d(causal)
-    nuisance, _ = _as_2d(nuisance)
-    if causal.shape[0] != nuisance.shape[0]:
-        raise ValueError("Causal and nuisance matrices must share rows.")
-    if causal.shape[1] != len(causal_names):
-        raise ValueError("Causal name count does not match matrix width.")
-    if nuisance.shape[1] != len(nuisance_names):
-        raise ValueError("Nuisance name count does not match matrix width.")
+    ``causal`` and ``nuisance`` may be coordinates in any orthonormal basis of
+    the design's column space; ``n_rows`` is the panel length used by the
+    rank threshold.
+    """
 
     causal_norm = np.linalg.norm(causal, axis=0)
     zero_causal = [
@@ -269,61 +453,241 @@ def causal_first_full_rank_design(
     q_causal, r_causal, _ = scipy.linalg.qr(
         causal_scaled, mode="economic", pivoting=True, check_finite=False
     )
-    causal_rank = _rank_from_qr(
-        np.abs(np.diag(r_causal)), causal.shape[0], causal.shape[1]
-    )
+    causal_rank = _rank_from_qr(np.abs(np.diag(r_causal)), n_rows, causal.shape[1])
     if causal_rank != causal.shape[1]:
         raise ValueError(
             f"Named causal block has rank {causal_rank} for "
             f"{causal.shape[1]} coordinates; no causal term was dropped."
         )
-
     if nuisance.shape[1] == 0:
-        return SelectedDesign(
-            matrix=causal,
-            names=causal_names,
-            causal_count=causal.shape[1],
-            selected_nuisance_indices=(),
-            dropped_nuisance_names=(),
-        )
+        return ()
+    return _pivoted_complement(q_causal, nuisance, n_rows)
+
+
+def _pivoted_complement(
+    basis: np.ndarray, candidates: np.ndarray, n_rows: int
+) -> tuple[int, ...]:
+    """Return candidate columns, in pivot order, that extend an orthonormal basis.
+
+    Each step keeps the column farthest from the span of ``basis`` and the
+    columns kept so far, relative to its own norm, until no distance exceeds
+    the QR rank tolerance.  Distances within ``PIVOT_TIE_TOLERANCE`` of the
+    largest are ties and go to the earliest column.  A LAPACK column-pivoted
+    QR resolves those ties by rounding, starting with its first pivot among
+    unit-norm columns, so its choice among exactly collinear columns changes
+    with the projector kernel, row order, or accumulation order.
+    """
 
-    nuisance_orthogonal = nuisance - q_causal @ (q_causal.T @ nuisance)
-    nuisance_norm = np.linalg.norm(nuisance_orthogonal, axis=0)
-    nonzero = np.flatnonzero(nuisance_norm > 0)
-    if nonzero.size:
-        normalized = nuisance_orthogonal[:, nonzero] / nuisance_norm[nonzero]
-        _, r_nuisance, pivot = scipy.linalg.qr(
-            normalized, mode="economic", pivoting=True, check_finite=False
-        )
-        nuisance_rank = _rank_from_qr(
-            np.abs(np.diag(r_nuisance)), normalized.shape[0], normalized.shape[1]
-        )
-        selected = tuple(int(nonzero[index]) for index in pivot[:nuisance_rank])
-    else:
-        selected = ()
+    tolerance = max(n_rows, candidates.shape[1]) * np.finfo(np.float64).eps
+    norms = np.linalg.norm(candidates, axis=0)
+    order = np.flatnonzero(norms > 0)
+    norms = norms[order]
+    work = np.asfortranarray(candidates[:, order])
+    for _ in range(2):
+        work -= basis @ (basis.T @ work)
+    # Squared distances are downdated after each pivot and recomputed where
+    # they lost precision or decide the pivot, as LAPACK's xGEQP3 does.
+    squared = np.einsum("ij,ij->j", work, work) / np.square(norms)
+    exact = squared.copy()
+    vectors = np.empty((work.shape[0], basis.shape[1] + order.size))
+    vectors[:, : basis.shape[1]] = basis
+    count = basis.shape[1]
+    kept: list[int] = []
+    active = order.size
+    while active:
+        near = np.flatnonzero(squared[:active] >= squared[:active].max() * (1 - 1e-4))
+        squared[near] = np.einsum("ij,ij->j", work[:, near], work[:, near])
+        squared[near] /= np.square(norms[near])
+        exact[near] = squared[near]
+        largest = float(squared[near].max())
+        if np.sqrt(largest) <= tolerance:
+            break
+        tied = near[squared[near] >= largest * (1.0 - PIVOT_TIE_TOLERANCE) ** 2]
+        position = int(tied[np.argmin(order[tied])])
+        vector = work[:, position].copy()
+        vector -= vectors[:, :count] @ (vectors[:, :count].T @ vector)
+        vector /= np.linalg.norm(vector)
+        vectors[:, count] = vector
+        count += 1
+        kept.append(int(order[position]))
+
+        active -= 1
+        for array in (order, norms, squared, exact):
+            array[position] = array[active]
+        work[:, position] = work[:, active]
+        if not active:
+            break
+        remaining = work[:, :active]
+        loading = vector @ remaining
+        scipy.linalg.blas.dger(-1.0, vector, loading, a=remaining, overwrite_a=True)
+        squared[:active] -= np.square(loading / norms[:active])
+        stale = np.flatnonzero(squared[:active] < 1e-4 * exact[:active])
+        if stale.size:
+            squared[stale] = np.einsum("ij,ij->j", work[:, stale], work[:, stale])
+            squared[stale] /= np.square(norms[stale])
+            exact[stale] = squared[stale]
+    return tuple(kept)
+
+
+def _selected_design(
+    causal: np.ndarray,
+    nuisance: np.ndarray,
+    causal_names: tuple[str, ...],
+    nuisance_names: tuple[str, ...],
+    selected: tuple[int, ...],
+) -> SelectedDesign:
     selected_set = set(selected)
     dropped = tuple(
         name for index, name in enumerate(nuisance_names) if index not in selected_set
     )
-    matrix = np.column_stack((causal, nuisance[:, selected]))
-    names = causal_names + tuple(nuisance_names[index] for index in selected)
     return SelectedDesign(
-        matrix=matrix,
-        names=names,
+        matrix=np.column_stack((causal, nuisance[:, selected])),
+        names=causal_names + tuple(nuisance_names[index] for index in selected),
         causal_count=causal.shape[1],
         selected_nuisance_indices=selected,
         dropped_nuisance_names=dropped,
     )
 
 
+def causal_first_full_rank_design(
+    causal: np.ndarray,
+    nuisance: np.ndarray,
+    causal_names: tuple[str, ...],
+    nuisance_names: tuple[str, ...],
+) -> SelectedDesign:
+    """Keep all named causal columns, then a maximal nuisance complement."""
+
+    causal, _ = _as_2d(causal)
+    nuisance, _ = _as_2d(nuisance)
+    if causal.shape[0] != nuisance.shape[0]:
+        raise ValueError("Causal and nuisance matrices must share rows.")
+    if causal.shape[1] != len(causal_names):
+        raise ValueError("Causal name count does not match matrix width.")
+    if nuisance.shape[1] != len(nuisance_names):
+        raise ValueError("Nuisance name count does not match matrix width.")
+    selected = _causal_first_selection(causal, nuisance, causal_names, causal.shape[0])
+    return _selected_design(causal, nuisance, causal_names, nuisance_names, selected)
+
+
+@dataclass(frozen=True, slots=True)
+class WithinNuisance:
+    """A fixed-effect set's nuisance dictionary, residualized and factored once.
+
+    ``within`` equals ``basis @ coordinates`` to working precision, where
+    ``basis`` is an orthonormal basis of its numerical column space from a
+    pivoted QR.  Specifications sharing the fixed effects and sample reuse the
+    factor and only project and orthogonalize their own causal block.
+    """
+
+    projector: OLSProjector
+    raw: np.ndarray
+    within: np.ndarray
+    names: tuple[str, ...]
+    basis: np.ndarray
+    coordinates: np.ndarray
+
+    @classmethod
+    def from_nuisance(
+        cls,
+        projector: OLSProjector,
+        nuisance: np.ndarray,
+        names: tuple[str, ...],
+    ) -> WithinNuisance:
+        raw, _ = _as_2d(nuisance)
+        if raw.shape[1] != len(names):
+            raise ValueError("Nuisance name count does not match matrix width.")
+        within = projector.within(raw, block_columns=WITHIN_BLOCK_COLUMNS)
+        norm = np.linalg.norm(within, axis=0)
+        # Absorbed columns keep rounding residue from the group means; scaled to
+        # unit norm it would pass for a real nuisance direction.
+        absorbed = _absorbed_columns(np.linalg.norm(raw, axis=0), norm)
+        within[:, absorbed] = 0.0
+        norm[absorbed] = 0.0
+        scale = np.where(norm > 0, norm, 1.0)
+        q, r, pivot = scipy.linalg.qr(
+            within / scale,
+            mode="economic",
+            pivoting=True,
+            overwrite_a=True,
+            check_finite=False,
+        )
+        rank = _rank_from_qr(np.abs(np.diag(r)), within.shape[0], within.shape[1])
+        coordinates = np.empty((rank, within.shape[1]), dtype=np.float64)
+        coordinates[:, pivot] = r[:rank]
+        return cls(
+            projector=projector,
+            raw=raw,
+            within=within,
+            names=names,
+            basis=np.ascontiguousarray(q[:, :rank]),
+            coordinates=coordinates * scale,
+        )
+
+
+def causal_first_reduced_design(
+    causal: np.ndarray,
+    nuisance: WithinNuisance,
+    causal_names: tuple[str, ...],
+) -> SelectedDesign:
+    """Select a causal-first design against a factored nuisance dictionary.
+
+    The within causal block is split into its component in the nuisance basis
+    and an orthonormalized remainder.  Rank selection then runs on the small
+    ``(rank + K_causal) x K`` coordinate matrices instead of ``N`` rows and
+    keeps the same nuisance columns as :func:`causal_first_full_rank_design`.
+    """
+
+    causal, _ = _as_2d(causal)
+    if causal.shape[0] != nuisance.within.shape[0]:
+        raise ValueError("Causal and nuisance matrices must share rows.")
+    if causal.shape[1] != len(causal_names):
+        raise ValueError("Causal name count does not match matrix width.")
+    basis = nuisance.basis
+    loading = basis.T @ causal
+    remainder = causal - basis @ loading
+    # One reorthogonalization pass restores orthogonality lost to cancellation.
+    correction = basis.T @ remainder
+    remainder -= basis @ correction
+    loading += correction
+    r_remainder = scipy.linalg.qr(remainder, mode="r", check_finite=False)[0]
+    r_remainder = r_remainder[: causal.shape[1]]
+    causal_coordinates = np.vstack((loading, r_remainder))
+    nuisance_coordinates = np.vstack(
+        (
+            nuisance.coordinates,
+            np.zeros((r_remainder.shape[0], nuisance.coordinates.shape[1])),
+        )
+    )
+    selected = _causal_first_selection(
+        causal_coordinates, nuisance_coordinates, causal_names, causal.shape[0]
+    )
+    return _selected_design(
+        causal, nuisance.within, causal_names, nuisance.names, selected
+    )
+
+
+def _reject_absorbed_causal(
+    causal_names: tuple[str, ...],
+    raw_causal_norm: np.ndarray,
+    within_causal_norm: np.ndarray,
+) -> None:
+    mask = _absorbed_columns(raw_causal_norm, within_causal_norm)
+    absorbed = [name for name, flag in zip(causal_names, mask, strict=True) if flag]
+    if absorbed:
+        raise ValueError(
+            "Causal coordinates are numerically absorbed by the fixed effects: "
+            f"{absorbed}"
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class CommonOLSFit:
     coefficient: np.ndarray
     bread: np.ndarray
     residual: np.ndarray
     fitted: np.ndarray
-    within_design: np.ndarray
-    raw_design: np.ndarray
+    within_design: np.ndarray | None
+    raw_design: np.ndarray | None
     design_names: tuple[str, ...]
     outcome_names: tuple[str, ...]
     causal_count: int
@@ -348,42 +712,46 @@ def fit_common_ols(
 ) -> CommonOLSFit:
     """Fit all primitive outcomes on one audited design and sample."""
 
+    nuisance, _ = _as_2d(nuisance)
+    guard_fit_working_set(nuisance.shape[0], nuisance.shape[1] + np.shape(causal)[-1])
+    return fit_common_ols_within(
+        WithinNuisance.from_nuisance(projector, nuisance, nuisance_names),
+        causal,
+        outcomes,
+        causal_names,
+        outcome_names,
+    )
+
+
+def fit_common_ols_within(
+    nuisance: WithinNuisance,
+    causal: np.ndarray,
+    outcomes: np.ndarray,
+    causal_names: tuple[str, ...],
+    outcome_names: tuple[str, ...],
+) -> CommonOLSFit:
+    """Fit all primitive outcomes against an already factored nuisance block."""
+
     outcomes, _ = _as_2d(outcomes)
     if outcomes.shape[1] != len(outcome_names):
         raise ValueError("Outcome name count does not match matrix width.")
     if not np.all(np.isfinite(outcomes)):
         raise ValueError("Primitive outcomes must be finite on the common sample.")
 
+    projector = nuisance.projector
+    causal, _ = _as_2d(causal)
     causal_within = projector.within(causal)
-    nuisance_within = projector.within(nuisance)
     guard_fit_working_set(
-        causal_within.shape[0], causal_within.shape[1] + nuisance_within.shape[1]
+        causal_within.shape[0], causal_within.shape[1] + nuisance.within.shape[1]
     )
-    raw_causal_norm = np.linalg.norm(causal, axis=0)
-    within_causal_norm = np.linalg.norm(causal_within, axis=0)
-    absorbed = [
-        name
-        for name, raw_norm, within_norm in zip(
-            causal_names,
-            raw_causal_norm,
-            within_causal_norm,
-            strict=True,
-        )
-        if raw_norm == 0.0 or within_norm <= 1e-12 * max(raw_norm, np.finfo(float).tiny)
-    ]
-    if absorbed:
-        raise ValueError(
-            "Causal coordinates are numerically absorbed by the fixed effects: "
-            f"{absorbed}"
-        )
-    selected = causal_first_full_rank_design(
-        causal_within,
-        nuisance_within,
+    _reject_absorbed_causal(
         causal_names,
-        nuisance_names,
+        np.linalg.norm(causal, axis=0),
+        np.linalg.norm(causal_within, axis=0),
     )
+    selected = causal_first_reduced_design(causal_within, nuisance, causal_names)
     raw_selected = np.column_stack(
-        (causal, nuisance[:, selected.selected_nuisance_indices])
+        (causal, nuisance.raw[:, selected.selected_nuisance_indices])
     )
     x = selected.matrix
     y = projector.within(outcomes)
@@ -443,3 +811,251 @@ def fit_common_ols(
         condition_number=condition_number,
         solve_relative_residual=solve_relative_residual,
     )
+
+
+def _row_blocks(n_rows: int, block_rows: int) -> Iterator[slice]:
+    for start in range(0, n_rows, block_rows):
+        yield slice(start, min(start + block_rows, n_rows))
+
+
+@dataclass(frozen=True, slots=True)
+class ProductColumns:
+    """Columns ``factors[:, left] * factors[:, right]``, formed on demand.
+
+    An interaction dictionary is held as its narrow row factors, so a row
+    block of any column subset costs only that block.  A plain column pairs
+    its factor with a factor of ones, which multiplies exactly.
+    """
+
+    factors: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.factors.shape[0], self.left.size)
+
+    def block(self, rows: slice, columns: np.ndarray | slice) -> np.ndarray:
+        factors = self.factors[rows]
+        return factors[:, self.left[columns]] * factors[:, self.right[columns]]
+
+
+def _raw_rows(
+    values: np.ndarray | ProductColumns,
+    rows: slice,
+    columns: np.ndarray | slice | None = None,
+) -> np.ndarray:
+    index = slice(None) if columns is None else columns
+    if isinstance(values, ProductColumns):
+        return values.block(rows, index)
+    return values[rows, index]
+
+
+def _column_block_means(
+    projector: OLSProjector, values: np.ndarray | ProductColumns
+) -> tuple[tuple[np.ndarray, ...], np.ndarray]:
+    """Return group means and raw norms, forming ``N x 64`` columns at a time."""
+
+    width = values.shape[1]
+    means: list[tuple[np.ndarray, ...]] = []
+    norms: list[np.ndarray] = []
+    for start in range(0, max(width, 1), WITHIN_BLOCK_COLUMNS):
+        block = _raw_rows(
+            values, slice(None), slice(start, min(start + WITHIN_BLOCK_COLUMNS, width))
+        )
+        means.append(projector.group_means(block))
+        norms.append(np.linalg.norm(block, axis=0))
+    return (
+        tuple(np.concatenate(parts, axis=-1) for parts in zip(*means, strict=True)),
+        np.concatenate(norms),
+    )
+
+
+def fit_common_ols_streaming(
+    projector: OLSProjector,
+    causal: np.ndarray,
+    nuisance: np.ndarray | ProductColumns,
+    outcomes: np.ndarray,
+    causal_names: tuple[str, ...],
+    nuisance_names: tuple[str, ...],
+    outcome_names: tuple[str, ...],
+    *,
+    block_rows: int = STREAMING_BLOCK_ROWS,
+    allocate: Callable[[tuple[int, int]], np.ndarray] | None = None,
+) -> CommonOLSFit:
+    """Fit :func:`fit_common_ols` from within-design row blocks.
+
+    Fixed-effect group means are computed once, and every row block of the
+    within design, and of a :class:`ProductColumns` dictionary, is formed from
+    them on demand.  The first pass reduces ``[W, Y]`` to its triangular QR
+    factor one block at a time; ``R`` holds the coordinates of ``W`` in an
+    orthonormal basis, so the causal-first selection and the solve match the
+    dense fit.  The second pass accumulates residuals, leverage, and the
+    normal-equation check.  No ``N x K`` array is held; the selected within
+    design is written to ``allocate((N, K))`` only when that is given.
+    """
+
+    outcomes, _ = _as_2d(outcomes)
+    causal, _ = _as_2d(causal)
+    if not isinstance(nuisance, ProductColumns):
+        nuisance, _ = _as_2d(nuisance)
+    if outcomes.shape[1] != len(outcome_names):
+        raise ValueError("Outcome name count does not match matrix width.")
+    if not np.all(np.isfinite(outcomes)):
+        raise ValueError("Primitive outcomes must be finite on the common sample.")
+    if causal.shape[1] != len(causal_names):
+        raise ValueError("Causal name count does not match matrix width.")
+    if nuisance.shape[1] != len(nuisance_names):
+        raise ValueError("Nuisance name count does not match matrix width.")
+    if block_rows < 1:
+        raise ValueError("Streaming row blocks must be positive.")
+    n_rows = projector.n_rows
+    if not (causal.shape[0] == nuisance.shape[0] == outcomes.shape[0] == n_rows):
+        raise ValueError("Matrix row count does not match the projector.")
+    causal_count = causal.shape[1]
+    width = causal_count + nuisance.shape[1]
+    # One row of means per absorbed group, whatever the projector's layout.
+    group_mean_rows = sum(
+        int(np.prod(mean.shape[:-1]))
+        for mean in projector.group_means(np.zeros((n_rows, 1)))
+    )
+    guard_fit_working_set(
+        n_rows,
+        width,
+        mode="streaming",
+        outcomes=outcomes.shape[1],
+        group_mean_rows=group_mean_rows,
+    )
+
+    causal_means = projector.group_means(causal)
+    nuisance_means, raw_nuisance_norm = _column_block_means(projector, nuisance)
+    outcome_means = projector.group_means(outcomes)
+
+    def within_block(rows: slice, columns: np.ndarray | None = None) -> np.ndarray:
+        return np.hstack(
+            (
+                projector.within_rows(causal[rows], causal_means, rows),
+                projector.within_rows(
+                    _raw_rows(nuisance, rows, columns), nuisance_means, rows, columns
+                ),
+            )
+        )
+
+    triangle = np.empty((0, width + outcomes.shape[1]))
+    for rows in _row_blocks(n_rows, block_rows):
+        stacked = np.vstack(
+            (
+                triangle,
+                np.hstack(
+                    (
+                        within_block(rows),
+                        projector.within_rows(outcomes[rows], outcome_means, rows),
+                    )
+                ),
+            )
+        )
+        triangle = scipy.linalg.qr(
+            stacked, mode="r", overwrite_a=True, check_finite=False
+        )[0][: stacked.shape[1]]
+    _reject_absorbed_causal(
+        causal_names,
+        np.linalg.norm(causal, axis=0),
+        np.linalg.norm(triangle[:, :causal_count], axis=0),
+    )
+    nuisance_coordinates = triangle[:, causal_count:width].copy()
+    absorbed = _absorbed_columns(
+        raw_nuisance_norm, np.linalg.norm(nuisance_coordinates, axis=0)
+    )
+    nuisance_coordinates[:, absorbed] = 0.0
+    selected = _causal_first_selection(
+        triangle[:, :causal_count], nuisance_coordinates, causal_names, n_rows
+    )
+    selected_index = np.asarray(selected, dtype=np.int64)
+    columns = np.concatenate((np.arange(causal_count), causal_count + selected_index))
+    names = causal_names + tuple(nuisance_names[index] for index in selected)
+    selected_set = set(selected)
+    dropped = tuple(
+        name for index, name in enumerate(nuisance_names) if index not in selected_set
+    )
+    guard_fit_working_set(
+        n_rows,
+        columns.size,
+        mode="streaming",
+        outcomes=outcomes.shape[1],
+        group_mean_rows=group_mean_rows,
+    )
+
+    # Re-triangularize the kept columns with the outcomes behind them.
+    kept = scipy.linalg.qr(
+        triangle[:, np.concatenate((columns, np.arange(width, triangle.shape[1])))],
+        mode="r",
+        check_finite=False,
+    )[0]
+    r_design = kept[: columns.size, : columns.size]
+    scales = np.linalg.norm(r_design, axis=0) / np.sqrt(n_rows)
+    if np.any(~np.isfinite(scales)) or np.any(scales <= 0):
+        raise ValueError("Non-finite or zero scale in selected design.")
+    r_scaled = r_design / scales
+    singular = scipy.linalg.svdvals(r_scaled, check_finite=False)
+    if singular[-1] <= 0:
+        raise ValueError("Selected common design is not positive definite.")
+    condition_number = float((singular[0] / singular[-1]) ** 2)
+    beta_scaled = scipy.linalg.solve_triangular(
+        r_scaled, kept[: columns.size, columns.size :], check_finite=False
+    )
+    coefficient = beta_scaled / scales[:, None]
+    inverse_factor = scipy.linalg.solve_triangular(
+        r_scaled, np.eye(columns.size), check_finite=False
+    )
+    inverse_scale = 1.0 / scales
+    bread = (
+        inverse_scale[:, None]
+        * (inverse_factor @ inverse_factor.T)
+        * inverse_scale[None, :]
+    )
+
+    design = None if allocate is None else allocate((n_rows, columns.size))
+    residual = np.empty_like(outcomes)
+    leverage = projector.leverage_diagonal().astype(np.float64, copy=True)
+    cross = np.zeros((columns.size, outcomes.shape[1]))
+    normal_equation = np.zeros_like(cross)
+    for rows in _row_blocks(n_rows, block_rows):
+        block = within_block(rows, selected_index)
+        if design is not None:
+            design[rows] = block
+        block_outcomes = projector.within_rows(outcomes[rows], outcome_means, rows)
+        block_residual = block_outcomes - block @ coefficient
+        residual[rows] = block_residual
+        leverage[rows] += np.einsum("ij,ij->i", block @ bread, block, optimize=True)
+        cross += block.T @ block_outcomes
+        normal_equation += block.T @ block_residual
+    denominator = max(float(np.linalg.norm(cross)), np.finfo(float).tiny)
+    solve_relative_residual = float(np.linalg.norm(normal_equation) / denominator)
+    if np.any(leverage < -1e-10) or np.any(leverage >= 1.0 - 1e-10):
+        raise ValueError(
+            "Full-model leverage is outside [0, 1); HC3 would be undefined."
+        )
+
+    model_rank = projector.rank + columns.size
+    residual_df = n_rows - model_rank
+    if residual_df <= 0:
+        raise ValueError("Non-positive residual degrees of freedom.")
+    return CommonOLSFit(
+        coefficient=coefficient,
+        bread=bread,
+        residual=residual,
+        fitted=outcomes - residual,
+        within_design=design,
+        raw_design=None,
+        design_names=names,
+        outcome_names=outcome_names,
+        causal_count=causal_count,
+        selected_nuisance_indices=selected,
+        dropped_nuisance_names=dropped,
+        leverage=leverage,
+        fixed_effect_rank=projector.rank,
+        model_rank=model_rank,
+        residual_df=residual_df,
+        condition_number=condition_number,
+        solve_relative_residual=solve_relative_residual,
+    )
@@ -11,12 +11,12 @@ that a scalar second-moment weight is sufficient for arbitrary continuous
 assignment processes.
 """
 
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 
 import numpy as np
 import numpy.typing as npt
-from scipy import linalg
+from scipy import linalg, sparse
 
 FloatArray = npt.NDArray[np.float64]
 
@@ -106,6 +106,21 @@ class ExperimentalScalarCCV:
     q: float = 1.0
 
 
+@dataclass(frozen=True, slots=True)
+class LeaveClusterOut:
+    """Leave-one-cluster-out estimates stacked outcome-major, one row per cluster.
+
+    Rows follow the sorted cluster ``labels``.  ``refit_clusters`` indexes the
+    rows obtained by literal refits rather than the exact deletion update.
+    """
+
+    full_estimate: FloatArray
+    estimates: FloatArray
+    labels: npt.NDArray[np.generic]
+    refit_clusters: tuple[int, ...]
+    cv3: FloatArray
+
+
 def _float_array(value: npt.ArrayLike, *, name: str) -> FloatArray:
     try:
         array = np.asarray(value, dtype=np.float64)
@@ -659,34 +674,56 @@ def experimental_scalar_ccv_hc3(
     direction = _float_array(contrast_direction, name="contrast_direction")
     if direction.ndim != 1 or direction.size < 1:
         raise InferenceContractError("contrast_direction must be a nonempty vector.")
-    outcomes = _outcome_matrix(residuals, n_observations=direction.size)
-    leverage = _leverage(full_model_leverage, n_observations=direction.size)
+    return batch_experimental_scalar_ccv_hc3(
+        direction[:, None],
+        residuals,
+        full_model_leverage,
+        clusters,
+        n_parameters=n_parameters,
+        zero_tolerance=zero_tolerance,
+    )[0]
+
+
+def batch_experimental_scalar_ccv_hc3(
+    contrast_directions: npt.ArrayLike,
+    residuals: npt.ArrayLike,
+    full_model_leverage: npt.ArrayLike,
+    clusters: npt.ArrayLike,
+    *,
+    n_parameters: int,
+    zero_tolerance: float = 1e-14,
+) -> tuple[ExperimentalScalarCCV, ...]:
+    """Compute the experimental scalar CCV-HC3 for ``N x C`` directions.
+
+    Residuals, leverage, and the cluster partition are validated once, and
+    the cluster moments and score sums of every direction are formed together.
+    Each result equals :func:`experimental_scalar_ccv_hc3` for its column.
+    """
+
+    directions = _float_array(contrast_directions, name="contrast_directions")
+    if directions.ndim != 2 or min(directions.shape) < 1:
+        raise InferenceContractError(
+            "contrast_directions must be a nonempty N x C matrix."
+        )
+    n_observations, n_directions = directions.shape
+    outcomes = _outcome_matrix(residuals, n_observations=n_observations)
+    leverage = _leverage(full_model_leverage, n_observations=n_observations)
     codes, n_clusters = _cluster_codes(
         clusters,
-        n_observations=direction.size,
+        n_observations=n_observations,
     )
     if zero_tolerance < 0:
         raise InferenceContractError("zero_tolerance must be nonnegative.")
 
-    counts = np.bincount(codes, minlength=n_clusters).astype(np.float64)
-    second = (
-        np.bincount(
-            codes,
-            weights=direction**2,
-            minlength=n_clusters,
-        )
-        / counts
+    membership = sparse.csr_array(
+        (np.ones(n_observations), (codes, np.arange(n_observations))),
+        shape=(n_clusters, n_observations),
     )
-    fourth = (
-        np.bincount(
-            codes,
-            weights=direction**4,
-            minlength=n_clusters,
-        )
-        / counts
-    )
-    omega_scale = float(np.max(second))
-    if omega_scale <= 0:
+    counts = np.bincount(codes, minlength=n_clusters).astype(np.float64)[:, None]
+    second = (membership @ directions**2) / counts
+    fourth = (membership @ directions**4) / counts
+    omega_scale = np.max(second, axis=0)
+    if np.any(omega_scale <= 0):
         raise InferenceContractError(
             "Residualized contrast direction has no cluster-level variation."
         )
@@ -695,69 +732,78 @@ def experimental_scalar_ccv_hc3(
     # normalized and can be numerically small in a large panel, while lambda
     # is exactly invariant to any global rescaling.
     scaled_omega = second / omega_scale
-    mean_omega = float(np.mean(scaled_omega))
-    second_moment = float(np.mean(scaled_omega**2))
-    moment_ratio = mean_omega**2 / second_moment
+    moment_ratio = np.mean(scaled_omega, axis=0) ** 2 / np.mean(scaled_omega**2, axis=0)
     numerical_tolerance = 1e-10
-    if moment_ratio < -numerical_tolerance or moment_ratio > 1 + numerical_tolerance:
+    if np.any(
+        (moment_ratio < -numerical_tolerance) | (moment_ratio > 1 + numerical_tolerance)
+    ):
         raise InferenceContractError(
             "The omega moment ratio lies materially outside [0, 1]."
         )
-    moment_ratio = min(max(moment_ratio, 0.0), 1.0)
-    lambda_weight = 1.0 - moment_ratio
+    lambda_weights = 1.0 - np.clip(moment_ratio, 0.0, 1.0)
 
-    kappa = np.full(n_clusters, np.nan)
+    kappa = np.full(second.shape, np.nan)
     positive = second > zero_tolerance * omega_scale
     kappa[positive] = fourth[positive] / second[positive] ** 2
-    finite_kappa = kappa[np.isfinite(kappa)]
-    kappa_cv = (
-        _population_cv(finite_kappa, name="kappa") if finite_kappa.size else np.nan
-    )
-    omega_cv = _population_cv(second, name="omega")
 
-    robust_influence = direction[:, None] * outcomes / (1.0 - leverage[:, None])
-    hc3 = validate_covariance(
-        robust_influence.T @ robust_influence,
-        name="scalar-contrast HC3 covariance",
-    ).covariance
-
-    score = direction[:, None] * outcomes
-    cluster_score = np.zeros((n_clusters, outcomes.shape[1]))
-    np.add.at(cluster_score, codes, score)
-    cr0 = validate_covariance(
-        cluster_score.T @ cluster_score,
-        name="scalar-contrast CR0 covariance",
-    ).covariance
+    robust_influence = (
+        directions[:, :, None] * (outcomes / (1.0 - leverage[:, None]))[:, None, :]
+    )
+    hc3_blocks = np.einsum(
+        "ncj,nck->cjk", robust_influence, robust_influence, optimize=True
+    )
+    score = directions[:, :, None] * outcomes[:, None, :]
+    cluster_score = (membership @ score.reshape(n_observations, -1)).reshape(
+        n_clusters, n_directions, outcomes.shape[1]
+    )
+    cr0_blocks = np.einsum("gcj,gck->cjk", cluster_score, cluster_score, optimize=True)
     factor = cr1_small_sample_factor(
-        direction.size,
+        n_observations,
         n_clusters,
         n_parameters,
     )
-    cr1 = validate_covariance(factor * cr0, name="scalar-contrast CR1").covariance
-    ccv_hc3 = validate_covariance(
-        lambda_weight * cr0 + (1.0 - lambda_weight) * hc3,
-        name="experimental CCV-HC3 covariance",
-    ).covariance
-    ccv_hc3_cr1 = validate_covariance(
-        lambda_weight * cr1 + (1.0 - lambda_weight) * hc3,
-        name="experimental CCV-HC3-CR1 covariance",
-    ).covariance
 
-    return ExperimentalScalarCCV(
-        hc3=hc3,
-        cr0=cr0,
-        cr1=cr1,
-        ccv_hc3=ccv_hc3,
-        ccv_hc3_cr1=ccv_hc3_cr1,
-        omega=second,
-        kappa=kappa,
-        lambda_weight=lambda_weight,
-        omega_cv=omega_cv,
-        kappa_cv=kappa_cv,
-        omega_zero_share=float(np.mean(~positive)),
-        cr1_factor=factor,
-        n_clusters=n_clusters,
-    )
+    results: list[ExperimentalScalarCCV] = []
+    for index in range(n_directions):
+        lambda_weight = float(lambda_weights[index])
+        finite_kappa = kappa[:, index][np.isfinite(kappa[:, index])]
+        hc3 = validate_covariance(
+            hc3_blocks[index],
+            name="scalar-contrast HC3 covariance",
+        ).covariance
+        cr0 = validate_covariance(
+            cr0_blocks[index],
+            name="scalar-contrast CR0 covariance",
+        ).covariance
+        cr1 = validate_covariance(factor * cr0, name="scalar-contrast CR1").covariance
+        results.append(
+            ExperimentalScalarCCV(
+                hc3=hc3,
+                cr0=cr0,
+                cr1=cr1,
+                ccv_hc3=validate_covariance(
+                    lambda_weight * cr0 + (1.0 - lambda_weight) * hc3,
+                    name="experimental CCV-HC3 covariance",
+                ).covariance,
+                ccv_hc3_cr1=validate_covariance(
+                    lambda_weight * cr1 + (1.0 - lambda_weight) * hc3,
+                    name="experimental CCV-HC3-CR1 covariance",
+                ).covariance,
+                omega=second[:, index],
+                kappa=kappa[:, index],
+                lambda_weight=lambda_weight,
+                omega_cv=_population_cv(second[:, index], name="omega"),
+                kappa_cv=(
+                    _population_cv(finite_kappa, name="kappa")
+                    if finite_kappa.size
+                    else np.nan
+                ),
+                omega_zero_share=float(np.mean(~positive[:, index])),
+                cr1_factor=factor,
+                n_clusters=n_clusters,
+            )
+        )
+    return tuple(results)
 
 
 def direct_cv3_covariance(
@@ -863,6 +909,332 @@ def cr2_cross_outcome_covariance_dense(
     return validate_covariance(covariance, name="dense CR2 covariance").covariance
 
 
+def _absorbed_terms(
+    absorbed_terms: Sequence[tuple[npt.ArrayLike, npt.ArrayLike]],
+    *,
+    n_observations: int,
+) -> tuple[tuple[npt.NDArray[np.int64], FloatArray], ...]:
+    checked: list[tuple[npt.NDArray[np.int64], FloatArray]] = []
+    for index, (codes, weights) in enumerate(absorbed_terms):
+        group_codes = np.asarray(codes)
+        group_weights = _float_array(weights, name=f"absorbed_terms[{index}] weights")
+        if (
+            group_codes.ndim != 1
+            or group_codes.size != n_observations
+            or group_codes.dtype.kind not in {"i", "u"}
+        ):
+            raise InferenceContractError(
+                f"absorbed_terms[{index}] must assign one integer group code "
+                "per observation."
+            )
+        if group_weights.ndim != 1 or (
+            group_codes.size
+            and (
+                int(group_codes.min()) < 0
+                or int(group_codes.max()) >= group_weights.size
+            )
+        ):
+            raise InferenceContractError(
+                f"absorbed_terms[{index}] needs one weight per group code."
+            )
+        checked.append((group_codes.astype(np.int64, copy=False), group_weights))
+    return tuple(checked)
+
+
+def _open_clusters(
+    codes: npt.NDArray[np.int64],
+    n_clusters: int,
+    terms: Sequence[tuple[npt.NDArray[np.int64], FloatArray]],
+) -> npt.NDArray[np.bool_]:
+    """Flag clusters that share an absorbed group with another cluster."""
+
+    open_cluster = np.zeros(n_clusters, dtype=bool)
+    for group_codes, weights in terms:
+        pairs = np.unique(codes * weights.size + group_codes)
+        groups = pairs % weights.size
+        shared = np.bincount(groups, minlength=weights.size)[groups] > 1
+        open_cluster[pairs[shared] // weights.size] = True
+    return open_cluster
+
+
+def _spectral_loadings(
+    basis: FloatArray,
+    eigenvalues: FloatArray,
+    direction_rows: FloatArray,
+    residual_rows: FloatArray,
+    *,
+    exponent: float,
+    eigenvalue_tolerance: float,
+) -> tuple[FloatArray, float]:
+    """Return ``d_g' (I - H_gg)^{+exponent} e_g`` and the smallest kept gap.
+
+    ``basis`` holds orthonormal eigenvectors of ``H_gg`` with ``eigenvalues``;
+    ``H_gg`` vanishes on their orthogonal complement.  Directions with
+    eigenvalue one are dropped.  Residuals never load on them, so this is exact
+    precisely when ``d_g`` does not load either, i.e. when the contrast stays
+    identified after deleting the cluster.
+    """
+
+    if float(np.max(eigenvalues, initial=0.0)) > 1.0 + eigenvalue_tolerance:
+        raise InferenceContractError("A cluster hat block has an eigenvalue above one.")
+    singular = eigenvalues >= 1.0 - eigenvalue_tolerance
+    loadings = direction_rows.T @ basis
+    if np.any(singular):
+        scale = max(float(linalg.norm(direction_rows)), 1.0)
+        if float(np.max(np.abs(loadings[:, singular]))) > 1e-8 * scale:
+            raise InferenceContractError(
+                "Deleting a cluster leaves a reported coefficient contrast "
+                "unidentified."
+            )
+    gaps = 1.0 - eigenvalues[~singular]
+    scale = np.zeros_like(eigenvalues)
+    scale[~singular] = gaps**-exponent - 1.0
+    adjusted = direction_rows.T @ residual_rows + loadings @ (
+        scale[:, None] * (basis.T @ residual_rows)
+    )
+    return adjusted, float(np.min(gaps, initial=1.0))
+
+
+def _absorbed_hat_factor(
+    rows: npt.NDArray[np.int64],
+    basis_rows: FloatArray,
+    terms: Sequence[tuple[npt.NDArray[np.int64], FloatArray]],
+) -> tuple[FloatArray, FloatArray]:
+    """Return ``H_gg = Z M Z'`` with group indicators and the design basis."""
+
+    columns: list[FloatArray] = []
+    middles: list[FloatArray] = []
+    for group_codes, weights in terms:
+        levels, local = np.unique(group_codes[rows], return_inverse=True)
+        indicator = np.zeros((rows.size, levels.size))
+        indicator[np.arange(rows.size), local] = 1.0
+        columns.append(indicator)
+        middles.append(np.diag(weights[levels]))
+    columns.append(basis_rows)
+    middles.append(np.eye(basis_rows.shape[1]))
+    return np.hstack(columns), linalg.block_diag(*middles)
+
+
+def _cluster_hat_spectra(
+    matrix: FloatArray,
+    codes: npt.NDArray[np.int64],
+    n_clusters: int,
+    terms: Sequence[tuple[npt.NDArray[np.int64], FloatArray]],
+) -> Iterator[tuple[int, npt.NDArray[np.int64], FloatArray, FloatArray]]:
+    """Yield each cluster's rows and the nonzero spectrum of its hat block.
+
+    The full-model block is ``H_gg = P_FE,gg + Q_g Q_g'``, where ``Q`` is a
+    rank-revealing orthonormal basis of the within design.  The basis, rather
+    than ``X B X'``, keeps the spectrum bounded by one when retained columns
+    are numerically absorbed.  When every absorbed group lies inside one
+    cluster, ``P_FE,gg`` is a projection orthogonal to ``Q_g`` and to the
+    residuals, so only the at most ``K``-dimensional spectrum of ``Q_g Q_g'``
+    matters; such clusters are decomposed in batches of equal size.  Clusters
+    that cut absorbed groups use the low-rank factor ``[S_g, Q_g]``.
+    """
+
+    q, r, _ = linalg.qr(matrix, mode="economic", pivoting=True, check_finite=False)
+    diagonal = np.abs(np.diag(r))
+    rank = int(
+        np.count_nonzero(
+            diagonal > max(matrix.shape) * np.finfo(np.float64).eps * diagonal[0]
+        )
+    )
+    basis = q[:, :rank]
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes, minlength=n_clusters)
+    members = np.split(order, np.cumsum(counts)[:-1])
+    open_cluster = _open_clusters(codes, n_clusters, terms)
+
+    for size in np.unique(counts[~open_cluster]):
+        batch = np.flatnonzero(~open_cluster & (counts == size))
+        rows = np.stack([members[cluster] for cluster in batch])
+        vectors, singular_values, _ = np.linalg.svd(basis[rows], full_matrices=False)
+        for position, cluster in enumerate(batch):
+            yield (
+                int(cluster),
+                rows[position],
+                vectors[position],
+                singular_values[position] ** 2,
+            )
+
+    for cluster in np.flatnonzero(open_cluster):
+        rows = members[cluster]
+        factor, middle = _absorbed_hat_factor(rows, basis[rows], terms)
+        factor_basis, triangular = linalg.qr(
+            factor, mode="economic", check_finite=False
+        )
+        core = triangular @ middle @ triangular.T
+        eigenvalues, vectors = linalg.eigh((core + core.T) / 2.0, check_finite=False)
+        yield int(cluster), rows, factor_basis @ vectors, eigenvalues
+
+
+def _deletion_directions(
+    matrix: FloatArray,
+    inverse: FloatArray,
+    contrasts: npt.ArrayLike | None,
+) -> tuple[FloatArray, FloatArray]:
+    """Return ``K x C`` contrasts and their guarded residualized directions.
+
+    Without contrasts every coefficient is reported, so the directions are the
+    coefficient loadings ``X B``.
+    """
+
+    if contrasts is None:
+        return _coefficient_loadings(matrix, inverse), np.eye(matrix.shape[1])
+    selected = _float_array(contrasts, name="contrasts")
+    if selected.ndim == 1:
+        selected = selected[:, None]
+    if selected.ndim != 2 or selected.shape[0] != matrix.shape[1]:
+        raise InferenceContractError(
+            "contrasts must have one row per common-design coefficient."
+        )
+    return _residualized_contrast_directions(matrix, inverse, selected), selected
+
+
+def cr2_cross_outcome_covariance_block(
+    design: npt.ArrayLike,
+    residuals: npt.ArrayLike,
+    bread: npt.ArrayLike,
+    clusters: npt.ArrayLike,
+    *,
+    absorbed_terms: Sequence[tuple[npt.ArrayLike, npt.ArrayLike]] = (),
+    contrasts: npt.ArrayLike | None = None,
+    eigenvalue_tolerance: float = 1e-10,
+) -> FloatArray:
+    """Return full-model CR2 without forming any ``n_g x n_g`` hat block.
+
+    ``design`` is the within design after absorbing fixed effects, and each
+    absorbed term ``(codes, weights)`` adds ``S diag(weights) S'`` to the
+    fixed-effect projection, as returned by a projector's ``hat_terms``.  Each
+    cluster's adjustment uses the low-rank spectrum of its full-model hat
+    block.  Unit eigenvalues use the Moore-Penrose square root and are
+    accepted only where the coefficient loadings vanish.  Optional ``K x C``
+    ``contrasts`` return the outcome-major ``J*C`` covariance of
+    ``contrasts' beta`` instead of all ``J*K`` coefficients.
+    """
+
+    matrix, outcomes, inverse = _common_inputs(design, residuals, bread)
+    codes, n_clusters = _cluster_codes(
+        clusters,
+        n_observations=matrix.shape[0],
+    )
+    if eigenvalue_tolerance <= 0:
+        raise InferenceContractError("eigenvalue_tolerance must be positive.")
+    terms = _absorbed_terms(absorbed_terms, n_observations=matrix.shape[0])
+    directions, _ = _deletion_directions(matrix, inverse, contrasts)
+
+    adjusted = np.empty((n_clusters, directions.shape[1], outcomes.shape[1]))
+    for cluster, rows, basis, eigenvalues in _cluster_hat_spectra(
+        matrix, codes, n_clusters, terms
+    ):
+        adjusted[cluster], _ = _spectral_loadings(
+            basis,
+            eigenvalues,
+            directions[rows],
+            outcomes[rows],
+            exponent=0.5,
+            eigenvalue_tolerance=eigenvalue_tolerance,
+        )
+
+    contributions = np.swapaxes(adjusted, 1, 2).reshape(n_clusters, -1)
+    return validate_covariance(
+        contributions.T @ contributions,
+        name="block CR2 covariance",
+    ).covariance
+
+
+def leave_cluster_out_estimates(
+    design: npt.ArrayLike,
+    residuals: npt.ArrayLike,
+    bread: npt.ArrayLike,
+    clusters: npt.ArrayLike,
+    coefficients: npt.ArrayLike,
+    *,
+    absorbed_terms: Sequence[tuple[npt.ArrayLike, npt.ArrayLike]] = (),
+    contrasts: npt.ArrayLike | None = None,
+    refit: Callable[[npt.NDArray[np.bool_]], npt.ArrayLike] | None = None,
+    refit_map: Callable[..., Iterable[npt.ArrayLike]] = map,
+    conditioning_tolerance: float = 1e-8,
+    eigenvalue_tolerance: float = 1e-10,
+) -> LeaveClusterOut:
+    """Return exact leave-one-cluster-out estimates and their CV3 covariance.
+
+    Deleting cluster ``g`` from the full model, fixed effects included, gives
+    ``beta_(-g) = beta - B X_g' (I - H_gg)^+ e_g`` for every coefficient
+    contrast that remains identified.  The update reuses the hat spectra of
+    :func:`cr2_cross_outcome_covariance_block`, so no fixed-effect projection
+    is rebuilt.  A cluster whose smallest nonzero ``1 - eigenvalue`` falls
+    below ``conditioning_tolerance`` would amplify rounding error; it is
+    instead passed to ``refit`` as a boolean mask of retained rows, which
+    must return the ``C x J`` refitted contrasts.  Pass an executor's ``map``
+    as ``refit_map`` to run those refits in parallel.
+    """
+
+    matrix, outcomes, inverse = _common_inputs(design, residuals, bread)
+    codes, n_clusters = _cluster_codes(
+        clusters,
+        n_observations=matrix.shape[0],
+    )
+    if eigenvalue_tolerance <= 0 or conditioning_tolerance <= 0:
+        raise InferenceContractError("Deletion tolerances must be positive.")
+    terms = _absorbed_terms(absorbed_terms, n_observations=matrix.shape[0])
+    directions, selected = _deletion_directions(matrix, inverse, contrasts)
+    beta = _float_array(coefficients, name="coefficients")
+    if beta.ndim == 1:
+        beta = beta[:, None]
+    if beta.shape != (matrix.shape[1], outcomes.shape[1]):
+        raise InferenceContractError(
+            "coefficients must have one row per design coefficient and one "
+            "column per outcome."
+        )
+    full = selected.T @ beta
+    estimates = np.empty((n_clusters, *full.shape))
+    refit_clusters: list[int] = []
+    for cluster, rows, basis, eigenvalues in _cluster_hat_spectra(
+        matrix, codes, n_clusters, terms
+    ):
+        adjusted, gap = _spectral_loadings(
+            basis,
+            eigenvalues,
+            directions[rows],
+            outcomes[rows],
+            exponent=1.0,
+            eigenvalue_tolerance=eigenvalue_tolerance,
+        )
+        estimates[cluster] = full - adjusted
+        if gap < conditioning_tolerance:
+            refit_clusters.append(cluster)
+
+    refit_clusters.sort()
+    if refit_clusters:
+        if refit is None:
+            raise InferenceContractError(
+                "Leave-cluster-out updates are ill-conditioned for clusters "
+                f"{refit_clusters}; supply a refit callable."
+            )
+        masks = [codes != cluster for cluster in refit_clusters]
+        for cluster, refitted in zip(
+            refit_clusters, refit_map(refit, masks), strict=True
+        ):
+            values = _float_array(refitted, name="refitted estimates")
+            if values.size != full.size:
+                raise InferenceContractError(
+                    "refit must return one estimate per contrast and outcome."
+                )
+            estimates[cluster] = values.reshape(full.shape)
+
+    stacked = np.swapaxes(estimates, 1, 2).reshape(n_clusters, -1)
+    full_stacked = full.T.reshape(-1)
+    return LeaveClusterOut(
+        full_estimate=full_stacked,
+        estimates=stacked,
+        labels=np.unique(np.asarray(clusters)),
+        refit_clusters=tuple(refit_clusters),
+        cv3=direct_cv3_covariance(full_stacked, stacked),
+    )
+
+
 def assemble_block_covariance(
     blocks: Sequence[Sequence[npt.ArrayLike]],
 ) -> FloatArray:
@@ -931,16 +1303,20 @@ __all__ = [
     "CovarianceCheck",
     "ExperimentalScalarCCV",
     "InferenceContractError",
+    "LeaveClusterOut",
     "LinearGradientSandwich",
     "apply_gradient",
     "assemble_block_covariance",
+    "batch_experimental_scalar_ccv_hc3",
     "batch_linear_gradient_cross_outcome_inference",
     "cluster_cross_outcome_covariance",
     "cr1_small_sample_factor",
+    "cr2_cross_outcome_covariance_block",
     "cr2_cross_outcome_covariance_dense",
     "direct_cv3_covariance",
     "experimental_scalar_ccv_hc3",
     "hc3_cross_outcome_covariance",
+    "leave_cluster_out_estimates",
     "linear_gradient_cross_outcome_inference",
     "ols_bread",
     "residualized_contrast_direction",
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import hashlib
+import inspect
 import json
+import math
 import os
 import platform
+import shutil
 import sys
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +29,8 @@ RESULTS_PATH = TABLES / "mc_v4_constructed_estimands.csv"
 DIAGNOSTICS_PATH = TABLES / "mc_v4_diagnostics.csv"
 COEFFICIENTS_PATH = TABLES / "mc_v4_coefficients.csv"
 MANIFEST_PATH = INTERMEDIATE / "mundlak_chamberlain_v4_manifest.json"
+# Modules whose code determines fitted arrays; inference and reporting are not.
+FIT_CODE_MODULES = ("clusters", "design", "fwl", "model", "resources")
 
 
 def sha256_file(path: Path) -> str:
@@ -49,6 +54,24 @@ def code_hash() -> str:
     return digest.hexdigest()
 
 
+def fit_code_hash(*fit_path: Callable[..., Any]) -> str:
+    """Hash the estimator modules, the array store, and the caller's fit path.
+
+    Unlike :func:`code_hash`, editing inference or reporting code leaves this
+    unchanged, so retained fits stay valid across report-only changes.
+    """
+
+    digest = hashlib.sha256()
+    for name in FIT_CODE_MODULES:
+        path = BRANCH_DIR / "mcw" / f"{name}.py"
+        digest.update(path.relative_to(ROOT).as_posix().encode())
+        digest.update(path.read_bytes())
+    for function in (array_metadata, atomic_write_array_store, *fit_path):
+        digest.update(f"{function.__module__}.{function.__qualname__}".encode())
+        digest.update(inspect.getsource(function).encode())
+    return digest.hexdigest()
+
+
 def environment_record() -> dict[str, str]:
     return {
         "python": sys.version.split()[0],
@@ -72,6 +95,62 @@ def atomic_write_frame(frame: pl.DataFrame, path: Path) -> None:
     temporary.replace(path)
 
 
+def array_metadata(array: np.ndarray) -> dict[str, Any]:
+    return {"dtype": array.dtype.str, "shape": list(array.shape)}
+
+
+def atomic_write_array_store(
+    arrays: Mapping[str, np.ndarray], directory: Path
+) -> dict[str, dict[str, Any]]:
+    """Write one uncompressed ``.npy`` file per array and return its metadata.
+
+    The returned dtype and shape records belong in the caller's manifest, so
+    readers can validate a store before touching any payload.  The directory
+    is replaced as a whole; callers remove the manifest that describes it
+    first.
+    """
+
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    temporary = directory.with_name(f".{directory.name}.{os.getpid()}.tmp")
+    shutil.rmtree(temporary, ignore_errors=True)
+    temporary.mkdir()
+    metadata = {}
+    for name, value in arrays.items():
+        array = np.asarray(value)
+        np.save(temporary / f"{name}.npy", array, allow_pickle=False)
+        metadata[name] = array_metadata(array)
+    if directory.is_file():
+        directory.unlink()
+    shutil.rmtree(directory, ignore_errors=True)
+    temporary.replace(directory)
+    return metadata
+
+
+def load_array_store(
+    directory: Path,
+    metadata: Mapping[str, Mapping[str, Any]],
+    names: tuple[str, ...],
+) -> dict[str, np.ndarray]:
+    """Memory-map the named arrays read-only after checking dtype and shape."""
+
+    arrays = {}
+    for name in names:
+        expected = metadata[name]
+        # Zero-length payloads cannot be mapped and are read directly.
+        array = np.load(
+            directory / f"{name}.npy",
+            mmap_mode="r" if math.prod(expected["shape"]) else None,
+            allow_pickle=False,
+        )
+        if array_metadata(array) != {
+            "dtype": expected["dtype"],
+            "shape": list(expected["shape"]),
+        }:
+            raise ValueError(f"Stored array {name} does not match its manifest.")
+        arrays[name] = array
+    return arrays
+
+
 def atomic_write_json(value: Mapping[str, Any], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
@@ -20,7 +20,13 @@ from .design import (
     TREATMENT_HISTORY_YEARS,
     Specification,
 )
-from .fwl import NestedFixedEffectProjector, NoFixedEffectProjector, OLSProjector
+from .fwl import (
+    NestedFixedEffectProjector,
+    NoFixedEffectProjector,
+    OLSProjector,
+    ProductColumns,
+    WithinNuisance,
+)
 from .resources import guard_dense_allocation
 
 BASELINE_COLUMN_OVERRIDES = {
@@ -43,7 +49,7 @@ BASELINE_COLUMN_OVERRIDES = {
 @dataclass(frozen=True, slots=True)
 class ModelMatrices:
     causal: np.ndarray
-    nuisance: np.ndarray
+    nuisance: np.ndarray | ProductColumns
     outcomes: np.ndarray
     causal_names: tuple[str, ...]
     nuisance_names: tuple[str, ...]
@@ -236,6 +242,94 @@ def categorical_region_contrasts(
     return matrix, names
 
 
+def build_nuisance_dictionary(
+    frame: pl.DataFrame,
+    specification: Specification,
+) -> tuple[ProductColumns, tuple[str, ...]]:
+    """Return the nuisance dictionary as products of its narrow row factors.
+
+    Every column is a baseline component, missingness indicator, or contrast,
+    or one of those times a calendar or region contrast, so the ``N x K``
+    matrix is never needed to form a row block of it.
+    """
+
+    components, component_names = hierarchical_baseline_components(frame)
+    contrasts, contrast_names = categorical_year_contrasts(frame["year"].to_numpy())
+    pooled = specification.fixed_effects == "pooled_wmc"
+    if pooled:
+        region_contrasts, region_contrast_names = categorical_region_contrasts(
+            frame["aewr_region_id"].to_numpy()
+        )
+    else:
+        region_contrasts = np.empty((frame.height, 0))
+        region_contrast_names = ()
+    missing_blocks: list[np.ndarray] = []
+    missing_names: list[str] = []
+    for column in BASELINE_COLUMN_OVERRIDES.values():
+        missing_column = f"{column.removesuffix('_z')}_missing"
+        values = frame[missing_column].cast(pl.Float64).to_numpy()
+        if not np.all(np.isfinite(values)):
+            raise ValueError(f"Missingness indicator {missing_column} is non-finite.")
+        if np.std(values, ddof=0) > 0:
+            missing_blocks.append(values[:, None])
+            missing_names.append(missing_column)
+
+    factors = np.column_stack(
+        (
+            np.ones((frame.height, 1)),
+            contrasts,
+            region_contrasts,
+            components,
+            *missing_blocks,
+        )
+    )
+    # Factor 0 is the ones column; the blocks follow in stacking order.
+    offsets = np.cumsum(
+        [1, contrasts.shape[1], region_contrasts.shape[1], components.shape[1]]
+    )
+    contrast_index = np.arange(offsets[0], offsets[1])
+    region_index = np.arange(offsets[1], offsets[2])
+    component_index = np.arange(offsets[2], offsets[3])
+    missing_index = np.arange(offsets[3], factors.shape[1])
+    pairs: list[tuple[int, int]] = []
+    names: list[str] = []
+    if pooled:
+        pairs.append((0, 0))
+        names.append("pooled_intercept")
+        pairs.extend((int(index), 0) for index in contrast_index)
+        names.extend(contrast_names)
+        pairs.extend((int(index), 0) for index in region_index)
+        names.extend(region_contrast_names)
+    pairs.extend((int(index), 0) for index in component_index)
+    names.extend(component_names)
+    for index, component_name in zip(component_index, component_names, strict=True):
+        pairs.extend((int(index), int(other)) for other in contrast_index)
+        names.extend(
+            f"{component_name}__x__{contrast_name}" for contrast_name in contrast_names
+        )
+        if pooled and not component_name.endswith("_region"):
+            pairs.extend((int(index), int(other)) for other in region_index)
+            names.extend(
+                f"{component_name}__x__{contrast_name}"
+                for contrast_name in region_contrast_names
+            )
+    for index, missing_column in zip(missing_index, missing_names, strict=True):
+        pairs.append((int(index), 0))
+        names.append(missing_column)
+        pairs.extend((int(index), int(other)) for other in contrast_index)
+        names.extend(
+            f"{missing_column}__x__{contrast_name}" for contrast_name in contrast_names
+        )
+        if pooled:
+            pairs.extend((int(index), int(other)) for other in region_index)
+            names.extend(
+                f"{missing_column}__x__{contrast_name}"
+                for contrast_name in region_contrast_names
+            )
+    left, right = np.array(pairs, dtype=np.int64).reshape(-1, 2).T
+    return ProductColumns(factors=factors, left=left, right=right), tuple(names)
+
+
 def build_nuisance_matrix(
     frame: pl.DataFrame,
     specification: Specification,
@@ -263,63 +357,8 @@ def build_nuisance_matrix(
     guard_dense_allocation(
         frame.height, nuisance_upper_bound, label="WMC nuisance dictionary upper bound"
     )
-    components, component_names = hierarchical_baseline_components(frame)
-    contrasts, contrast_names = categorical_year_contrasts(frame["year"].to_numpy())
-    pooled = specification.fixed_effects == "pooled_wmc"
-    if pooled:
-        region_contrasts, region_contrast_names = categorical_region_contrasts(
-            frame["aewr_region_id"].to_numpy()
-        )
-        blocks: list[np.ndarray] = [
-            np.ones((frame.height, 1)),
-            contrasts,
-            region_contrasts,
-            components,
-        ]
-        names: list[str] = [
-            "pooled_intercept",
-            *contrast_names,
-            *region_contrast_names,
-            *component_names,
-        ]
-    else:
-        region_contrasts = np.empty((frame.height, 0))
-        region_contrast_names = ()
-        blocks = [components]
-        names = list(component_names)
-    for component_index, component_name in enumerate(component_names):
-        block = components[:, component_index, None] * contrasts
-        blocks.append(block)
-        names.extend(
-            f"{component_name}__x__{contrast_name}" for contrast_name in contrast_names
-        )
-        if pooled and not component_name.endswith("_region"):
-            region_block = components[:, component_index, None] * region_contrasts
-            blocks.append(region_block)
-            names.extend(
-                f"{component_name}__x__{contrast_name}"
-                for contrast_name in region_contrast_names
-            )
-    for column in BASELINE_COLUMN_OVERRIDES.values():
-        missing_column = f"{column.removesuffix('_z')}_missing"
-        values = frame[missing_column].cast(pl.Float64).to_numpy()
-        if not np.all(np.isfinite(values)):
-            raise ValueError(f"Missingness indicator {missing_column} is non-finite.")
-        if np.std(values, ddof=0) > 0:
-            blocks.append(values[:, None])
-            names.append(missing_column)
-            blocks.append(values[:, None] * contrasts)
-            names.extend(
-                f"{missing_column}__x__{contrast_name}"
-                for contrast_name in contrast_names
-            )
-            if pooled:
-                blocks.append(values[:, None] * region_contrasts)
-                names.extend(
-                    f"{missing_column}__x__{contrast_name}"
-                    for contrast_name in region_contrast_names
-                )
-    return np.column_stack(blocks), tuple(names)
+    dictionary, names = build_nuisance_dictionary(frame, specification)
+    return dictionary.block(slice(None), slice(None)), names
 
 
 def _within_region_transform(
@@ -497,40 +536,102 @@ def build_causal_matrix(
     return np.column_stack(columns), tuple(names), tuple(metadata)
 
 
+FIXED_EFFECT_PARENT_COLUMNS: dict[str, str | None] = {
+    "county_year": None,
+    "county_state_year": "state_fips",
+    "county_region_year": "aewr_region_id",
+}
+
+
+def fixed_effect_parent_geography(specification: Specification) -> str:
+    """Name the geography whose by-year effects the specification absorbs."""
+
+    if specification.fixed_effects == "pooled_wmc":
+        return "none"
+    if specification.fixed_effects not in FIXED_EFFECT_PARENT_COLUMNS:
+        raise ValueError(f"Unknown fixed effects: {specification.fixed_effects}")
+    return FIXED_EFFECT_PARENT_COLUMNS[specification.fixed_effects] or "national"
+
+
 def _fixed_effect_parent(
     frame: pl.DataFrame, specification: Specification
 ) -> np.ndarray:
-    if specification.fixed_effects == "county_year":
+    if specification.fixed_effects not in FIXED_EFFECT_PARENT_COLUMNS:
+        raise ValueError(f"Unknown fixed effects: {specification.fixed_effects}")
+    column = FIXED_EFFECT_PARENT_COLUMNS[specification.fixed_effects]
+    if column is None:
         return np.repeat("national", frame.height)
-    if specification.fixed_effects == "county_state_year":
-        return frame["state_fips"].to_numpy()
-    if specification.fixed_effects == "county_region_year":
-        return frame["aewr_region_id"].to_numpy()
-    raise ValueError(f"Unknown fixed effects: {specification.fixed_effects}")
+    return frame[column].to_numpy()
+
+
+def fixed_effect_projector(
+    frame: pl.DataFrame, specification: Specification
+) -> OLSProjector:
+    """Return the fixed-effect backend for rows sorted by county and year."""
+
+    if specification.fixed_effects == "pooled_wmc":
+        return NoFixedEffectProjector.from_row_count(frame.height)
+    return NestedFixedEffectProjector.from_arrays(
+        frame["county_fips"].to_numpy(),
+        frame["year"].to_numpy(),
+        _fixed_effect_parent(frame, specification),
+    )
+
+
+def build_within_nuisance(
+    frame: pl.DataFrame, specification: Specification
+) -> WithinNuisance:
+    """Build and factor the nuisance block shared by one fixed-effect set.
+
+    The block depends only on the sample and ``specification.fixed_effects``,
+    so one result serves every treatment, moderator, and cluster choice.
+    """
+
+    specification.validate()
+    frame = frame.sort(["county_fips", "year"])
+    nuisance, nuisance_names = build_nuisance_matrix(frame, specification)
+    return WithinNuisance.from_nuisance(
+        fixed_effect_projector(frame, specification), nuisance, nuisance_names
+    )
 
 
 def build_model_matrices(
     frame: pl.DataFrame,
     specification: Specification,
     cluster_column: str,
+    *,
+    nuisance: WithinNuisance | None = None,
+    streaming: bool = False,
 ) -> ModelMatrices:
-    """Compile one specification after enforcing the common-sample contract."""
+    """Compile one specification after enforcing the common-sample contract.
+
+    A ``nuisance`` block from :func:`build_within_nuisance` on the same sample
+    and fixed effects replaces rebuilding the dictionary and projector.  With
+    ``streaming`` the dictionary stays in its factored form from
+    :func:`build_nuisance_dictionary`.
+    """
 
     specification.validate()
     _assert_frame_contract(frame, specification)
     frame = frame.sort(["county_fips", "year"])
     causal, causal_names, causal_metadata = build_causal_matrix(frame, specification)
-    nuisance, nuisance_names = build_nuisance_matrix(frame, specification)
+    if streaming:
+        if nuisance is not None:
+            raise ValueError("A factored nuisance block cannot be streamed.")
+        nuisance_matrix, nuisance_names = build_nuisance_dictionary(
+            frame, specification
+        )
+        projector = fixed_effect_projector(frame, specification)
+    elif nuisance is None:
+        nuisance_matrix, nuisance_names = build_nuisance_matrix(frame, specification)
+        projector = fixed_effect_projector(frame, specification)
+    else:
+        if nuisance.raw.shape[0] != frame.height:
+            raise ValueError("Shared nuisance block does not match the sample rows.")
+        nuisance_matrix, nuisance_names = nuisance.raw, nuisance.names
+        projector = nuisance.projector
     outcome_names = tuple(PRIMITIVE_OUTCOMES)
     outcomes = frame.select(PRIMITIVE_OUTCOMES.values()).to_numpy().astype(np.float64)
-    if specification.fixed_effects == "pooled_wmc":
-        projector: OLSProjector = NoFixedEffectProjector.from_row_count(frame.height)
-    else:
-        projector = NestedFixedEffectProjector.from_arrays(
-            frame["county_fips"].to_numpy(),
-            frame["year"].to_numpy(),
-            _fixed_effect_parent(frame, specification),
-        )
     if cluster_column not in frame.columns:
         raise ValueError(f"Cluster column is missing: {cluster_column}")
     cluster = frame[cluster_column].cast(pl.String).to_numpy()
@@ -538,7 +639,7 @@ def build_model_matrices(
         raise ValueError(f"Cluster column {cluster_column} contains nulls.")
     return ModelMatrices(
         causal=causal,
-        nuisance=nuisance,
+        nuisance=nuisance_matrix,
         outcomes=outcomes,
         causal_names=causal_names,
         nuisance_names=nuisance_names,
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 import os
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict
+from functools import partial
+from itertools import repeat
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import polars as pl
@@ -32,11 +38,20 @@ from .estimands import (
     per_baseline_worker_effect,
     positions_per_application_derivative,
 )
-from .fwl import CommonOLSFit, fit_common_ols
+from .fwl import (
+    WithinNuisance,
+    fit_common_ols,
+    fit_common_ols_streaming,
+    fit_common_ols_within,
+)
 from .inference import (
+    ExperimentalScalarCCV,
+    InferenceContractError,
+    LinearGradientSandwich,
+    batch_experimental_scalar_ccv_hc3,
     batch_linear_gradient_cross_outcome_inference,
-    experimental_scalar_ccv_hc3,
-    residualized_contrast_direction,
+    cr2_cross_outcome_covariance_block,
+    leave_cluster_out_estimates,
 )
 from .io import (
     ANALYSIS_PANEL,
@@ -46,20 +61,64 @@ from .io import (
     REGISTRY_PATH,
     RESULTS_PATH,
     SOURCE_PANEL,
+    atomic_write_array_store,
     atomic_write_frame,
     atomic_write_json,
     code_hash,
     environment_record,
+    fit_code_hash,
+    load_array_store,
     panel_key_hash,
     sha256_file,
     sha256_json,
 )
-from .model import ModelMatrices, build_model_matrices, causal_moderator_values
+from .model import (
+    build_model_matrices,
+    build_within_nuisance,
+    causal_moderator_values,
+    fixed_effect_parent_geography,
+    fixed_effect_projector,
+)
+from .resources import fit_mode
 
 FIT_CACHE = ANALYSIS_PANEL.parent.parent / "intermediate" / "mcw_v4_fits"
 RESIDUAL_VARIANCE_SHARE_MINIMUM = 1e-10
 CURRENT_EFFECT_START_YEAR = min(CURRENT_EFFECT_REPORTING_YEARS)
 CURRENT_EFFECT_END_YEAR = max(CURRENT_EFFECT_REPORTING_YEARS)
+CACHED_ARRAY_FIELDS = (
+    "coefficient",
+    "residual",
+    "leverage",
+    "cluster",
+    "design_names",
+    "outcome_names",
+    "causal_count",
+    "model_rank",
+    "causal_metadata_json",
+)
+REPORT_ARRAY_FIELDS = (
+    "coefficient",
+    "bread",
+    "residual",
+    "leverage",
+    "within_design",
+    "cluster",
+    "design_names",
+    "outcome_names",
+    "causal_count",
+    "model_rank",
+)
+CACHED_SUMMARY_FIELDS = (
+    "model_rank",
+    "condition_number",
+    "solve_relative_residual",
+    "residualized_treatment_variance_share",
+    "dropped_nuisance_names",
+)
+# Set only inside ``MC_SPEC_WORKERS`` processes; see ``_map_specifications``.
+_SHARED_SAMPLE: pl.DataFrame | None = None
+# Per-process, single-entry: registry rows are grouped by fixed effects.
+_NUISANCE_CACHE: dict[tuple[str, str, str], WithinNuisance] = {}
 RETAINED_ARTIFACT_PATHS = {
     "coefficients_sha256": COEFFICIENTS_PATH,
     "diagnostics_sha256": DIAGNOSTICS_PATH,
@@ -100,13 +159,24 @@ def _specification(row: dict[str, object]) -> Specification:
 
 
 def _fit_path(specification_id: str) -> Path:
-    return FIT_CACHE / f"{specification_id}.npz"
+    return FIT_CACHE / specification_id
 
 
 def _manifest_path(specification_id: str) -> Path:
     return FIT_CACHE / f"{specification_id}.json"
 
 
+def _fit_code_hash() -> str:
+    """Hash the estimator code and every pipeline helper that shapes a fit."""
+
+    return fit_code_hash(
+        _sample_frame,
+        _shared_nuisance,
+        _fit_specification,
+        _residualized_variance_share,
+    )
+
+
 def _cache_hash(
     spec: Specification,
     panel_hash: str,
@@ -118,7 +188,7 @@ def _cache_hash(
             "specification": asdict(spec),
             "panel_sha256": panel_hash,
             "sample_hash": sample_hash,
-            "code_hash": code_hash(),
+            "code_hash": _fit_code_hash(),
             "selected_names": selected_names,
         }
     )
@@ -173,15 +243,18 @@ def _sample_frame(panel: pl.DataFrame) -> pl.DataFrame:
 
 def _coefficient_rows(
     spec: Specification,
-    fit: CommonOLSFit,
+    coefficient: np.ndarray,
+    design_names: tuple[str, ...],
+    outcome_names: tuple[str, ...],
+    causal_count: int,
     causal_metadata: tuple[dict[str, object], ...],
 ) -> list[dict[str, object]]:
     rows = []
-    for outcome_index, outcome in enumerate(fit.outcome_names):
-        for coefficient_index, term in enumerate(fit.design_names):
+    for outcome_index, outcome in enumerate(outcome_names):
+        for coefficient_index, term in enumerate(design_names):
             metadata = (
                 causal_metadata[coefficient_index]
-                if coefficient_index < fit.causal_count
+                if coefficient_index < causal_count
                 else {}
             )
             rows.append(
@@ -189,8 +262,8 @@ def _coefficient_rows(
                     "specification_id": spec.specification_id,
                     "outcome": outcome,
                     "term": term,
-                    "estimate": fit.coefficient[coefficient_index, outcome_index],
-                    "causal_term": coefficient_index < fit.causal_count,
+                    "estimate": coefficient[coefficient_index, outcome_index],
+                    "causal_term": coefficient_index < causal_count,
                     "causal_outcome_year": metadata.get("outcome_year"),
                     "causal_history_year": metadata.get("history_year"),
                     "causal_lag": metadata.get("lag"),
@@ -203,23 +276,34 @@ def _coefficient_rows(
     return rows
 
 
+def _residualized_variance_share(
+    raw_causal: np.ndarray, within_causal: np.ndarray
+) -> float:
+    raw_centered = raw_causal - np.mean(raw_causal, axis=0)
+    denominator = float(np.sum(np.square(raw_centered)))
+    return float(np.sum(np.square(within_causal)) / denominator)
+
+
 def _diagnostic_rows(
     spec: Specification,
-    matrices: ModelMatrices,
-    fit: CommonOLSFit,
+    fit_manifest: Mapping[str, Any],
+    *,
+    leverage: np.ndarray,
+    cluster: np.ndarray,
+    lpm_fitted: np.ndarray,
     panel_hash: str,
     sample_hash: str,
 ) -> list[dict[str, object]]:
-    raw_causal = matrices.causal
-    within_causal = matrices.projector.within(raw_causal)
-    raw_centered = raw_causal - np.mean(raw_causal, axis=0)
-    denominator = float(np.sum(np.square(raw_centered)))
-    residualized_share = float(np.sum(np.square(within_causal)) / denominator)
-    cluster_sizes = (
-        pl.DataFrame({"cluster": matrices.cluster}).group_by("cluster").len()
+    """Build fit diagnostics from retained arrays and the fit manifest alone."""
+
+    model_rank = int(fit_manifest["model_rank"])
+    condition_number = float(fit_manifest["condition_number"])
+    solve_relative_residual = float(fit_manifest["solve_relative_residual"])
+    residualized_share = float(fit_manifest["residualized_treatment_variance_share"])
+    dropped_nuisance_names = tuple(
+        str(name) for name in fit_manifest["dropped_nuisance_names"]
     )
-    any_application_index = fit.outcome_names.index("any_application")
-    lpm_fitted = fit.fitted[:, any_application_index]
+    cluster_sizes = pl.DataFrame({"cluster": cluster}).group_by("cluster").len()
     below_zero_share = float(np.mean(lpm_fitted < 0.0))
     above_one_share = float(np.mean(lpm_fitted > 1.0))
     common = {
@@ -232,22 +316,22 @@ def _diagnostic_rows(
         {
             **common,
             "diagnostic": "model_rank",
-            "value": float(fit.model_rank),
+            "value": float(model_rank),
             "status": "pass",
             "detail": "full rank including fixed effects",
         },
         {
             **common,
             "diagnostic": "condition_number",
-            "value": fit.condition_number,
-            "status": "warning" if fit.condition_number > 1e10 else "pass",
+            "value": condition_number,
+            "status": "warning" if condition_number > 1e10 else "pass",
             "detail": "scaled within-design Gram",
         },
         {
             **common,
             "diagnostic": "solve_relative_residual",
-            "value": fit.solve_relative_residual,
-            "status": "warning" if fit.solve_relative_residual > 1e-9 else "pass",
+            "value": solve_relative_residual,
+            "status": "warning" if solve_relative_residual > 1e-9 else "pass",
             "detail": "norm(X' residual) / norm(X' outcome)",
         },
         {
@@ -264,8 +348,8 @@ def _diagnostic_rows(
         {
             **common,
             "diagnostic": "maximum_full_model_leverage",
-            "value": float(np.max(fit.leverage)),
-            "status": "warning" if np.max(fit.leverage) > 0.5 else "pass",
+            "value": float(np.max(leverage)),
+            "status": "warning" if np.max(leverage) > 0.5 else "pass",
             "detail": "includes absorbed fixed effects and selected design",
         },
         {
@@ -278,9 +362,9 @@ def _diagnostic_rows(
         {
             **common,
             "diagnostic": "dropped_nuisance_columns",
-            "value": float(len(fit.dropped_nuisance_names)),
-            "status": "warning" if fit.dropped_nuisance_names else "pass",
-            "detail": "|".join(fit.dropped_nuisance_names),
+            "value": float(len(dropped_nuisance_names)),
+            "status": "warning" if dropped_nuisance_names else "pass",
+            "detail": "|".join(dropped_nuisance_names),
         },
         {
             **common,
@@ -300,27 +384,87 @@ def _diagnostic_rows(
     return rows
 
 
-def fit_registry() -> None:
-    """Fit every selected registry row and retain provenance-checked arrays."""
+def _cached_fit(
+    spec: Specification,
+    panel_hash: str,
+    sample_hash: str,
+    row_count: int,
+) -> tuple[dict[str, Any], dict[str, np.ndarray]] | None:
+    """Return retained arrays whose content address matches the current inputs.
 
-    panel = pl.read_parquet(ANALYSIS_PANEL)
-    sample = _sample_frame(panel)
-    registry = _load_registry()
-    panel_hash = sha256_file(ANALYSIS_PANEL)
-    sample_hash = panel_key_hash(sample)
-    force = os.getenv("MC_SPEC_FORCE", "0") == "1"
-    FIT_CACHE.mkdir(parents=True, exist_ok=True)
-    coefficient_rows: list[dict[str, object]] = []
-    diagnostic_rows: list[dict[str, object]] = []
+    The cache hash covers the specification, panel, sample keys, estimator
+    code, and selected design names.  The names are a deterministic output of
+    the other inputs, so the manifest's own names are hashed with the current
+    inputs and compared before any array payload is read.
+    """
 
-    for row in registry.iter_rows(named=True):
-        spec = _specification(row)
+    fit_path = _fit_path(spec.specification_id)
+    manifest_path = _manifest_path(spec.specification_id)
+    if not fit_path.is_dir() or not manifest_path.is_file():
+        return None
+    try:
+        fit_manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return None
+    names = tuple(str(name) for name in fit_manifest.get("design_names", ()))
+    if fit_manifest.get("cache_hash") != _cache_hash(
+        spec, panel_hash, sample_hash, names
+    ) or any(key not in fit_manifest for key in CACHED_SUMMARY_FIELDS):
+        return None
+    if fit_manifest.get("fit_mode") != fit_mode():
+        return None
+    metadata = fit_manifest.get("arrays", {})
+    try:
+        residual_shape = list(metadata["residual"]["shape"])
+        coefficient_shape = list(metadata["coefficient"]["shape"])
+    except (KeyError, TypeError):
+        return None
+    if residual_shape[0] != row_count or coefficient_shape != [
+        len(names),
+        *residual_shape[1:],
+    ]:
+        return None
+    try:
+        arrays = load_array_store(fit_path, metadata, CACHED_ARRAY_FIELDS)
+    except (OSError, ValueError, KeyError):
+        return None
+    if tuple(str(name) for name in arrays["design_names"]) != names:
+        return None
+    return fit_manifest, arrays
+
+
+def _shared_nuisance(
+    spec: Specification, sample: pl.DataFrame, sample_hash: str
+) -> WithinNuisance:
+    """Return the factored nuisance block for this fixed-effect set and sample."""
+
+    key = (spec.fixed_effects, fixed_effect_parent_geography(spec), sample_hash)
+    if key not in _NUISANCE_CACHE:
+        _NUISANCE_CACHE.clear()
+        _NUISANCE_CACHE[key] = build_within_nuisance(sample, spec)
+    return _NUISANCE_CACHE[key]
+
+
+def _fit_specification(
+    spec: Specification,
+    sample: pl.DataFrame,
+    panel_hash: str,
+    sample_hash: str,
+    source_panel_hash: str,
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """Fit one specification and persist its arrays before its manifest."""
+
+    mode = fit_mode()
+    # The streamed within design is written straight to disk for the report.
+    design_path = (
+        FIT_CACHE / f".{spec.specification_id}.within_design.{os.getpid()}.npy"
+    )
+    if mode == "streaming":
         matrices = build_model_matrices(
-            sample,
-            spec,
-            CLUSTER_DEFINITIONS[spec.cluster],
+            sample, spec, CLUSTER_DEFINITIONS[spec.cluster], streaming=True
         )
-        fit = fit_common_ols(
+        design_path.parent.mkdir(parents=True, exist_ok=True)
+        fit = fit_common_ols_streaming(
             matrices.projector,
             matrices.causal,
             matrices.nuisance,
@@ -328,61 +472,258 @@ def fit_registry() -> None:
             matrices.causal_names,
             matrices.nuisance_names,
             matrices.outcome_names,
-        )
-        digest = _cache_hash(spec, panel_hash, sample_hash, fit.design_names)
-        fit_path = _fit_path(spec.specification_id)
-        manifest_path = _manifest_path(spec.specification_id)
-        if not force and fit_path.is_file() and manifest_path.is_file():
-            previous = json.loads(manifest_path.read_text())
-            if previous.get("cache_hash") == digest:
-                print(
-                    f"Compatible cache exists; recomputing summary: {spec.specification_id}"
-                )
-        np.savez_compressed(
-            fit_path,
-            coefficient=fit.coefficient,
-            bread=fit.bread,
-            residual=fit.residual,
-            leverage=fit.leverage,
-            within_design=fit.within_design,
-            cluster=np.asarray(matrices.cluster, dtype=str),
-            design_names=np.asarray(fit.design_names, dtype=str),
-            outcome_names=np.asarray(fit.outcome_names, dtype=str),
-            causal_count=np.asarray([fit.causal_count]),
-            model_rank=np.asarray([fit.model_rank]),
-            causal_metadata_json=np.asarray(
-                [json.dumps(matrices.causal_metadata, sort_keys=True)], dtype=str
+            allocate=lambda shape: np.lib.format.open_memmap(
+                design_path, mode="w+", dtype=np.float64, shape=shape
             ),
         )
-        atomic_write_json(
-            {
-                "cache_hash": digest,
-                "specification": asdict(spec),
-                "panel_sha256": panel_hash,
-                "source_panel_sha256": sha256_file(SOURCE_PANEL),
-                "sample_hash": sample_hash,
-                "code_hash": code_hash(),
-                "environment": environment_record(),
-                "row_count": matrices.row_count,
-                "model_rank": fit.model_rank,
-                "residual_df": fit.residual_df,
-                "condition_number": fit.condition_number,
-                "solve_relative_residual": fit.solve_relative_residual,
-                "design_names": fit.design_names,
-                "causal_metadata": matrices.causal_metadata,
-                "dropped_nuisance_names": fit.dropped_nuisance_names,
-            },
-            manifest_path,
+    else:
+        nuisance = _shared_nuisance(spec, sample, sample_hash)
+        matrices = build_model_matrices(
+            sample,
+            spec,
+            CLUSTER_DEFINITIONS[spec.cluster],
+            nuisance=nuisance,
         )
-        coefficient_rows.extend(_coefficient_rows(spec, fit, matrices.causal_metadata))
-        diagnostic_rows.extend(
-            _diagnostic_rows(spec, matrices, fit, panel_hash, sample_hash)
+        fit = fit_common_ols_within(
+            nuisance,
+            matrices.causal,
+            matrices.outcomes,
+            matrices.causal_names,
+            matrices.outcome_names,
         )
-        print(
-            f"Fit {spec.specification_id}: N={matrices.row_count:,}, "
-            f"K={fit.model_rank:,}, max(h)={fit.leverage.max():.4f}."
+    fit_manifest: dict[str, Any] = {
+        "cache_hash": _cache_hash(spec, panel_hash, sample_hash, fit.design_names),
+        "arrays": None,
+        "specification": asdict(spec),
+        "panel_sha256": panel_hash,
+        "source_panel_sha256": source_panel_hash,
+        "sample_hash": sample_hash,
+        "code_hash": _fit_code_hash(),
+        "environment": environment_record(),
+        "row_count": matrices.row_count,
+        "fit_mode": mode,
+        "model_rank": fit.model_rank,
+        "residual_df": fit.residual_df,
+        "condition_number": fit.condition_number,
+        "solve_relative_residual": fit.solve_relative_residual,
+        "residualized_treatment_variance_share": _residualized_variance_share(
+            matrices.causal, fit.within_design[:, : fit.causal_count]
+        ),
+        "design_names": fit.design_names,
+        "causal_metadata": matrices.causal_metadata,
+        "dropped_nuisance_names": fit.dropped_nuisance_names,
+    }
+    arrays = {
+        "coefficient": fit.coefficient,
+        "bread": fit.bread,
+        "residual": fit.residual,
+        "leverage": fit.leverage,
+        "within_design": fit.within_design,
+        "cluster": np.asarray(matrices.cluster, dtype=str),
+        "design_names": np.asarray(fit.design_names, dtype=str),
+        "outcome_names": np.asarray(fit.outcome_names, dtype=str),
+        "causal_count": np.asarray([fit.causal_count]),
+        "model_rank": np.asarray([fit.model_rank]),
+        "causal_metadata_json": np.asarray(
+            [json.dumps(matrices.causal_metadata, sort_keys=True)], dtype=str
+        ),
+    }
+    # Callers read the within design back from the store, so hold no other
+    # reference to the streamed memmap: a mapped file cannot be unlinked on
+    # Windows.
+    del fit
+    manifest_path = _manifest_path(spec.specification_id)
+    # A retained manifest must never describe a partially replaced array file.
+    manifest_path.unlink(missing_ok=True)
+    try:
+        fit_manifest["arrays"] = atomic_write_array_store(
+            arrays, _fit_path(spec.specification_id)
+        )
+    finally:
+        del arrays["within_design"]
+        design_path.unlink(missing_ok=True)
+    atomic_write_json(fit_manifest, manifest_path)
+    return fit_manifest, arrays
+
+
+def _worker_count() -> int:
+    text = os.getenv("MC_SPEC_WORKERS", "1")
+    try:
+        workers = int(text)
+    except ValueError as error:
+        raise ValueError("MC_SPEC_WORKERS must be a positive integer.") from error
+    if workers < 1:
+        raise ValueError("MC_SPEC_WORKERS must be a positive integer.")
+    return workers
+
+
+def _attach_shared_sample(path: Path, fit_cache: Path) -> None:
+    """Map the parent's sample read-only into one worker process."""
+
+    global FIT_CACHE, _SHARED_SAMPLE
+    FIT_CACHE = fit_cache
+    # Polars memory-maps an uncompressed local IPC file instead of copying it.
+    _SHARED_SAMPLE = pl.read_ipc(path)
+
+
+def _shared_sample_task[TaskResult](
+    task: Callable[..., TaskResult], spec: Specification, *arguments: object
+) -> TaskResult:
+    if _SHARED_SAMPLE is None:
+        raise RuntimeError("Worker process has no shared sample attached.")
+    return task(spec, _SHARED_SAMPLE, *arguments)
+
+
+def _map_specifications[TaskResult](
+    task: Callable[..., TaskResult],
+    specs: Sequence[Specification],
+    sample: pl.DataFrame,
+    *arguments: object,
+) -> list[TaskResult]:
+    """Run ``task`` for every specification and return results in input order.
+
+    With ``MC_SPEC_WORKERS>1`` the sample is written once as an uncompressed
+    Arrow IPC file that every worker memory-maps, so no worker receives a
+    pickled copy.  Rows run grouped by fixed effects, in contiguous chunks per
+    worker, so the per-process nuisance cache is rebuilt once per group; the
+    results are restored to input order, which keeps the merged artifacts
+    byte-identical to a serial run.
+    """
+
+    order = sorted(range(len(specs)), key=lambda index: specs[index].fixed_effects)
+    grouped = [specs[index] for index in order]
+    workers = min(_worker_count(), len(specs))
+    if workers <= 1:
+        results = [task(spec, sample, *arguments) for spec in grouped]
+    else:
+        results = _map_in_workers(task, grouped, sample, workers, arguments)
+    restored: list[TaskResult] = [results[0]] * len(specs)
+    for position, index in enumerate(order):
+        restored[index] = results[position]
+    return restored
+
+
+def _map_in_workers[TaskResult](
+    task: Callable[..., TaskResult],
+    specs: Sequence[Specification],
+    sample: pl.DataFrame,
+    workers: int,
+    arguments: tuple[object, ...],
+) -> list[TaskResult]:
+    FIT_CACHE.mkdir(parents=True, exist_ok=True)
+    shared_path = FIT_CACHE / f".shared_sample.{os.getpid()}.arrow"
+    sample.write_ipc(shared_path, compression="uncompressed")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_attach_shared_sample,
+            initargs=(shared_path, FIT_CACHE),
+        ) as executor:
+            return list(
+                executor.map(
+                    partial(_shared_sample_task, task),
+                    specs,
+                    *(repeat(argument, len(specs)) for argument in arguments),
+                    chunksize=max(1, -(-len(specs) // (4 * workers))),
+                )
+            )
+    finally:
+        shared_path.unlink(missing_ok=True)
+
+
+def _fit_rows(
+    spec: Specification,
+    sample: pl.DataFrame,
+    panel_hash: str,
+    sample_hash: str,
+    source_panel_hash: str,
+    force: bool,
+) -> tuple[list[dict[str, object]], list[dict[str, object]], str]:
+    """Fit or reload one specification and build its artifact rows."""
+
+    cached = (
+        None if force else _cached_fit(spec, panel_hash, sample_hash, sample.height)
+    )
+    if cached is None:
+        fit_manifest, arrays = _fit_specification(
+            spec, sample, panel_hash, sample_hash, source_panel_hash
         )
+        action = "Fit"
+    else:
+        fit_manifest, arrays = cached
+        action = "Reused cached fit"
+    design_names = tuple(str(value) for value in arrays["design_names"])
+    outcome_names = tuple(str(value) for value in arrays["outcome_names"])
+    causal_count = int(arrays["causal_count"][0])
+    causal_metadata = tuple(json.loads(str(arrays["causal_metadata_json"][0])))
+    residual = arrays["residual"]
+    leverage = arrays["leverage"]
+    any_application = sample[PRIMITIVE_OUTCOMES["any_application"]].cast(pl.Float64)
+    coefficient_rows = _coefficient_rows(
+        spec,
+        arrays["coefficient"],
+        design_names,
+        outcome_names,
+        causal_count,
+        causal_metadata,
+    )
+    diagnostic_rows = _diagnostic_rows(
+        spec,
+        fit_manifest,
+        leverage=leverage,
+        cluster=arrays["cluster"],
+        lpm_fitted=(
+            any_application.to_numpy()
+            - residual[:, outcome_names.index("any_application")]
+        ),
+        panel_hash=panel_hash,
+        sample_hash=sample_hash,
+    )
+    message = (
+        f"{action} {spec.specification_id}: N={residual.shape[0]:,}, "
+        f"K={int(arrays['model_rank'][0]):,}, max(h)={leverage.max():.4f}."
+    )
+    return coefficient_rows, diagnostic_rows, message
+
+
+def fit_registry() -> None:
+    """Fit every selected registry row and retain provenance-checked arrays.
+
+    A specification whose content-addressed cache matches the current inputs
+    is not rebuilt: its coefficient and diagnostic rows are reconstructed from
+    the retained arrays.  ``MC_SPEC_FORCE=1`` refits every row, and
+    ``MC_SPEC_WORKERS`` fits independent rows in that many processes.
+    """
 
+    panel = pl.read_parquet(ANALYSIS_PANEL)
+    sample = _sample_frame(panel)
+    registry = _load_registry()
+    panel_hash = sha256_file(ANALYSIS_PANEL)
+    sample_hash = panel_key_hash(sample)
+    force = os.getenv("MC_SPEC_FORCE", "0") == "1"
+    FIT_CACHE.mkdir(parents=True, exist_ok=True)
+    specs = [_specification(row) for row in registry.iter_rows(named=True)]
+    coefficient_rows: list[dict[str, object]] = []
+    diagnostic_rows: list[dict[str, object]] = []
+    # The sample hash covers keys only, so the nuisance cache lives for one run.
+    _NUISANCE_CACHE.clear()
+    try:
+        results = _map_specifications(
+            _fit_rows,
+            specs,
+            sample,
+            panel_hash,
+            sample_hash,
+            sha256_file(SOURCE_PANEL),
+            force,
+        )
+    finally:
+        _NUISANCE_CACHE.clear()
+    for coefficients, diagnostics, message in results:
+        coefficient_rows.extend(coefficients)
+        diagnostic_rows.extend(diagnostics)
+        print(message)
     atomic_write_frame(
         pl.DataFrame(coefficient_rows, infer_schema_length=None), COEFFICIENTS_PATH
     )
@@ -543,23 +884,15 @@ def _fixed_observed_mean_metric(
     )
 
 
-def _postfit_rows(
+def _postfit_gradients(
     spec: Specification,
-    coefficient: np.ndarray,
-    names: tuple[str, ...],
-    outcomes: tuple[str, ...],
+    layout: CoefficientLayout,
     causal_count: int,
     frame: pl.DataFrame,
-    *,
-    design: np.ndarray,
-    residual: np.ndarray,
-    bread: np.ndarray,
-    leverage: np.ndarray,
-    cluster: np.ndarray,
-    model_rank: int,
-) -> list[dict[str, object]]:
-    layout = CoefficientLayout(names, outcomes)
-    coefficients = CommonCoefficientMatrix(coefficient, layout)
+) -> tuple[TargetPopulation, list[NamedGradient]]:
+    """Return the reporting target and every constructed estimand's gradient."""
+
+    names, outcomes = layout.coefficient_names, layout.outcome_names
     row_ids = _row_ids(frame)
     analysis_year = frame["year"].cast(pl.Int32).to_numpy()
     target = TargetPopulation(
@@ -640,17 +973,73 @@ def _postfit_rows(
             ),
         )
     )
+    return target, gradients
+
+
+def _batched_inference(
+    gradients: np.ndarray,
+    *,
+    design: np.ndarray,
+    residual: np.ndarray,
+    bread: np.ndarray,
+    leverage: np.ndarray,
+    cluster: np.ndarray,
+    model_rank: int,
+) -> tuple[tuple[LinearGradientSandwich, ...], dict[int, ExperimentalScalarCCV]]:
+    """Contract every ``G x K x J`` gradient of one specification in one pass.
+
+    The common inputs are validated once and all residualized directions come
+    from one matrix product.  The experimental CCV is batched over the common
+    directions of the gradients whose outcome columns are proportional; it is
+    keyed by gradient index and returns the full ``J x J`` covariance, so a
+    gradient's variance is ``loadings' V loadings``.
+    """
+
     sandwiches = batch_linear_gradient_cross_outcome_inference(
         design,
         residual,
         bread,
         leverage,
         cluster,
-        np.stack([gradient.values for gradient in gradients]),
+        gradients,
         n_parameters=model_rank,
     )
+    scalar_indices = [
+        index
+        for index, sandwich in enumerate(sandwiches)
+        if sandwich.common_contrast_direction is not None
+        and sandwich.outcome_loadings is not None
+    ]
+    if not scalar_indices:
+        return sandwiches, {}
+    scalars = batch_experimental_scalar_ccv_hc3(
+        np.column_stack(
+            [sandwiches[index].common_contrast_direction for index in scalar_indices]
+        ),
+        residual,
+        leverage,
+        cluster,
+        n_parameters=model_rank,
+    )
+    return sandwiches, dict(zip(scalar_indices, scalars, strict=True))
+
+
+def _loaded_variance(covariance: np.ndarray, loadings: np.ndarray) -> float:
+    return float(loadings @ covariance @ loadings)
+
+
+def _postfit_rows(
+    spec: Specification,
+    coefficients: CommonCoefficientMatrix,
+    target: TargetPopulation,
+    gradients: Sequence[NamedGradient],
+    sandwiches: Sequence[LinearGradientSandwich],
+    scalars: Mapping[int, ExperimentalScalarCCV],
+) -> list[dict[str, object]]:
     rows = []
-    for gradient, sandwich in zip(gradients, sandwiches, strict=True):
+    for index, (gradient, sandwich) in enumerate(
+        zip(gradients, sandwiches, strict=True)
+    ):
         estimate = gradient.evaluate(coefficients)
         common = {
             "specification_id": spec.specification_id,
@@ -676,35 +1065,29 @@ def _postfit_rows(
                     **common,
                     "standard_error": sandwich.cr0_standard_error,
                     "inference_method": "cr0_cluster_sandwich_joint_delta",
-                    "cluster_count": np.unique(cluster).size,
+                    "cluster_count": sandwich.n_clusters,
                     "experimental_ccv": False,
                 },
                 {
                     **common,
                     "standard_error": sandwich.cr1_standard_error,
                     "inference_method": "cr1_cluster_sandwich_joint_delta",
-                    "cluster_count": np.unique(cluster).size,
+                    "cluster_count": sandwich.n_clusters,
                     "experimental_ccv": False,
                 },
             )
         )
-        if (
-            sandwich.common_contrast_direction is not None
-            and sandwich.outcome_loadings is not None
-        ):
-            scalar = experimental_scalar_ccv_hc3(
-                sandwich.common_contrast_direction,
-                residual @ sandwich.outcome_loadings[:, None],
-                leverage,
-                cluster,
-                n_parameters=model_rank,
-            )
+        if index in scalars and sandwich.outcome_loadings is not None:
+            scalar = scalars[index]
+            loadings = sandwich.outcome_loadings
             rows.extend(
                 (
                     {
                         **common,
                         "standard_error": float(
-                            np.sqrt(max(scalar.ccv_hc3[0, 0], 0.0))
+                            np.sqrt(
+                                max(_loaded_variance(scalar.ccv_hc3, loadings), 0.0)
+                            )
                         ),
                         "inference_method": (
                             "ccv_hc3_scalar_mixture_experimental_delta"
@@ -715,7 +1098,12 @@ def _postfit_rows(
                     {
                         **common,
                         "standard_error": float(
-                            np.sqrt(max(scalar.ccv_hc3_cr1[0, 0], 0.0))
+                            np.sqrt(
+                                max(
+                                    _loaded_variance(scalar.ccv_hc3_cr1, loadings),
+                                    0.0,
+                                )
+                            )
                         ),
                         "inference_method": (
                             "ccv_hc3_cr1_scalar_mixture_experimental_delta"
@@ -813,17 +1201,121 @@ def _history_disagreement_diagnostics(
     return pl.DataFrame(rows)
 
 
-def report_registry() -> None:
-    """Report one transparent common estimand under every inference comparator."""
+def _deletion_refit(
+    spec: Specification,
+    sample: pl.DataFrame,
+    names: tuple[str, ...],
+    causal_count: int,
+    contrast: np.ndarray,
+    keep: np.ndarray,
+) -> np.ndarray:
+    """Refit one specification without a deleted cluster for the CV3 fallback."""
+
+    try:
+        matrices = build_model_matrices(
+            sample.filter(pl.Series(keep)), spec, CLUSTER_DEFINITIONS[spec.cluster]
+        )
+        fit = fit_common_ols(
+            matrices.projector,
+            matrices.causal,
+            matrices.nuisance,
+            matrices.outcomes,
+            matrices.causal_names,
+            matrices.nuisance_names,
+            matrices.outcome_names,
+        )
+    except ValueError as error:
+        raise InferenceContractError(
+            f"Cannot refit {spec.specification_id} without a cluster: {error}"
+        ) from error
+    if fit.design_names[:causal_count] != names[:causal_count]:
+        raise InferenceContractError(
+            f"Cluster-deletion refit of {spec.specification_id} changed the "
+            "causal block."
+        )
+    return contrast[:causal_count] @ fit.coefficient[:causal_count]
+
+
+def _cluster_deletion_covariances(
+    spec: Specification,
+    sample: pl.DataFrame,
+    provenance: Mapping[str, str],
+    *,
+    design: np.ndarray,
+    residual: np.ndarray,
+    bread: np.ndarray,
+    cluster: np.ndarray,
+    coefficient: np.ndarray,
+    contrast: np.ndarray,
+    names: tuple[str, ...],
+    causal_count: int,
+) -> tuple[dict[str, np.ndarray], list[dict[str, object]]]:
+    """Return block CR2 and exact-deletion CV3 for the scalar contrast.
+
+    Either comparator is withheld, with a warning diagnostic, when deleting
+    some cluster leaves the contrast unidentified or a required refit fails.
+    """
+
+    absorbed_terms = fixed_effect_projector(sample, spec).hat_terms()
+    covariances: dict[str, np.ndarray] = {}
+    diagnostics: list[dict[str, object]] = []
+    try:
+        covariances["cr2_bell_mccaffrey_cluster_sandwich"] = (
+            cr2_cross_outcome_covariance_block(
+                design,
+                residual,
+                bread,
+                cluster,
+                absorbed_terms=absorbed_terms,
+                contrasts=contrast,
+            )
+        )
+        cr2_detail = "full-model Bell-McCaffrey adjustment from block hat spectra"
+    except InferenceContractError as error:
+        cr2_detail = str(error)
+    try:
+        deletion = leave_cluster_out_estimates(
+            design,
+            residual,
+            bread,
+            cluster,
+            coefficient,
+            absorbed_terms=absorbed_terms,
+            contrasts=contrast,
+            # Specifications already run in parallel, so refits stay serial.
+            refit=partial(_deletion_refit, spec, sample, names, causal_count, contrast),
+        )
+        covariances["cv3_cluster_jackknife"] = deletion.cv3
+        cv3_detail = (
+            f"exact deletion updates; {len(deletion.refit_clusters)} "
+            "ill-conditioned clusters refitted"
+        )
+    except InferenceContractError as error:
+        cv3_detail = str(error)
+    for diagnostic, method, detail in (
+        ("cr2_block_defined", "cr2_bell_mccaffrey_cluster_sandwich", cr2_detail),
+        ("cv3_cluster_jackknife_defined", "cv3_cluster_jackknife", cv3_detail),
+    ):
+        diagnostics.append(
+            {
+                "specification_id": spec.specification_id,
+                **provenance,
+                "diagnostic": diagnostic,
+                "value": float(method in covariances),
+                "status": "pass" if method in covariances else "warning",
+                "detail": detail,
+            }
+        )
+    return covariances, diagnostics
+
+
+def _report_rows(
+    spec: Specification,
+    sample: pl.DataFrame,
+    provenance: Mapping[str, str],
+) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
+    """Build one specification's estimand rows and inference diagnostics."""
 
-    registry = _load_registry()
-    sample = _sample_frame(pl.read_parquet(ANALYSIS_PANEL))
-    manifest = _report_manifest(sample, registry)
-    diagnostic_provenance = {
-        "design_version": DESIGN_VERSION,
-        "panel_sha256": str(manifest["panel_sha256"]),
-        "sample_hash": str(manifest["sample_hash"]),
-    }
     target_rows = np.isin(
         sample["year"].cast(pl.Int32).to_numpy(), CURRENT_EFFECT_REPORTING_YEARS
     )
@@ -834,134 +1326,187 @@ def report_registry() -> None:
     )
     rows: list[dict[str, object]] = []
     inference_diagnostics: list[dict[str, object]] = []
-    for row in registry.iter_rows(named=True):
-        spec = _specification(row)
-        fit_path = _fit_path(spec.specification_id)
-        fit_manifest_path = _manifest_path(spec.specification_id)
-        if not fit_path.is_file() or not fit_manifest_path.is_file():
-            raise FileNotFoundError(
-                f"Missing fitted arrays for {spec.specification_id}; "
-                "re-run 03_estimate.py."
-            )
-        arrays = np.load(fit_path, allow_pickle=False)
-        coefficient = arrays["coefficient"]
-        bread = arrays["bread"]
-        residual = arrays["residual"]
-        leverage = arrays["leverage"]
-        design = arrays["within_design"]
-        cluster = arrays["cluster"]
-        names = tuple(str(value) for value in arrays["design_names"])
-        outcomes = tuple(str(value) for value in arrays["outcome_names"])
-        fit_manifest = json.loads(fit_manifest_path.read_text())
-        expected_cache_hash = _cache_hash(
-            spec,
-            str(manifest["panel_sha256"]),
-            str(manifest["sample_hash"]),
-            names,
-        )
-        if fit_manifest.get("cache_hash") != expected_cache_hash:
-            raise ValueError(
-                f"Fitted arrays are stale for {spec.specification_id}; "
-                "re-run 03_estimate.py."
-            )
-        causal_count = int(arrays["causal_count"][0])
-        model_rank = int(arrays["model_rank"][0])
-        contrast = _average_current_contrast(sample, names, causal_count)
-        estimate = contrast @ coefficient
-
-        direction = residualized_contrast_direction(design, bread, contrast)
-        experimental = experimental_scalar_ccv_hc3(
-            direction,
-            residual,
-            leverage,
-            cluster,
-            n_parameters=model_rank,
-        )
-        for outcome_index, outcome in enumerate(outcomes):
-            variances = {
-                "hc3_full_model_leverage": float(
-                    experimental.hc3[outcome_index, outcome_index]
-                ),
-                "cr0_cluster_sandwich": float(
-                    experimental.cr0[outcome_index, outcome_index]
-                ),
-                "cr1_cluster_sandwich": float(
-                    experimental.cr1[outcome_index, outcome_index]
-                ),
-                "ccv_hc3_scalar_mixture_experimental": float(
-                    experimental.ccv_hc3[outcome_index, outcome_index]
-                ),
-                "ccv_hc3_cr1_scalar_mixture_experimental": float(
-                    experimental.ccv_hc3_cr1[outcome_index, outcome_index]
-                ),
-            }
-            for method, variance in variances.items():
-                rows.append(
-                    {
-                        "specification_id": spec.specification_id,
-                        "outcome": str(outcome),
-                        "estimand": "average_current_coordinate_effect_"
-                        f"{CURRENT_EFFECT_START_YEAR}_{CURRENT_EFFECT_END_YEAR}",
-                        "estimate": float(estimate[outcome_index]),
-                        "standard_error": float(np.sqrt(max(variance, 0.0))),
-                        "inference_method": method,
-                        "cluster": spec.cluster,
-                        "cluster_count": (
-                            None
-                            if method == "hc3_full_model_leverage"
-                            else experimental.n_clusters
-                        ),
-                        "experimental_ccv": "experimental" in method,
-                        "target_population": target_name,
-                        "target_observations": target_observations,
-                        "target_weight_sum": float(target_observations),
-                        "target_weighting": "equal_county_year",
-                    }
-                )
-        rows.extend(
-            _postfit_rows(
-                spec,
-                coefficient,
-                names,
-                outcomes,
-                causal_count,
-                sample,
-                design=design,
-                residual=residual,
-                bread=bread,
-                leverage=leverage,
-                cluster=cluster,
-                model_rank=model_rank,
-            )
+    fit_path = _fit_path(spec.specification_id)
+    fit_manifest_path = _manifest_path(spec.specification_id)
+    if not fit_path.is_dir() or not fit_manifest_path.is_file():
+        raise FileNotFoundError(
+            f"Missing fitted arrays for {spec.specification_id}; re-run 03_estimate.py."
+        )
+    # The manifest alone decides staleness; payloads are mapped only afterwards.
+    fit_manifest = json.loads(fit_manifest_path.read_text())
+    names = tuple(str(value) for value in fit_manifest.get("design_names", ()))
+    expected_cache_hash = _cache_hash(
+        spec,
+        provenance["panel_sha256"],
+        provenance["sample_hash"],
+        names,
+    )
+    if fit_manifest.get("cache_hash") != expected_cache_hash or "arrays" not in (
+        fit_manifest
+    ):
+        raise ValueError(
+            f"Fitted arrays are stale for {spec.specification_id}; "
+            "re-run 03_estimate.py."
         )
-        inference_diagnostics.extend(
+    arrays = load_array_store(fit_path, fit_manifest["arrays"], REPORT_ARRAY_FIELDS)
+    if tuple(str(value) for value in arrays["design_names"]) != names:
+        raise ValueError(
+            f"Fitted arrays do not match the manifest for {spec.specification_id}; "
+            "re-run 03_estimate.py."
+        )
+    coefficient = arrays["coefficient"]
+    bread = arrays["bread"]
+    residual = arrays["residual"]
+    leverage = arrays["leverage"]
+    design = arrays["within_design"]
+    cluster = arrays["cluster"]
+    outcomes = tuple(str(value) for value in arrays["outcome_names"])
+    causal_count = int(arrays["causal_count"][0])
+    model_rank = int(arrays["model_rank"][0])
+    contrast = _average_current_contrast(sample, names, causal_count)
+    estimate = contrast @ coefficient
+    layout = CoefficientLayout(names, outcomes)
+    target, postfit_gradients = _postfit_gradients(spec, layout, causal_count, sample)
+    # One gradient per outcome places the average contrast in that column.
+    average_gradients = np.einsum("k,jl->jkl", contrast, np.eye(len(outcomes)))
+    sandwiches, scalars = _batched_inference(
+        np.concatenate(
             (
+                average_gradients,
+                np.stack([gradient.values for gradient in postfit_gradients]),
+            )
+        ),
+        design=design,
+        residual=residual,
+        bread=bread,
+        leverage=leverage,
+        cluster=cluster,
+        model_rank=model_rank,
+    )
+    experimental = scalars[0]
+    deletion, deletion_diagnostics = _cluster_deletion_covariances(
+        spec,
+        sample,
+        provenance,
+        design=design,
+        residual=residual,
+        bread=bread,
+        cluster=cluster,
+        coefficient=coefficient,
+        contrast=contrast,
+        names=names,
+        causal_count=causal_count,
+    )
+    inference_diagnostics.extend(deletion_diagnostics)
+    for outcome_index, outcome in enumerate(outcomes):
+        sandwich = sandwiches[outcome_index]
+        variances = {
+            "hc3_full_model_leverage": sandwich.hc3_variance,
+            "cr0_cluster_sandwich": sandwich.cr0_variance,
+            "cr1_cluster_sandwich": sandwich.cr1_variance,
+            "ccv_hc3_scalar_mixture_experimental": float(
+                experimental.ccv_hc3[outcome_index, outcome_index]
+            ),
+            "ccv_hc3_cr1_scalar_mixture_experimental": float(
+                experimental.ccv_hc3_cr1[outcome_index, outcome_index]
+            ),
+        }
+        variances.update(
+            (method, float(covariance[outcome_index, outcome_index]))
+            for method, covariance in deletion.items()
+        )
+        for method, variance in variances.items():
+            rows.append(
                 {
                     "specification_id": spec.specification_id,
-                    **diagnostic_provenance,
-                    "diagnostic": "experimental_ccv_lambda",
-                    "value": experimental.lambda_weight,
-                    "status": "warning",
-                    "detail": CCV_STATUS,
-                },
-                {
-                    "specification_id": spec.specification_id,
-                    **diagnostic_provenance,
-                    "diagnostic": "experimental_ccv_omega_cv",
-                    "value": experimental.omega_cv,
-                    "status": "warning",
-                    "detail": "descriptive; not a validity gate",
-                },
-                {
-                    "specification_id": spec.specification_id,
-                    **diagnostic_provenance,
-                    "diagnostic": "experimental_ccv_kappa_cv",
-                    "value": experimental.kappa_cv,
-                    "status": "warning",
-                    "detail": "descriptive heuristic; not a Lean theorem",
-                },
+                    "outcome": str(outcome),
+                    "estimand": "average_current_coordinate_effect_"
+                    f"{CURRENT_EFFECT_START_YEAR}_{CURRENT_EFFECT_END_YEAR}",
+                    "estimate": float(estimate[outcome_index]),
+                    "standard_error": float(np.sqrt(max(variance, 0.0))),
+                    "inference_method": method,
+                    "cluster": spec.cluster,
+                    "cluster_count": (
+                        None
+                        if method == "hc3_full_model_leverage"
+                        else experimental.n_clusters
+                    ),
+                    "experimental_ccv": "experimental" in method,
+                    "target_population": target_name,
+                    "target_observations": target_observations,
+                    "target_weight_sum": float(target_observations),
+                    "target_weighting": "equal_county_year",
+                }
             )
+    postfit_start = len(outcomes)
+    rows.extend(
+        _postfit_rows(
+            spec,
+            CommonCoefficientMatrix(coefficient, layout),
+            target,
+            postfit_gradients,
+            sandwiches[postfit_start:],
+            {
+                index - postfit_start: scalar
+                for index, scalar in scalars.items()
+                if index >= postfit_start
+            },
+        )
+    )
+    inference_diagnostics.extend(
+        (
+            {
+                "specification_id": spec.specification_id,
+                **provenance,
+                "diagnostic": "experimental_ccv_lambda",
+                "value": experimental.lambda_weight,
+                "status": "warning",
+                "detail": CCV_STATUS,
+            },
+            {
+                "specification_id": spec.specification_id,
+                **provenance,
+                "diagnostic": "experimental_ccv_omega_cv",
+                "value": experimental.omega_cv,
+                "status": "warning",
+                "detail": "descriptive; not a validity gate",
+            },
+            {
+                "specification_id": spec.specification_id,
+                **provenance,
+                "diagnostic": "experimental_ccv_kappa_cv",
+                "value": experimental.kappa_cv,
+                "status": "warning",
+                "detail": "descriptive heuristic; not a Lean theorem",
+            },
         )
+    )
+    return rows, inference_diagnostics
+
+
+def report_registry() -> None:
+    """Report one transparent common estimand under every inference comparator.
+
+    ``MC_SPEC_WORKERS`` reports independent rows in that many processes and
+    merges them in registry order.
+    """
+
+    registry = _load_registry()
+    sample = _sample_frame(pl.read_parquet(ANALYSIS_PANEL))
+    manifest = _report_manifest(sample, registry)
+    diagnostic_provenance = {
+        "design_version": DESIGN_VERSION,
+        "panel_sha256": str(manifest["panel_sha256"]),
+        "sample_hash": str(manifest["sample_hash"]),
+    }
+    specs = [_specification(row) for row in registry.iter_rows(named=True)]
+    rows: list[dict[str, object]] = []
+    inference_diagnostics: list[dict[str, object]] = []
+    for estimand_rows, diagnostics in _map_specifications(
+        _report_rows, specs, sample, diagnostic_provenance
+    ):
+        rows.extend(estimand_rows)
+        inference_diagnostics.extend(diagnostics)
     result_frame = pl.DataFrame(rows, infer_schema_length=None)
     atomic_write_frame(result_frame, RESULTS_PATH)
     existing = pl.read_csv(DIAGNOSTICS_PATH)
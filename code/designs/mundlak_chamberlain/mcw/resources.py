@@ -11,6 +11,12 @@ DEFAULT_MAX_DENSE_GIB = 1.25
 DEFAULT_MAX_ESTIMATED_PEAK_GIB = 6.0
 DENSE_PEAK_COPIES = 4
 GRAM_PEAK_COPIES = 3
+# The streaming fit holds a few row blocks and a triangular factor in flight,
+# never a working copy of the design, next to the outcomes and residuals.
+STREAMING_BLOCK_COPIES = 4
+STREAMING_OUTCOME_COPIES = 2
+STREAMING_BLOCK_ROWS = 4096
+FIT_MODES = ("dense", "streaming")
 
 
 @dataclass(frozen=True, slots=True)
@@ -35,19 +41,56 @@ def _positive_environment(name: str, default: float) -> float:
     return value
 
 
-def resource_budget(rows: int, columns: int) -> ResourceBudget:
-    """Estimate the dense and fit working sets for an ``N x K`` design."""
+def fit_mode() -> str:
+    """Return the declared OLS fit mode from ``MC_SPEC_FIT_MODE``."""
+
+    mode = os.getenv("MC_SPEC_FIT_MODE", "dense")
+    if mode not in FIT_MODES:
+        raise ValueError(f"MC_SPEC_FIT_MODE must be one of {FIT_MODES}.")
+    return mode
+
+
+def resource_budget(
+    rows: int,
+    columns: int,
+    *,
+    mode: str = "dense",
+    outcomes: int = 0,
+    group_mean_rows: int = 0,
+) -> ResourceBudget:
+    """Estimate the dense and fit working sets for an ``N x K`` design.
+
+    A streaming fit also holds its ``N x J`` outcomes and residuals and the
+    fixed-effect means of every design and outcome column, one row per
+    absorbed group.
+    """
 
     if rows < 1 or columns < 1:
         raise ValueError("Resource-budget dimensions must be positive.")
+    if outcomes < 0 or group_mean_rows < 0:
+        raise ValueError("Resource-budget counts must be nonnegative.")
+    if mode not in FIT_MODES:
+        raise ValueError(f"Unknown fit mode: {mode}")
     dense_gib = rows * columns * BYTES_PER_FLOAT64 / BYTES_PER_GIB
     gram_gib = columns * columns * BYTES_PER_FLOAT64 / BYTES_PER_GIB
+    if mode == "streaming":
+        block_gib = dense_gib * min(rows, STREAMING_BLOCK_ROWS) / rows
+        outcome_gib = rows * outcomes * BYTES_PER_FLOAT64 / BYTES_PER_GIB
+        mean_gib = (
+            group_mean_rows * (columns + outcomes) * BYTES_PER_FLOAT64 / BYTES_PER_GIB
+        )
+        estimated_peak_gib = (
+            STREAMING_BLOCK_COPIES * block_gib
+            + GRAM_PEAK_COPIES * gram_gib
+            + STREAMING_OUTCOME_COPIES * outcome_gib
+            + mean_gib
+        )
+    else:
+        estimated_peak_gib = DENSE_PEAK_COPIES * dense_gib + GRAM_PEAK_COPIES * gram_gib
     return ResourceBudget(
         dense_gib=dense_gib,
         gram_gib=gram_gib,
-        estimated_peak_gib=(
-            DENSE_PEAK_COPIES * dense_gib + GRAM_PEAK_COPIES * gram_gib
-        ),
+        estimated_peak_gib=estimated_peak_gib,
         dense_limit_gib=_positive_environment(
             "MC_SPEC_MAX_DENSE_GIB", DEFAULT_MAX_DENSE_GIB
         ),
@@ -69,13 +112,32 @@ def guard_dense_allocation(rows: int, columns: int, *, label: str) -> ResourceBu
     return budget
 
 
-def guard_fit_working_set(rows: int, columns: int) -> ResourceBudget:
-    """Reject a selected fit whose declared dense peak exceeds the ceiling."""
-
-    budget = guard_dense_allocation(rows, columns, label="Selected OLS design")
+def guard_fit_working_set(
+    rows: int,
+    columns: int,
+    *,
+    mode: str = "dense",
+    outcomes: int = 0,
+    group_mean_rows: int = 0,
+) -> ResourceBudget:
+    """Reject a selected fit whose declared dense peak exceeds the ceiling.
+
+    A streaming fit never allocates the ``N x K`` design, so only its
+    estimated peak is checked.
+    """
+
+    if mode != "streaming":
+        guard_dense_allocation(rows, columns, label="Selected OLS design")
+    budget = resource_budget(
+        rows,
+        columns,
+        mode=mode,
+        outcomes=outcomes,
+        group_mean_rows=group_mean_rows,
+    )
     if budget.estimated_peak_gib > budget.peak_limit_gib:
         raise MemoryError(
-            "Selected OLS working set is estimated at "
+            f"Selected {mode} OLS working set is estimated at "
             f"{budget.estimated_peak_gib:.3f} GiB, above "
             f"MC_SPEC_MAX_PEAK_GIB={budget.peak_limit_gib:.3f}."
         )
@@ -12,7 +12,16 @@ BRANCH_ROOT = Path(__file__).resolve().parents[1]
 if str(BRANCH_ROOT) not in sys.path:
     sys.path.insert(0, str(BRANCH_ROOT))
 
-from mcw.fwl import NestedFixedEffectProjector, NoFixedEffectProjector, fit_common_ols
+from benchmarks.within_projector import add_at_within
+from mcw.fwl import (
+    NestedFixedEffectProjector,
+    NoFixedEffectProjector,
+    WithinNuisance,
+    causal_first_full_rank_design,
+    causal_first_reduced_design,
+    fit_common_ols,
+    fit_common_ols_streaming,
+)
 
 
 def _fixture() -> tuple[np.ndarray, ...]:
@@ -57,6 +66,63 @@ def _dense_fixed_effects(
     return np.column_stack(blocks)
 
 
+class _ScatterAddProjector:
+    """The nested projector with the original scatter-add annihilator."""
+
+    def __init__(self, projector: NestedFixedEffectProjector) -> None:
+        self.projector = projector
+        self.n_rows = projector.n_rows
+        self.rank = projector.rank
+
+    def within(
+        self,
+        values: np.ndarray,
+        *,
+        out: np.ndarray | None = None,
+        block_columns: int | None = None,
+    ) -> np.ndarray:
+        return add_at_within(self.projector, np.atleast_2d(values.T).T)
+
+    def leverage_diagonal(self) -> np.ndarray:
+        return self.projector.leverage_diagonal()
+
+
+def _absorbed_nuisance_fixture() -> tuple[np.ndarray, ...]:
+    """A registry-sized panel whose dictionary mixes absorbed columns in."""
+
+    rng = np.random.default_rng(20261018)
+    n_units, n_years = 40, 13
+    unit_code = np.repeat(np.arange(n_units), n_years)
+    year_code = np.tile(np.arange(n_years), n_units)
+    parent_code = unit_code // 10
+    n_rows = unit_code.size
+    nuisance = np.column_stack(
+        (
+            rng.normal(size=(n_rows, 3)),
+            rng.normal(size=(n_units, 2))[unit_code],
+            (rng.random(n_units) < 0.3).astype(float)[unit_code],
+            rng.lognormal(size=n_units)[unit_code] * 1000.0,
+            rng.normal(size=(4, n_years))[parent_code, year_code],
+        )
+    )
+    causal = rng.normal(size=(n_rows, 2))
+    # Collinear with the causal block, so the kept representative is pinned.
+    nuisance = np.column_stack((nuisance, nuisance[:, 0] + causal[:, 0]))
+    outcomes = (
+        np.column_stack((causal, nuisance[:, :3])) @ rng.normal(size=(5, 2))
+        + rng.normal(size=(n_units, 2))[unit_code]
+        + rng.normal(scale=0.1, size=(n_rows, 2))
+    )
+    return (
+        unit_code.astype(str),
+        year_code.astype(str),
+        parent_code.astype(str),
+        causal,
+        nuisance,
+        outcomes,
+    )
+
+
 class FWLTest(unittest.TestCase):
     def test_pooled_explicit_nuisance_matches_dense_ols_and_leverage(self) -> None:
         rng = np.random.default_rng(20260813)
@@ -164,6 +230,109 @@ class FWLTest(unittest.TestCase):
         fixed_effects = _dense_fixed_effects(unit, year, parent)
         np.testing.assert_allclose(fixed_effects.T @ within, 0.0, atol=1e-12)
 
+    def test_group_sum_kernels_match_scatter_add_reference(self) -> None:
+        unit, year, parent, causal, nuisance, _ = _fixture()
+        matrix = np.column_stack((causal, nuisance))
+        sorted_projector = NestedFixedEffectProjector.from_arrays(unit, year, parent)
+        self.assertTrue(sorted_projector.unit_year_layout)
+        expected = add_at_within(sorted_projector, matrix)
+        np.testing.assert_allclose(
+            sorted_projector.within(matrix), expected, atol=1e-13
+        )
+        np.testing.assert_allclose(
+            sorted_projector.within(matrix[:, 1]), expected[:, 1], atol=1e-13
+        )
+
+        in_place = matrix.copy()
+        returned = sorted_projector.within(in_place, out=in_place, block_columns=2)
+        self.assertIs(returned, in_place)
+        np.testing.assert_allclose(in_place, expected, atol=1e-13)
+
+        order = np.random.default_rng(7).permutation(unit.size)
+        shuffled = NestedFixedEffectProjector.from_arrays(
+            unit[order], year[order], parent[order]
+        )
+        self.assertFalse(shuffled.unit_year_layout)
+        np.testing.assert_allclose(
+            shuffled.within(matrix[order], block_columns=3),
+            expected[order],
+            atol=1e-13,
+        )
+        with self.assertRaisesRegex(ValueError, "block width"):
+            shuffled.within(matrix, block_columns=0)
+
+    def test_absorbed_nuisance_fit_matches_scatter_add_projector(self) -> None:
+        unit, year, parent, causal, nuisance, outcomes = _absorbed_nuisance_fixture()
+        names = (
+            "z1",
+            "z2",
+            "z3",
+            "unit_a",
+            "unit_b",
+            "unit_flag",
+            "unit_level",
+            "parent_year",
+            "z1_plus_d1",
+        )
+        projector = NestedFixedEffectProjector.from_arrays(unit, year, parent)
+        fits = [
+            fit_common_ols(
+                candidate,
+                causal,
+                nuisance,
+                outcomes,
+                ("d1", "d2"),
+                names,
+                ("y1", "y2"),
+            )
+            for candidate in (projector, _ScatterAddProjector(projector))
+        ]
+        for fit in fits:
+            self.assertEqual(fit.model_rank, projector.rank + 5)
+            self.assertEqual(fit.dropped_nuisance_names, names[3:])
+        np.testing.assert_allclose(
+            fits[0].coefficient, fits[1].coefficient, rtol=1e-10, atol=1e-12
+        )
+
+    def test_streaming_fit_matches_dense_fit_in_row_blocks(self) -> None:
+        unit, year, parent, causal, nuisance, outcomes = _fixture()
+        nuisance = np.column_stack((nuisance, nuisance[:, 0] + nuisance[:, 2]))
+        names = ("z1", "z2", "z3", "z1_plus_z3")
+        for projector in (
+            NestedFixedEffectProjector.from_arrays(unit, year, parent),
+            NoFixedEffectProjector.from_row_count(unit.size),
+        ):
+            arguments = (
+                projector,
+                causal,
+                nuisance,
+                outcomes,
+                ("d1", "d2"),
+                names,
+                ("y1", "y2"),
+            )
+            dense = fit_common_ols(*arguments)
+            allocated: list[tuple[int, int]] = []
+
+            def allocate(
+                shape: tuple[int, int], allocated: list[tuple[int, int]] = allocated
+            ) -> np.ndarray:
+                allocated.append(shape)
+                return np.empty(shape)
+
+            streaming = fit_common_ols_streaming(
+                *arguments, block_rows=5, allocate=allocate
+            )
+            self.assertEqual(allocated, [dense.within_design.shape])
+            self.assertEqual(len(streaming.dropped_nuisance_names), 1)
+            self.assertEqual(streaming.model_rank, dense.model_rank)
+            np.testing.assert_allclose(streaming.residual, dense.residual, atol=1e-10)
+            np.testing.assert_allclose(streaming.leverage, dense.leverage, atol=1e-10)
+            np.testing.assert_allclose(
+                streaming.coefficient[:2], dense.coefficient[:2], atol=1e-10
+            )
+            self.assertLess(streaming.solve_relative_residual, 1e-10)
+
     def test_causal_first_contract_never_drops_duplicate_causal_term(self) -> None:
         unit, year, parent, causal, nuisance, outcomes = _fixture()
         projector = NestedFixedEffectProjector.from_arrays(unit, year, parent)
@@ -197,6 +366,29 @@ class FWLTest(unittest.TestCase):
                 ("y1", "y2"),
             )
 
+    def test_reduced_selection_matches_full_row_selection(self) -> None:
+        unit, year, parent, causal, nuisance, _ = _fixture()
+        projector = NestedFixedEffectProjector.from_arrays(unit, year, parent)
+        nuisance = np.column_stack((nuisance, nuisance[:, 0] - nuisance[:, 1]))
+        names = ("z1", "z2", "z3", "z1_minus_z2")
+        shared = WithinNuisance.from_nuisance(projector, nuisance, names)
+        np.testing.assert_allclose(
+            shared.basis @ shared.coordinates, shared.within, atol=1e-12
+        )
+        causal_within = projector.within(causal)
+        full = causal_first_full_rank_design(
+            causal_within, shared.within, ("d1", "d2"), names
+        )
+        reduced = causal_first_reduced_design(causal_within, shared, ("d1", "d2"))
+        self.assertEqual(reduced.causal_count, full.causal_count)
+        self.assertEqual(reduced.names[:2], full.names[:2])
+        self.assertEqual(len(reduced.names), len(full.names))
+        self.assertEqual(len(reduced.dropped_nuisance_names), 1)
+        full_span = np.linalg.lstsq(full.matrix, reduced.matrix, rcond=None)
+        np.testing.assert_allclose(
+            full.matrix @ full_span[0], reduced.matrix, atol=1e-10
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
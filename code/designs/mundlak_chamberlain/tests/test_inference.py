@@ -10,16 +10,21 @@ BRANCH_ROOT = Path(__file__).resolve().parents[1]
 if str(BRANCH_ROOT) not in sys.path:
     sys.path.insert(0, str(BRANCH_ROOT))
 
+from mcw.fwl import NestedFixedEffectProjector
 from mcw.inference import (
     InferenceContractError,
+    LeaveClusterOut,
     apply_gradient,
     assemble_block_covariance,
+    batch_experimental_scalar_ccv_hc3,
     batch_linear_gradient_cross_outcome_inference,
     cluster_cross_outcome_covariance,
+    cr2_cross_outcome_covariance_block,
     cr2_cross_outcome_covariance_dense,
     direct_cv3_covariance,
     experimental_scalar_ccv_hc3,
     hc3_cross_outcome_covariance,
+    leave_cluster_out_estimates,
     linear_gradient_cross_outcome_inference,
     ols_bread,
     residualized_contrast_direction,
@@ -250,6 +255,37 @@ class InferenceFixtures(unittest.TestCase):
                 max_cluster_size=5,
             )
 
+    def test_block_cr2_matches_dense_without_absorbed_terms(self) -> None:
+        dense = cr2_cross_outcome_covariance_dense(
+            self.design,
+            self.residuals,
+            self.bread,
+            self.clusters,
+            max_cluster_size=10,
+        )
+        block = cr2_cross_outcome_covariance_block(
+            self.design,
+            self.residuals,
+            self.bread,
+            self.clusters,
+        )
+        np.testing.assert_allclose(block, dense, rtol=1e-10, atol=1e-12)
+
+        contrast = np.array([0.0, 1.0, -0.5, 0.25])
+        gradient = np.kron(np.eye(2), contrast)
+        np.testing.assert_allclose(
+            cr2_cross_outcome_covariance_block(
+                self.design,
+                self.residuals,
+                self.bread,
+                self.clusters,
+                contrasts=contrast,
+            ),
+            gradient @ dense @ gradient.T,
+            rtol=1e-10,
+            atol=1e-12,
+        )
+
     def test_contrast_direction_blocks_gradient_and_psd_guards(self) -> None:
         contrast = np.array([0.0, 1.0, -0.5, 0.25])
         direction = residualized_contrast_direction(
@@ -323,6 +359,56 @@ class InferenceFixtures(unittest.TestCase):
             atol=1e-12,
         )
 
+    def test_batch_scalar_ccv_matches_scalar_calls(self) -> None:
+        contrasts = np.column_stack(
+            (
+                np.array([0.0, 1.0, -0.5, 0.25]),
+                np.array([1.0, -0.25, 0.0, 0.75]),
+            )
+        )
+        directions = residualized_contrast_directions(
+            self.design,
+            self.bread,
+            contrasts,
+        )
+        batch = batch_experimental_scalar_ccv_hc3(
+            directions,
+            self.residuals,
+            self.hat,
+            self.clusters,
+            n_parameters=self.design.shape[1],
+        )
+
+        self.assertEqual(len(batch), contrasts.shape[1])
+        for column, actual in enumerate(batch):
+            expected = experimental_scalar_ccv_hc3(
+                directions[:, column],
+                self.residuals,
+                self.hat,
+                self.clusters,
+                n_parameters=self.design.shape[1],
+            )
+            for field in ("hc3", "cr0", "cr1", "ccv_hc3", "ccv_hc3_cr1", "omega"):
+                np.testing.assert_allclose(
+                    getattr(actual, field),
+                    getattr(expected, field),
+                    rtol=1e-12,
+                    atol=1e-14,
+                )
+            self.assertAlmostEqual(actual.lambda_weight, expected.lambda_weight)
+            self.assertEqual(actual.n_clusters, expected.n_clusters)
+
+        zero_column = directions.copy()
+        zero_column[:, 1] = 0.0
+        with self.assertRaises(InferenceContractError):
+            batch_experimental_scalar_ccv_hc3(
+                zero_column,
+                self.residuals,
+                self.hat,
+                self.clusters,
+                n_parameters=self.design.shape[1],
+            )
+
     def test_batch_contrast_directions_reject_zero_columns(self) -> None:
         contrasts = np.column_stack(
             (
@@ -589,5 +675,171 @@ class InferenceFixtures(unittest.TestCase):
             )
 
 
+class AbsorbedFixedEffectDeletionTest(unittest.TestCase):
+    """Compare absorbed-FE block CR2 and CV3 with the explicit dummy design."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        rng = np.random.default_rng(20260906)
+        n_units, n_years, n_parents = 12, 6, 3
+        unit = np.repeat(np.arange(n_units), n_years)
+        year = np.tile(np.arange(n_years), n_units)
+        parent = unit % n_parents
+        cls.unit, cls.year, cls.parent = unit, year, parent
+        cls.projector = NestedFixedEffectProjector.from_arrays(
+            np.char.zfill(unit.astype(str), 3), year, parent
+        )
+        unit_dummies = np.eye(n_units)[unit]
+        parent_year = parent * n_years + year
+        parent_year_dummies = np.eye(n_parents * n_years)[parent_year]
+        retained = np.arange(n_parents * n_years) % n_years != 0
+        cls.dummies = np.column_stack((unit_dummies, parent_year_dummies[:, retained]))
+        regressors = rng.normal(size=(unit.size, 3)) + 0.3 * year[:, None]
+        cls.full_design = np.column_stack((cls.dummies, regressors))
+        full_bread = ols_bread(cls.full_design)
+        outcomes = rng.normal(size=(unit.size, 2))
+        cls.outcomes = outcomes
+        cls.coefficients = (full_bread @ cls.full_design.T @ outcomes)[-3:]
+        cls.residuals = (
+            np.eye(unit.size) - cls.full_design @ full_bread @ cls.full_design.T
+        ) @ outcomes
+        cls.within = cls.projector.within(regressors)
+        cls.bread = ols_bread(cls.within)
+
+    def _refit(self, keep: np.ndarray) -> np.ndarray:
+        """Delete rows from the explicit dummy design and refit by least squares."""
+
+        solution = np.linalg.lstsq(
+            self.full_design[keep], self.outcomes[keep], rcond=None
+        )[0]
+        return solution[-3:]
+
+    def _literal_stack(self, clusters: np.ndarray) -> np.ndarray:
+        return np.stack(
+            [
+                self._refit(clusters != cluster).T.reshape(-1)
+                for cluster in np.unique(clusters)
+            ]
+        )
+
+    def _deletion(self, clusters: np.ndarray, **options: object) -> LeaveClusterOut:
+        return leave_cluster_out_estimates(
+            self.within,
+            self.residuals,
+            self.bread,
+            clusters,
+            self.coefficients,
+            absorbed_terms=self.projector.hat_terms(),
+            **options,
+        )
+
+    def _block(self, clusters: np.ndarray) -> np.ndarray:
+        return cr2_cross_outcome_covariance_block(
+            self.within,
+            self.residuals,
+            self.bread,
+            clusters,
+            absorbed_terms=self.projector.hat_terms(),
+        )
+
+    def test_projector_hat_terms_rebuild_the_fixed_effect_projection(self) -> None:
+        projection = np.zeros((self.unit.size, self.unit.size))
+        for codes, weights in self.projector.hat_terms():
+            indicator = np.eye(weights.size)[codes]
+            projection += indicator @ np.diag(weights) @ indicator.T
+        dummy_bread = np.linalg.pinv(self.dummies.T @ self.dummies)
+        np.testing.assert_allclose(
+            projection, self.dummies @ dummy_bread @ self.dummies.T, atol=1e-12
+        )
+
+    def test_clusters_cutting_fixed_effects_match_dense_full_design(self) -> None:
+        clusters = (self.unit // 2) * 2 + (self.year >= 3)
+        dense = cr2_cross_outcome_covariance_dense(
+            self.full_design,
+            self.residuals,
+            ols_bread(self.full_design),
+            clusters,
+        )
+        width = self.full_design.shape[1]
+        causal = np.concatenate(
+            [np.arange(width - 3, width) + outcome * width for outcome in range(2)]
+        )
+        np.testing.assert_allclose(
+            self._block(clusters),
+            dense[np.ix_(causal, causal)],
+            rtol=1e-9,
+            atol=1e-12,
+        )
+
+    def test_nested_clusters_use_the_pseudo_inverse_square_root(self) -> None:
+        with self.assertRaises(InferenceContractError):
+            cr2_cross_outcome_covariance_dense(
+                self.full_design,
+                self.residuals,
+                ols_bread(self.full_design),
+                self.parent,
+            )
+        full_bread = ols_bread(self.full_design)
+        expected = np.zeros((6, 6))
+        for cluster in range(3):
+            selected = self.parent == cluster
+            rows = self.full_design[selected]
+            annihilator = np.eye(rows.shape[0]) - rows @ full_bread @ rows.T
+            eigenvalues, vectors = linalg.eigh(annihilator)
+            inverse_root = np.zeros_like(eigenvalues)
+            kept = eigenvalues > 1e-9
+            inverse_root[kept] = 1.0 / np.sqrt(eigenvalues[kept])
+            adjusted = (vectors * inverse_root) @ vectors.T @ self.residuals[selected]
+            contribution = (full_bread @ rows.T @ adjusted)[-3:].T.reshape(-1)
+            expected += np.outer(contribution, contribution)
+        np.testing.assert_allclose(
+            self._block(self.parent), expected, rtol=1e-9, atol=1e-12
+        )
+
+    def test_leave_cluster_out_matches_literal_refits(self) -> None:
+        for clusters in (
+            (self.unit // 2) * 2 + (self.year >= 3),
+            self.parent,
+            self.unit,
+        ):
+            with self.subTest(clusters=np.unique(clusters).size):
+                deletion = self._deletion(clusters)
+                literal = self._literal_stack(clusters)
+                self.assertEqual(deletion.refit_clusters, ())
+                np.testing.assert_allclose(
+                    deletion.full_estimate, self.coefficients.T.reshape(-1)
+                )
+                np.testing.assert_allclose(
+                    deletion.estimates, literal, rtol=1e-9, atol=1e-10
+                )
+                np.testing.assert_allclose(
+                    deletion.cv3,
+                    direct_cv3_covariance(deletion.full_estimate, literal),
+                    rtol=1e-8,
+                    atol=1e-12,
+                )
+
+    def test_ill_conditioned_clusters_fall_back_to_refits(self) -> None:
+        clusters = self.parent
+        with self.assertRaisesRegex(InferenceContractError, "refit"):
+            self._deletion(clusters, conditioning_tolerance=2.0)
+        deletion = self._deletion(
+            clusters, conditioning_tolerance=2.0, refit=self._refit
+        )
+        self.assertEqual(deletion.refit_clusters, (0, 1, 2))
+        np.testing.assert_allclose(
+            deletion.estimates, self._literal_stack(clusters), rtol=1e-9, atol=1e-10
+        )
+
+        contrast = np.array([1.0, -1.0, 0.5])
+        projected = self._deletion(clusters, contrasts=contrast)
+        np.testing.assert_allclose(
+            projected.estimates,
+            self._literal_stack(clusters).reshape(3, 2, 3) @ contrast,
+            rtol=1e-9,
+            atol=1e-10,
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
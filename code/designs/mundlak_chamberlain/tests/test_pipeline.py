@@ -0,0 +1,466 @@
+"""End-to-end registry tests on a small synthetic county-year panel."""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import polars as pl
+
+BRANCH_ROOT = Path(__file__).resolve().parents[1]
+if str(BRANCH_ROOT) not in sys.path:
+    sys.path.insert(0, str(BRANCH_ROOT))
+
+from mcw import model, pipeline
+from mcw.design import (
+    ANALYSIS_YEARS,
+    MODERATOR_SETS,
+    PRIMITIVE_OUTCOMES,
+    TREATMENT_HISTORY_YEARS,
+    Specification,
+)
+from mcw.fwl import fit_common_ols
+from mcw.inference import leave_cluster_out_estimates
+from mcw.io import FIT_CODE_MODULES
+from mcw.model import BASELINE_COLUMN_OVERRIDES, fixed_effect_projector
+
+N_COUNTIES = 192
+N_REGIONS = 16
+
+
+def _synthetic_panel() -> pl.DataFrame:
+    rng = np.random.default_rng(20260901)
+    region = np.arange(N_COUNTIES) % N_REGIONS
+    state = np.arange(N_COUNTIES) % (2 * N_REGIONS)
+    market = np.arange(N_COUNTIES) % (4 * N_REGIONS)
+    region_paths = rng.normal(size=(N_REGIONS, len(TREATMENT_HISTORY_YEARS)))
+    county_paths = rng.normal(size=(N_COUNTIES, len(TREATMENT_HISTORY_YEARS)))
+    baselines = {
+        column: rng.normal(size=N_COUNTIES)
+        for column in (
+            *BASELINE_COLUMN_OVERRIDES.values(),
+            *MODERATOR_SETS["maximal_predetermined"],
+        )
+    }
+    missing = rng.random(N_COUNTIES) < 0.2
+    rows: list[dict[str, object]] = []
+    for county in range(N_COUNTIES):
+        for year in ANALYSIS_YEARS:
+            row: dict[str, object] = {
+                "county_fips": f"{10_000 + county:05d}",
+                "year": year,
+                "state_fips": f"{state[county]:02d}",
+                "aewr_region_id": f"r{region[county]:02d}",
+                "cz_id": f"cz{county // 3:03d}",
+                "mc_market_id": f"m{market[county]:02d}",
+                "mc_baseline_farm_employment": 50.0 + county,
+            }
+            for history_index, history_year in enumerate(TREATMENT_HISTORY_YEARS):
+                row[f"mc_aewr_log_level_{history_year}"] = region_paths[
+                    region[county], history_index
+                ]
+                row[f"mc_bite_f0809_{history_year}"] = county_paths[
+                    county, history_index
+                ]
+            for column, values in baselines.items():
+                row[column] = float(values[county])
+            for column in BASELINE_COLUMN_OVERRIDES.values():
+                row[f"{column.removesuffix('_z')}_missing"] = float(
+                    missing[county] and column == "mc_baseline_low_wage_z"
+                )
+            for index, column in enumerate(PRIMITIVE_OUTCOMES.values()):
+                row[column] = float(rng.poisson(2.0 + index))
+            row["mc_y_any_application"] = float(rng.random() < 0.4)
+            rows.append(row)
+    return pl.DataFrame(rows)
+
+
+def _registry() -> pl.DataFrame:
+    specifications = (
+        Specification(
+            specification_id="log_level_county",
+            stage="test",
+            treatment="aewr_log_level",
+            history="one_lag",
+            fixed_effects="county_year",
+            moderator_set="bite",
+            cluster="aewr_region",
+        ),
+        Specification(
+            specification_id="bite_state",
+            stage="test",
+            treatment="bite_f0809",
+            history="one_lag",
+            fixed_effects="county_state_year",
+            moderator_set="none",
+            cluster="state",
+        ),
+        Specification(
+            specification_id="bite_county_full",
+            stage="test",
+            treatment="bite_f0809",
+            history="full",
+            fixed_effects="county_year",
+            moderator_set="none",
+            cluster="aewr_region",
+        ),
+    )
+    return pl.DataFrame(
+        [
+            {
+                "specification_id": spec.specification_id,
+                "stage": spec.stage,
+                "treatment": spec.treatment,
+                "history": spec.history,
+                "fixed_effects": spec.fixed_effects,
+                "moderator_set": spec.moderator_set,
+                "cluster": spec.cluster,
+                "treatment_transform": spec.treatment_transform,
+                "interpretation_status": spec.interpretation_status,
+            }
+            for spec in specifications
+        ]
+    )
+
+
+class RegistryPipelineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        root = Path(directory.name)
+        self.paths = {
+            "ANALYSIS_PANEL": root / "processed" / "analysis.parquet",
+            "SOURCE_PANEL": root / "processed" / "source.parquet",
+            "REGISTRY_PATH": root / "tables" / "registry.csv",
+            "COEFFICIENTS_PATH": root / "tables" / "coefficients.csv",
+            "DIAGNOSTICS_PATH": root / "tables" / "diagnostics.csv",
+            "RESULTS_PATH": root / "tables" / "results.csv",
+            "MANIFEST_PATH": root / "intermediate" / "manifest.json",
+            "FIT_CACHE": root / "intermediate" / "fits",
+        }
+        self.paths["ANALYSIS_PANEL"].parent.mkdir(parents=True)
+        self.paths["REGISTRY_PATH"].parent.mkdir(parents=True)
+        panel = _synthetic_panel()
+        panel.write_parquet(self.paths["ANALYSIS_PANEL"])
+        panel.write_parquet(self.paths["SOURCE_PANEL"])
+        _registry().write_csv(self.paths["REGISTRY_PATH"])
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        for name, path in self.paths.items():
+            stack.enter_context(patch.object(pipeline, name, path))
+        stack.enter_context(
+            patch.object(
+                pipeline,
+                "RETAINED_ARTIFACT_PATHS",
+                {
+                    "coefficients_sha256": self.paths["COEFFICIENTS_PATH"],
+                    "diagnostics_sha256": self.paths["DIAGNOSTICS_PATH"],
+                    "results_sha256": self.paths["RESULTS_PATH"],
+                },
+            )
+        )
+        stack.enter_context(patch.dict(os.environ, {"MC_SPEC_FORCE": "0"}))
+
+    def _artifact_bytes(self) -> dict[str, bytes]:
+        return {
+            name: self.paths[name].read_bytes()
+            for name in ("COEFFICIENTS_PATH", "DIAGNOSTICS_PATH")
+        }
+
+    def _artifact_frames(self) -> dict[str, pl.DataFrame]:
+        return {
+            "coefficients": pl.read_csv(self.paths["COEFFICIENTS_PATH"]),
+            "diagnostics": pl.read_csv(self.paths["DIAGNOSTICS_PATH"]),
+        }
+
+    def test_compatible_cache_is_reused_without_refitting(self) -> None:
+        pipeline.fit_registry()
+        first = self._artifact_bytes()
+        with patch.object(
+            pipeline,
+            "fit_common_ols_within",
+            side_effect=AssertionError("cache hit must not refit"),
+        ):
+            pipeline.fit_registry()
+        self.assertEqual(self._artifact_bytes(), first)
+
+        with (
+            patch.dict(os.environ, {"MC_SPEC_FORCE": "1"}),
+            patch.object(
+                pipeline, "fit_common_ols_within", wraps=pipeline.fit_common_ols_within
+            ) as refit,
+        ):
+            pipeline.fit_registry()
+        self.assertEqual(refit.call_count, _registry().height)
+        self.assertEqual(self._artifact_bytes(), first)
+
+    def test_worker_pool_matches_serial_artifacts(self) -> None:
+        pipeline.fit_registry()
+        pipeline.report_registry()
+        serial = {
+            name: self.paths[name].read_bytes()
+            for name in ("COEFFICIENTS_PATH", "DIAGNOSTICS_PATH", "RESULTS_PATH")
+        }
+        with patch.dict(os.environ, {"MC_SPEC_FORCE": "1", "MC_SPEC_WORKERS": "2"}):
+            pipeline.fit_registry()
+            pipeline.report_registry()
+        parallel = {name: self.paths[name].read_bytes() for name in serial}
+        self.assertEqual(parallel, serial)
+        self.assertEqual(list(self.paths["FIT_CACHE"].glob(".shared_sample*")), [])
+
+    def test_nuisance_block_is_built_once_per_fixed_effect_set(self) -> None:
+        with patch.object(
+            pipeline, "build_within_nuisance", wraps=pipeline.build_within_nuisance
+        ) as build:
+            pipeline.fit_registry()
+        fixed_effects = _registry()["fixed_effects"]
+        self.assertEqual(build.call_count, fixed_effects.n_unique())
+        self.assertEqual(pipeline._NUISANCE_CACHE, {})
+
+        spec = pipeline._specification(_registry().row(0, named=True))
+        sample = pipeline._sample_frame(pl.read_parquet(self.paths["ANALYSIS_PANEL"]))
+        matrices = pipeline.build_model_matrices(sample, spec, "aewr_region_id")
+        direct = fit_common_ols(
+            matrices.projector,
+            matrices.causal,
+            matrices.nuisance,
+            matrices.outcomes,
+            matrices.causal_names,
+            matrices.nuisance_names,
+            matrices.outcome_names,
+        )
+        store = pipeline._fit_path(spec.specification_id)
+        np.testing.assert_allclose(
+            np.load(store / "coefficient.npy"), direct.coefficient
+        )
+        np.testing.assert_allclose(np.load(store / "residual.npy"), direct.residual)
+
+    def test_streaming_fit_mode_refits_and_matches_dense_rows(self) -> None:
+        pipeline.fit_registry()
+        dense = self._artifact_frames()
+        with (
+            patch.dict(os.environ, {"MC_SPEC_FIT_MODE": "streaming"}),
+            patch.object(
+                pipeline,
+                "fit_common_ols_streaming",
+                wraps=pipeline.fit_common_ols_streaming,
+            ) as streaming,
+            patch.object(
+                model, "build_nuisance_matrix", wraps=model.build_nuisance_matrix
+            ) as dense_nuisance,
+        ):
+            pipeline.fit_registry()
+        self.assertEqual(streaming.call_count, _registry().height)
+        self.assertEqual(dense_nuisance.call_count, 0)
+        self.assertEqual(list(self.paths["FIT_CACHE"].glob(".*within_design*")), [])
+        streamed = self._artifact_frames()
+        leverage = pl.col("diagnostic") == "maximum_full_model_leverage"
+        np.testing.assert_allclose(
+            streamed["diagnostics"].filter(leverage)["value"].to_numpy(),
+            dense["diagnostics"].filter(leverage)["value"].to_numpy(),
+            atol=1e-10,
+        )
+        # Both modes retain the same nuisance columns, so every causal
+        # coefficient matches, including the partly collinear log-level block.
+        for specification_id in _registry()["specification_id"]:
+            rows = (pl.col("specification_id") == specification_id) & pl.col(
+                "causal_term"
+            )
+            streamed_rows = streamed["coefficients"].filter(rows)
+            dense_rows = dense["coefficients"].filter(rows)
+            self.assertEqual(
+                streamed_rows["term"].to_list(), dense_rows["term"].to_list()
+            )
+            np.testing.assert_allclose(
+                streamed_rows["estimate"].to_numpy(),
+                dense_rows["estimate"].to_numpy(),
+                rtol=1e-7,
+                atol=1e-9,
+            )
+
+    def test_streamed_design_is_unmapped_before_its_file_is_removed(self) -> None:
+        mapped_at_unlink = []
+        unlink = Path.unlink
+
+        def checked_unlink(path: Path, missing_ok: bool = False) -> None:
+            if ".within_design." in path.name:
+                mapped_at_unlink.append(
+                    any(
+                        isinstance(value, np.memmap)
+                        and value.filename is not None
+                        and Path(value.filename) == path.resolve()
+                        for value in gc.get_objects()
+                    )
+                )
+            unlink(path, missing_ok=missing_ok)
+
+        with (
+            patch.dict(os.environ, {"MC_SPEC_FIT_MODE": "streaming"}),
+            patch.object(Path, "unlink", checked_unlink),
+        ):
+            pipeline.fit_registry()
+        # Windows refuses to remove a file that is still mapped.
+        self.assertEqual(mapped_at_unlink, [False] * _registry().height)
+
+    def test_report_adds_deletion_comparators_where_clusters_can_be_deleted(
+        self,
+    ) -> None:
+        pipeline.fit_registry()
+        pipeline.report_registry()
+        results = pl.read_csv(self.paths["RESULTS_PATH"])
+        diagnostics = pl.read_csv(self.paths["DIAGNOSTICS_PATH"])
+        for method, diagnostic in (
+            ("cr2_bell_mccaffrey_cluster_sandwich", "cr2_block_defined"),
+            ("cv3_cluster_jackknife", "cv3_cluster_jackknife_defined"),
+        ):
+            with self.subTest(method=method):
+                reported = results.filter(pl.col("inference_method") == method)
+                self.assertEqual(
+                    sorted(reported["specification_id"].unique()),
+                    ["bite_county_full", "bite_state"],
+                )
+                self.assertTrue(
+                    np.all(np.isfinite(reported["standard_error"].to_numpy()))
+                )
+                self.assertTrue((reported["cluster_count"] > 1).all())
+                defined = diagnostics.filter(pl.col("diagnostic") == diagnostic)
+                # The region-level treatment is unidentified once a region is
+                # deleted.
+                self.assertEqual(
+                    defined.sort("specification_id")
+                    .select("specification_id", "status")
+                    .rows(),
+                    [
+                        ("bite_county_full", "pass"),
+                        ("bite_state", "pass"),
+                        ("log_level_county", "warning"),
+                    ],
+                )
+
+    def test_cluster_deletion_update_matches_a_literal_refit(self) -> None:
+        pipeline.fit_registry()
+        spec = pipeline._specification(_registry().row(1, named=True))
+        sample = pipeline._sample_frame(pl.read_parquet(self.paths["ANALYSIS_PANEL"]))
+        store = pipeline._fit_path(spec.specification_id)
+        arrays = {path.stem: np.load(path) for path in store.glob("*.npy")}
+        names = tuple(str(name) for name in arrays["design_names"])
+        causal_count = int(arrays["causal_count"][0])
+        contrast = pipeline._average_current_contrast(sample, names, causal_count)
+        deletion = leave_cluster_out_estimates(
+            arrays["within_design"],
+            arrays["residual"],
+            arrays["bread"],
+            arrays["cluster"],
+            arrays["coefficient"],
+            absorbed_terms=fixed_effect_projector(sample, spec).hat_terms(),
+            contrasts=contrast,
+        )
+        self.assertEqual(deletion.refit_clusters, ())
+        refit = pipeline._deletion_refit(
+            spec,
+            sample,
+            names,
+            causal_count,
+            contrast,
+            arrays["cluster"] != deletion.labels[0],
+        )
+        np.testing.assert_allclose(deletion.estimates[0], refit, rtol=1e-7, atol=1e-9)
+
+    def test_fit_store_maps_uncompressed_arrays_described_by_the_manifest(
+        self,
+    ) -> None:
+        pipeline.fit_registry()
+        spec_id = _registry()["specification_id"][0]
+        store = pipeline._fit_path(spec_id)
+        manifest_path = pipeline._manifest_path(spec_id)
+        manifest = json.loads(manifest_path.read_text())
+        self.assertEqual(
+            sorted(path.name for path in store.iterdir()),
+            sorted(f"{name}.npy" for name in manifest["arrays"]),
+        )
+        residual = np.load(store / "residual.npy", mmap_mode="r")
+        self.assertIsInstance(residual, np.memmap)
+        self.assertEqual(
+            manifest["arrays"]["residual"],
+            {"dtype": residual.dtype.str, "shape": list(residual.shape)},
+        )
+
+        manifest["arrays"]["residual"]["shape"][0] += 1
+        manifest_path.write_text(json.dumps(manifest))
+        with patch.object(
+            pipeline, "fit_common_ols_within", wraps=pipeline.fit_common_ols_within
+        ) as refit:
+            pipeline.fit_registry()
+        self.assertEqual(refit.call_count, 1)
+
+        with patch.object(
+            pipeline, "load_array_store", wraps=pipeline.load_array_store
+        ) as load:
+            pipeline.report_registry()
+        self.assertEqual(load.call_count, _registry().height)
+        self.assertTrue(
+            all(
+                call.args[2] == pipeline.REPORT_ARRAY_FIELDS
+                for call in load.call_args_list
+            )
+        )
+
+    def test_worker_count_must_be_positive(self) -> None:
+        with (
+            patch.dict(os.environ, {"MC_SPEC_WORKERS": "0"}),
+            self.assertRaisesRegex(ValueError, "MC_SPEC_WORKERS"),
+        ):
+            pipeline.fit_registry()
+
+    def test_stale_cache_hash_forces_refit(self) -> None:
+        pipeline.fit_registry()
+        with (
+            patch.object(pipeline, "fit_code_hash", return_value="changed"),
+            patch.object(
+                pipeline, "fit_common_ols_within", wraps=pipeline.fit_common_ols_within
+            ) as refit,
+        ):
+            pipeline.fit_registry()
+        self.assertEqual(refit.call_count, _registry().height)
+
+    def test_fit_hash_covers_the_pipeline_fit_helpers(self) -> None:
+        with patch.object(
+            pipeline, "fit_code_hash", wraps=pipeline.fit_code_hash
+        ) as hashed:
+            pipeline.fit_registry()
+        self.assertTrue(hashed.called)
+        for call in hashed.call_args_list:
+            self.assertEqual(
+                set(call.args),
+                {
+                    pipeline._sample_frame,
+                    pipeline._shared_nuisance,
+                    pipeline._fit_specification,
+                    pipeline._residualized_variance_share,
+                },
+            )
+
+    def test_report_code_changes_keep_retained_fits(self) -> None:
+        pipeline.fit_registry()
+        with (
+            patch.object(pipeline, "code_hash", return_value="changed"),
+            patch.object(
+                pipeline, "fit_common_ols_within", wraps=pipeline.fit_common_ols_within
+            ) as refit,
+        ):
+            pipeline.fit_registry()
+        self.assertEqual(refit.call_count, 0)
+        self.assertNotIn("inference", FIT_CODE_MODULES)
+        self.assertNotIn("pipeline", FIT_CODE_MODULES)
+
+
+if __name__ == "__main__":
+    unittest.main()
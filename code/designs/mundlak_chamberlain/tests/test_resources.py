@@ -23,6 +23,28 @@ class ResourceGuardTest(unittest.TestCase):
             4 * budget.dense_gib + 3 * budget.gram_gib,
         )
 
+    def test_streaming_budget_counts_only_row_blocks(self) -> None:
+        dense = resource_budget(100_000, 500)
+        streaming = resource_budget(100_000, 500, mode="streaming")
+        block_gib = dense.dense_gib * 4096 / 100_000
+        self.assertAlmostEqual(
+            streaming.estimated_peak_gib, 4 * block_gib + 3 * dense.gram_gib
+        )
+        self.assertLess(streaming.estimated_peak_gib, dense.estimated_peak_gib)
+        held = resource_budget(
+            100_000, 500, mode="streaming", outcomes=3, group_mean_rows=2_000
+        )
+        self.assertAlmostEqual(
+            held.estimated_peak_gib - streaming.estimated_peak_gib,
+            (2 * 100_000 * 3 + 2_000 * 503) * 8 / 1024**3,
+        )
+        self.assertEqual(
+            resource_budget(100_000, 500, outcomes=3, group_mean_rows=2_000),
+            dense,
+        )
+        with self.assertRaisesRegex(ValueError, "Unknown fit mode"):
+            resource_budget(10, 2, mode="sparse")
+
     def test_environment_limits_fail_before_dense_work(self) -> None:
         with (
             patch.dict(
@@ -43,6 +65,8 @@ class ResourceGuardTest(unittest.TestCase):
             self.assertRaisesRegex(MemoryError, "MC_SPEC_MAX_PEAK_GIB"),
         ):
             guard_fit_working_set(1_000, 100)
+        with patch.dict(os.environ, {"MC_SPEC_MAX_DENSE_GIB": "0.000001"}):
+            guard_fit_working_set(1_000, 100, mode="streaming")
 
 
 if __name__ == "__main__":
@@ -14,13 +14,13 @@ def _():
 
 
 @app.cell
-def _():
+def fls_frame_builders():
     import math
-    from collections import defaultdict
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
     from itertools import pairwise
     from typing import Any
 
+    import numpy as np
     import polars as pl
 
     from h2a.geography import assert_geo_columns
@@ -37,19 +37,6 @@ def _():
     _EXPECTED_QUARTERS = {1, 2, 3, 4}
 
 
-    def _finite_nonnegative(value: Any) -> bool:
-        return (
-            value is not None
-            and isinstance(value, (int, float))
-            and math.isfinite(float(value))
-            and float(value) >= 0
-        )
-
-
-    def _finite_positive(value: Any) -> bool:
-        return _finite_nonnegative(value) and float(value) > 0
-
-
     def _require_columns(
         frame: pl.DataFrame,
         columns: Iterable[str],
@@ -293,42 +280,41 @@ def _():
         return result
 
 
-    def _positive_signal_by_county(
+    def _finite_nonnegative_expr(value: pl.Expr) -> pl.Expr:
+        value = value.cast(pl.Float64, strict=False)
+        return value.is_not_null() & value.is_finite() & (value >= 0)
+
+
+    def _finite_positive_expr(value: pl.Expr) -> pl.Expr:
+        return _finite_nonnegative_expr(value) & (value.cast(pl.Float64, strict=False) > 0)
+
+
+    def _positive_signal_counties(
         census_county: pl.DataFrame,
         qcew: pl.DataFrame,
         qwi: pl.DataFrame,
         bea_annual: pl.DataFrame,
-    ) -> dict[str, bool]:
-        signal: defaultdict[str, bool] = defaultdict(bool)
-        for row in census_county.select(
-            "county_fips", "census_hired_workers_total"
-        ).iter_rows(named=True):
-            if _finite_positive(row["census_hired_workers_total"]):
-                signal[row["county_fips"]] = True
-        for row in qcew.select(
-            "county_fips",
-            "qcew_crop_sector_disclosed",
-            "qcew_crop_sector_annual_avg_emplvl",
-            "qcew_animal_sector_disclosed",
-            "qcew_animal_sector_annual_avg_emplvl",
-        ).iter_rows(named=True):
-            crop_positive = row["qcew_crop_sector_disclosed"] and _finite_positive(
-                row["qcew_crop_sector_annual_avg_emplvl"]
-            )
-            animal_positive = row["qcew_animal_sector_disclosed"] and _finite_positive(
-                row["qcew_animal_sector_annual_avg_emplvl"]
-            )
-            if crop_positive or animal_positive:
-                signal[row["county_fips"]] = True
-        for row in qwi.select(
-            "county_fips", "qwi_beginning_quarter_employment"
-        ).iter_rows(named=True):
-            if _finite_positive(row["qwi_beginning_quarter_employment"]):
-                signal[row["county_fips"]] = True
-        for row in bea_annual.iter_rows(named=True):
-            if _finite_positive(row["bea_hired_farm_jobs"]):
-                signal[row["county_fips"]] = True
-        return dict(signal)
+    ) -> pl.Series:
+        crop_positive = pl.col("qcew_crop_sector_disclosed").fill_null(
+            False
+        ) & _finite_positive_expr(pl.col("qcew_crop_sector_annual_avg_emplvl"))
+        animal_positive = pl.col("qcew_animal_sector_disclosed").fill_null(
+            False
+        ) & _finite_positive_expr(pl.col("qcew_animal_sector_annual_avg_emplvl"))
+        return pl.concat(
+            [
+                census_county.filter(
+                    _finite_positive_expr(pl.col("census_hired_workers_total"))
+                ).get_column("county_fips"),
+                qcew.filter(crop_positive | animal_positive).get_column("county_fips"),
+                qwi.filter(
+                    _finite_positive_expr(pl.col("qwi_beginning_quarter_employment"))
+                ).get_column("county_fips"),
+                bea_annual.filter(
+                    _finite_positive_expr(pl.col("bea_hired_farm_jobs"))
+                ).get_column("county_fips"),
+            ]
+        ).unique()
 
 
     def build_annual_employment_updates(
@@ -359,109 +345,89 @@ def _():
             .sort(*_ANNUAL_KEYS)
         )
 
-        rows = grid.to_dicts()
-        previous_by_county: dict[str, dict[str, Any]] = {}
-        for row in rows:
-            qcew_valid = bool(row["qcew_strict_complete"]) and _finite_nonnegative(
-                row["qcew_ag_employment"]
+        def previous(expression: pl.Expr) -> pl.Expr:
+            return expression.shift(1).over("county_fips")
+
+        qcew_valid = pl.col("qcew_strict_complete") & _finite_nonnegative_expr(
+            pl.col("qcew_ag_employment")
+        )
+        qwi_valid = pl.col("qwi_strict_complete") & _finite_nonnegative_expr(
+            pl.col("qwi_ag_employment")
+        )
+        bea_valid = _finite_nonnegative_expr(pl.col("bea_hired_farm_jobs"))
+        update_source = (
+            pl.when(qcew_valid)
+            .then(pl.lit("qcew"))
+            .when(qwi_valid)
+            .then(pl.lit("qwi"))
+            .when(bea_valid)
+            .then(pl.lit("bea"))
+            .otherwise(pl.lit("unavailable"))
+        )
+        update_employment = (
+            pl.when(qcew_valid)
+            .then(pl.col("qcew_ag_employment"))
+            .when(qwi_valid)
+            .then(pl.col("qwi_ag_employment"))
+            .when(bea_valid)
+            .then(pl.col("bea_hired_farm_jobs"))
+            .cast(pl.Float64)
+        )
+
+        # Growth uses the first source valid in both consecutive years.
+        previous_year = previous(pl.col("source_year"))
+        consecutive = previous_year == pl.col("source_year") - 1
+        growth_source = pl.when(previous_year.is_null()).then(pl.lit("not_applicable"))
+        log_growth = pl.when(previous_year.is_null()).then(pl.lit(0.0))
+        for source, column, valid, previous_valid in (
+            ("qcew", "qcew_ag_employment", qcew_valid, pl.col("qcew_strict_complete")),
+            ("qwi", "qwi_ag_employment", qwi_valid, pl.col("qwi_strict_complete")),
+            ("bea", "bea_hired_farm_jobs", bea_valid, bea_valid),
+        ):
+            value = pl.col(column).cast(pl.Float64)
+            pair_valid = consecutive & valid & previous(previous_valid)
+            growth_source = growth_source.when(pair_valid).then(pl.lit(source))
+            log_growth = log_growth.when(pair_valid).then(
+                value.log1p() - previous(value).log1p()
             )
-            qwi_valid = bool(row["qwi_strict_complete"]) and _finite_nonnegative(
-                row["qwi_ag_employment"]
+
+        result = (
+            grid.with_columns(
+                update_source.alias("annual_update_source"),
+                update_employment.alias("annual_update_employment"),
+                growth_source.otherwise(pl.lit("unit_growth")).alias(
+                    "annual_growth_source"
+                ),
+                log_growth.otherwise(0.0).alias("annual_log1p_growth"),
             )
-            bea_valid = _finite_nonnegative(row["bea_hired_farm_jobs"])
-            if qcew_valid:
-                update_source = "qcew"
-                update_employment = float(row["qcew_ag_employment"])
-            elif qwi_valid:
-                update_source = "qwi"
-                update_employment = float(row["qwi_ag_employment"])
-            elif bea_valid:
-                update_source = "bea"
-                update_employment = float(row["bea_hired_farm_jobs"])
-            else:
-                update_source = "unavailable"
-                update_employment = None
-
-            previous = previous_by_county.get(row["county_fips"])
-            growth_source = "not_applicable"
-            log_growth = 0.0
-            if previous is not None:
-                consecutive = previous["source_year"] == row["source_year"] - 1
-                source_pairs = (
-                    (
-                        "qcew",
-                        qcew_valid,
-                        bool(previous["qcew_strict_complete"]),
-                        row["qcew_ag_employment"],
-                        previous["qcew_ag_employment"],
-                    ),
-                    (
-                        "qwi",
-                        qwi_valid,
-                        bool(previous["qwi_strict_complete"]),
-                        row["qwi_ag_employment"],
-                        previous["qwi_ag_employment"],
-                    ),
-                    (
-                        "bea",
-                        bea_valid,
-                        _finite_nonnegative(previous["bea_hired_farm_jobs"]),
-                        row["bea_hired_farm_jobs"],
-                        previous["bea_hired_farm_jobs"],
-                    ),
-                )
-                for (
-                    candidate_source,
-                    current_valid,
-                    previous_valid,
-                    current_value,
-                    previous_value,
-                ) in source_pairs:
-                    if consecutive and current_valid and previous_valid:
-                        growth_source = candidate_source
-                        log_growth = math.log1p(float(current_value)) - math.log1p(
-                            float(previous_value)
-                        )
-                        break
-                else:
-                    growth_source = "unit_growth"
-
-            row["annual_update_source"] = update_source
-            row["annual_update_employment"] = update_employment
-            row["annual_growth_source"] = growth_source
-            row["annual_log1p_growth"] = log_growth
-            row["annual_growth_factor_log1p"] = math.exp(log_growth)
-            row["extreme_annual_change"] = (
-                growth_source not in {"not_applicable", "unit_growth"}
-                and abs(log_growth) > EXTREME_LOG1P_GROWTH_THRESHOLD
+            .with_columns(
+                pl.col("annual_log1p_growth").exp().alias("annual_growth_factor_log1p"),
+                (
+                    ~pl.col("annual_growth_source").is_in(
+                        ["not_applicable", "unit_growth"]
+                    )
+                    & (pl.col("annual_log1p_growth").abs() > EXTREME_LOG1P_GROWTH_THRESHOLD)
+                ).alias("extreme_annual_change"),
+                (pl.col("annual_update_source") == "qwi").alias("qwi_annual_fallback_used"),
+                (pl.col("annual_update_source") == "bea").alias("bea_annual_fallback_used"),
+                (pl.col("annual_growth_source") == "unit_growth").alias(
+                    "unit_growth_fallback_used"
+                ),
             )
-            row["qwi_annual_fallback_used"] = update_source == "qwi"
-            row["bea_annual_fallback_used"] = update_source == "bea"
-            row["unit_growth_fallback_used"] = growth_source == "unit_growth"
-            previous_by_county[row["county_fips"]] = row
-
-        result = pl.DataFrame(rows)
+        )
         _require_unique(result, _ANNUAL_KEYS, "annual employment update grid")
         return result.sort(*_ANNUAL_KEYS)
 
 
     def _cumulative_growth(
-        growth: dict[tuple[str, int], float],
-        county_fips: str,
-        start_year: int,
-        end_year: int,
-    ) -> float:
-        if start_year == end_year:
-            return 0.0
-        if start_year < end_year:
-            return sum(
-                growth[(county_fips, year)]
-                for year in range(start_year + 1, end_year + 1)
-            )
-        return -sum(
-            growth[(county_fips, year)]
-            for year in range(end_year + 1, start_year + 1)
-        )
+        growth: np.ndarray,
+        start: int,
+        end: int,
+    ) -> np.ndarray:
+        """Sum every county's annual log growth from column ``start`` to ``end``."""
+        low, high = sorted((start, end))
+        total = growth[:, low + 1 : high + 1].sum(axis=1)
+        return -total if start > end else total
 
 
     def _interval_for_year(
@@ -474,34 +440,54 @@ def _():
         raise ValueError(f"Year {year} is outside the benchmark interval")
 
 
-    def _quality_flags(row: dict[str, Any]) -> str:
-        flags: list[str] = []
-        if row["census_benchmark_reported"]:
-            flags.append("census_reported")
-        if row["census_published_zero"]:
-            flags.append("census_published_zero")
-        if (
-            row["census_benchmark_fill_method"] is not None
-            and not row["census_benchmark_reported"]
-        ):
-            flags.append("census_benchmark_imputed")
-        if row["structural_zero"]:
-            flags.append("structural_zero")
-        if row["qwi_annual_fallback_used"]:
-            flags.append("qwi_annual_fallback")
-        if row["bea_annual_fallback_used"]:
-            flags.append("bea_annual_fallback")
-        if row["unit_growth_fallback_used"]:
-            flags.append("unit_growth_fallback")
-        if row["annual_update_source"] == "unavailable":
-            flags.append("annual_update_unavailable")
-        if row["extreme_annual_change"]:
-            flags.append("extreme_annual_change")
-        if row["nonnegative_floor_applied"]:
-            flags.append("nonnegative_floor")
-        if abs(row["state_rake_factor"] - 1) > 1e-10:
-            flags.append("state_raked")
-        return "|".join(flags) if flags else "none"
+    def _nearest_order(target: int, candidates: Sequence[int]) -> list[int]:
+        """Candidate positions by distance to ``target``, earlier year first on ties."""
+        return sorted(
+            range(len(candidates)),
+            key=lambda index: (abs(candidates[index] - target), candidates[index]),
+        )
+
+
+    def _is_close(
+        left: np.ndarray,
+        right: np.ndarray,
+        *,
+        rel_tol: float,
+        abs_tol: float,
+    ) -> np.ndarray:
+        """Vectorized :func:`math.isclose`."""
+        return np.abs(left - right) <= np.maximum(
+            rel_tol * np.maximum(np.abs(left), np.abs(right)), abs_tol
+        )
+
+
+    def _quality_flags() -> pl.Expr:
+        flags = (
+            ("census_reported", pl.col("census_benchmark_reported")),
+            ("census_published_zero", pl.col("census_published_zero")),
+            (
+                "census_benchmark_imputed",
+                pl.col("census_benchmark_fill_method").is_not_null()
+                & ~pl.col("census_benchmark_reported"),
+            ),
+            ("structural_zero", pl.col("structural_zero")),
+            ("qwi_annual_fallback", pl.col("qwi_annual_fallback_used")),
+            ("bea_annual_fallback", pl.col("bea_annual_fallback_used")),
+            ("unit_growth_fallback", pl.col("unit_growth_fallback_used")),
+            (
+                "annual_update_unavailable",
+                pl.col("annual_update_source") == "unavailable",
+            ),
+            ("extreme_annual_change", pl.col("extreme_annual_change")),
+            ("nonnegative_floor", pl.col("nonnegative_floor_applied")),
+            ("state_raked", (pl.col("state_rake_factor") - 1).abs() > 1e-10),
+        )
+        joined = pl.concat_str(
+            [pl.when(condition).then(pl.lit(flag)) for flag, condition in flags],
+            separator="|",
+            ignore_nulls=True,
+        )
+        return pl.when(joined == "").then(pl.lit("none")).otherwise(joined)
 
 
     def build_frame_employment_analog(
@@ -523,6 +509,9 @@ def _():
         then scaled only within the unreported state residual. Annual paths use
         same-source QCEW/QWI/BEA log-growth and a two-sided endpoint correction,
         followed by state-year raking to interpolated published state totals.
+
+        Every step runs on county-by-year arrays; only the handful of benchmark
+        and frame years is iterated in Python.
         """
         benchmark_years = tuple(int(year) for year in benchmark_years)
         frame_years = tuple(int(year) for year in frame_years)
@@ -542,8 +531,8 @@ def _():
         _require_columns(counties, required_county_columns, "county universe")
         counties = counties.select(required_county_columns).unique()
         _require_unique(counties, _COUNTY_KEYS, "county universe")
-        county_rows = counties.sort("county_fips").to_dicts()
-        county_ids = {row["county_fips"] for row in county_rows}
+        counties = counties.sort("county_fips")
+        county_ids = counties.get_column("county_fips")
 
         _require_columns(
             census_county,
@@ -551,7 +540,7 @@ def _():
             "county Census benchmarks",
         )
         census_county = census_county.filter(
-            pl.col("county_fips").is_in(county_ids),
+            pl.col("county_fips").is_in(county_ids.implode()),
             pl.col("year").cast(pl.Int32).is_in(benchmark_years),
         ).with_columns(pl.col("year").cast(pl.Int32))
         _require_unique(
@@ -584,12 +573,9 @@ def _():
             raise ValueError(
                 "State Census benchmarks do not cover every state-vintage cell"
             )
-        if not all(
-            _finite_nonnegative(value)
-            for value in census_state.get_column(
-                "state_census_hired_workers_reported"
-            ).to_list()
-        ):
+        if not census_state.select(
+            _finite_nonnegative_expr(pl.col("state_census_hired_workers_reported")).all()
+        ).item():
             raise ValueError("State Census hired-worker totals must be reported")
 
         updates = build_annual_employment_updates(
@@ -600,405 +586,489 @@ def _():
             frame_years=frame_years,
         )
         bea_annual = build_bea_hired_farm_jobs(bea)
-        positive_signal = _positive_signal_by_county(
-            census_county,
-            qcew,
-            qwi,
-            bea_annual,
-        )
-        update_map = {
-            (row["county_fips"], row["source_year"]): row
-            for row in updates.iter_rows(named=True)
-        }
-        growth = {
-            key: float(row["annual_log1p_growth"])
-            for key, row in update_map.items()
-        }
-
-        reported_map: dict[tuple[str, int], float] = {}
-        observed_years: defaultdict[str, list[int]] = defaultdict(list)
-        for row in census_county.iter_rows(named=True):
-            value = row["census_hired_workers_total"]
-            if _finite_nonnegative(value):
-                key = (row["county_fips"], int(row["year"]))
-                reported_map[key] = float(value)
-                observed_years[row["county_fips"]].append(int(row["year"]))
-        for county_fips in observed_years:
-            observed_years[county_fips].sort()
-
-        state_total = {
-            (row["state_fips"], int(row["year"])): float(
-                row["state_census_hired_workers_reported"]
+        positive_signal = county_ids.is_in(
+            _positive_signal_counties(census_county, qcew, qwi, bea_annual).implode()
+        ).to_numpy()
+
+        # County-by-year arrays, rows in county order and columns in year order.
+        county_count = counties.height
+        frame_index = {year: index for index, year in enumerate(frame_years)}
+        benchmark_columns = [frame_index[year] for year in benchmark_years]
+
+        def county_by_year(column: str) -> np.ndarray:
+            return (
+                updates.get_column(column)
+                .cast(pl.Float64)
+                .fill_null(np.nan)
+                .to_numpy()
+                .reshape(county_count, len(frame_years))
             )
-            for row in census_state.iter_rows(named=True)
-        }
-
-        state_denominator: defaultdict[tuple[str, int], float] = defaultdict(float)
-        region_denominator: defaultdict[tuple[str, int], float] = defaultdict(float)
-        national_denominator: defaultdict[int, float] = defaultdict(float)
-        state_to_region = {
-            row["state_fips"]: row["aewr_region_id"] for row in county_rows
-        }
-        for county in county_rows:
-            for year in benchmark_years:
-                employment = update_map[
-                    (county["county_fips"], year)
-                ]["annual_update_employment"]
-                if _finite_nonnegative(employment):
-                    value = float(employment)
-                    state_denominator[(county["state_fips"], year)] += value
-                    region_denominator[(county["aewr_region_id"], year)] += value
-                    national_denominator[year] += value
-
-        region_numerator: defaultdict[tuple[str, int], float] = defaultdict(float)
-        national_numerator: defaultdict[int, float] = defaultdict(float)
-        for (state_fips, year), value in state_total.items():
-            region = state_to_region[state_fips]
-            region_numerator[(region, year)] += value
-            national_numerator[year] += value
-
-        state_ratio = {
-            key: state_total[key] / denominator
-            for key, denominator in state_denominator.items()
-            if denominator > 0
-        }
-        region_ratio = {
-            key: region_numerator[key] / denominator
-            for key, denominator in region_denominator.items()
-            if denominator > 0
-        }
-        national_ratio = {
-            year: national_numerator[year] / denominator
-            for year, denominator in national_denominator.items()
-            if denominator > 0
-        }
-
-        prefill: dict[tuple[str, int], dict[str, Any]] = {}
-        for county in county_rows:
-            county_fips = county["county_fips"]
-            reported_years = observed_years[county_fips]
-            for year in benchmark_years:
-                key = (county_fips, year)
-                if key in reported_map:
-                    value = reported_map[key]
-                    prefill[key] = {
-                        "value": value,
-                        "method": "reported",
-                        "reported": True,
-                        "published_zero": value == 0,
-                        "structural_zero": False,
-                    }
-                    continue
-
-                has_any_signal = positive_signal.get(county_fips, False)
-                if not has_any_signal:
-                    prefill[key] = {
-                        "value": 0.0,
-                        "method": "structural_zero",
-                        "reported": False,
-                        "published_zero": False,
-                        "structural_zero": True,
-                    }
-                    continue
-
-                lower_years = [
-                    observed_year
-                    for observed_year in reported_years
-                    if observed_year < year
-                ]
-                upper_years = [
-                    observed_year
-                    for observed_year in reported_years
-                    if observed_year > year
-                ]
-                if lower_years and upper_years:
-                    lower = max(lower_years)
-                    upper = min(upper_years)
-                    share = (year - lower) / (upper - lower)
-                    value = math.expm1(
-                        (1 - share) * math.log1p(reported_map[(county_fips, lower)])
-                        + share * math.log1p(reported_map[(county_fips, upper)])
-                    )
-                    method = "county_log1p_interpolation"
-                elif reported_years:
-                    neighbor = min(
-                        reported_years,
-                        key=lambda observed_year: (abs(observed_year - year), observed_year),
-                    )
-                    projected_log = math.log1p(
-                        reported_map[(county_fips, neighbor)]
-                    ) + _cumulative_growth(growth, county_fips, neighbor, year)
-                    value = math.expm1(projected_log)
-                    method = f"county_growth_projection_from_{neighbor}"
-                    if value < 0:
-                        value = 0.0
-                        method += "_nonnegative_floor"
-                else:
-                    update_values = [
-                        (
-                            abs(candidate_year - year),
-                            candidate_year,
-                            update_map[
-                                (county_fips, candidate_year)
-                            ]["annual_update_employment"],
-                        )
-                        for candidate_year in frame_years
-                        if _finite_nonnegative(
-                            update_map[
-                                (county_fips, candidate_year)
-                            ]["annual_update_employment"]
-                        )
-                    ]
-                    if update_values:
-                        _, proxy_year, proxy = min(update_values)
-                        proxy = float(proxy)
-                    else:
-                        proxy_year = year
-                        proxy = 1.0
-
-                    state_key = (county["state_fips"], year)
-                    region_key = (county["aewr_region_id"], year)
-                    if state_key in state_ratio:
-                        ratio = state_ratio[state_key]
-                        method = "state_census_to_employment_ratio"
-                    elif region_key in region_ratio:
-                        ratio = region_ratio[region_key]
-                        method = "aewr_region_census_to_employment_ratio"
-                    elif year in national_ratio:
-                        ratio = national_ratio[year]
-                        method = "national_census_to_employment_ratio"
-                    else:
-                        raise ValueError(
-                            f"No Census-to-employment ratio for {county_fips}, {year}"
-                        )
-                    value = ratio * proxy
-                    if proxy_year != year:
-                        method += f"_nearest_employment_{proxy_year}"
-
-                prefill[key] = {
-                    "value": max(float(value), 0.0),
-                    "method": method,
-                    "reported": False,
-                    "published_zero": False,
-                    "structural_zero": False,
-                }
-
-        benchmark: dict[tuple[str, int], dict[str, Any]] = {}
-        counties_by_state: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
-        for county in county_rows:
-            counties_by_state[county["state_fips"]].append(county)
-
-        for state_fips, state_counties in counties_by_state.items():
-            for year in benchmark_years:
-                cells = [
-                    prefill[(county["county_fips"], year)]
-                    for county in state_counties
-                ]
-                reported_sum = sum(
-                    cell["value"] for cell in cells if cell["reported"]
+
+        employment = county_by_year("annual_update_employment")
+        employment_valid = np.isfinite(employment) & (employment >= 0)
+        employment_positive = employment_valid & (employment > 0)
+        growth = county_by_year("annual_log1p_growth")
+
+        county_codes = pl.DataFrame(
+            {"county_fips": county_ids, "_county": np.arange(county_count)}
+        )
+        reported_cells = census_county.filter(
+            _finite_nonnegative_expr(pl.col("census_hired_workers_total"))
+        ).join(county_codes, on="county_fips")
+        reported = np.zeros((county_count, len(benchmark_years)), dtype=bool)
+        reported_value = np.full((county_count, len(benchmark_years)), np.nan)
+        benchmark_position = {year: index for index, year in enumerate(benchmark_years)}
+        reported_rows = reported_cells.get_column("_county").to_numpy()
+        reported_years = np.asarray(
+            [
+                benchmark_position[year]
+                for year in reported_cells.get_column("year").to_list()
+            ],
+            dtype=np.int64,
+        )
+        reported[reported_rows, reported_years] = True
+        reported_value[reported_rows, reported_years] = (
+            reported_cells.get_column("census_hired_workers_total")
+            .cast(pl.Float64)
+            .to_numpy()
+        )
+
+        # States in first-appearance order; sums accumulate in county order.
+        state_ids, state_first, state_code = np.unique(
+            counties.get_column("state_fips").to_numpy(),
+            return_index=True,
+            return_inverse=True,
+        )
+        state_order = np.argsort(state_first, kind="stable")
+        state_rank = np.empty_like(state_order)
+        state_rank[state_order] = np.arange(state_order.size)
+        state_ids, state_code = state_ids[state_order], state_rank[state_code]
+        state_count = state_ids.size
+        region_ids, region_code = np.unique(
+            counties.get_column("aewr_region_id").to_numpy(), return_inverse=True
+        )
+        state_region = np.empty(state_count, dtype=np.int64)
+        state_region[state_code] = region_code
+
+        state_lookup = {state: index for index, state in enumerate(state_ids)}
+        state_total = np.full((state_count, len(benchmark_years)), np.nan)
+        state_rows = np.asarray(
+            [state_lookup[state] for state in census_state.get_column("state_fips")],
+            dtype=np.int64,
+        )
+        state_years = np.asarray(
+            [benchmark_position[year] for year in census_state.get_column("year")],
+            dtype=np.int64,
+        )
+        state_values = (
+            census_state.get_column("state_census_hired_workers_reported")
+            .cast(pl.Float64)
+            .to_numpy()
+        )
+        state_total[state_rows, state_years] = state_values
+
+        value = np.zeros((county_count, len(benchmark_years)))
+        method = np.empty((county_count, len(benchmark_years)), dtype=object)
+        structural_zero = np.zeros((county_count, len(benchmark_years)), dtype=bool)
+        missing_ratio = np.zeros((county_count, len(benchmark_years)), dtype=bool)
+        has_reported = reported.any(axis=1)
+        for position, year in enumerate(benchmark_years):
+            column = benchmark_columns[position]
+            value[:, position] = reported_value[:, position]
+            method[:, position] = "reported"
+            unreported = ~reported[:, position]
+            structural = unreported & ~positive_signal
+            value[structural, position] = 0.0
+            method[structural, position] = "structural_zero"
+            structural_zero[:, position] = structural
+            pending = unreported & positive_signal
+
+            # Nearest reported benchmarks on each side of the year.
+            lower = np.full(county_count, -1)
+            upper = np.full(county_count, -1)
+            for other in range(position):
+                lower[reported[:, other]] = other
+            for other in reversed(range(position + 1, len(benchmark_years))):
+                upper[reported[:, other]] = other
+            interpolate = pending & (lower >= 0) & (upper >= 0)
+            if interpolate.any():
+                rows = np.flatnonzero(interpolate)
+                lower_year = np.asarray(benchmark_years)[lower[rows]]
+                upper_year = np.asarray(benchmark_years)[upper[rows]]
+                share = (year - lower_year) / (upper_year - lower_year)
+                value[rows, position] = np.expm1(
+                    (1 - share) * np.log1p(reported_value[rows, lower[rows]])
+                    + share * np.log1p(reported_value[rows, upper[rows]])
                 )
-                target = state_total[(state_fips, year)]
-                residual = target - reported_sum
-                tolerance = 1e-8 * max(1.0, target)
-                if residual < -tolerance:
-                    raise ValueError(
-                        f"Reported county Census workers exceed the state total "
-                        f"for {state_fips}, {year}"
-                    )
-                residual = max(residual, 0.0)
-                missing_indexes = [
-                    index for index, cell in enumerate(cells) if not cell["reported"]
-                ]
-                eligible_indexes = [
-                    index
-                    for index in missing_indexes
-                    if not cells[index]["structural_zero"]
-                ]
-                initial_total = sum(cells[index]["value"] for index in missing_indexes)
-
-                if not missing_indexes:
-                    if residual > tolerance:
-                        raise ValueError(
-                            f"State residual has no unreported counties for "
-                            f"{state_fips}, {year}"
-                        )
-                elif initial_total > 0:
-                    factor = residual / initial_total
-                    for index in missing_indexes:
-                        cells[index]["value"] *= factor
-                        cells[index]["state_residual_factor"] = factor
-                        cells[index]["method"] += "_state_residual_scaled"
-                elif residual > tolerance:
-                    if not eligible_indexes:
-                        raise ValueError(
-                            f"A positive state residual would violate structural "
-                            f"zeros for {state_fips}, {year}"
-                        )
-                    employment_weights = [
-                        update_map[
-                            (state_counties[index]["county_fips"], year)
-                        ]["annual_update_employment"]
-                        for index in eligible_indexes
-                    ]
-                    employment_total = sum(
-                        float(value)
-                        for value in employment_weights
-                        if _finite_positive(value)
+                method[rows, position] = "county_log1p_interpolation"
+            pending &= ~interpolate
+
+            project = pending & has_reported
+            neighbor = np.full(county_count, -1)
+            for other in _nearest_order(year, benchmark_years):
+                neighbor[project & (neighbor < 0) & reported[:, other]] = other
+            for other in np.unique(neighbor[project]):
+                rows = np.flatnonzero(project & (neighbor == other))
+                projected = np.expm1(
+                    np.log1p(reported_value[rows, other])
+                    + _cumulative_growth(growth[rows], benchmark_columns[other], column)
+                )
+                floor = projected < 0
+                label = f"county_growth_projection_from_{benchmark_years[other]}"
+                value[rows, position] = np.where(floor, 0.0, projected)
+                method[rows, position] = np.where(
+                    floor, label + "_nonnegative_floor", label
+                )
+            pending &= ~project
+
+            if pending.any():
+                proxy_column = np.full(county_count, -1)
+                for other in _nearest_order(year, frame_years):
+                    proxy_column[
+                        pending & (proxy_column < 0) & employment_valid[:, other]
+                    ] = other
+                proxy = np.where(
+                    proxy_column >= 0,
+                    employment[np.arange(county_count), proxy_column],
+                    1.0,
+                )
+
+                denominator = np.where(
+                    employment_valid[:, column], employment[:, column], 0.0
+                )
+                state_denominator = np.bincount(
+                    state_code, weights=denominator, minlength=state_count
+                )
+                region_denominator = np.bincount(
+                    region_code, weights=denominator, minlength=region_ids.size
+                )
+                national_denominator = float(denominator.sum())
+                year_states = state_years == position
+                region_numerator = np.bincount(
+                    state_region[state_rows[year_states]],
+                    weights=state_values[year_states],
+                    minlength=region_ids.size,
+                )
+                national_numerator = float(state_values[year_states].sum())
+
+                county_state_denominator = state_denominator[state_code]
+                county_region_denominator = region_denominator[region_code]
+                use_state = county_state_denominator > 0
+                use_region = ~use_state & (county_region_denominator > 0)
+                use_national = ~use_state & ~use_region & (national_denominator > 0)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    ratio = np.where(
+                        use_state,
+                        state_total[state_code, position] / county_state_denominator,
+                        np.where(
+                            use_region,
+                            region_numerator[region_code] / county_region_denominator,
+                            national_numerator / national_denominator
+                            if national_denominator > 0
+                            else np.nan,
+                        ),
                     )
-                    for index, employment in zip(
-                        eligible_indexes, employment_weights
-                    ):
-                        if employment_total > 0 and _finite_positive(employment):
-                            share = float(employment) / employment_total
-                            method_suffix = "_state_residual_employment_allocated"
-                        else:
-                            share = 1 / len(eligible_indexes)
-                            method_suffix = "_state_residual_equal_allocated"
-                        cells[index]["value"] = residual * share
-                        cells[index]["state_residual_factor"] = None
-                        cells[index]["method"] += method_suffix
-                else:
-                    for index in missing_indexes:
-                        cells[index]["value"] = 0.0
-                        cells[index]["state_residual_factor"] = 0.0
-                        cells[index]["method"] += "_zero_state_residual"
-
-                for county, cell in zip(state_counties, cells):
-                    if cell["reported"]:
-                        cell["state_residual_factor"] = 1.0
-                    benchmark[(county["county_fips"], year)] = dict(cell)
-
-                filled_sum = sum(cell["value"] for cell in cells)
-                if not math.isclose(
-                    filled_sum,
-                    target,
-                    rel_tol=1e-10,
-                    abs_tol=1e-7,
-                ):
-                    raise AssertionError(
-                        f"Filled Census benchmarks miss state total for "
-                        f"{state_fips}, {year}: {filled_sum} != {target}"
+                missing_ratio[:, position] = pending & ~(
+                    use_state | use_region | use_national
+                )
+                rows = np.flatnonzero(pending)
+                value[rows, position] = ratio[rows] * proxy[rows]
+                method[rows, position] = np.where(
+                    use_state[rows],
+                    "state_census_to_employment_ratio",
+                    np.where(
+                        use_region[rows],
+                        "aewr_region_census_to_employment_ratio",
+                        "national_census_to_employment_ratio",
+                    ),
+                )
+                for other in np.unique(proxy_column[rows]):
+                    if other < 0 or frame_years[other] == year:
+                        continue
+                    suffix_rows = rows[proxy_column[rows] == other]
+                    method[suffix_rows, position] = (
+                        method[suffix_rows, position]
+                        + f"_nearest_employment_{frame_years[other]}"
                     )
 
-        farm_map: dict[tuple[str, int], float] = {}
-        for row in census_farms.iter_rows(named=True):
-            farm_map[(row["county_fips"], int(row["year"]))] = float(row["census_eligible_farms"])
-
-        path_rows: list[dict[str, Any]] = []
-        for county in county_rows:
-            county_fips = county["county_fips"]
-            for year in frame_years:
-                lower_candidates = [b for b in benchmark_years if b <= year]
-                if not lower_candidates:
-                    raise ValueError(f"No benchmark year <= {year}")
-                lower = max(lower_candidates)
-            
-                lower_value = benchmark[(county_fips, lower)]["value"]
-                cumulative = _cumulative_growth(growth, county_fips, lower, year)
-                forward_log = math.log1p(lower_value) + cumulative
-                projected_value = math.expm1(forward_log)
-                nonnegative_floor = projected_value < 0
-                if nonnegative_floor:
-                    projected_value = 0.0
-
-                base_farms = farm_map.get((county_fips, lower), 0.0)
-                frame_mass = projected_value + 1.0 * base_farms
-
-                update = update_map[(county_fips, year)]
-                is_benchmark = year in benchmark_years
-                benchmark_cell = benchmark[(county_fips, year)] if is_benchmark else None
-                reported_value = reported_map.get((county_fips, year))
-                if not is_benchmark:
-                    benchmark_status = "non_benchmark_year"
-                elif reported_value is None:
-                    benchmark_status = "suppressed_or_absent"
-                elif reported_value == 0:
-                    benchmark_status = "reported_zero"
-                else:
-                    benchmark_status = "reported_positive"
-
-                path_rows.append(
-                    {
-                        **county,
-                        "source_year": year,
-                        "weight_spec": WEIGHT_SPEC,
-                        "annual_update_spec": ANNUAL_UPDATE_SPEC,
-                        "weight_draw_id": None,
-                        "census_benchmark_status": benchmark_status,
-                        "census_benchmark_reported": bool(
-                            benchmark_cell and benchmark_cell["reported"]
-                        ),
-                        "census_published_zero": bool(
-                            benchmark_cell and benchmark_cell["published_zero"]
-                        ),
-                        "census_hired_workers_reported": reported_value,
-                        "census_hired_workers_benchmark_filled": (
-                            benchmark_cell["value"] if benchmark_cell else None
-                        ),
-                        "census_benchmark_fill_method": (
-                            benchmark_cell["method"] if benchmark_cell else None
-                        ),
-                        "census_benchmark_prefill": (
-                            prefill[(county_fips, year)]["value"]
-                            if is_benchmark
-                            else None
-                        ),
-                        "census_benchmark_state_residual_factor": (
-                            benchmark_cell["state_residual_factor"]
-                            if benchmark_cell
-                            else None
-                        ),
-                        "structural_zero": bool(
-                            benchmark_cell and benchmark_cell["structural_zero"]
-                        ),
-                        "lower_census_benchmark_year": lower,
-                        "upper_census_benchmark_year": lower,
-                        "lower_census_hired_workers_filled": lower_value,
-                        "upper_census_hired_workers_filled": lower_value,
-                        "interval_share": 0.0,
-                        "qcew_ag_employment": update["qcew_ag_employment"],
-                        "qcew_strict_complete": update["qcew_strict_complete"],
-                        "qcew_observed_cells": update["qcew_observed_cells"],
-                        "qcew_valid_cells": update["qcew_valid_cells"],
-                        "qwi_ag_employment": update["qwi_ag_employment"],
-                        "qwi_strict_complete": update["qwi_strict_complete"],
-                        "qwi_observed_cells": update["qwi_observed_cells"],
-                        "qwi_valid_cells": update["qwi_valid_cells"],
-                        "bea_hired_farm_jobs": update["bea_hired_farm_jobs"],
-                        "annual_update_employment": update["annual_update_employment"],
-                        "annual_update_source": update["annual_update_source"],
-                        "annual_growth_source": update["annual_growth_source"],
-                        "annual_log1p_growth": update["annual_log1p_growth"],
-                        "annual_growth_factor_log1p": update["annual_growth_factor_log1p"],
-                        "two_sided_log1p_drift": 0.0,
-                        "frame_employment_mass_prerake": projected_value,
-                        "state_census_hired_workers_target": 0.0,
-                        "state_frame_employment_prerake": 0.0,
-                        "state_rake_factor": 1.0,
-                        "frame_employment_mass": frame_mass,
-                        "qwi_annual_fallback_used": update["qwi_annual_fallback_used"],
-                        "bea_annual_fallback_used": update["bea_annual_fallback_used"],
-                        "unit_growth_fallback_used": update["unit_growth_fallback_used"],
-                        "extreme_annual_change": update["extreme_annual_change"],
-                        "nonnegative_floor_applied": nonnegative_floor,
-                    }
+            imputed = unreported & positive_signal
+            value[imputed, position] = np.maximum(value[imputed, position], 0.0)
+
+        if missing_ratio.any():
+            row = int(np.flatnonzero(missing_ratio.any(axis=1))[0])
+            position = int(np.flatnonzero(missing_ratio[row])[0])
+            raise ValueError(
+                f"No Census-to-employment ratio for {county_ids[row]}, "
+                f"{benchmark_years[position]}"
+            )
+
+        # Scale unreported benchmarks within each state's residual.
+        residual_factor = np.full((county_count, len(benchmark_years)), np.nan)
+        residual_factor[reported] = 1.0
+        failures: dict[tuple[int, int], Exception] = {}
+        for position, year in enumerate(benchmark_years):
+            cells = value[:, position]
+            reported_cells = reported[:, position]
+            missing = ~reported_cells
+            eligible = missing & ~structural_zero[:, position]
+            target = state_total[:, position]
+            reported_sum = np.bincount(
+                state_code,
+                weights=np.where(reported_cells, cells, 0.0),
+                minlength=state_count,
+            )
+            residual = target - reported_sum
+            tolerance = 1e-8 * np.maximum(1.0, target)
+            negative = residual < -tolerance
+            residual = np.maximum(residual, 0.0)
+            missing_count = np.bincount(state_code[missing], minlength=state_count)
+            eligible_count = np.bincount(state_code[eligible], minlength=state_count)
+            initial_total = np.bincount(
+                state_code,
+                weights=np.where(missing, cells, 0.0),
+                minlength=state_count,
+            )
+
+            scaled = (missing_count > 0) & (initial_total > 0)
+            allocated = (missing_count > 0) & ~scaled & (residual > tolerance)
+            zeroed = (missing_count > 0) & ~scaled & ~allocated
+            for state in np.flatnonzero(negative):
+                failures[(state, position)] = ValueError(
+                    f"Reported county Census workers exceed the state total "
+                    f"for {state_ids[state]}, {year}"
+                )
+            for state in np.flatnonzero((missing_count == 0) & (residual > tolerance)):
+                failures.setdefault(
+                    (state, position),
+                    ValueError(
+                        f"State residual has no unreported counties for "
+                        f"{state_ids[state]}, {year}"
+                    ),
+                )
+            for state in np.flatnonzero(allocated & (eligible_count == 0)):
+                failures.setdefault(
+                    (state, position),
+                    ValueError(
+                        f"A positive state residual would violate structural "
+                        f"zeros for {state_ids[state]}, {year}"
+                    ),
+                )
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                factor = residual / initial_total
+            rows = missing & scaled[state_code]
+            cells[rows] *= factor[state_code[rows]]
+            residual_factor[rows, position] = factor[state_code[rows]]
+            method[rows, position] = method[rows, position] + "_state_residual_scaled"
+
+            rows = eligible & allocated[state_code]
+            weights = employment[:, benchmark_columns[position]]
+            positive = employment_positive[:, benchmark_columns[position]]
+            employment_total = np.bincount(
+                state_code,
+                weights=np.where(rows & positive, weights, 0.0),
+                minlength=state_count,
+            )
+            by_employment = rows & positive & (employment_total[state_code] > 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                share = np.where(
+                    by_employment,
+                    weights / employment_total[state_code],
+                    1 / eligible_count[state_code],
                 )
+            cells[rows] = residual[state_code[rows]] * share[rows]
+            method[rows, position] = method[rows, position] + np.where(
+                by_employment[rows],
+                "_state_residual_employment_allocated",
+                "_state_residual_equal_allocated",
+            )
+
+            rows = missing & zeroed[state_code]
+            cells[rows] = 0.0
+            residual_factor[rows, position] = 0.0
+            method[rows, position] = method[rows, position] + "_zero_state_residual"
+
+            filled_sum = np.bincount(state_code, weights=cells, minlength=state_count)
+            for state in np.flatnonzero(
+                ~_is_close(filled_sum, target, rel_tol=1e-10, abs_tol=1e-7)
+            ):
+                failures.setdefault(
+                    (state, position),
+                    AssertionError(
+                        f"Filled Census benchmarks miss state total for "
+                        f"{state_ids[state]}, {year}: {filled_sum[state]} != "
+                        f"{target[state]}"
+                    ),
+                )
+        if failures:
+            raise failures[min(failures)]
+
+        # Project each frame year forward from its latest benchmark.
+        frame_count = len(frame_years)
+        lower = np.asarray(
+            [
+                max(
+                    position
+                    for position, benchmark in enumerate(benchmark_years)
+                    if benchmark <= year
+                )
+                for year in frame_years
+            ]
+        )
+        lower_value = value[:, lower]
+        cumulative = np.column_stack(
+            [
+                _cumulative_growth(growth, benchmark_columns[lower[column]], column)
+                for column in range(frame_count)
+            ]
+        )
+        projected = np.expm1(np.log1p(lower_value) + cumulative)
+        nonnegative_floor = projected < 0
+        projected[nonnegative_floor] = 0.0
 
-        for row in path_rows:
-            row["update_imputation_source"] = (
-                row["census_benchmark_fill_method"]
-                if row["census_benchmark_fill_method"] is not None
-                else row["annual_growth_source"]
+        farms = (
+            census_farms.select(
+                "county_fips",
+                pl.col("year").cast(pl.Int32),
+                pl.col("census_eligible_farms").cast(pl.Float64),
+            )
+            .filter(pl.col("year").is_in(benchmark_years))
+            .unique(["county_fips", "year"], keep="last", maintain_order=True)
+            .join(county_codes, on="county_fips")
+        )
+        base_farms = np.zeros((county_count, len(benchmark_years)))
+        base_farms[
+            farms.get_column("_county").to_numpy(),
+            [benchmark_position[year] for year in farms.get_column("year")],
+        ] = farms.get_column("census_eligible_farms").fill_null(np.nan).to_numpy()
+        frame_mass = projected + 1.0 * base_farms[:, lower]
+
+        def benchmark_cells(cells: np.ndarray, fill: Any) -> np.ndarray:
+            """Spread benchmark-year columns over the frame years."""
+            spread = np.full((county_count, frame_count), fill, dtype=cells.dtype)
+            spread[:, benchmark_columns] = cells
+            return spread.ravel()
+
+        def frame_cells(cells: np.ndarray) -> pl.Series:
+            return pl.Series(cells.ravel(), nan_to_null=True)
+
+        status = np.where(
+            reported,
+            np.where(reported_value == 0, "reported_zero", "reported_positive"),
+            "suppressed_or_absent",
+        ).astype(object)
+        result = (
+            updates.join(
+                counties, on="county_fips", how="left", maintain_order="left"
+            )
+            .with_columns(
+                census_benchmark_status=pl.Series(
+                    benchmark_cells(status, "non_benchmark_year"), dtype=pl.String
+                ),
+                census_benchmark_reported=benchmark_cells(reported, False),
+                census_published_zero=benchmark_cells(
+                    reported & (reported_value == 0), False
+                ),
+                census_hired_workers_reported=frame_cells(
+                    benchmark_cells(reported_value, np.nan)
+                ),
+                census_hired_workers_benchmark_filled=frame_cells(
+                    benchmark_cells(value, np.nan)
+                ),
+                census_benchmark_fill_method=pl.Series(
+                    benchmark_cells(method, None), dtype=pl.String
+                ),
+                census_benchmark_prefill=frame_cells(benchmark_cells(value, np.nan)),
+                census_benchmark_state_residual_factor=frame_cells(
+                    benchmark_cells(residual_factor, np.nan)
+                ),
+                structural_zero=benchmark_cells(structural_zero, False),
+                lower_census_benchmark_year=pl.Series(
+                    np.tile(np.asarray(benchmark_years)[lower], county_count),
+                    dtype=pl.Int64,
+                ),
+                lower_census_hired_workers_filled=lower_value.ravel(),
+                frame_employment_mass_prerake=projected.ravel(),
+                frame_employment_mass=frame_mass.ravel(),
+                nonnegative_floor_applied=nonnegative_floor.ravel(),
+            )
+            .with_columns(
+                pl.col("source_year").cast(pl.Int32),
+                pl.lit(WEIGHT_SPEC).alias("weight_spec"),
+                pl.lit(ANNUAL_UPDATE_SPEC).alias("annual_update_spec"),
+                pl.lit(None, dtype=pl.Int64).alias("weight_draw_id"),
+                pl.col("lower_census_benchmark_year").alias(
+                    "upper_census_benchmark_year"
+                ),
+                pl.col("lower_census_hired_workers_filled").alias(
+                    "upper_census_hired_workers_filled"
+                ),
+                pl.lit(0.0).alias("interval_share"),
+                pl.col(
+                    "qcew_observed_cells",
+                    "qcew_valid_cells",
+                    "qwi_observed_cells",
+                    "qwi_valid_cells",
+                )
+                .fill_null(0)
+                .cast(pl.Int32),
+                pl.lit(0.0).alias("two_sided_log1p_drift"),
+                pl.lit(0.0).alias("state_census_hired_workers_target"),
+                pl.lit(0.0).alias("state_frame_employment_prerake"),
+                pl.lit(1.0).alias("state_rake_factor"),
+                pl.coalesce(
+                    "census_benchmark_fill_method", "annual_growth_source"
+                ).alias("update_imputation_source"),
+            )
+            .with_columns(_quality_flags().alias("quality_flags"))
+            .select(
+                *required_county_columns,
+                "source_year",
+                "weight_spec",
+                "annual_update_spec",
+                "weight_draw_id",
+                "census_benchmark_status",
+                "census_benchmark_reported",
+                "census_published_zero",
+                "census_hired_workers_reported",
+                "census_hired_workers_benchmark_filled",
+                "census_benchmark_fill_method",
+                "census_benchmark_prefill",
+                "census_benchmark_state_residual_factor",
+                "structural_zero",
+                "lower_census_benchmark_year",
+                "upper_census_benchmark_year",
+                "lower_census_hired_workers_filled",
+                "upper_census_hired_workers_filled",
+                "interval_share",
+                "qcew_ag_employment",
+                "qcew_strict_complete",
+                "qcew_observed_cells",
+                "qcew_valid_cells",
+                "qwi_ag_employment",
+                "qwi_strict_complete",
+                "qwi_observed_cells",
+                "qwi_valid_cells",
+                "bea_hired_farm_jobs",
+                "annual_update_employment",
+                "annual_update_source",
+                "annual_growth_source",
+                "annual_log1p_growth",
+                "annual_growth_factor_log1p",
+                "two_sided_log1p_drift",
+                "frame_employment_mass_prerake",
+                "state_census_hired_workers_target",
+                "state_frame_employment_prerake",
+                "state_rake_factor",
+                "frame_employment_mass",
+                "qwi_annual_fallback_used",
+                "bea_annual_fallback_used",
+                "unit_growth_fallback_used",
+                "extreme_annual_change",
+                "nonnegative_floor_applied",
+                "update_imputation_source",
+                "quality_flags",
             )
-            row["quality_flags"] = _quality_flags(row)
-
-        result = pl.DataFrame(path_rows).with_columns(
-            pl.col("source_year").cast(pl.Int32),
-            pl.col("weight_draw_id").cast(pl.Int64),
-            pl.col("qcew_observed_cells").fill_null(0).cast(pl.Int32),
-            pl.col("qcew_valid_cells").fill_null(0).cast(pl.Int32),
-            pl.col("qwi_observed_cells").fill_null(0).cast(pl.Int32),
-            pl.col("qwi_valid_cells").fill_null(0).cast(pl.Int32),
         )
         _require_unique(result, _ANNUAL_KEYS, "frame employment analog")
         masses = result.get_column("frame_employment_mass")
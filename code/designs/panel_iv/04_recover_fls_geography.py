@@ -12,9 +12,11 @@ from __future__ import annotations
 
 import argparse
 import math
+import multiprocessing
 import os
 import zlib
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -55,6 +57,18 @@ DRAW_ROOT = INTERMEDIATE / "panel_iv_fls_county_draws"
 
 COUNTY_KEYS = ["aewr_region_id", "source_year", "county_fips"]
 CELL_KEYS = ["aewr_region_id", "source_year"]
+_INTEGER_COLUMNS = {
+    name: pl.Int64
+    for name in (
+        "source_year",
+        "simulation_seed",
+        "active_moment_count",
+        "inactive_moment_count",
+        "draws_requested",
+        "draws_succeeded",
+        "optimizer_iterations",
+    )
+}
 
 
 def require_columns(frame: pl.DataFrame, columns: Iterable[str], label: str) -> None:
@@ -220,6 +234,68 @@ def _dual_state(
     return weights, moments, objective, gradient
 
 
+def _batched_newton_directions(
+    hessian: np.ndarray, gradient: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Solve stacked Newton systems, flagging any singular Hessian."""
+    try:
+        return np.linalg.solve(hessian, gradient[..., None])[..., 0], np.ones(
+            len(hessian), dtype=bool
+        )
+    except np.linalg.LinAlgError:
+        pass
+    # One singular system aborts the stacked solve; isolate it.
+    direction = np.zeros_like(gradient)
+    solved = np.ones(len(hessian), dtype=bool)
+    for index in range(len(hessian)):
+        try:
+            direction[index] = np.linalg.solve(hessian[index], gradient[index])
+        except np.linalg.LinAlgError:
+            solved[index] = False
+    return direction, solved
+
+
+def _backtracking_line_search(
+    log_prior: np.ndarray,
+    design: np.ndarray,
+    target: np.ndarray,
+    rho: float,
+    multipliers: np.ndarray,
+    objective: np.ndarray,
+    gradient: np.ndarray,
+    direction: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Halve every draw's Newton step until its Armijo condition holds.
+
+    Each draw keeps its own step size, and only draws still searching are
+    re-evaluated, so the accepted steps equal a draw-by-draw search.
+    """
+    directional_derivative = np.sum(gradient * direction, axis=1)
+    tolerance = 1e-12 * (1 + np.abs(objective))
+    proposal = multipliers.copy()
+    accepted = np.zeros(len(multipliers), dtype=bool)
+    searching = np.arange(len(multipliers))
+    step_size = 1.0
+    while searching.size and step_size >= 2**-20:
+        candidate = multipliers[searching] - step_size * direction[searching]
+        _, _, candidate_objective, _ = _dual_state(
+            log_prior[searching], design, target, rho, candidate
+        )
+        sufficient = np.isfinite(candidate_objective) & (
+            (
+                candidate_objective
+                <= objective[searching]
+                - 1e-4 * step_size * directional_derivative[searching]
+            )
+            | (candidate_objective <= objective[searching] + tolerance[searching])
+        )
+        proposal[searching[sufficient]] = candidate[sufficient]
+        accepted[searching[sufficient]] = True
+        searching = searching[~sufficient]
+        step_size *= 0.5
+    return proposal, accepted
+
+
 def solve_soft_entropy_batch(
     prior_weights: np.ndarray,
     design: np.ndarray,
@@ -275,53 +351,32 @@ def solve_soft_entropy_batch(
             log_prior, design, target, rho, multipliers
         )
         converged |= np.max(np.abs(gradient), axis=1) <= OPTIMIZER_GRADIENT_TOLERANCE
-        active = ~(converged | failed)
-        if not np.any(active):
+        active = np.flatnonzero(~(converged | failed))
+        if not active.size:
             break
-        for batch_index in np.flatnonzero(active):
-            second = np.einsum(
-                "n,np,nq->pq",
-                weights[batch_index],
-                design,
-                design,
-                optimize=True,
-            )
-            hessian = (
-                second
-                - np.outer(moments[batch_index], moments[batch_index])
-                + identity / rho
+        hessian = (
+            np.einsum(
+                "bn,np,nq->bpq", weights[active], design, design, optimize=True
             )
-            try:
-                direction = np.linalg.solve(hessian, gradient[batch_index])
-            except np.linalg.LinAlgError:
-                failed[batch_index] = True
-                continue
-            directional_derivative = float(gradient[batch_index] @ direction)
-            step_size = 1.0
-            accepted = False
-            while step_size >= 2**-20:
-                proposal = (multipliers[batch_index] - step_size * direction)[None, :]
-                _, _, proposal_objective, _ = _dual_state(
-                    log_prior[batch_index : batch_index + 1],
-                    design,
-                    target,
-                    rho,
-                    proposal,
-                )
-                tolerance = 1e-12 * (1 + abs(float(objective[batch_index])))
-                if math.isfinite(float(proposal_objective[0])) and (
-                    proposal_objective[0]
-                    <= objective[batch_index]
-                    - 1e-4 * step_size * directional_derivative
-                    or proposal_objective[0] <= objective[batch_index] + tolerance
-                ):
-                    multipliers[batch_index] = proposal[0]
-                    iterations[batch_index] = iteration
-                    accepted = True
-                    break
-                step_size *= 0.5
-            if not accepted:
-                failed[batch_index] = True
+            - moments[active, :, None] * moments[active, None, :]
+            + identity / rho
+        )
+        direction, solved = _batched_newton_directions(hessian, gradient[active])
+        failed[active[~solved]] = True
+        active, direction = active[solved], direction[solved]
+        proposal, accepted = _backtracking_line_search(
+            log_prior[active],
+            design,
+            target,
+            rho,
+            multipliers[active],
+            objective[active],
+            gradient[active],
+            direction,
+        )
+        multipliers[active[accepted]] = proposal[accepted]
+        iterations[active[accepted]] = iteration
+        failed[active[~accepted]] = True
 
     final_weights, final_moments, _, final_gradient = _dual_state(
         log_prior, design, target, rho, multipliers
@@ -914,289 +969,341 @@ def _spec_design(
     return design, target, selected
 
 
-def _solver_diagnostic_rows(
+def _solver_diagnostics(
     *,
     region: str,
     year: int,
     specification: dict[str, Any],
     solution: dict[str, np.ndarray],
-    weight_kind: str,
+    weight_kinds: Sequence[str],
     draw_ids: Sequence[int | None],
     kappa: float,
     frame_effective_county_count: float,
     active_moment_count: int,
     inactive_moment_count: int,
     simulation_seed: int,
-) -> list[dict[str, Any]]:
-    rows = []
-    for index, draw_id in enumerate(draw_ids):
-        rows.append(
-            {
-                "aewr_region_id": region,
-                "source_year": year,
-                "specification": specification["specification"],
-                "moment_spec": specification["moment_spec"],
-                "is_primary": specification["is_primary"],
-                "weight_spec": WEIGHT_SPEC,
-                "baseline_weight_spec": BASELINE_WEIGHT_SPEC,
-                "rho": PRIMARY_RHO,
-                "kappa_multiplier": KAPPA_MULTIPLIER,
-                "kappa": kappa,
-                "frame_effective_county_count": frame_effective_county_count,
-                "weight_kind": weight_kind,
-                "weight_draw_id": draw_id,
-                "simulation_seed": simulation_seed,
-                "active_moment_count": active_moment_count,
-                "inactive_moment_count": inactive_moment_count,
-                "optimizer_success": bool(solution["success"][index]),
-                "optimizer_status": str(solution["status"][index]),
-                "optimizer_iterations": int(solution["iterations"][index]),
-                "input_standardized_residual_norm": float(
-                    solution["input_imbalance_norm"][index]
-                ),
-                "calibrated_standardized_residual_norm": float(
-                    solution["calibrated_imbalance_norm"][index]
-                ),
-                "maximum_absolute_standardized_residual": float(
-                    solution["maximum_absolute_imbalance"][index]
-                ),
-                "kl_divergence": float(solution["kl_divergence"][index]),
-                "calibrated_effective_county_count": float(
-                    solution["effective_county_count"][index]
-                ),
-                "maximum_calibrated_county_weight": float(
-                    solution["maximum_county_weight"][index]
-                ),
-            }
-        )
-    return rows
+) -> pl.DataFrame:
+    """One calibration diagnostic row per solved prior vector."""
+    return pl.DataFrame(
+        {
+            "aewr_region_id": region,
+            "source_year": year,
+            "specification": specification["specification"],
+            "moment_spec": specification["moment_spec"],
+            "is_primary": specification["is_primary"],
+            "weight_spec": WEIGHT_SPEC,
+            "baseline_weight_spec": BASELINE_WEIGHT_SPEC,
+            "rho": PRIMARY_RHO,
+            "kappa_multiplier": KAPPA_MULTIPLIER,
+            "kappa": kappa,
+            "frame_effective_county_count": frame_effective_county_count,
+            "weight_kind": pl.Series(weight_kinds, dtype=pl.String),
+            "weight_draw_id": pl.Series(draw_ids, dtype=pl.Int64),
+            "simulation_seed": simulation_seed,
+            "active_moment_count": active_moment_count,
+            "inactive_moment_count": inactive_moment_count,
+            "optimizer_success": solution["success"],
+            "optimizer_status": pl.Series(solution["status"], dtype=pl.String),
+            "optimizer_iterations": solution["iterations"],
+            "input_standardized_residual_norm": solution["input_imbalance_norm"],
+            "calibrated_standardized_residual_norm": solution[
+                "calibrated_imbalance_norm"
+            ],
+            "maximum_absolute_standardized_residual": solution[
+                "maximum_absolute_imbalance"
+            ],
+            "kl_divergence": solution["kl_divergence"],
+            "calibrated_effective_county_count": solution["effective_county_count"],
+            "maximum_calibrated_county_weight": solution["maximum_county_weight"],
+        },
+        schema_overrides=_INTEGER_COLUMNS,
+    )
 
 
-def recover_cells(
-    cells: dict[tuple[str, int], dict[str, Any]],
-) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame, dict[tuple[str, int, str], pl.DataFrame]]:
-    summary_rows: list[dict[str, Any]] = []
-    diagnostic_rows: list[dict[str, Any]] = []
+def _weight_summary(
+    *,
+    prior: np.ndarray,
+    center: np.ndarray,
+    draws: np.ndarray,
+    draw_success: np.ndarray,
+) -> dict[str, Any]:
+    """County weight columns summarizing the center and successful draws.
+
+    Successful draws are transposed to one contiguous row per county, so
+    every axis reduction matches the per-county scalar computation.
+    """
+    succeeded = np.ascontiguousarray(draws[draw_success].T)
+    county_count, draw_count = succeeded.shape
+    missing = np.full(county_count, np.nan)
+    if draw_count:
+        mean = succeeded.mean(axis=1)
+        p025, p50, p975 = np.quantile(succeeded, [0.025, 0.5, 0.975], axis=1)
+    else:
+        mean = p025 = p50 = p975 = missing
+    return {
+        "frame_prior_weight": prior,
+        "calibrated_center_weight": center,
+        "draw_mean_weight": pl.Series(mean, nan_to_null=True),
+        "draw_standard_deviation_weight": (
+            succeeded.std(axis=1, ddof=1)
+            if draw_count > 1
+            else np.zeros(county_count)
+        ),
+        "simulation_envelope_p025_weight": pl.Series(p025, nan_to_null=True),
+        "simulation_envelope_p50_weight": pl.Series(p50, nan_to_null=True),
+        "simulation_envelope_p975_weight": pl.Series(p975, nan_to_null=True),
+    }
+
+
+def _recover_cell(
+    key: tuple[str, int],
+    cell: dict[str, Any],
+    progress: str,
+) -> tuple[
+    pl.DataFrame,
+    pl.DataFrame,
+    list[dict[str, Any]],
+    dict[tuple[str, int, str], pl.DataFrame],
+]:
+    """Calibrate every specification of one region-year cell."""
+    region, year = key
+    summaries: list[pl.DataFrame] = []
+    diagnostics: list[pl.DataFrame] = []
     moment_rows: list[dict[str, Any]] = []
     draw_partitions: dict[tuple[str, int, str], pl.DataFrame] = {}
     specifications = specification_grid()
 
-    for cell_number, ((region, year), cell) in enumerate(cells.items(), start=1):
-        print(
-            f"Recovering county weights for AEWR region {region}, {year} "
-            f"({cell_number}/{len(cells)})",
-            flush=True,
+    print(
+        f"Recovering county weights for AEWR region {region}, {year} "
+        f"({progress})",
+        flush=True,
+    )
+    prior = np.asarray(cell["prior"], dtype=float)
+    supported = prior > 0
+    supported_prior = prior[supported]
+    supported_prior /= supported_prior.sum()
+    seed = deterministic_seed(region, year)
+    prior_draws, kappa, frame_effective = dirichlet_prior_draws(
+        supported_prior,
+        draw_count=DIAGNOSTIC_DRAW_COUNT,
+        seed=seed,
+    )
+
+    for specification in specifications:
+        design_all, target, selected_moments = _spec_design(cell, specification)
+        design = design_all[supported]
+        # The center and the draws share one batched Newton solve.
+        solution = solve_soft_entropy_batch(
+            np.vstack((supported_prior, prior_draws)),
+            design,
+            target,
+            rho=PRIMARY_RHO,
         )
-        prior = np.asarray(cell["prior"], dtype=float)
-        supported = prior > 0
-        supported_prior = prior[supported]
-        supported_prior /= supported_prior.sum()
-        seed = deterministic_seed(region, year)
-        prior_draws, kappa, frame_effective = dirichlet_prior_draws(
-            supported_prior,
-            draw_count=DIAGNOSTIC_DRAW_COUNT,
-            seed=seed,
+        center_solution = {name: values[:1] for name, values in solution.items()}
+        draw_solution = {name: values[1:] for name, values in solution.items()}
+        active_count = sum(moment["active"] for moment in selected_moments)
+        inactive_count = len(selected_moments) - active_count
+        diagnostics.append(
+            _solver_diagnostics(
+                region=region,
+                year=year,
+                specification=specification,
+                solution=solution,
+                weight_kinds=["deterministic_center"]
+                + ["dirichlet_draw"] * DIAGNOSTIC_DRAW_COUNT,
+                draw_ids=[None, *range(1, DIAGNOSTIC_DRAW_COUNT + 1)],
+                kappa=kappa,
+                frame_effective_county_count=frame_effective,
+                active_moment_count=active_count,
+                inactive_moment_count=inactive_count,
+                simulation_seed=seed,
+            )
         )
+        if not bool(center_solution["success"][0]):
+            raise RuntimeError(
+                f"County calibration failed for {region}, {year}, "
+                f"{specification['specification']}: {center_solution['status'][0]}"
+            )
 
-        for specification in specifications:
-            design_all, target, selected_moments = _spec_design(cell, specification)
-            design = design_all[supported]
-            center_solution = solve_soft_entropy_batch(
-                supported_prior, design, target, rho=PRIMARY_RHO
+        center_all = np.zeros_like(prior)
+        center_all[supported] = center_solution["weights"][0]
+        draws_all = np.zeros((DIAGNOSTIC_DRAW_COUNT, len(prior)))
+        draws_all[:, supported] = draw_solution["weights"]
+        prior_draws_all = np.zeros_like(draws_all)
+        prior_draws_all[:, supported] = prior_draws
+        county_codes = cell["county_codes"]
+
+        draw_success = draw_solution["success"]
+        summaries.append(
+            pl.DataFrame(
+                {
+                    "aewr_region_id": region,
+                    "source_year": year,
+                    "county_fips": pl.Series(county_codes, dtype=pl.String),
+                    "weight_draw_id": pl.Series(
+                        [None] * len(county_codes), dtype=pl.Int64
+                    ),
+                    **_weight_summary(
+                        prior=prior,
+                        center=center_all,
+                        draws=draws_all,
+                        draw_success=draw_success,
+                    ),
+                    "center_solver_status": str(center_solution["status"][0]),
+                    "draws_requested": DIAGNOSTIC_DRAW_COUNT,
+                    "draws_succeeded": int(draw_success.sum()),
+                    "draw_success_rate": float(draw_success.mean()),
+                    "active_moment_count": active_count,
+                    "inactive_moment_count": inactive_count,
+                    "kappa": kappa,
+                    "frame_effective_county_count": frame_effective,
+                    "calibrated_effective_county_count": float(
+                        center_solution["effective_county_count"][0]
+                    ),
+                    "maximum_calibrated_county_weight": float(
+                        center_solution["maximum_county_weight"][0]
+                    ),
+                    "specification": specification["specification"],
+                    "moment_spec": specification["moment_spec"],
+                    "weight_spec": WEIGHT_SPEC,
+                    "baseline_weight_spec": BASELINE_WEIGHT_SPEC,
+                    "rho": PRIMARY_RHO,
+                    "kappa_multiplier": KAPPA_MULTIPLIER,
+                    "is_primary": specification["is_primary"],
+                    "simulation_seed": seed,
+                },
+                schema_overrides=_INTEGER_COLUMNS,
             )
-            draw_solution = solve_soft_entropy_batch(
-                prior_draws, design, target, rho=PRIMARY_RHO
+        )
+
+        # Draw-major rows: every county for draw 1, then draw 2, ...
+        county_count = len(county_codes)
+        draw_partitions[(region, year, specification["specification"])] = (
+            pl.DataFrame(
+                {
+                    "aewr_region_id": region,
+                    "source_year": year,
+                    "county_fips": pl.Series(
+                        list(county_codes) * DIAGNOSTIC_DRAW_COUNT, dtype=pl.String
+                    ),
+                    "specification": specification["specification"],
+                    "moment_spec": specification["moment_spec"],
+                    "weight_draw_id": np.repeat(
+                        np.arange(1, DIAGNOSTIC_DRAW_COUNT + 1), county_count
+                    ),
+                    "prior_draw_weight": prior_draws_all.ravel(),
+                    "calibrated_draw_weight": draws_all.ravel(),
+                    "optimizer_success": np.repeat(draw_success, county_count),
+                    "optimizer_status": pl.Series(
+                        np.repeat(draw_solution["status"], county_count),
+                        dtype=pl.String,
+                    ),
+                    "weight_spec": WEIGHT_SPEC,
+                    "simulation_seed": seed,
+                },
+                schema_overrides=_INTEGER_COLUMNS,
             )
-            active_count = sum(moment["active"] for moment in selected_moments)
-            inactive_count = len(selected_moments) - active_count
-            diagnostic_rows.extend(
-                _solver_diagnostic_rows(
-                    region=region,
-                    year=year,
-                    specification=specification,
-                    solution=center_solution,
-                    weight_kind="deterministic_center",
-                    draw_ids=[None],
-                    kappa=kappa,
-                    frame_effective_county_count=frame_effective,
-                    active_moment_count=active_count,
-                    inactive_moment_count=inactive_count,
-                    simulation_seed=seed,
-                )
+            .with_columns(
+                pl.when("optimizer_success").then(pl.col("calibrated_draw_weight"))
             )
-            diagnostic_rows.extend(
-                _solver_diagnostic_rows(
-                    region=region,
-                    year=year,
-                    specification=specification,
-                    solution=draw_solution,
-                    weight_kind="dirichlet_draw",
-                    draw_ids=list(range(1, DIAGNOSTIC_DRAW_COUNT + 1)),
-                    kappa=kappa,
-                    frame_effective_county_count=frame_effective,
-                    active_moment_count=active_count,
-                    inactive_moment_count=inactive_count,
-                    simulation_seed=seed,
+            .sort("weight_draw_id", "county_fips")
+        )
+
+        for moment in selected_moments:
+            prior_raw = float(prior @ moment["raw_values"])
+            calibrated_raw = float(center_all @ moment["raw_values"])
+            prior_standardized = (
+                float(
+                    supported_prior
+                    @ moment["standardized_values"][supported]
                 )
+                if moment["active"]
+                else None
             )
-            if not bool(center_solution["success"][0]):
-                raise RuntimeError(
-                    f"County calibration failed for {region}, {year}, "
-                    f"{specification['specification']}: {center_solution['status'][0]}"
+            calibrated_standardized = (
+                float(
+                    center_all[supported]
+                    @ moment["standardized_values"][supported]
                 )
+                if moment["active"]
+                else None
+            )
+            moment_rows.append(
+                {
+                    "aewr_region_id": region,
+                    "source_year": year,
+                    "specification": specification["specification"],
+                    "moment_spec": specification["moment_spec"],
+                    "is_primary": specification["is_primary"],
+                    "moment_id": moment["moment_id"],
+                    "moment_family": moment["moment_family"],
+                    "quarter": moment["quarter"],
+                    "moment_active": moment["active"],
+                    "moment_status": moment["status"],
+                    "observed_prior_mass": moment["observed_prior_mass"],
+                    "raw_target": moment["raw_target"],
+                    "prior_raw_moment": prior_raw,
+                    "calibrated_raw_moment": calibrated_raw,
+                    "prior_raw_residual": prior_raw - moment["raw_target"],
+                    "calibrated_raw_residual": (
+                        calibrated_raw - moment["raw_target"]
+                    ),
+                    "standardized_target": moment["standardized_target"],
+                    "prior_standardized_moment": prior_standardized,
+                    "calibrated_standardized_moment": calibrated_standardized,
+                    "calibrated_standardized_residual": (
+                        calibrated_standardized
+                        - float(moment["standardized_target"])
+                        if moment["active"]
+                        else None
+                    ),
+                    "prior_center": moment["prior_center"],
+                    "prior_scale": moment["prior_scale"],
+                    "weight_spec": WEIGHT_SPEC,
+                    "rho": PRIMARY_RHO,
+                }
+            )
 
-            center_all = np.zeros_like(prior)
-            center_all[supported] = center_solution["weights"][0]
-            draws_all = np.zeros((DIAGNOSTIC_DRAW_COUNT, len(prior)))
-            draws_all[:, supported] = draw_solution["weights"]
-            prior_draws_all = np.zeros_like(draws_all)
-            prior_draws_all[:, supported] = prior_draws
-            county_codes = cell["county_codes"]
-
-            for county_index, county in enumerate(county_codes):
-                values = draws_all[draw_solution["success"], county_index]
-                summary_rows.append(
-                    {
-                        "aewr_region_id": region,
-                        "source_year": year,
-                        "county_fips": county,
-                        "weight_draw_id": None,
-                        "frame_prior_weight": float(prior[county_index]),
-                        "calibrated_center_weight": float(center_all[county_index]),
-                        "draw_mean_weight": float(values.mean()) if values.size else None,
-                        "draw_standard_deviation_weight": (
-                            float(values.std(ddof=1)) if values.size > 1 else 0.0
-                        ),
-                        "simulation_envelope_p025_weight": (
-                            float(np.quantile(values, 0.025)) if values.size else None
-                        ),
-                        "simulation_envelope_p50_weight": (
-                            float(np.quantile(values, 0.5)) if values.size else None
-                        ),
-                        "simulation_envelope_p975_weight": (
-                            float(np.quantile(values, 0.975)) if values.size else None
-                        ),
-                        "center_solver_status": str(center_solution["status"][0]),
-                        "draws_requested": DIAGNOSTIC_DRAW_COUNT,
-                        "draws_succeeded": int(draw_solution["success"].sum()),
-                        "draw_success_rate": float(draw_solution["success"].mean()),
-                        "active_moment_count": active_count,
-                        "inactive_moment_count": inactive_count,
-                        "kappa": kappa,
-                        "frame_effective_county_count": frame_effective,
-                        "calibrated_effective_county_count": float(
-                            center_solution["effective_county_count"][0]
-                        ),
-                        "maximum_calibrated_county_weight": float(
-                            center_solution["maximum_county_weight"][0]
-                        ),
-                        "specification": specification["specification"],
-                        "moment_spec": specification["moment_spec"],
-                        "weight_spec": WEIGHT_SPEC,
-                        "baseline_weight_spec": BASELINE_WEIGHT_SPEC,
-                        "rho": PRIMARY_RHO,
-                        "kappa_multiplier": KAPPA_MULTIPLIER,
-                        "is_primary": specification["is_primary"],
-                        "simulation_seed": seed,
-                    }
-                )
+    return (
+        pl.concat(summaries),
+        pl.concat(diagnostics),
+        moment_rows,
+        draw_partitions,
+    )
 
-            draw_rows = []
-            for draw_index in range(DIAGNOSTIC_DRAW_COUNT):
-                for county_index, county in enumerate(county_codes):
-                    draw_rows.append(
-                        {
-                            "aewr_region_id": region,
-                            "source_year": year,
-                            "county_fips": county,
-                            "specification": specification["specification"],
-                            "moment_spec": specification["moment_spec"],
-                            "weight_draw_id": draw_index + 1,
-                            "prior_draw_weight": float(
-                                prior_draws_all[draw_index, county_index]
-                            ),
-                            "calibrated_draw_weight": (
-                                float(draws_all[draw_index, county_index])
-                                if draw_solution["success"][draw_index]
-                                else None
-                            ),
-                            "optimizer_success": bool(
-                                draw_solution["success"][draw_index]
-                            ),
-                            "optimizer_status": str(
-                                draw_solution["status"][draw_index]
-                            ),
-                            "weight_spec": WEIGHT_SPEC,
-                            "simulation_seed": seed,
-                        }
-                    )
-            draw_partitions[(region, year, specification["specification"])] = (
-                pl.DataFrame(draw_rows, infer_schema_length=None).sort(
-                    "weight_draw_id", "county_fips"
-                )
-            )
 
-            for moment in selected_moments:
-                prior_raw = float(prior @ moment["raw_values"])
-                calibrated_raw = float(center_all @ moment["raw_values"])
-                prior_standardized = (
-                    float(
-                        supported_prior
-                        @ moment["standardized_values"][supported]
-                    )
-                    if moment["active"]
-                    else None
-                )
-                calibrated_standardized = (
-                    float(
-                        center_all[supported]
-                        @ moment["standardized_values"][supported]
-                    )
-                    if moment["active"]
-                    else None
-                )
-                moment_rows.append(
-                    {
-                        "aewr_region_id": region,
-                        "source_year": year,
-                        "specification": specification["specification"],
-                        "moment_spec": specification["moment_spec"],
-                        "is_primary": specification["is_primary"],
-                        "moment_id": moment["moment_id"],
-                        "moment_family": moment["moment_family"],
-                        "quarter": moment["quarter"],
-                        "moment_active": moment["active"],
-                        "moment_status": moment["status"],
-                        "observed_prior_mass": moment["observed_prior_mass"],
-                        "raw_target": moment["raw_target"],
-                        "prior_raw_moment": prior_raw,
-                        "calibrated_raw_moment": calibrated_raw,
-                        "prior_raw_residual": prior_raw - moment["raw_target"],
-                        "calibrated_raw_residual": (
-                            calibrated_raw - moment["raw_target"]
-                        ),
-                        "standardized_target": moment["standardized_target"],
-                        "prior_standardized_moment": prior_standardized,
-                        "calibrated_standardized_moment": calibrated_standardized,
-                        "calibrated_standardized_residual": (
-                            calibrated_standardized
-                            - float(moment["standardized_target"])
-                            if moment["active"]
-                            else None
-                        ),
-                        "prior_center": moment["prior_center"],
-                        "prior_scale": moment["prior_scale"],
-                        "weight_spec": WEIGHT_SPEC,
-                        "rho": PRIMARY_RHO,
-                    }
-                )
+def recover_cells(
+    cells: dict[tuple[str, int], dict[str, Any]],
+    *,
+    workers: int = 1,
+) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame, dict[tuple[str, int, str], pl.DataFrame]]:
+    """Recover every cell, fanning cells out over ``workers`` processes.
 
-    summary = pl.DataFrame(summary_rows, infer_schema_length=None).with_columns(
-        pl.col("weight_draw_id").cast(pl.Int64)
-    )
-    diagnostics = pl.DataFrame(diagnostic_rows, infer_schema_length=None).with_columns(
-        pl.col("weight_draw_id").cast(pl.Int64)
-    )
+    Cells are independent and seeded by region and year, so results are
+    concatenated in input order and match a serial run exactly.
+    """
+    if workers < 1:
+        raise ValueError("County recovery needs at least one worker")
+    progress = [f"{number}/{len(cells)}" for number in range(1, len(cells) + 1)]
+    workers = min(workers, len(cells))
+    if workers <= 1:
+        results = list(map(_recover_cell, cells, cells.values(), progress))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            results = list(
+                executor.map(_recover_cell, cells, cells.values(), progress)
+            )
+    moment_rows: list[dict[str, Any]] = []
+    draw_partitions: dict[tuple[str, int, str], pl.DataFrame] = {}
+    for _, _, cell_moments, cell_draws in results:
+        moment_rows.extend(cell_moments)
+        draw_partitions.update(cell_draws)
+
+    summary = pl.concat([result[0] for result in results])
+    diagnostics = pl.concat([result[1] for result in results])
     moments = pl.DataFrame(moment_rows, infer_schema_length=None)
     require_unique(
         summary,
@@ -1281,7 +1388,9 @@ def read_inputs() -> dict[str, pl.DataFrame]:
     return {name: pl.read_parquet(path) for name, path in paths.items()}
 
 
-def run_recovery(*, years: list[int], regions: list[str] | None) -> None:
+def run_recovery(
+    *, years: list[int], regions: list[str] | None, workers: int = 1
+) -> None:
     inputs = read_inputs()
     annual_targets = _annual_fls_targets(inputs["fls_region"], years)
     quarterly_targets = _paired_quarterly_targets(
@@ -1304,7 +1413,9 @@ def run_recovery(*, years: list[int], regions: list[str] | None) -> None:
     expected_cells = len(years) * (len(regions) if regions is not None else 17)
     if len(cells) != expected_cells:
         raise ValueError(f"Expected {expected_cells} region-year cells, found {len(cells)}")
-    summary, diagnostics, moments, draw_partitions = recover_cells(cells)
+    summary, diagnostics, moments, draw_partitions = recover_cells(
+        cells, workers=workers
+    )
 
     replace_selected(
         FEATURE_PATH,
@@ -1370,6 +1481,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="optional AEWR region identifiers for a restartable partial rebuild",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="processes that recover region-year cells in parallel",
+    )
     return parser.parse_args()
 
 
@@ -1389,7 +1506,9 @@ def main() -> None:
     )
     if regions and any(not 1 <= int(region) <= 17 for region in regions):
         raise ValueError("AEWR region identifiers must be between 1 and 17")
-    run_recovery(years=years, regions=regions)
+    if args.workers < 1:
+        raise ValueError("--workers must be a positive integer")
+    run_recovery(years=years, regions=regions, workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -83,6 +83,60 @@ class SeasonalAndSolverTests(unittest.TestCase):
         np.testing.assert_allclose(solution["weights"].sum(axis=1), 1.0, atol=1e-12)
         np.testing.assert_allclose(solution["weights"][0], prior, atol=1e-12)
 
+    def test_batched_newton_matches_one_draw_at_a_time(self) -> None:
+        rng = np.random.default_rng(20260812)
+        design = rng.normal(size=(40, 4))
+        prior = np.full(40, 1 / 40)
+        target = prior @ design + np.array([0.8, -0.5, 0.3, 1.2])
+        draws, _, _ = RECOVERY.dirichlet_prior_draws(prior, draw_count=6, seed=7)
+        batch = RECOVERY.solve_soft_entropy_batch(draws, design, target)
+        self.assertTrue(np.all(batch["success"]))
+        self.assertGreater(int(batch["iterations"].max()), 1)
+        for index, draw in enumerate(draws):
+            single = RECOVERY.solve_soft_entropy_batch(draw, design, target)
+            np.testing.assert_allclose(
+                batch["weights"][index], single["weights"][0], rtol=1e-10, atol=1e-14
+            )
+            self.assertEqual(batch["iterations"][index], single["iterations"][0])
+            self.assertEqual(batch["status"][index], single["status"][0])
+
+    def test_singular_newton_system_fails_only_its_draw(self) -> None:
+        hessian = np.stack((np.eye(2), np.zeros((2, 2)), 2 * np.eye(2)))
+        gradient = np.array([[1.0, 2.0], [1.0, 1.0], [4.0, 2.0]])
+        direction, solved = RECOVERY._batched_newton_directions(hessian, gradient)
+        np.testing.assert_array_equal(solved, [True, False, True])
+        np.testing.assert_allclose(direction[[0, 2]], [[1.0, 2.0], [2.0, 1.0]])
+
+    def test_weight_summary_matches_per_county_reductions(self) -> None:
+        rng = np.random.default_rng(5)
+        draws = rng.dirichlet(np.ones(7), size=12)
+        success = rng.random(12) < 0.7
+        summary = RECOVERY._weight_summary(
+            prior=np.full(7, 1 / 7),
+            center=draws[0],
+            draws=draws,
+            draw_success=success,
+        )
+        for county in range(7):
+            values = draws[success, county]
+            self.assertEqual(summary["draw_mean_weight"][county], values.mean())
+            self.assertEqual(
+                summary["draw_standard_deviation_weight"][county], values.std(ddof=1)
+            )
+            self.assertEqual(
+                summary["simulation_envelope_p975_weight"][county],
+                np.quantile(values, 0.975),
+            )
+
+        failed = RECOVERY._weight_summary(
+            prior=np.full(7, 1 / 7),
+            center=draws[0],
+            draws=draws,
+            draw_success=np.zeros(12, dtype=bool),
+        )
+        self.assertEqual(failed["draw_mean_weight"].null_count(), 7)
+        np.testing.assert_array_equal(failed["draw_standard_deviation_weight"], 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,147 @@
+"""Binary ``.npz`` checkpoints with a JSON header and background writes."""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Self
+
+import numpy as np
+
+HEADER_KEY = "header"
+FORMAT_VERSION = 1
+
+
+def snapshot_path(path: Path, iteration: int) -> Path:
+    """Retained copy of checkpoint ``path`` taken at ``iteration``."""
+    return path.with_name(f"{path.stem}.iter{iteration:06d}{path.suffix}")
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    tmp_path.replace(path)
+
+
+def write_checkpoint(
+    path: Path,
+    header: Mapping[str, Any],
+    groups: Mapping[str, Sequence[Any]],
+    *,
+    keep: int = 3,
+) -> None:
+    """Atomically write a checkpoint and keep its ``keep`` latest snapshots.
+
+    ``groups`` maps a name to an ordered list of array leaves, stored as
+    ``{name}_{index}`` entries next to a JSON header. The header must carry
+    an integer ``iter``, which names the snapshot; snapshots from later
+    iterations are left over from a restarted run and are removed. The header
+    also records each group's leaf count, so a truncated file cannot be read
+    as a short one.
+    """
+    if keep < 0:
+        raise ValueError("keep must be nonnegative.")
+    arrays = {
+        f"{name}_{index}": np.asarray(leaf)
+        for name, leaves in groups.items()
+        for index, leaf in enumerate(leaves)
+    }
+    full_header = {
+        **header,
+        "format": FORMAT_VERSION,
+        "groups": {name: len(leaves) for name, leaves in groups.items()},
+    }
+    buffer = io.BytesIO()
+    np.savez(buffer, **{HEADER_KEY: np.array(json.dumps(full_header))}, **arrays)
+    payload = buffer.getvalue()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if keep:
+        _atomic_write(snapshot_path(path, int(header["iter"])), payload)
+    _atomic_write(path, payload)
+
+    # Snapshots past this iteration belong to a run that was restarted.
+    pattern = re.compile(rf"{re.escape(path.stem)}\.iter(\d+){re.escape(path.suffix)}")
+    snapshots = sorted(
+        (int(match.group(1)), candidate)
+        for candidate in path.parent.glob(f"{path.stem}.iter*{path.suffix}")
+        if (match := pattern.fullmatch(candidate.name))
+    )
+    current = [item for item in snapshots if item[0] <= int(header["iter"])]
+    retained = {candidate for _, candidate in current[-keep:]} if keep else set()
+    for _, candidate in snapshots:
+        if candidate not in retained:
+            candidate.unlink(missing_ok=True)
+
+
+def read_checkpoint(path: Path) -> tuple[dict[str, Any], dict[str, list[np.ndarray]]]:
+    """Header and per-group leaf lists of a checkpoint from :func:`write_checkpoint`."""
+    with np.load(path, allow_pickle=False) as data:
+        if HEADER_KEY not in data.files:
+            raise ValueError(f"{path.name} is not a checkpoint: it has no header.")
+        header = json.loads(data[HEADER_KEY].item())
+        if header.get("format") != FORMAT_VERSION:
+            raise ValueError(
+                f"{path.name} has checkpoint format {header.get('format')!r}; "
+                f"expected {FORMAT_VERSION}."
+            )
+        keys = {
+            name: [f"{name}_{index}" for index in range(count)]
+            for name, count in header["groups"].items()
+        }
+        missing = [key for group in keys.values() for key in group if key not in data]
+        if missing:
+            raise ValueError(f"{path.name} is missing leaves: {', '.join(missing)}")
+        groups = {name: [data[key] for key in group] for name, group in keys.items()}
+    return header, groups
+
+
+class CheckpointWriter:
+    """Write checkpoints on one background thread, at most one at a time.
+
+    ``submit`` waits for the previous write, so errors surface on the next
+    checkpoint or on ``flush`` and at most one snapshot is ever in flight.
+    Leaves are converted to NumPy on the writer thread, so device arrays
+    can be handed over without blocking the caller on a host transfer.
+    """
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="checkpoint"
+        )
+        self._pending: Future[None] | None = None
+
+    def submit(
+        self,
+        path: Path,
+        header: Mapping[str, Any],
+        groups: Mapping[str, Sequence[Any]],
+        *,
+        keep: int = 3,
+    ) -> None:
+        self.flush()
+        self._pending = self._executor.submit(
+            write_checkpoint, path, dict(header), dict(groups), keep=keep
+        )
+
+    def flush(self) -> None:
+        """Block until the pending write, if any, is on disk."""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
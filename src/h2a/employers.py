@@ -0,0 +1,810 @@
+"""Normalization and linkage of H-2A employer identity records."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from functools import cache
+from typing import Any
+
+import numpy as np
+import polars as pl
+from rapidfuzz import fuzz, process
+
+GENERIC_NAME_TOKENS = frozenset(
+    {
+        "AG",
+        "AGRICULTURAL",
+        "AGRICULTURE",
+        "AND",
+        "CO",
+        "COMPANY",
+        "CORP",
+        "CORPORATION",
+        "DBA",
+        "ENTERPRISE",
+        "ENTERPRISES",
+        "FARM",
+        "FARMING",
+        "FARMS",
+        "GROWER",
+        "GROWERS",
+        "INC",
+        "INCORPORATED",
+        "LIMITED",
+        "LLC",
+        "LLP",
+        "LP",
+        "LTD",
+        "NURSERIES",
+        "NURSERY",
+        "OF",
+        "ORCHARD",
+        "ORCHARDS",
+        "PARTNERSHIP",
+        "RANCH",
+        "RANCHES",
+        "SERVICE",
+        "SERVICES",
+        "THE",
+    }
+)
+
+PLACEHOLDER_ADDRESSES = frozenset(
+    {
+        "",
+        "N A",
+        "NA",
+        "NONE",
+        "NOT APPLICABLE",
+        "SAME",
+        "TBD",
+        "UNKNOWN",
+        "VARIOUS",
+    }
+)
+
+INVALID_TRADE_NAMES = frozenset(
+    {
+        "N A",
+        "NA",
+        "NIL",
+        "NO DBA",
+        "NO D B A",
+        "NONE",
+        "NONE USED",
+        "NOT APPLICABLE",
+        "SAME",
+        "UNKNOWN",
+    }
+)
+
+# Tiers and the most distinct names a fuzzy or DBA link may leave in a cluster.
+LINKAGE_METHODS = {"conservative": 25, "balanced": 100, "high_recall": 500}
+_ALL_METHODS = 0b111
+_BALANCED_METHODS = 0b110
+_HIGH_RECALL = 0b100
+_EDGE_SCHEMA = {
+    "left": pl.UInt32,
+    "right": pl.UInt32,
+    "evidence": pl.String,
+    "methods": pl.UInt8,
+}
+_SCORE_BATCH = 1_000_000
+MERGE_SCHEMA = {
+    "method": pl.String,
+    "employer_id": pl.String,
+    "merged_into": pl.String,
+    "evidence": pl.String,
+}
+
+
+def normalize_text(column: pl.Expr) -> pl.Expr:
+    """ASCII-folded, upper-case alphanumeric words joined by single spaces."""
+    return (
+        column.fill_null("")
+        .str.normalize("NFKD")
+        .str.replace_all(r"[^\x00-\x7F]", "")
+        .str.to_uppercase()
+        .str.replace_all("&", " AND ", literal=True)
+        .str.replace_all(r"[^A-Z0-9]+", " ")
+        .str.strip_chars(" ")
+    )
+
+
+def normalize_name(column: pl.Expr) -> pl.Expr:
+    return normalize_text(column)
+
+
+def _digits(column: pl.Expr) -> pl.Expr:
+    return (
+        column.fill_null("")
+        .str.strip_chars()
+        .str.strip_suffix(".0")
+        .str.replace_all(r"\D", "")
+    )
+
+
+def _repeats_one_digit(digits: pl.Expr, length: int) -> pl.Expr:
+    return digits == pl.concat_str([digits.str.slice(0, 1)] * length)
+
+
+def normalize_zip(column: pl.Expr) -> pl.Expr:
+    """First five digits, zero-padded; blank when fewer than four digits."""
+    digits = _digits(column)
+    return (
+        pl.when(digits.str.len_chars() < 4)
+        .then(pl.lit(""))
+        .otherwise(digits.str.slice(0, 5).str.zfill(5))
+    )
+
+
+def normalize_phone(column: pl.Expr) -> pl.Expr:
+    """Ten-digit phone number without a leading 1; blank for placeholders."""
+    digits = column.fill_null("").str.replace_all(r"\D", "")
+    digits = (
+        pl.when((digits.str.len_chars() == 11) & digits.str.starts_with("1"))
+        .then(digits.str.slice(1))
+        .otherwise(digits)
+    )
+    return (
+        pl.when((digits.str.len_chars() != 10) | _repeats_one_digit(digits, 10))
+        .then(pl.lit(""))
+        .otherwise(digits)
+    )
+
+
+def normalize_fein(column: pl.Expr) -> pl.Expr:
+    """Nine-digit FEIN; blank for malformed or repeated-digit placeholders."""
+    digits = _digits(column)
+    return (
+        pl.when((digits.str.len_chars() != 9) | _repeats_one_digit(digits, 9))
+        .then(pl.lit(""))
+        .otherwise(digits)
+    )
+
+
+@cache
+def _state_abbreviation(text: str) -> str:
+    import us
+
+    if not text:
+        return ""
+    if text in {"DC", "DISTRICT OF COLUMBIA"}:
+        return "DC"
+    state = us.states.lookup(text)
+    return "" if state is None else state.abbr
+
+
+def _state_abbreviations(texts: pl.Series) -> pl.Series:
+    distinct = texts.unique()
+    abbreviations = pl.Series([_state_abbreviation(text) for text in distinct])
+    return texts.replace_strict(distinct, abbreviations, return_dtype=pl.String)
+
+
+def normalize_state(column: pl.Expr) -> pl.Expr:
+    """Two-letter postal abbreviation, looked up once per distinct value."""
+    return normalize_text(column).map_batches(
+        _state_abbreviations, return_dtype=pl.String
+    )
+
+
+def valid_full_address() -> pl.Expr:
+    """Pipe-joined normalized address, blank for placeholders or missing parts."""
+    address_1 = pl.col("normalized_address_1")
+    unusable = (
+        address_1.is_in(list(PLACEHOLDER_ADDRESSES))
+        | (address_1.str.replace_all("[^A-Z0-9]", "").str.len_chars() < 5)
+        | (pl.col("normalized_state") == "")
+        | (pl.col("normalized_postal_code") == "")
+    )
+    return (
+        pl.when(unusable)
+        .then(pl.lit(""))
+        .otherwise(
+            pl.concat_str(
+                address_1,
+                "normalized_address_2",
+                "normalized_city",
+                "normalized_state",
+                "normalized_postal_code",
+                separator="|",
+            )
+        )
+    )
+
+
+def core_name_tokens(name: pl.Expr) -> pl.Expr:
+    """Sorted distinct name tokens that are long, non-numeric and not generic."""
+    token = pl.element()
+    return (
+        name.str.split(" ")
+        .list.eval(
+            token.filter(
+                (token.str.len_chars() >= 4)
+                & ~token.str.contains("^[0-9]+$")
+                & ~token.is_in(list(GENERIC_NAME_TOKENS))
+            )
+        )
+        .list.unique()
+        .list.sort()
+    )
+
+
+def blocking_ngrams(entries: pl.DataFrame) -> pl.DataFrame:
+    """One ``block`` row per distinct character trigram of each entry's core name.
+
+    ``entries`` needs ``entry`` and ``alias`` columns. Names whose compacted
+    core is shorter than four characters produce no rows.
+    """
+    core = core_name_tokens(pl.col("alias")).list.join("")
+    compact = (
+        pl.when(core != "")
+        .then(core)
+        .otherwise(pl.col("alias").str.replace_all("[^A-Z0-9]", ""))
+    )
+    return (
+        entries.select("entry", compact.alias("compact"))
+        .filter(pl.col("compact").str.len_chars() >= 4)
+        .with_columns(offset=pl.int_ranges(pl.col("compact").str.len_chars() - 2))
+        .explode("offset")
+        .select("entry", pl.col("compact").str.slice("offset", 3).alias("block"))
+        .unique()
+    )
+
+
+def raw_identity_fingerprint(identities: pl.DataFrame) -> pl.Series:
+    """Stable ``er_`` identifier hashed from each row's raw identity fields.
+
+    Polars has no SHA-256 kernel, so rows are serialized and hashed in one
+    comprehension rather than through per-row struct dictionaries.
+    """
+    return pl.Series(
+        "employer_record_id",
+        [
+            "er_"
+            + hashlib.sha256(
+                json.dumps(list(row), ensure_ascii=False, separators=(",", ":")).encode(
+                    "utf-8"
+                )
+            ).hexdigest()[:24]
+            for row in identities.iter_rows()
+        ],
+        dtype=pl.String,
+    )
+
+
+class DisjointSet:
+    """Union-find over identity records with FEIN and name-sprawl guards.
+
+    Components restored from an earlier run are *established*: they keep
+    their anchor when new records join, and a union of two of them is
+    logged in ``merges`` as (retired anchor, surviving anchor, evidence).
+    """
+
+    def __init__(
+        self,
+        record_ids: Sequence[str],
+        feins: Sequence[str | None],
+        aliases: Iterable[Iterable[str]],
+        max_fuzzy_names: int,
+    ) -> None:
+        self.parent = list(range(len(record_ids)))
+        self.size = [1] * len(record_ids)
+        self.anchor = list(record_ids)
+        self.fein = [value or "" for value in feins]
+        self.names = [set(value) for value in aliases]
+        self.max_fuzzy_names = max_fuzzy_names
+        self.accepted: Counter[str] = Counter()
+        self.rejected_fein_conflicts: Counter[str] = Counter()
+        self.rejected_name_sprawl: Counter[str] = Counter()
+        self.evidence: dict[int, set[str]] = {}
+        self.established = [False] * len(record_ids)
+        self.merges: list[tuple[str, str, str]] = []
+
+    def restore(
+        self, root: int, members: Iterable[int], anchor: str, evidence: str
+    ) -> None:
+        """Rebuild an earlier component from its records, anchor and evidence."""
+        names = self.names[root]
+        for member in members:
+            if member == root:
+                continue
+            self.parent[member] = root
+            self.size[root] += 1
+            self.fein[root] = self.fein[root] or self.fein[member]
+            names |= self.names[member]
+            self.names[member] = set()
+        self.anchor[root] = anchor
+        self.established[root] = True
+        if evidence != "singleton":
+            self.evidence[root] = set(evidence.split("|"))
+
+    def find(self, value: int) -> int:
+        root = value
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[value] != value:
+            parent = self.parent[value]
+            self.parent[value] = root
+            value = parent
+        return root
+
+    def union(self, left: int, right: int, evidence: str) -> bool:
+        left_root = self.find(left)
+        right_root = self.find(right)
+        if left_root == right_root:
+            return False
+
+        left_fein = self.fein[left_root]
+        right_fein = self.fein[right_root]
+        if left_fein and right_fein and left_fein != right_fein:
+            self.rejected_fein_conflicts[evidence] += 1
+            return False
+
+        # Merge the smaller name set into the larger one in place.
+        smaller, larger = sorted(
+            (self.names[left_root], self.names[right_root]), key=len
+        )
+        if evidence.startswith("fuzzy_") or evidence == "exact_dba":
+            combined = len(larger) + sum(name not in larger for name in smaller)
+            if combined > self.max_fuzzy_names:
+                self.rejected_name_sprawl[evidence] += 1
+                return False
+
+        if self.size[left_root] < self.size[right_root] or (
+            self.size[left_root] == self.size[right_root]
+            and self.anchor[left_root] > self.anchor[right_root]
+        ):
+            left_root, right_root = right_root, left_root
+
+        left_anchor = self.anchor[left_root]
+        right_anchor = self.anchor[right_root]
+        if self.established[left_root] == self.established[right_root]:
+            anchor = min(left_anchor, right_anchor)
+            if self.established[left_root]:
+                retired = max(left_anchor, right_anchor)
+                self.merges.append((retired, anchor, evidence))
+        else:
+            anchor = left_anchor if self.established[left_root] else right_anchor
+            self.established[left_root] = True
+
+        self.parent[right_root] = left_root
+        self.size[left_root] += self.size[right_root]
+        self.anchor[left_root] = anchor
+        self.fein[left_root] = left_fein or right_fein
+        larger |= smaller
+        self.names[left_root] = larger
+        self.names[right_root] = set()
+        combined_evidence = self.evidence.pop(left_root, set())
+        combined_evidence.update(self.evidence.pop(right_root, set()))
+        combined_evidence.add(evidence)
+        self.evidence[left_root] = combined_evidence
+        self.accepted[evidence] += 1
+        return True
+
+    def output_columns(self, method: str) -> tuple[list[str], list[int], list[str]]:
+        roots = [self.find(index) for index in range(len(self.parent))]
+        entity_ids = [_entity_id(method, self.anchor[root]) for root in roots]
+        cluster_sizes = [self.size[root] for root in roots]
+        evidence = [
+            "|".join(sorted(self.evidence.get(root, {"singleton"}))) for root in roots
+        ]
+        return entity_ids, cluster_sizes, evidence
+
+
+def _entity_id(method: str, anchor: str) -> str:
+    return f"emp_{method}_{anchor.removeprefix('er_')}"
+
+
+def _restore_components(
+    disjoint_set: DisjointSet, rows: pl.DataFrame, previous: pl.DataFrame, method: str
+) -> None:
+    """Seed ``disjoint_set`` with the ``method`` components of a prior crosswalk."""
+    components = (
+        previous.select(
+            pl.col("employer_record_id").alias("record_id"),
+            pl.col(f"employer_id_{method}").alias("component"),
+            pl.col(f"employer_linkage_evidence_{method}").alias("evidence"),
+        )
+        .join(rows.select("record_id", "index"), on="record_id")
+        .group_by("component")
+        .agg(pl.col("index").min().alias("root"), "index", pl.col("evidence").first())
+    )
+    prefix = f"emp_{method}_"
+    for component, root, members, evidence in components.iter_rows():
+        anchor = "er_" + component.removeprefix(prefix)
+        disjoint_set.restore(root, members, anchor, evidence)
+
+
+def _wratio(
+    left: pl.Series, right: pl.Series, *, score_cutoff: float, workers: int
+) -> pl.Series:
+    """Element-wise ``fuzz.WRatio``; scores below ``score_cutoff`` are 0."""
+    scores = [np.empty(0)]
+    for start in range(0, left.len(), _SCORE_BATCH):
+        scores.append(
+            process.cpdist(
+                left.slice(start, _SCORE_BATCH).to_list(),
+                right.slice(start, _SCORE_BATCH).to_list(),
+                scorer=fuzz.WRatio,
+                score_cutoff=score_cutoff,
+                dtype=np.float64,
+                workers=workers,
+            )
+        )
+    return pl.Series("score", np.concatenate(scores), dtype=pl.Float64)
+
+
+def _exact_group_edges(
+    members: pl.DataFrame, evidence: str
+) -> tuple[pl.DataFrame, int]:
+    """Star edges inside each ``key`` group, split by FEIN when FEINs conflict.
+
+    Returns the edges and the number of groups with more than one FEIN.
+    """
+    known_fein = pl.col("fein").filter(pl.col("fein") != "")
+    members = (
+        members.unique()
+        .with_columns(ambiguous=known_fein.n_unique().over("key") > 1)
+        .with_columns(partition=pl.when("ambiguous").then("fein").otherwise(pl.lit("")))
+        .sort("key", "partition", "index")
+        .with_columns(left=pl.col("index").first().over("key", "partition"))
+    )
+    ambiguous = members.filter("ambiguous").get_column("key").n_unique()
+    edges = members.filter(pl.col("index") != pl.col("left")).select(
+        "left",
+        pl.col("index").alias("right"),
+        pl.lit(evidence).alias("evidence"),
+        pl.lit(_ALL_METHODS, dtype=pl.UInt8).alias("methods"),
+    )
+    return edges, ambiguous
+
+
+def _first_record() -> list[pl.Expr]:
+    """Aggregations keeping the entry with the lowest record id.
+
+    An entry is ``new`` when any of its records is.
+    """
+    return [
+        pl.col("index").sort_by("record_id").first(),
+        pl.col("record_id").min(),
+        pl.col("new").any(),
+    ]
+
+
+def _contact_edges(
+    aliases: pl.DataFrame, contact: str, evidence: str, *, workers: int
+) -> tuple[pl.DataFrame, int]:
+    """Fuzzy-name links among records sharing one phone number or address."""
+    representatives = (
+        aliases.filter(pl.col(contact) != "")
+        .group_by(contact, "alias", "fein")
+        .agg(*_first_record())
+        .sort(contact, "alias", "record_id")
+        .with_columns(
+            position=pl.int_range(pl.len()).over(contact),
+            group_size=pl.len().over(contact),
+        )
+    )
+    # Filing agents and shared administrative worksites can supply one
+    # phone/address for hundreds of unrelated growers. Such identifiers are
+    # not employer evidence. Moderately reused contacts are allowed only in
+    # the less conservative tiers.
+    shared = representatives.filter(pl.col("group_size") > 25)
+    representatives = representatives.filter(pl.col("group_size") <= 25)
+    pairs = (
+        representatives.join(
+            representatives.select(contact, "position", "alias", "index", "new"),
+            on=contact,
+            suffix="_right",
+        )
+        .filter(
+            (pl.col("position") < pl.col("position_right"))
+            & (pl.col("new") | pl.col("new_right"))
+        )
+        .sort(contact, "position", "position_right")
+    )
+    score = _wratio(
+        pairs["alias"], pairs["alias_right"], score_cutoff=92, workers=workers
+    )
+    edges = (
+        pairs.with_columns(score)
+        .select(
+            pl.col("index").alias("left"),
+            pl.col("index_right").alias("right"),
+            pl.lit(evidence).alias("evidence"),
+            pl.when((pl.col("score") >= 95) & (pl.col("group_size") <= 10))
+            .then(pl.lit(_ALL_METHODS, dtype=pl.UInt8))
+            .when(pl.col("score") >= 92)
+            .then(pl.lit(_BALANCED_METHODS, dtype=pl.UInt8))
+            .alias("methods"),
+        )
+        .drop_nulls("methods")
+    )
+    return edges, shared.get_column(contact).n_unique()
+
+
+def _blocked_edges(
+    entries: pl.DataFrame,
+    blocks: pl.DataFrame,
+    block_keys: Sequence[str],
+    *,
+    threshold: float,
+    evidence: str,
+    methods: int,
+    workers: int,
+) -> pl.DataFrame:
+    """Fuzzy-name links from each entry to later entries sharing a block.
+
+    ``entries`` are in link order with ``entry`` numbering their rows;
+    ``blocks`` holds ``entry`` and ``block`` rows. Entries meet when they
+    share a block and all of ``block_keys``, and at least one is ``new``.
+    """
+    members = (
+        blocks.join(entries.select("entry", *block_keys), on="entry")
+        .group_by(*block_keys, "block")
+        .agg("entry")
+        .select(pl.int_range(pl.len(), dtype=pl.UInt32).alias("group"), "entry")
+        .explode("entry")
+    )
+    # Each candidate pair packed into one integer, ordered by (entry, later entry)
+    packed = (
+        members.join(members, on="group", suffix="_right")
+        .filter(pl.col("entry_right") > pl.col("entry"))
+        .select(
+            (pl.col("entry").cast(pl.UInt64) * 2**32 + pl.col("entry_right")).alias(
+                "pair"
+            )
+        )
+        .unique()
+        .sort("pair")
+        .get_column("pair")
+    )
+    first = (packed // 2**32).cast(pl.UInt32)
+    second = (packed % 2**32).cast(pl.UInt32)
+    unseen = entries["new"].gather(first) | entries["new"].gather(second)
+    first, second = first.filter(unseen), second.filter(unseen)
+    pairs = pl.DataFrame(
+        {
+            "index": entries["index"].gather(first),
+            "index_right": entries["index"].gather(second),
+            "score": _wratio(
+                entries["alias"].gather(first),
+                entries["alias"].gather(second),
+                score_cutoff=threshold,
+                workers=workers,
+            ),
+        }
+    )
+    return pairs.filter(pl.col("score") >= threshold).select(
+        pl.col("index").alias("left"),
+        pl.col("index_right").alias("right"),
+        pl.lit(evidence).alias("evidence"),
+        pl.lit(methods, dtype=pl.UInt8).alias("methods"),
+    )
+
+
+def link_employer_records(
+    records: pl.DataFrame,
+    *,
+    previous: pl.DataFrame | None = None,
+    workers: int = -1,
+) -> tuple[pl.DataFrame, dict[str, Any]]:
+    """Cluster identity records into nested employer entities for each tier.
+
+    Every candidate link is generated and scored in bulk, then applied to
+    all tiers in one pass over the ordered edge list: FEINs, exact names,
+    exact DBAs, fuzzy names sharing a phone or address, fuzzy names in the
+    same ZIP, and fuzzy names in the same state. A tier takes a link only if
+    every coarser tier holds it, so each cluster lies inside one cluster of
+    every coarser tier.
+
+    ``previous`` is an earlier crosswalk whose records are all still in
+    ``records``. Its components are restored rather than rebuilt, only
+    links involving a record it lacks are scored and applied, and its
+    employer ids survive unless two of them merge. Such merges are listed
+    in ``diagnostics["merges"]``.
+    """
+    if previous is None:
+        known = pl.Series("employer_record_id", [], dtype=pl.String)
+    else:
+        known = previous.get_column("employer_record_id")
+        dropped = known.is_in(records["employer_record_id"].implode()).not_().sum()
+        if dropped:
+            raise ValueError(
+                f"{dropped} records of the previous crosswalk are missing; "
+                "link from scratch instead"
+            )
+    rows = records.select(
+        pl.int_range(pl.len(), dtype=pl.UInt32).alias("index"),
+        pl.col("employer_record_id").alias("record_id"),
+        pl.col("normalized_name").alias("name"),
+        pl.col("normalized_trade_name").alias("trade_name"),
+        pl.col("normalized_full_address").alias("address"),
+        pl.col("normalized_phone").alias("phone"),
+        pl.col("normalized_fein").fill_null("").alias("fein"),
+        pl.col("normalized_state").alias("state"),
+        pl.col("normalized_postal_code").alias("postal_code"),
+        pl.col("employer_record_id").is_in(known.implode()).not_().alias("new"),
+    )
+    trade_names = (
+        rows.filter(pl.col("trade_name") != "")
+        .group_by("trade_name")
+        .agg(pl.col("name").n_unique().alias("primary_names"))
+    )
+    valid_trade_names = trade_names.filter(
+        ~pl.col("trade_name").is_in(list(INVALID_TRADE_NAMES))
+        & (pl.col("primary_names") <= 10)
+    ).get_column("trade_name")
+    rows = rows.with_columns(
+        valid_trade=pl.col("trade_name").is_in(valid_trade_names.implode())
+    )
+    trade_aliases = rows.filter(
+        pl.col("valid_trade") & (pl.col("trade_name") != pl.col("name"))
+    )
+    aliases = pl.concat(
+        [
+            rows.with_columns(alias=pl.col("name")),
+            trade_aliases.with_columns(alias=pl.col("trade_name")),
+        ]
+    )
+
+    record_ids = rows.get_column("record_id").to_list()
+    feins = rows.get_column("fein").to_list()
+    names = [{name} for name in rows.get_column("name")]
+    for index, trade_name in trade_aliases.select("index", "trade_name").iter_rows():
+        names[index].add(trade_name)
+
+    edges = []
+    fein_edges, _ = _exact_group_edges(
+        rows.filter(pl.col("fein") != "").select(
+            pl.col("fein").alias("key"), "index", "fein"
+        ),
+        "exact_fein",
+    )
+    name_edges, ambiguous_exact_names = _exact_group_edges(
+        rows.select(pl.col("name").alias("key"), "index", "fein"), "exact_name"
+    )
+    dba_edges, _ = _exact_group_edges(
+        pl.concat(
+            [
+                rows.filter("valid_trade").select(
+                    pl.col("trade_name").alias("key"), "index", "fein"
+                ),
+                rows.filter(pl.col("name").is_in(valid_trade_names.implode())).select(
+                    pl.col("name").alias("key"), "index", "fein"
+                ),
+            ]
+        ),
+        "exact_dba",
+    )
+    edges += [fein_edges, name_edges, dba_edges]
+
+    skipped_shared_contacts = {}
+    for contact, evidence in [
+        ("phone", "fuzzy_name_exact_phone"),
+        ("address", "fuzzy_name_exact_address"),
+    ]:
+        contact_edges, skipped = _contact_edges(
+            aliases, contact, evidence, workers=workers
+        )
+        edges.append(contact_edges)
+        if skipped:
+            skipped_shared_contacts[evidence] = skipped
+
+    location_entries = (
+        aliases.group_by("alias", "state", "postal_code", "fein")
+        .agg(*_first_record())
+        .sort("alias", "state", "postal_code", "fein")
+    )
+    located = location_entries.filter(
+        (pl.col("state") != "") & (pl.col("postal_code") != "")
+    ).with_row_index("entry")
+    edges.append(
+        _blocked_edges(
+            located,
+            blocking_ngrams(located),
+            ["state", "postal_code"],
+            threshold=96,
+            evidence="fuzzy_name_same_state_zip",
+            methods=_BALANCED_METHODS,
+            workers=workers,
+        )
+    )
+
+    state_entries = (
+        aliases.filter(pl.col("state") != "")
+        .group_by("alias", "state", "fein")
+        .agg(*_first_record())
+        .sort("alias", "state", "fein")
+        .with_row_index("entry")
+    )
+    state_tokens = state_entries.select(
+        "entry", core_name_tokens(pl.col("alias")).alias("block")
+    ).explode("block", empty_as_null=False)
+    edges.append(
+        _blocked_edges(
+            state_entries,
+            state_tokens.drop_nulls("block"),
+            ["state"],
+            threshold=94,
+            evidence="fuzzy_name_same_state",
+            methods=_HIGH_RECALL,
+            workers=workers,
+        )
+    )
+
+    disjoint_sets = {
+        method: DisjointSet(record_ids, feins, names, max_fuzzy_names)
+        for method, max_fuzzy_names in LINKAGE_METHODS.items()
+    }
+    if previous is not None:
+        for method, disjoint_set in disjoint_sets.items():
+            _restore_components(disjoint_set, rows, previous, method)
+
+    edges = pl.concat(
+        [pl.DataFrame(schema=_EDGE_SCHEMA), *edges], how="vertical_relaxed"
+    )
+    new = rows.get_column("new")
+    edges = edges.filter(new.gather(edges["left"]) | new.gather(edges["right"]))
+    # Coarsest tier first: a finer tier only takes a link every coarser tier
+    # holds, so its components stay inside theirs even when restored coarse
+    # components reject a link the finer tiers would accept.
+    tiers = [(1 << bit, tier) for bit, tier in enumerate(disjoint_sets.values())]
+    tiers.reverse()
+    for left, right, evidence, methods in edges.iter_rows():
+        for bit, disjoint_set in tiers:
+            if not methods & bit:
+                continue
+            if not disjoint_set.union(left, right, evidence) and (
+                disjoint_set.find(left) != disjoint_set.find(right)
+            ):
+                break
+
+    output = records
+    cluster_counts = {}
+    accepted_edges = {}
+    rejected_conflicts = {}
+    rejected_name_sprawl = {}
+    for method, disjoint_set in disjoint_sets.items():
+        entity_ids, cluster_sizes, evidence = disjoint_set.output_columns(method)
+        output = output.with_columns(
+            pl.Series(f"employer_id_{method}", entity_ids, dtype=pl.String),
+            pl.Series(
+                f"employer_cluster_size_{method}", cluster_sizes, dtype=pl.UInt32
+            ),
+            pl.Series(f"employer_linkage_evidence_{method}", evidence, dtype=pl.String),
+        )
+        cluster_counts[method] = len(set(entity_ids))
+        accepted_edges[method] = dict(sorted(disjoint_set.accepted.items()))
+        rejected_conflicts[method] = dict(
+            sorted(disjoint_set.rejected_fein_conflicts.items())
+        )
+        rejected_name_sprawl[method] = dict(
+            sorted(disjoint_set.rejected_name_sprawl.items())
+        )
+
+    diagnostics = {
+        "identity_records": records.height,
+        "ambiguous_exact_names": ambiguous_exact_names,
+        "excluded_shared_or_placeholder_trade_names": trade_names.height
+        - valid_trade_names.len(),
+        "cluster_counts": cluster_counts,
+        "accepted_edges": accepted_edges,
+        "rejected_fein_conflicts": rejected_conflicts,
+        "rejected_name_sprawl": rejected_name_sprawl,
+        "skipped_shared_contacts": dict(sorted(skipped_shared_contacts.items())),
+        "merges": pl.DataFrame(
+            [
+                (method, _entity_id(method, retired), _entity_id(method, anchor), how)
+                for method, disjoint_set in disjoint_sets.items()
+                for retired, anchor, how in disjoint_set.merges
+            ],
+            schema=MERGE_SCHEMA,
+            orient="row",
+        ),
+    }
+    return output, diagnostics
@@ -0,0 +1,85 @@
+"""``jax.export`` round trips for functions over arbitrary pytrees."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Hashable, Iterable
+from pathlib import Path
+from typing import Any
+
+import jax
+import jax.numpy as jnp
+from jax import export as jax_export
+
+
+def export_path(
+    export_dir: Path,
+    prefix: str,
+    args: tuple[Any, ...],
+    *,
+    sources: Iterable[Path],
+    static_key: Hashable = (),
+) -> Path:
+    """File a function exported for ``args`` is serialized to.
+
+    The name hashes the ``sources`` files, the JAX version and backend, the
+    argument tree with its leaf shapes and dtypes, and ``static_key``, so a
+    changed kernel, layout, or static argument is exported afresh.
+    """
+    leaves, treedef = jax.tree_util.tree_flatten(args)
+    layout = (
+        jax.__version__,
+        jax.default_backend(),
+        str(treedef),
+        [(tuple(jnp.shape(leaf)), str(jnp.result_type(leaf))) for leaf in leaves],
+        static_key,
+    )
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(Path(source).read_bytes())
+    digest.update(repr(layout).encode())
+    return export_dir / f"{prefix}_{digest.hexdigest()[:24]}.jaxexport"
+
+
+def load_or_export(
+    function: Callable[..., Any],
+    args: tuple[Any, ...],
+    path: Path,
+    *,
+    out_tree: jax.tree_util.PyTreeDef,
+) -> Callable[..., Any]:
+    """``function`` served from the module serialized at ``path``.
+
+    Serialization only accepts dictionaries with string keys, so the module
+    is exported over the flattened leaves of ``args`` and writes its outputs
+    as a flat list. The returned callable takes the same pytrees as
+    ``function`` and rebuilds the output with ``out_tree``. A missing file is
+    exported from ``function`` traced at ``args`` and written atomically.
+    """
+    if path.exists():
+        exported = jax_export.deserialize(bytearray(path.read_bytes()))
+    else:
+        treedef = jax.tree_util.tree_structure(args)
+
+        def flat_function(*leaves):
+            outputs = function(*jax.tree_util.tree_unflatten(treedef, leaves))
+            return jax.tree_util.tree_leaves(outputs)
+
+        exported = jax_export.export(jax.jit(flat_function))(
+            *jax.tree_util.tree_leaves(args)
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(exported.serialize())
+        tmp_path.replace(path)
+    if len(exported.out_avals) != out_tree.num_leaves:
+        raise ValueError(
+            f"{path.name} returns {len(exported.out_avals)} leaves; "
+            f"the output tree has {out_tree.num_leaves}."
+        )
+
+    def call(*call_args):
+        outputs = exported.call(*jax.tree_util.tree_leaves(call_args))
+        return jax.tree_util.tree_unflatten(out_tree, outputs)
+
+    return call
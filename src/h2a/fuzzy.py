@@ -0,0 +1,160 @@
+"""Batched fuzzy matching of locality names against state reference lists."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from rapidfuzz import fuzz, process, utils
+
+MATCH_SCHEMA = {
+    "state": pl.String,
+    "query": pl.String,
+    "fips": pl.String,
+    "score": pl.Float64,
+    "name": pl.String,
+}
+_NO_MATCH = {"fips": "", "score": 0.0, "name": ""}
+
+
+def reference_digest(reference: pl.DataFrame) -> str:
+    """Order-independent fingerprint of a ``state``/``name``/``fips`` reference."""
+    rows = reference.select("state", "name", "fips").sort(pl.all()).write_csv()
+    return hashlib.sha256(rows.encode("utf-8")).hexdigest()[:16]
+
+
+def _normalized(queries: pl.Series) -> pl.Series:
+    """``rapidfuzz.utils.default_process`` applied once per distinct value."""
+    distinct = queries.unique(maintain_order=True)
+    processed = pl.Series([utils.default_process(query) for query in distinct])
+    return queries.replace_strict(distinct, processed, return_dtype=pl.String)
+
+
+def _score_state(
+    queries: list[str],
+    names: list[str],
+    *,
+    workers: int,
+    chunk_size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Index and score of the first best-scoring name for each query."""
+    index = np.empty(len(queries), dtype=np.int64)
+    score = np.empty(len(queries), dtype=np.float64)
+    for start in range(0, len(queries), chunk_size):
+        stop = min(start + chunk_size, len(queries))
+        scores = process.cdist(
+            queries[start:stop],
+            names,
+            scorer=fuzz.partial_ratio,
+            dtype=np.float64,
+            workers=workers,
+        )
+        # argmax keeps the first maximum, as extractOne does.
+        index[start:stop] = scores.argmax(axis=1)
+        score[start:stop] = scores[np.arange(stop - start), index[start:stop]]
+    return index, score
+
+
+def _score_queries(
+    queries: pl.DataFrame,
+    reference: pl.DataFrame,
+    *,
+    workers: int,
+    chunk_size: int,
+) -> pl.DataFrame:
+    by_state = reference.partition_by("state", as_dict=True)
+    frames = []
+    for (state,), state_queries in queries.group_by("state", maintain_order=True):
+        choices = by_state.get((state,))
+        if choices is None:
+            continue
+        index, score = _score_state(
+            state_queries["query"].to_list(),
+            choices["processed_name"].to_list(),
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+        frames.append(
+            state_queries.with_columns(
+                fips=choices["fips"].gather(index),
+                score=pl.Series(score),
+                name=choices["name"].gather(index),
+            )
+        )
+    return pl.concat(
+        [pl.DataFrame(schema=MATCH_SCHEMA), *frames], how="vertical_relaxed"
+    )
+
+
+def _write_cache(frame: pl.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp")
+    frame.write_parquet(temporary)
+    temporary.replace(path)
+
+
+def best_fuzzy_matches(
+    frame: pl.DataFrame,
+    state_col: str,
+    query_col: str,
+    reference: pl.DataFrame,
+    *,
+    cache_file: Path | None = None,
+    workers: int = -1,
+    chunk_size: int = 1024,
+) -> pl.DataFrame:
+    """Best same-state ``partial_ratio`` match for every row of ``frame``.
+
+    Returns ``fips``, ``score`` and ``name`` aligned with ``frame``, equal to
+    calling ``rapidfuzz.process.extractOne`` with ``default_process`` per row
+    against ``reference`` (``state``, ``name``, ``fips``) in its row order.
+    Rows without a state or query, or whose state has no reference names,
+    get ``("", 0.0, "")``.
+
+    Distinct (state, normalized query) pairs are scored once, each state in
+    ``cdist`` batches of ``chunk_size`` queries. With ``cache_file`` set,
+    scored pairs persist between runs; name the file after the reference
+    (for example with :func:`reference_digest`) so a new vintage starts
+    fresh.
+    """
+    keys = frame.select(
+        pl.col(state_col).cast(pl.String).alias("state"),
+        pl.col(query_col).cast(pl.String).alias("raw"),
+    )
+    pairs = keys.filter((pl.col("state") != "") & (pl.col("raw") != "")).unique(
+        maintain_order=True
+    )
+    pairs = pairs.with_columns(_normalized(pairs["raw"]).alias("query"))
+
+    if cache_file is not None and cache_file.exists():
+        scored = pl.read_parquet(cache_file)
+    else:
+        scored = pl.DataFrame(schema=MATCH_SCHEMA)
+    missing = (
+        pairs.select("state", "query")
+        .unique(maintain_order=True)
+        .join(scored, on=["state", "query"], how="anti")
+    )
+    if missing.height:
+        choices = reference.filter(pl.col("name").is_not_null()).select(
+            pl.col("state"),
+            pl.col("name"),
+            pl.col("fips").cast(pl.String),
+        )
+        choices = choices.with_columns(
+            _normalized(choices["name"]).alias("processed_name")
+        )
+        new = _score_queries(missing, choices, workers=workers, chunk_size=chunk_size)
+        if new.height:
+            scored = pl.concat([scored, new])
+            if cache_file is not None:
+                _write_cache(scored, cache_file)
+
+    matches = pairs.join(scored, on=["state", "query"], how="inner").select(
+        "state", "raw", *_NO_MATCH
+    )
+    return keys.join(
+        matches, on=["state", "raw"], how="left", maintain_order="left"
+    ).select(pl.col(column).fill_null(value) for column, value in _NO_MATCH.items())
@@ -0,0 +1,283 @@
+"""Gemini batch requests and responses for cleaning unmatched locations."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+from pydantic import BaseModel, Field, ValidationError
+
+CLEANED_LOCATION_SCHEMA = {
+    "location_hash": pl.String,
+    "city": pl.String,
+    "county": pl.String,
+    "state": pl.String,
+    "zipcode": pl.String,
+    "confidence": pl.String,
+}
+
+# Standard Gemini response structure: response -> candidates -> content -> parts -> text
+_MODEL_TEXT_PATH = "$.response.candidates[0].content.parts[0].text"
+# Numbers, booleans or nested values where a string is expected; pydantic
+# rejects these, so such responses take the row-by-row path.
+_NON_STRING_FIELD = re.compile(
+    r'"(?:location_hash|city|county|state|zipcode|confidence)"\s*:\s*[^"\sn]'
+)
+
+
+class CleanedLocation(BaseModel):
+    """Structured output Gemini returns for each location."""
+
+    location_hash: str = Field(
+        ..., description="The unique hash ID of the row from the input data."
+    )
+    city: str | None = Field(None, description="Corrected city name.")
+    county: str | None = Field(
+        None, description="County name if present or easily inferable."
+    )
+    state: str | None = Field(
+        None, description="Two-letter state abbreviation (e.g., NY, CA)."
+    )
+    zipcode: str | None = Field(None, description="5-digit zipcode as a string.")
+    confidence: str = Field(
+        ..., description="High/Medium/Low confidence in the correction."
+    )
+
+
+def _hash_part(name: str, dtype: pl.DataType) -> pl.Expr:
+    """``str(value) if value else ""`` for one column."""
+    column = pl.col(name)
+    if dtype == pl.Boolean:
+        falsy = ~column
+    elif dtype.is_numeric():
+        falsy = column == 0
+    else:
+        falsy = column.cast(pl.String) == ""
+    return (
+        pl.when(column.is_null() | falsy)
+        .then(pl.lit(""))
+        .otherwise(column.cast(pl.String))
+    )
+
+
+def location_hash(
+    frame: pl.DataFrame,
+    columns: Sequence[str] = ("city", "county", "state", "zip"),
+) -> pl.Series:
+    """Stable MD5 of the lower-cased, pipe-joined location fields.
+
+    The key is assembled with Polars expressions; Polars has no MD5 kernel,
+    so only the distinct keys are hashed in Python and mapped back.
+    """
+    keys = frame.select(
+        pl.concat_str(
+            [_hash_part(name, frame.schema[name]) for name in columns], separator="|"
+        ).str.to_lowercase()
+    ).to_series()
+    distinct = keys.unique(maintain_order=True)
+    digests = pl.Series(
+        [hashlib.md5(key.encode("utf-8")).hexdigest() for key in distinct],
+        dtype=pl.String,
+    )
+    return keys.replace_strict(distinct, digests).alias("location_hash")
+
+
+def write_batch_request_jsonl(
+    frame: pl.DataFrame,
+    id_column: str,
+    response_schema: dict[str, Any],
+    path: Path,
+    chunk_size: int,
+) -> int:
+    """Write one GenerateContentRequest per ``chunk_size`` rows, returning the count.
+
+    Each chunk is serialized and written as it is produced, so the request
+    file never has to be held in memory.
+    """
+    if id_column not in frame.columns:
+        raise ValueError(f"Missing ID column {id_column!r} for matching output rows")
+    total_chunks = math.ceil(frame.height / chunk_size)
+    print(f"Writing {total_chunks} requests (chunks) to {path}")
+    with open(path, "w", encoding="utf-8") as handle:
+        for index, chunk in enumerate(frame.iter_slices(chunk_size)):
+            chunk_in_json = json.dumps(chunk.to_dicts())
+            prompt_string = f"""
+            You are an expert data cleaning assistant.
+            I have a list of US locations that contain errors such as typos, swapped columns, blank entries, or formatting issues.
+            Your goal is to clean these locations so they can be successfully queried against the Google Places API to find the County and FIPS code.
+
+            Instruction:
+            1. Fix typos in City and County names.
+            2. Move data to the correct field if swapped.
+            3. Ensure Zipcode is a 5-digit string.
+            4. If a field is missing, leave it null.
+            5. Return a list of CleanedLocation objects.
+            6. EXTREMELY IMPORTANT: Preserve the '{id_column}' for each row exactly.
+
+            Input Data (JSON): {chunk_in_json}
+            """
+            request_entry = {
+                "key": f"request_chunk_{index * chunk_size}",
+                "request": {
+                    "contents": [{"parts": [{"text": prompt_string}], "role": "user"}],
+                    "generation_config": {
+                        "response_mime_type": "application/json",
+                        "response_schema": response_schema,
+                        "temperature": 0.1,
+                    },
+                },
+            }
+            handle.write(json.dumps(request_entry) + "\n")
+    return total_chunks
+
+
+def _model_text(line: str) -> str | None:
+    """The model output in one batch line, reporting why a line is skipped."""
+    try:
+        batch_item = json.loads(line)
+    except json.JSONDecodeError as error:
+        print(f"Skipping invalid JSON line. Error: {error}")
+        return None
+    chunk_key = batch_item.get("key", "Unknown Key")
+    if "response" not in batch_item:
+        print(
+            f"Skipping {chunk_key}: No response found (Status: {batch_item.get('status')})"
+        )
+        return None
+    candidates = batch_item["response"].get("candidates", [])
+    if not candidates:
+        print(f"Skipping {chunk_key}: No candidates returned.")
+        return None
+    return candidates[0]["content"]["parts"][0]["text"]
+
+
+def _validated_rows(
+    locations: list[dict[str, Any]], line_number: int
+) -> list[dict[str, Any]]:
+    rows = []
+    for item, location in enumerate(locations):
+        try:
+            validated = CleanedLocation(**location).model_dump()
+        except ValidationError as error:
+            print(f"Validation error for ID {location.get('location_hash')}: {error}")
+            continue
+        rows.append({"line_number": line_number, "item": item, **validated})
+    return rows
+
+
+def _decode_locations(texts: pl.DataFrame) -> pl.DataFrame:
+    """Explode model texts into one row per location, all fields as strings."""
+    locations = pl.List(pl.Struct(CLEANED_LOCATION_SCHEMA))
+    return (
+        texts.select(
+            "line_number",
+            pl.col("text").str.json_decode(locations).alias("location"),
+        )
+        .with_columns(item=pl.int_ranges(pl.col("location").list.len()))
+        .explode("location", "item")
+        .filter(pl.col("location").is_not_null())
+        .unnest("location")
+    )
+
+
+def parse_batch_responses(content: str) -> pl.DataFrame:
+    """Cleaned locations from raw batch output, one JSON response per line.
+
+    Model texts are extracted and decoded for the whole file at once and the
+    required fields are checked column-wise. Pydantic only sees the items
+    that fail that check, to report why, and lines that need more than a
+    string decode: malformed batch lines and non-string field values.
+    """
+    lines = [line.strip() for line in content.splitlines()]
+    responses = (
+        pl.DataFrame(
+            {"line": [line for line in lines if line]}, schema={"line": pl.String}
+        )
+        .with_row_index("line_number")
+        .with_columns(text=pl.col("line").str.json_path_match(_MODEL_TEXT_PATH))
+    )
+    bulk = pl.col("text").is_not_null() & ~pl.col("text").str.contains(
+        _NON_STRING_FIELD.pattern
+    )
+    try:
+        decoded = _decode_locations(responses.filter(bulk))
+    except pl.exceptions.PolarsError:
+        # Malformed model output somewhere; the row-by-row path reports it.
+        decoded = _decode_locations(responses.clear())
+        bulk = pl.lit(False)
+
+    complete = (
+        pl.col("location_hash").is_not_null() & pl.col("confidence").is_not_null()
+    )
+    rejected = (
+        decoded.filter(~complete)
+        .group_by("line_number", maintain_order=True)
+        .agg("item")
+        .join(responses.select("line_number", "text"), on="line_number")
+    )
+    for line_number, items, text in rejected.iter_rows():
+        locations = json.loads(text)
+        _validated_rows([locations[item] for item in items], line_number)
+
+    rows: list[dict[str, Any]] = []
+    for line_number, line in (
+        responses.filter(~bulk).select("line_number", "line").iter_rows()
+    ):
+        text = _model_text(line)
+        if text is not None:
+            rows += _validated_rows(json.loads(text), line_number)
+
+    schema = {"line_number": pl.UInt32, "item": pl.Int64, **CLEANED_LOCATION_SCHEMA}
+    cleaned = (
+        pl.concat(
+            [decoded.filter(complete), pl.DataFrame(rows, schema=schema)],
+            how="diagonal_relaxed",
+        )
+        .sort("line_number", "item")
+        .select(*CLEANED_LOCATION_SCHEMA)
+    )
+    return cleaned.with_columns(pl.selectors.string().str.replace_all("null", ""))
+
+
+def _parsed_cache(response_file: Path) -> Path:
+    return response_file.with_suffix(".parquet")
+
+
+def load_cleaned_locations(response_file: Path) -> pl.DataFrame:
+    """Parsed contents of a raw response file, via its Parquet sidecar.
+
+    The sidecar is rebuilt whenever the response file is newer than it.
+    """
+    if not response_file.exists():
+        return pl.DataFrame(schema=CLEANED_LOCATION_SCHEMA)
+    parsed_file = _parsed_cache(response_file)
+    if (
+        parsed_file.exists()
+        and parsed_file.stat().st_mtime_ns >= response_file.stat().st_mtime_ns
+    ):
+        return pl.read_parquet(parsed_file)
+    cleaned = parse_batch_responses(response_file.read_text(encoding="utf-8"))
+    cleaned.write_parquet(parsed_file)
+    return cleaned
+
+
+def append_batch_responses(response_file: Path, content: str) -> pl.DataFrame:
+    """Append raw batch output to ``response_file`` and return all cleaned rows.
+
+    Only the new content is parsed; its rows are appended to the sidecar.
+    """
+    cleaned = pl.concat(
+        [load_cleaned_locations(response_file), parse_batch_responses(content)]
+    )
+    with open(response_file, "a", encoding="utf-8") as handle:
+        # Lead with a newline in case the file didn't end with one
+        handle.write("\n" + content.strip())
+    cleaned.write_parquet(_parsed_cache(response_file))
+    print(f"Successfully appended new results to {response_file.name}")
+    return cleaned
@@ -16,6 +16,17 @@ _FIXED_WIDTH = {
 }
 _UNPADDED = {"cz_id", "aewr_region_id"}
 _VARIABLE_WIDTH = {"oews_area_code"}
+_AEWR_REGIONS = tuple(str(i) for i in range(1, 18))
+# Exactly the characters removed by ``str.strip()``.
+_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003"
+    "\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+_DIGITS = r"^[0-9]+$"
+
+
+def _is_digits(text: str) -> bool:
+    return text.isascii() and text.isdigit()
 
 
 def clean_geo_code(value: Any) -> str | None:
@@ -23,7 +34,7 @@ def clean_geo_code(value: Any) -> str | None:
     if value is None:
         return None
     text = str(value).strip().replace('"', "")
-    if text.endswith(".0") and text[:-2].isdigit():
+    if text.endswith(".0") and _is_digits(text[:-2]):
         text = text[:-2]
     return text or None
 
@@ -33,7 +44,7 @@ def normalize_geo_code(value: Any, name: str) -> str | None:
     text = clean_geo_code(value)
     if text is None:
         return None
-    if not text.isdigit():
+    if not _is_digits(text):
         raise ValueError(f"{name} must contain digits only: {value!r}")
 
     if name in _FIXED_WIDTH:
@@ -48,7 +59,7 @@ def normalize_geo_code(value: Any, name: str) -> str | None:
     else:
         raise ValueError(f"Unknown geographic identifier: {name}")
 
-    if name == "aewr_region_id" and text not in {str(i) for i in range(1, 18)}:
+    if name == "aewr_region_id" and text not in _AEWR_REGIONS:
         raise ValueError(f"aewr_region_id must be between 1 and 17: {value!r}")
     return text
 
@@ -84,16 +95,99 @@ def normalize_county_fips_list(value: Any) -> str:
     return ",".join(county for county in counties if county is not None)
 
 
+def _normalize_distinct(
+    values: pl.Series, name: str, *, vintage_2010: bool
+) -> pl.Series:
+    """Normalize every row with Polars string kernels, raising for the first bad row."""
+    if vintage_2010:
+        name = "county_fips"
+    text = pl.col("text")
+    if name in _FIXED_WIDTH:
+        width = _FIXED_WIDTH[name]
+        code = text.str.zfill(width)
+        failure = pl.when(text.str.len_chars() > width).then(
+            pl.lit(f"{name} must contain at most {width} digits: ")
+        )
+    elif name in _UNPADDED:
+        stripped = text.str.strip_chars_start("0")
+        code = pl.when(stripped == "").then(pl.lit("0")).otherwise(stripped)
+        failure = pl.when(
+            pl.lit(name == "aewr_region_id") & ~code.is_in(_AEWR_REGIONS)
+        ).then(pl.lit("aewr_region_id must be between 1 and 17: "))
+    elif name in _VARIABLE_WIDTH:
+        code = text
+        failure = pl.lit(None, dtype=pl.String)
+    else:
+        code = pl.lit(None, dtype=pl.String)
+        failure = pl.lit(f"Unknown geographic identifier: {name}")
+    if vintage_2010:
+        code = pl.when(code == "46102").then(pl.lit("46113")).otherwise(code)
+
+    # Materialize the cleaned text once; every later kernel reuses it.
+    result = (
+        pl.DataFrame({"value": values})
+        .with_columns(
+            text=pl.col("value")
+            .cast(pl.String)
+            .str.strip_chars(_WHITESPACE)
+            .str.replace_all('"', "", literal=True)
+        )
+        .with_columns(head=text.str.strip_suffix(".0"))
+        .with_columns(
+            text=pl.when(
+                (pl.col("head") != text) & pl.col("head").str.contains(_DIGITS)
+            )
+            .then("head")
+            .when(text != "")
+            .then(text)
+        )
+        .with_columns(code=code)
+        .select(
+            "value",
+            "code",
+            pl.when(text.is_null())
+            .then(pl.lit(None, dtype=pl.String))
+            .when(~text.str.contains(_DIGITS))
+            .then(pl.lit(f"{name} must contain digits only: "))
+            .otherwise(failure)
+            .alias("failure"),
+        )
+    )
+    failures = result.filter(pl.col("failure").is_not_null())
+    if failures.height:
+        value, _, message = failures.row(0)
+        if message.startswith("Unknown"):
+            raise ValueError(message)
+        raise ValueError(f"{message}{value!r}")
+    return result.get_column("code").alias(values.name)
+
+
+def normalize_geo_series(
+    values: pl.Series, name: str, *, vintage_2010: bool = False
+) -> pl.Series:
+    """Normalize a column with Polars string kernels.
+
+    Equivalent to :func:`normalize_geo_code` (or, with ``vintage_2010``,
+    :func:`harmonize_county_fips_2010`) applied row by row, including the
+    error raised for the first malformed row. Distinct values are kept in
+    first-occurrence order, so only they pass through the string kernels.
+    """
+    distinct = values.unique(maintain_order=True)
+    codes = _normalize_distinct(distinct, name, vintage_2010=vintage_2010)
+    return values.replace_strict(distinct, codes, return_dtype=pl.String)
+
+
 def geo_expr(source: str, name: str, *, vintage_2010: bool = False) -> pl.Expr:
     """Build a Polars expression that normalizes a geographic column."""
-    normalizer = (
-        harmonize_county_fips_2010
-        if vintage_2010
-        else lambda value: normalize_geo_code(value, name)
-    )
     return (
         pl.col(source)
-        .map_elements(normalizer, return_dtype=pl.String)
+        .map_batches(
+            lambda values: normalize_geo_series(
+                values, name, vintage_2010=vintage_2010
+            ),
+            return_dtype=pl.String,
+            is_elementwise=True,
+        )
         .alias(name)
     )
 
@@ -117,12 +211,13 @@ def assert_geo_columns(
         values = frame.get_column(name)
         if name not in allow_null and values.null_count() > 0:
             raise ValueError(f"{name} contains missing values")
-        for value in values.drop_nulls().unique().to_list():
-            normalized = (
-                harmonize_county_fips_2010(value)
-                if name in {"county_fips", "neighbor_county_fips"}
-                else normalize_geo_code(value, name)
-            )
-            if normalized != value:
-                raise ValueError(f"{name} contains noncanonical value {value!r}")
+        values = values.drop_nulls().unique()
+        normalized = _normalize_distinct(
+            values,
+            name,
+            vintage_2010=name in {"county_fips", "neighbor_county_fips"},
+        )
+        noncanonical = values.filter(normalized.ne_missing(values))
+        if noncanonical.len():
+            raise ValueError(f"{name} contains noncanonical value {noncanonical[0]!r}")
 # docs-ground:end geographic-code-contract-python
@@ -0,0 +1,177 @@
+"""Concurrent Google Places lookups behind an append-only SQLite cache."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import Any, Protocol, Self
+
+from h2a.throttle import TokenBucket
+
+_SQLITE_BATCH = 900
+
+
+class PlacesCache:
+    """Append-only key to JSON-value table in a SQLite file.
+
+    Every resolved lookup is inserted as its own row, so progress survives
+    interruption without rewriting the cache. ``legacy_json`` seeds a newly
+    created table from the JSON dictionaries written by earlier runs.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        table: str,
+        *,
+        legacy_json: Path | None = None,
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name: {table!r}")
+        self.table = table
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        exists = self._connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table,),
+        ).fetchone()
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        if not exists and legacy_json is not None and legacy_json.exists():
+            legacy = json.loads(legacy_json.read_text(encoding="utf-8"))
+            self._insert(legacy.items())
+            print(f"Imported {len(legacy):,} cached responses from {legacy_json}")
+        self._connection.commit()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute(f"SELECT count(*) FROM {self.table}").fetchone()[0]
+
+    def _insert(self, items: Iterable[tuple[str, Any]]) -> None:
+        self._connection.executemany(
+            f"INSERT OR IGNORE INTO {self.table} (key, value) VALUES (?, ?)",
+            ((key, json.dumps(value)) for key, value in items),
+        )
+
+    def add(self, key: str, value: Any) -> None:
+        self._insert([(key, value)])
+        self._connection.commit()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Cached values for whichever ``keys`` are present."""
+        keys = list(keys)
+        found: dict[str, Any] = {}
+        for start in range(0, len(keys), _SQLITE_BATCH):
+            batch = keys[start : start + _SQLITE_BATCH]
+            placeholders = ", ".join("?" * len(batch))
+            found.update(
+                (key, json.loads(value))
+                for key, value in self._connection.execute(
+                    f"SELECT key, value FROM {self.table} WHERE key IN ({placeholders})",
+                    batch,
+                )
+            )
+        return found
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            key: json.loads(value)
+            for key, value in self._connection.execute(
+                f"SELECT key, value FROM {self.table} ORDER BY rowid"
+            )
+        }
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class PlacesBackend(Protocol):
+    """The two Places calls the resolver needs; tests substitute a fake."""
+
+    async def search_text(self, query: str) -> list[str]: ...
+
+    async def address_components(self, place_id: str) -> dict[str, Any]: ...
+
+
+class GooglePlacesBackend:
+    """Places API (New) through the official async client."""
+
+    def __init__(self, api_key: str | None) -> None:
+        from google.maps import places_v1
+
+        self._places = places_v1
+        self._client = places_v1.PlacesAsyncClient(
+            client_options={"api_key": api_key}
+        )
+
+    async def search_text(self, query: str) -> list[str]:
+        response = await self._client.search_text(
+            request=self._places.SearchTextRequest(text_query=query),
+            metadata=[("x-goog-fieldmask", "places.id")],
+        )
+        return [place.id for place in response.places]
+
+    async def address_components(self, place_id: str) -> dict[str, Any]:
+        from google.protobuf.json_format import MessageToDict
+
+        # Only addressComponents is requested, to minimize latency and cost.
+        response = await self._client.get_place(
+            request=self._places.GetPlaceRequest(name=f"places/{place_id}"),
+            metadata=[("x-goog-fieldmask", "addressComponents")],
+        )
+        return MessageToDict(response._pb)
+
+
+def searchable_query(query: str | None) -> bool:
+    """Only "place, state"-style names are worth a text search."""
+    return bool(query) and "," in query
+
+
+async def resolve_places(
+    keys: Iterable[str],
+    fetch: Callable[[str], Awaitable[Any]],
+    cache: PlacesCache,
+    *,
+    requests_per_minute: float,
+    concurrency: int = 16,
+) -> dict[str, Any]:
+    """Resolve every distinct key, calling ``fetch`` only for uncached ones.
+
+    Up to ``concurrency`` calls are in flight while a shared token bucket
+    holds the request rate at ``requests_per_minute``, so a fresh batch is
+    bound by quota rather than latency. Each result is appended to the
+    cache as it arrives; if any call fails the rest are cancelled and the
+    error propagates.
+    """
+    distinct = list(dict.fromkeys(keys))
+    resolved = cache.get_many(distinct)
+    missing = [key for key in distinct if key not in resolved]
+    bucket = TokenBucket(requests_per_minute / 60)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def resolve(key: str) -> None:
+        async with slots:
+            await bucket.acquire_async()
+            value = await fetch(key)
+        cache.add(key, value)
+        resolved[key] = value
+
+    async with asyncio.TaskGroup() as group:
+        for key in missing:
+            group.create_task(resolve(key))
+    print(
+        f"Resolved {len(distinct):,} distinct keys with {len(missing):,} new API calls.",
+        flush=True,
+    )
+    return resolved
@@ -0,0 +1,36 @@
+"""JAX kernels for the compositional PPML model of county H-2A counts."""
+
+from __future__ import annotations
+
+import jax.numpy as jnp
+
+from h2a.prediction_scoring import LOG_RATE_CAP
+
+
+def compute_patch_log_worker(
+    params: dict,
+    feature_ids: dict,
+    X_county_cont: jnp.ndarray,
+    X_patch_cont: jnp.ndarray,
+    group_ids: jnp.ndarray,
+) -> jnp.ndarray:
+    """Log worker rate of each soil patch, capped at ``LOG_RATE_CAP``.
+
+    ``feature_ids[order]`` holds one column of weight-row ids per categorical
+    combination. Each row is an intercept, county-covariate slopes, and
+    patch-covariate slopes. The rows a patch selects are summed first, with
+    one gather per interaction order, so the county covariates are broadcast
+    to patches once and each covariate block takes a single row-wise dot.
+    """
+    num_county = X_county_cont.shape[1]
+    summed = sum(
+        params["weights"][order][feature_ids[order]].sum(axis=1)
+        for order in sorted(feature_ids)
+    )
+    log_mu = (
+        params["bias"]
+        + summed[:, 0]
+        + jnp.sum(summed[:, 1 : 1 + num_county] * X_county_cont[group_ids], axis=1)
+        + jnp.sum(summed[:, 1 + num_county :] * X_patch_cont, axis=1)
+    )
+    return jnp.clip(log_mu, max=LOG_RATE_CAP)
@@ -0,0 +1,111 @@
+"""Chunked scoring of saved PPML models over county soil patches."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+from scipy import sparse
+
+LOG_RATE_CAP = np.float32(15.0)
+
+
+def categorical_design(
+    feature_ids: Mapping[int, np.ndarray], feature_counts: Mapping[int, int]
+) -> sparse.csr_array:
+    """Indicator matrix selecting each patch's rows of the packed weight table.
+
+    ``feature_ids[order]`` holds one column of feature ids per categorical
+    combination. The weight rows of each interaction order are packed in
+    ascending order, offset by the feature counts of the orders before it.
+    """
+    if sorted(feature_ids) != sorted(feature_counts):
+        raise ValueError("Feature ids and weights cover different interaction orders.")
+    columns = []
+    offset = 0
+    for order in sorted(feature_counts):
+        ids = np.asarray(feature_ids[order], dtype=np.int64)
+        if ids.size and (ids.min() < 0 or ids.max() >= feature_counts[order]):
+            raise ValueError(f"Order-{order} feature ids exceed the weight table.")
+        columns.append(ids + offset)
+        offset += feature_counts[order]
+    indices = np.concatenate(columns, axis=1)
+    rows, per_row = indices.shape
+    return sparse.csr_array(
+        (
+            np.ones(indices.size, dtype=np.float32),
+            indices.ravel(),
+            np.arange(0, indices.size + 1, per_row, dtype=np.int64),
+        ),
+        shape=(rows, offset),
+    )
+
+
+def pack_weights(weight_matrices: Sequence[Mapping[int, np.ndarray]]) -> np.ndarray:
+    """Stack each cutoff's per-order weight matrices into one ``(K, F, W)`` table."""
+    return np.stack(
+        [
+            np.concatenate([matrices[order] for order in sorted(matrices)])
+            for matrices in weight_matrices
+        ]
+    ).astype(np.float32, copy=False)
+
+
+def score_cutoffs(
+    design: sparse.csr_array,
+    weights: np.ndarray,
+    biases: np.ndarray,
+    county_values: np.ndarray,
+    patch_values: np.ndarray,
+    patch_transforms: np.ndarray,
+    county_index: np.ndarray,
+    patch_exposure: np.ndarray,
+    *,
+    chunk_size: int = 50_000,
+) -> np.ndarray:
+    """Predicted county counts for every cutoff, from one pass over the patches.
+
+    ``weights`` is the ``(K, F, 1 + county + patch)`` table from
+    :func:`pack_weights`: an intercept, county-covariate slopes and
+    patch-covariate slopes for each feature. ``county_values`` are the
+    transformed ``(K, counties, county)`` covariates. ``patch_values`` are
+    raw, and ``patch_transforms`` holds each cutoff's imputation value,
+    center and scale as a ``(K, 3, patch)`` array.
+
+    Each chunk sums its patches' weight rows for all cutoffs in one sparse
+    product, so no per-combination temporaries are allocated, and adds
+    ``exposure * exp(log rate)`` to the counties with one ``np.bincount``.
+    """
+    cutoffs, features, width = weights.shape
+    counties = county_values.shape[1]
+    county_width = county_values.shape[2]
+    stacked = weights.transpose(1, 0, 2).reshape(features, cutoffs * width)
+    imputation, center, scale = (
+        patch_transforms[:, part, None, :] for part in range(3)
+    )
+    bin_offsets = np.arange(cutoffs, dtype=np.int64)[:, None] * counties
+    predicted = np.zeros(cutoffs * counties, dtype=np.float64)
+
+    for start in range(0, design.shape[0], chunk_size):
+        chunk = slice(start, min(start + chunk_size, design.shape[0]))
+        summed = (design[chunk] @ stacked).reshape(-1, cutoffs, width)
+        raw = patch_values[chunk]
+        transformed = (np.where(np.isnan(raw), imputation, raw) - center) / scale
+        chunk_county_index = county_index[chunk]
+        log_rate = biases[:, None] + summed[:, :, 0].T
+        log_rate += np.einsum(
+            "nkc,knc->kn",
+            summed[:, :, 1 : 1 + county_width],
+            county_values[:, chunk_county_index],
+        )
+        log_rate += np.einsum(
+            "nkp,knp->kn", summed[:, :, 1 + county_width :], transformed
+        )
+        np.minimum(log_rate, LOG_RATE_CAP, out=log_rate)
+        predicted += np.bincount(
+            (bin_offsets + chunk_county_index).ravel(),
+            weights=(patch_exposure[chunk] * np.exp(log_rate)).ravel(),
+            minlength=cutoffs * counties,
+        )
+
+    return predicted.reshape(cutoffs, counties).astype(np.float32)
@@ -1,12 +1,22 @@
-"""QWI response parsing shared by the extractor and its schema test."""
+"""QWI download, caching, and response parsing shared by the extractor."""
 
 from __future__ import annotations
 
+import json
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import polars as pl
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from h2a.geography import harmonize_county_fips_2010
+from h2a.throttle import TokenBucket
 
 QWI_FIELDS = ("Emp", "EmpS", "EmpTotal", "sEmp", "sEmpS", "sEmpTotal")
 REQUIRED_FIELDS = {
@@ -18,6 +28,20 @@ REQUIRED_FIELDS = {
     "seasonadj",
     *QWI_FIELDS,
 }
+QWI_SCHEMA = {
+    "county_fips": pl.String,
+    "year": pl.Int16,
+    "qtr": pl.Int8,
+    "industry_code": pl.String,
+    "ownercode": pl.String,
+    "seasonadj": pl.String,
+    "qwi_beginning_quarter_employment": pl.Float64,
+    "qwi_stable_employment": pl.Float64,
+    "qwi_any_quarter_employment": pl.Float64,
+    "qwi_beginning_quarter_employment_status": pl.String,
+    "qwi_stable_employment_status": pl.String,
+    "qwi_any_quarter_employment_status": pl.String,
+}
 
 
 def parse_qwi_payload(payload: list[list[Any]]) -> pl.DataFrame:
@@ -87,3 +111,161 @@ def parse_qwi_payload(payload: list[list[Any]]) -> pl.DataFrame:
             "qwi_any_quarter_employment_status",
         )
     )
+
+
+@dataclass(frozen=True)
+class QwiRequest:
+    """One state-industry county extract over a range of years."""
+
+    state_fips: str
+    industry: str
+    first_year: int
+    last_year: int
+
+    @property
+    def label(self) -> str:
+        return f"state {self.state_fips}, NAICS {self.industry}"
+
+    def params(self, api_key: str | None) -> dict[str, Any]:
+        return {
+            "get": ",".join(QWI_FIELDS),
+            "for": "county:*",
+            "in": f"state:{self.state_fips}",
+            "time": f"from {self.first_year}-Q1 to {self.last_year}-Q4",
+            "industry": self.industry,
+            "ownercode": "A05",
+            "seasonadj": "U",
+            "sex": "0",
+            "agegrp": "A00",
+            "key": api_key,
+        }
+
+    def cache_file(self, cache_root: Path) -> Path:
+        """Hive-style partition holding the parsed response."""
+        return (
+            cache_root
+            / f"state={self.state_fips}"
+            / f"industry={self.industry}"
+            / f"years={self.first_year}_{self.last_year}.parquet"
+        )
+
+    def legacy_cache_file(self, cache_root: Path) -> Path:
+        """Raw JSON response written by earlier versions of the extractor."""
+        return cache_root / (
+            f"qwi_{self.state_fips}_{self.industry}_"
+            f"{self.first_year}_{self.last_year}.json"
+        )
+
+
+def qwi_retry() -> Retry:
+    """Retry policy for transient Census API failures."""
+    return Retry(
+        total=5,
+        backoff_factor=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+    )
+
+
+def _response_payload(response: requests.Response, request: QwiRequest) -> Any:
+    response.raise_for_status()
+    if response.status_code == 204 or not response.content.strip():
+        return []
+    try:
+        payload = response.json()
+    except requests.exceptions.JSONDecodeError as exc:
+        content_type = response.headers.get("content-type", "unknown")
+        body_preview = " ".join(response.text.split())[:200]
+        raise RuntimeError(
+            f"QWI returned non-JSON content for {request.label} "
+            f"(HTTP {response.status_code}, {content_type}): "
+            f"{body_preview or '<empty body>'}"
+        ) from exc
+    if isinstance(payload, dict) and "error" in payload:
+        raise RuntimeError(str(payload["error"]))
+    return payload
+
+
+def parse_qwi_response(payload: Any, request: QwiRequest) -> pl.DataFrame:
+    """Parse one response, returning an empty artifact frame when it has no rows."""
+    if not isinstance(payload, list):
+        raise TypeError(f"Unexpected QWI response for {request.label}: {payload!r}")
+    if len(payload) < 2:
+        return pl.DataFrame(schema=QWI_SCHEMA)
+    try:
+        frame = parse_qwi_payload(payload)
+    except ValueError as exc:
+        raise ValueError(f"QWI response for {request.label}: {exc}") from exc
+    return frame.cast(QWI_SCHEMA)
+
+
+def _write_cache(frame: pl.DataFrame, path: Path) -> None:
+    """Publish a partition atomically so interrupted runs never leave half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp")
+    frame.write_parquet(temporary)
+    temporary.replace(path)
+
+
+def download_qwi(
+    qwi_requests: Sequence[QwiRequest],
+    *,
+    endpoint: str,
+    cache_root: Path,
+    api_key: str | None = None,
+    refresh: bool = False,
+    workers: int = 8,
+    requests_per_second: float = 1 / 0.15,
+) -> pl.DataFrame:
+    """Fetch every request through the Parquet cache, ``workers`` at a time.
+
+    Each response is parsed once and stored as its own partition, so reruns
+    skip both the network and the JSON parsing. Raw JSON responses left by
+    earlier runs are converted without a request. Requests share one token
+    bucket, and rows are returned in request order.
+    """
+    bucket = TokenBucket(requests_per_second)
+    local = threading.local()
+    sessions: list[requests.Session] = []
+
+    def session() -> requests.Session:
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+            adapter = HTTPAdapter(max_retries=qwi_retry())
+            local.session.mount("https://", adapter)
+            local.session.mount("http://", adapter)
+            sessions.append(local.session)
+        return local.session
+
+    def load(request: QwiRequest) -> pl.DataFrame:
+        path = request.cache_file(cache_root)
+        legacy = request.legacy_cache_file(cache_root)
+        if path.exists() and not refresh:
+            frame = pl.read_parquet(path)
+        else:
+            if legacy.exists() and not refresh:
+                payload = json.loads(legacy.read_text(encoding="utf-8"))
+            else:
+                print(f"QWI {request.label}", flush=True)
+                bucket.acquire()
+                response = session().get(
+                    endpoint, params=request.params(api_key), timeout=120
+                )
+                payload = _response_payload(response, request)
+            frame = parse_qwi_response(payload, request)
+            _write_cache(frame, path)
+        if not frame.height:
+            print(f"No QWI rows for {request.label}; skipping", flush=True)
+        return frame
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        frames = [frame for frame in executor.map(load, qwi_requests) if frame.height]
+    finally:
+        # A failed request stops the queue; finished partitions stay cached.
+        executor.shutdown(cancel_futures=True)
+        for opened in sessions:
+            opened.close()
+    if not frames:
+        raise RuntimeError("The QWI API returned no county-quarter rows.")
+    return pl.concat(frames, how="vertical_relaxed")
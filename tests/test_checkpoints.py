@@ -0,0 +1,112 @@
+"""Binary checkpoint round trips, snapshot retention, and background writes."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from h2a.checkpoints import (
+    CheckpointWriter,
+    read_checkpoint,
+    snapshot_path,
+    write_checkpoint,
+)
+
+
+def leaves(iteration: int) -> dict[str, list[np.ndarray]]:
+    return {
+        "hparams": [np.float32(iteration), np.arange(3, dtype=np.float32)],
+        "state": [np.int32(iteration), np.ones((2, 4), dtype=np.float32)],
+        "empty": [],
+    }
+
+
+class CheckpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "nested" / "checkpoint.npz"
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_round_trip_preserves_header_dtypes_and_order(self) -> None:
+        header = {"iter": 7, "model_spec": "spec-a", "best_alo": float("inf")}
+        write_checkpoint(self.path, header, leaves(7))
+
+        observed_header, groups = read_checkpoint(self.path)
+        self.assertEqual(observed_header["model_spec"], "spec-a")
+        self.assertEqual(observed_header["best_alo"], float("inf"))
+        self.assertEqual(
+            observed_header["groups"], {"hparams": 2, "state": 2, "empty": 0}
+        )
+        self.assertEqual(groups["empty"], [])
+        for name, expected in leaves(7).items():
+            for leaf, reference in zip(groups[name], expected, strict=True):
+                self.assertEqual(leaf.dtype, reference.dtype)
+                np.testing.assert_array_equal(leaf, reference)
+        self.assertEqual(
+            sorted(p.name for p in self.path.parent.iterdir()),
+            ["checkpoint.iter000007.npz", "checkpoint.npz"],
+        )
+
+    def test_only_the_latest_snapshots_are_kept(self) -> None:
+        for iteration in (10, 20, 30, 40):
+            write_checkpoint(self.path, {"iter": iteration}, leaves(iteration), keep=2)
+        self.assertEqual(
+            sorted(p.name for p in self.path.parent.iterdir()),
+            [
+                "checkpoint.iter000030.npz",
+                "checkpoint.iter000040.npz",
+                "checkpoint.npz",
+            ],
+        )
+        header, groups = read_checkpoint(snapshot_path(self.path, 30))
+        self.assertEqual(header["iter"], 30)
+        self.assertEqual(int(groups["state"][0]), 30)
+
+        write_checkpoint(self.path, {"iter": 50}, leaves(50), keep=0)
+        self.assertEqual(
+            [p.name for p in self.path.parent.iterdir()], ["checkpoint.npz"]
+        )
+
+    def test_restarting_drops_snapshots_of_the_abandoned_run(self) -> None:
+        for iteration in (10, 20, 30):
+            write_checkpoint(self.path, {"iter": iteration}, leaves(iteration))
+        write_checkpoint(self.path, {"iter": 0}, leaves(0))
+        self.assertEqual(
+            sorted(p.name for p in self.path.parent.iterdir()),
+            ["checkpoint.iter000000.npz", "checkpoint.npz"],
+        )
+        self.assertEqual(read_checkpoint(self.path)[0]["iter"], 0)
+
+    def test_background_writer_finishes_every_write(self) -> None:
+        with CheckpointWriter() as writer:
+            for iteration in range(1, 6):
+                writer.submit(self.path, {"iter": iteration}, leaves(iteration))
+        header, groups = read_checkpoint(self.path)
+        self.assertEqual(header["iter"], 5)
+        np.testing.assert_array_equal(groups["hparams"][0], np.float32(5))
+        self.assertEqual(len(list(self.path.parent.glob("checkpoint.iter*.npz"))), 3)
+
+    def test_background_errors_surface_on_flush(self) -> None:
+        writer = CheckpointWriter()
+        writer.submit(self.path, {"model_spec": "no iteration"}, leaves(1))
+        with self.assertRaises(KeyError):
+            writer.flush()
+        writer.close()
+
+    def test_rejects_files_that_are_not_checkpoints(self) -> None:
+        self.path.parent.mkdir(parents=True)
+        np.savez(self.path, weights=np.zeros(2))
+        with self.assertRaisesRegex(ValueError, "no header"):
+            read_checkpoint(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+"""The elastic-net notebook end to end on a small synthetic cutoff sweep."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from importlib.util import find_spec, module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "src"))
+
+from h2a.checkpoints import read_checkpoint
+
+NOTEBOOK_PATH = REPO / "code" / "b01_derived" / "07_h2a_prediction_elastic_net.py"
+# The modelling stack ships with the GPU environment only.
+MISSING = [name for name in ("jax", "lineax", "optax") if find_spec(name) is None]
+COUNTIES = [f"37{2 * index + 1:03d}" for index in range(12)]
+YEARS = list(range(2008, 2012))
+CUTOFFS = (2010, 2011)
+MODEL_SPEC = "climate_norm_static_v1"
+PATCH_MEASURES = [
+    "slope_r",
+    "slopegradwta",
+    "resdept_r",
+    "aws025wta",
+    "aws050wta",
+    "aws0100wta",
+    "aws0150wta",
+    "wtdepannmin",
+    "wtdepaprjunmin",
+    "brockdepmin",
+    "cropprodindex",
+]
+
+
+def write_inputs(intermediate: Path, seed: int = 0) -> None:
+    """County-year H-2A, BEA and climate inputs plus six soil cells per county."""
+    rng = np.random.default_rng(seed)
+    county_years = pl.DataFrame(
+        {
+            "county_fips": [county for county in COUNTIES for _ in YEARS],
+            "year": YEARS * len(COUNTIES),
+        }
+    )
+    county_years.with_columns(
+        state_fips=pl.col("county_fips").str.head(2),
+        county_code=pl.col("county_fips").str.tail(3),
+        nbr_workers_certified_start_year=rng.poisson(20, county_years.height),
+    ).write_parquet(intermediate / "h2a_aggregated.parquet")
+    county_years.with_columns(
+        bea_farm_emp=rng.uniform(200, 900, county_years.height),
+        bea_nonfarm_emp=rng.uniform(1e4, 5e4, county_years.height),
+    ).write_parquet(intermediate / "bea_farm_nonfarm_emp.parquet")
+    county_years.with_columns(
+        pl.Series(
+            f"normal_cb_{index}", np.repeat(rng.normal(size=len(COUNTIES)), len(YEARS))
+        )
+        for index in range(3)
+    ).write_parquet(intermediate / "county_h2a_prediction_climate_basis_annual.parquet")
+    cells = len(COUNTIES) * 6
+    pl.DataFrame(
+        {
+            "county_fips": np.repeat(COUNTIES, 6),
+            "total_acres": rng.uniform(10, 100, cells),
+            **{
+                f"{measure}{suffix}": rng.normal(size=cells)
+                for suffix in ("", "_obs_share")
+                for measure in PATCH_MEASURES
+            },
+            "taxgrtgroup": rng.choice(["A", "B", "C"], cells),
+            "drainagecl": rng.choice(["WELL", "POOR"], cells),
+            "nirrcapcl": rng.choice(["1", "2", "3"], cells),
+        }
+    ).write_parquet(intermediate / "county_h2a_prediction_gnatsgo_soil_cells.parquet")
+
+
+def run_notebook(outer_iters: int) -> None:
+    """Run the notebook under ``H2A_PROJECT_ROOT`` with short tuning settings.
+
+    Called in a fresh interpreter: the notebook points JAX's process-wide
+    compilation cache at the project root when it is imported.
+    """
+    spec = spec_from_file_location("h2a_prediction_elastic_net", NOTEBOOK_PATH)
+    notebook = module_from_spec(spec)
+    spec.loader.exec_module(notebook)
+    root = Path(os.environ["H2A_PROJECT_ROOT"])
+    binary_path = root / "data" / "intermediate"
+    code_path = root / "code"
+
+    def cutoff_artifact_paths(cutoff):
+        return (
+            binary_path
+            / "meta_ppml_checkpoints"
+            / f"meta_ppml_opt_checkpoint_cutoff_{cutoff}.npz",
+            code_path / "json" / f"meta_ppml_opt_log_cutoff_{cutoff}.csv",
+            binary_path / f"h2a_prediction_elastic_net_model_cutoff_{cutoff}.parquet",
+        )
+
+    def legacy_cutoff_checkpoint_path(cutoff):
+        return code_path / "json" / f"meta_ppml_opt_checkpoint_cutoff_{cutoff}.json"
+
+    solver = {"alo_k": 2, "alo_cg_rtol": 5e-2, "alo_cg_atol": 5e-2}
+    notebook.app.run(
+        defs={
+            "meta_tuning_settings": {
+                **solver,
+                "outer_iters": outer_iters,
+                "patience": 50,
+                "chunk_size": 3,
+                "inner_iters": 50,
+                "inner_tol": 1e-4,
+                "alo_cg_max_steps": 10,
+                "meta_lr": 0.01,
+                "clip_norm": 1.0,
+                "export_dir": (
+                    root / "export" if os.environ.get("H2A_JAX_EXPORT") == "1" else None
+                ),
+            },
+            "best_check_settings": {
+                **solver,
+                "inner_iters": 50,
+                "inner_tol": 1e-6,
+                "alo_cg_max_steps": 10,
+            },
+            "cutoff_artifact_paths": cutoff_artifact_paths,
+            "legacy_cutoff_checkpoint_path": legacy_cutoff_checkpoint_path,
+        }
+    )
+
+
+def write_legacy_checkpoint(path: Path, legacy_path: Path) -> None:
+    """Rewrite an .npz checkpoint in the JSON format it replaced, then drop it."""
+    header, leaves = read_checkpoint(path)
+    legacy = {
+        "model_spec": header["model_spec"],
+        "iter": header["iter"],
+        "best_alo": header["best_alo"],
+        "wait": header["wait"],
+        **{
+            f"{name}_leaves": [leaf.tolist() for leaf in group]
+            for name, group in leaves.items()
+        },
+    }
+    legacy_path.write_text(json.dumps(legacy, indent=4))
+    for stale in path.parent.glob(f"{path.stem}*"):
+        stale.unlink()
+
+
+@unittest.skipIf(MISSING, f"{', '.join(MISSING)} not installed")
+class CutoffSweepTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.root = Path(cls.directory.name)
+        cls.intermediate = cls.root / "data" / "intermediate"
+        cls.intermediate.mkdir(parents=True)
+        (cls.root / "code" / "json").mkdir(parents=True)
+        write_inputs(cls.intermediate)
+        cls.first = cls.run_sweep(3, export=False)
+        cls.first_logs = {cutoff: cls.tuning_log(cutoff) for cutoff in CUTOFFS}
+        write_legacy_checkpoint(
+            cls.checkpoint(CUTOFFS[0]),
+            cls.root
+            / "code"
+            / "json"
+            / f"meta_ppml_opt_checkpoint_cutoff_{CUTOFFS[0]}.json",
+        )
+        cls.restart = cls.run_sweep(6, export=True)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.directory.cleanup()
+
+    @classmethod
+    def run_sweep(cls, outer_iters: int, *, export: bool) -> str:
+        environment = {
+            **os.environ,
+            "H2A_PROJECT_ROOT": str(cls.root),
+            "H2A_CUTOFF_YEARS": ",".join(map(str, CUTOFFS)),
+            "H2A_JAX_EXPORT": "1" if export else "0",
+            "JAX_PLATFORMS": "cpu",
+            "PYTHONPATH": os.pathsep.join(
+                [str(Path(__file__).parent), str(REPO / "src")]
+            ),
+        }
+        command = f"from {Path(__file__).stem} import run_notebook; "
+        command += f"run_notebook({outer_iters})"
+        completed = subprocess.run(
+            [sys.executable, "-c", command],
+            cwd=REPO,
+            env=environment,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode:
+            raise AssertionError(completed.stdout[-4000:] + completed.stderr[-4000:])
+        return completed.stdout
+
+    @classmethod
+    def checkpoint(cls, cutoff: int) -> Path:
+        return (
+            cls.intermediate
+            / "meta_ppml_checkpoints"
+            / f"meta_ppml_opt_checkpoint_cutoff_{cutoff}.npz"
+        )
+
+    @classmethod
+    def tuning_log(cls, cutoff: int) -> pl.DataFrame:
+        return pl.read_csv(
+            cls.root / "code" / "json" / f"meta_ppml_opt_log_cutoff_{cutoff}.csv"
+        )
+
+    def test_later_cutoffs_warm_start_from_the_previous_one(self) -> None:
+        self.assertIn(
+            "Warm-starting Bilevel Hyperparameter Tuning from "
+            f"meta_ppml_opt_checkpoint_cutoff_{CUTOFFS[0]}.npz",
+            self.first,
+        )
+        for cutoff in CUTOFFS:
+            model = pl.read_parquet(
+                self.intermediate
+                / f"h2a_prediction_elastic_net_model_cutoff_{cutoff}.parquet"
+            )
+            self.assertEqual(set(model["cutoff_year"]), {cutoff})
+            self.assertEqual(set(model["model_spec"]), {MODEL_SPEC})
+            self.assertEqual(self.first_logs[cutoff]["Step"].to_list(), [0, 1, 2])
+
+    def test_tuning_screens_the_inner_solve(self) -> None:
+        rounds = [
+            (int(active), int(total))
+            for active, total in re.findall(
+                r"Active set: (\d+) of (\d+) weights", self.first
+            )
+        ]
+        self.assertEqual(len(rounds), 3 * len(CUTOFFS))
+        self.assertTrue(any(active < total for active, total in rounds))
+
+    def test_restart_converts_resumes_and_exports(self) -> None:
+        self.assertIn(
+            "Converting legacy checkpoint "
+            f"meta_ppml_opt_checkpoint_cutoff_{CUTOFFS[0]}.json",
+            self.restart,
+        )
+        self.assertEqual(self.restart.count("Resuming at Iteration 3 "), 2)
+        self.assertEqual(len(list((self.root / "export").glob("*.jaxexport"))), 2)
+        for cutoff in CUTOFFS:
+            log = self.tuning_log(cutoff)
+            self.assertEqual(log["Step"].to_list(), list(range(6)))
+            self.assertTrue(log.head(3).equals(self.first_logs[cutoff]))
+            header, _ = read_checkpoint(self.checkpoint(cutoff))
+            self.assertEqual((header["iter"], header["model_spec"]), (6, MODEL_SPEC))
+
+
+if __name__ == "__main__":
+    unittest.main()
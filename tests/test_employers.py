@@ -0,0 +1,305 @@
+"""Vectorized employer normalizers and the bulk linkage contract."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from h2a.employers import (
+    LINKAGE_METHODS,
+    blocking_ngrams,
+    core_name_tokens,
+    link_employer_records,
+    normalize_fein,
+    normalize_name,
+    normalize_phone,
+    normalize_zip,
+    raw_identity_fingerprint,
+    valid_full_address,
+)
+
+
+def normalized(expression, values: list[str | None]) -> list[str]:
+    frame = pl.DataFrame({"value": values}, schema={"value": pl.String})
+    return frame.select(expression(pl.col("value"))).to_series().to_list()
+
+
+def identity_records(rows: list[tuple[str, str, str]]) -> pl.DataFrame:
+    """Records in one NC ZIP from (record id, name, FEIN) triples."""
+    record_ids, names, feins = zip(*rows, strict=True)
+    blank = [""] * len(rows)
+    return pl.DataFrame(
+        {
+            "employer_record_id": record_ids,
+            "normalized_name": names,
+            "normalized_trade_name": blank,
+            "normalized_full_address": blank,
+            "normalized_phone": blank,
+            "normalized_fein": feins,
+            "normalized_state": ["NC"] * len(rows),
+            "normalized_postal_code": ["27601"] * len(rows),
+        }
+    )
+
+
+def synthetic_records() -> pl.DataFrame:
+    blank = [""] * 14
+    return pl.DataFrame(
+        {
+            "employer_record_id": [f"er_{index:024x}" for index in range(14)],
+            "normalized_name": [
+                "ACME ORCHARDS LLC",
+                "ACME ORCHARD LLC",
+                "SMITH FARMS LLC",
+                "SMITH FARM LLC",
+                "BLUEBERRY HILL FARMS LLC",
+                "BLUEBERRY HILLS FARM LLC",
+                "ALPHA FARM LLC",
+                "OMEGA FARM LLC",
+                "SAME NAME LLC",
+                "SAME NAME LLC",
+                "FIRST LEGAL NAME LLC",
+                "SECOND LEGAL NAME LLC",
+                "FEIN LEGAL NAME ONE LLC",
+                "FEIN LEGAL NAME TWO LLC",
+            ],
+            "normalized_trade_name": [*blank[:10], "SHARED DBA", "SHARED DBA", "", ""],
+            "normalized_full_address": ["10 MAIN ST||RALEIGH|NC|27601"] * 2
+            + blank[:12],
+            "normalized_phone": [*blank[:6], "9105550100", "9105550100", *blank[:6]],
+            "normalized_fein": [
+                *blank[:8],
+                "111111112",
+                "222222223",
+                "",
+                "",
+                "333333334",
+                "333333334",
+            ],
+            "normalized_state": ["NC"] * 14,
+            "normalized_postal_code": [
+                "27601",
+                "27601",
+                "27511",
+                "27511",
+                "28001",
+                "28002",
+                "28301",
+                "28301",
+                "28401",
+                "28401",
+                "28501",
+                "28502",
+                "28601",
+                "28602",
+            ],
+        }
+    )
+
+
+class NormalizerTests(unittest.TestCase):
+    def test_names_are_ascii_folded_words(self) -> None:
+        self.assertEqual(
+            normalized(normalize_name, ["Café & Sons, LLC", "  a--b  ", None]),
+            ["CAFE AND SONS LLC", "A B", ""],
+        )
+
+    def test_numeric_identifiers(self) -> None:
+        self.assertEqual(
+            normalized(normalize_zip, ["1234", "27601-1234", "276", "27601.0", None]),
+            ["01234", "27601", "", "27601", ""],
+        )
+        self.assertEqual(
+            normalized(normalize_phone, ["1-910-555-0100", "1111111111", "555-0100"]),
+            ["9105550100", "", ""],
+        )
+        self.assertEqual(
+            normalized(normalize_fein, ["123456789.0", "12-3456789", "999999999"]),
+            ["123456789", "123456789", ""],
+        )
+
+    def test_full_address_requires_usable_parts(self) -> None:
+        frame = pl.DataFrame(
+            {
+                "normalized_address_1": ["10 MAIN ST", "SAME", "10 MAIN ST", "PO 1"],
+                "normalized_address_2": ["", "", "", ""],
+                "normalized_city": ["RALEIGH"] * 4,
+                "normalized_state": ["NC", "NC", "", "NC"],
+                "normalized_postal_code": ["27601"] * 4,
+            }
+        )
+        self.assertEqual(
+            frame.select(valid_full_address()).to_series().to_list(),
+            ["10 MAIN ST||RALEIGH|NC|27601", "", "", ""],
+        )
+
+    def test_core_tokens_and_blocks(self) -> None:
+        names = pl.DataFrame(
+            {"entry": [0, 1, 2], "alias": ["SMITH FARMS 1234 LLC", "A B C", "FARM"]}
+        )
+        self.assertEqual(
+            names.select(core_name_tokens(pl.col("alias"))).to_series().to_list(),
+            [["SMITH"], [], []],
+        )
+        blocks = blocking_ngrams(names).sort("entry", "block")
+        self.assertEqual(
+            blocks.rows(),
+            [(0, "ITH"), (0, "MIT"), (0, "SMI"), (2, "ARM"), (2, "FAR")],
+        )
+
+    def test_fingerprint_is_stable_per_row(self) -> None:
+        identities = pl.DataFrame(
+            {"name": ["ACME", "ACME", "Café"], "fein": ["1", "1", ""]}
+        )
+        fingerprints = raw_identity_fingerprint(identities).to_list()
+        self.assertRegex(fingerprints[0], "^er_[0-9a-f]{24}$")
+        self.assertEqual(fingerprints[0], fingerprints[1])
+        self.assertNotEqual(fingerprints[0], fingerprints[2])
+
+
+class LinkEmployerRecordsTests(unittest.TestCase):
+    def test_synthetic_linkage_contract(self) -> None:
+        records = synthetic_records()
+        linked, diagnostics = link_employer_records(records, workers=1)
+
+        def same(method: str, left: int, right: int) -> bool:
+            column = f"employer_id_{method}"
+            return linked[left, column] == linked[right, column]
+
+        self.assertTrue(same("conservative", 0, 1))
+        self.assertFalse(same("conservative", 2, 3))
+        self.assertTrue(same("balanced", 2, 3))
+        self.assertFalse(same("balanced", 4, 5))
+        self.assertTrue(same("high_recall", 4, 5))
+        self.assertFalse(same("high_recall", 6, 7))
+        self.assertFalse(same("high_recall", 8, 9))
+        self.assertTrue(same("conservative", 10, 11))
+        self.assertTrue(same("conservative", 12, 13))
+        self.assertEqual(diagnostics["identity_records"], 14)
+        self.assertEqual(set(diagnostics["cluster_counts"]), set(LINKAGE_METHODS))
+
+    def test_linkage_ignores_record_order(self) -> None:
+        records = synthetic_records()
+        id_columns = [
+            "employer_record_id",
+            *(f"employer_id_{method}" for method in LINKAGE_METHODS),
+        ]
+        linked, _ = link_employer_records(records, workers=1)
+        relinked, _ = link_employer_records(
+            records.sample(fraction=1, shuffle=True, seed=1729), workers=1
+        )
+        self.assertTrue(
+            linked.select(id_columns)
+            .sort("employer_record_id")
+            .equals(relinked.select(id_columns).sort("employer_record_id"))
+        )
+
+
+def sprawling_records(seed: int, count: int = 300) -> list[tuple[str, str, str]]:
+    """Overlapping three-word names, a quarter of them with one of 20 FEINs."""
+    rng = np.random.default_rng(seed)
+    words = [
+        *("NORTH", "SOUTH", "FIELD", "FIELDS", "GROWER", "GROWERS", "FARM", "FARMS"),
+        *("VALLEY", "RIVER", "BEND", "DAIRY", "ORCHARD", "ORCHARDS", "HILL", "HILLS"),
+    ]
+    rows = []
+    for index in rng.permutation(count):
+        name = " ".join(rng.choice(words, 3)) + rng.choice(["", " LLC", " INC"])
+        fein = f"{rng.integers(20):09d}" if rng.random() < 0.25 else ""
+        rows.append((f"er_{index:024x}", name, fein))
+    return rows
+
+
+def unnested_clusters(linked: pl.DataFrame) -> int:
+    """Clusters of a tier that span more than one cluster of a coarser tier."""
+    methods = list(LINKAGE_METHODS)
+    return sum(
+        linked.group_by(f"employer_id_{finer}")
+        .agg(pl.col(f"employer_id_{coarser}").n_unique())
+        .filter(pl.col(f"employer_id_{coarser}") > 1)
+        .height
+        for position, finer in enumerate(methods)
+        for coarser in methods[position + 1 :]
+    )
+
+
+EARLIER = [
+    (f"er_{2:024x}", "NORTH FIELD GROWERS", ""),
+    (f"er_{3:024x}", "SOUTH VALLEY PRODUCE", "123456789"),
+    (f"er_{4:024x}", "RIVER BEND DAIRY", ""),
+]
+
+
+# Seeds whose incremental links once left finer clusters spanning coarser ones.
+SPRAWL_SEEDS = [4, 7, 9]
+
+
+class IncrementalLinkTests(unittest.TestCase):
+    def test_new_records_join_without_renaming_components(self) -> None:
+        previous, _ = link_employer_records(identity_records(EARLIER), workers=1)
+        records = identity_records([*EARLIER, (f"er_{1:024x}", "RIVER BEND DAIRY", "")])
+        linked, diagnostics = link_employer_records(
+            records, previous=previous, workers=1
+        )
+        for method in LINKAGE_METHODS:
+            column = f"employer_id_{method}"
+            self.assertEqual(linked[column][:3].to_list(), previous[column].to_list())
+            self.assertEqual(linked[3, column], previous[2, column])
+        self.assertEqual(diagnostics["merges"].height, 0)
+
+    def test_bridging_record_merges_and_is_logged(self) -> None:
+        previous, _ = link_employer_records(identity_records(EARLIER), workers=1)
+        records = identity_records(
+            [*EARLIER, (f"er_{9:024x}", "NORTH FIELD GROWERS", "123456789")]
+        )
+        linked, diagnostics = link_employer_records(
+            records, previous=previous, workers=1
+        )
+        merges = diagnostics["merges"]
+        self.assertEqual(merges["method"].to_list(), list(LINKAGE_METHODS))
+        self.assertEqual(set(merges["evidence"]), {"exact_name"})
+        for method, retired, merged_into, _ in merges.iter_rows():
+            column = f"employer_id_{method}"
+            self.assertEqual(merged_into, previous[0, column])
+            self.assertEqual(retired, previous[1, column])
+            self.assertEqual(set(linked[column][[0, 1, 3]]), {merged_into})
+            self.assertEqual(linked[f"employer_cluster_size_{method}"][0], 3)
+
+    def test_relinking_without_new_records_changes_nothing(self) -> None:
+        linked, _ = link_employer_records(synthetic_records(), workers=1)
+        relinked, diagnostics = link_employer_records(
+            synthetic_records(), previous=linked, workers=1
+        )
+        self.assertTrue(relinked.equals(linked))
+        self.assertEqual(diagnostics["accepted_edges"]["high_recall"], {})
+
+    def test_incremental_tiers_nest_like_a_full_rebuild(self) -> None:
+        for seed in SPRAWL_SEEDS:
+            with self.subTest(seed=seed):
+                rows = sprawling_records(seed)
+                rebuilt, _ = link_employer_records(identity_records(rows), workers=1)
+                previous, _ = link_employer_records(
+                    identity_records(rows[: len(rows) * 85 // 100]), workers=1
+                )
+                linked, _ = link_employer_records(
+                    identity_records(rows), previous=previous, workers=1
+                )
+                self.assertEqual(unnested_clusters(rebuilt), 0)
+                self.assertEqual(unnested_clusters(linked), 0)
+
+    def test_previous_records_must_be_kept(self) -> None:
+        previous, _ = link_employer_records(identity_records(EARLIER), workers=1)
+        with self.assertRaisesRegex(ValueError, "link from scratch"):
+            link_employer_records(
+                identity_records(EARLIER[:2]), previous=previous, workers=1
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
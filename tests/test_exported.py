@@ -0,0 +1,103 @@
+"""Exported pytree functions survive serialization and a reload."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+try:
+    import jax
+    import jax.numpy as jnp
+
+    from h2a.exported import export_path, load_or_export
+except ImportError:  # JAX ships with the GPU modelling environment only.
+    jax = None
+
+
+def step(carry, scale):
+    """A carry keyed by integer interaction order, like the meta loop's."""
+    weights = {order: value * scale for order, value in carry["weights"].items()}
+    return {"weights": weights, "count": carry["count"] + 1}
+
+
+@unittest.skipIf(jax is None, "JAX is not installed")
+class LoadOrExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.export_dir = Path(self.directory.name) / "export"
+        self.source = Path(self.directory.name) / "kernel.py"
+        self.source.write_text("kernel v1\n")
+        carry = {
+            "weights": {
+                order: jnp.arange(order * 2, dtype=jnp.float32) for order in (1, 2, 3)
+            },
+            "count": jnp.array(0, dtype=jnp.int32),
+        }
+        self.args = (carry, jnp.array(1.5, dtype=jnp.float32))
+        self.out_tree = jax.tree_util.tree_structure(carry)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def path(self, args=None) -> Path:
+        return export_path(
+            self.export_dir,
+            "step",
+            self.args if args is None else args,
+            sources=[self.source],
+        )
+
+    def assert_matches_step(self, call) -> None:
+        observed = call(*self.args)
+        expected = step(*self.args)
+        self.assertEqual(
+            jax.tree_util.tree_structure(observed),
+            jax.tree_util.tree_structure(expected),
+        )
+        for leaf, reference in zip(
+            jax.tree_util.tree_leaves(observed),
+            jax.tree_util.tree_leaves(expected),
+            strict=True,
+        ):
+            self.assertEqual(leaf.dtype, reference.dtype)
+            np.testing.assert_array_equal(leaf, reference)
+
+    def test_export_then_reload_from_disk(self) -> None:
+        path = self.path()
+        self.assert_matches_step(
+            load_or_export(step, self.args, path, out_tree=self.out_tree)
+        )
+        self.assertEqual([p.name for p in self.export_dir.iterdir()], [path.name])
+
+        def fail(*args):
+            raise AssertionError("a saved export must not be traced again")
+
+        reloaded = load_or_export(fail, self.args, path, out_tree=self.out_tree)
+        self.assert_matches_step(jax.jit(reloaded))
+
+    def test_key_covers_sources_and_leaf_shapes(self) -> None:
+        path = self.path()
+        carry, scale = self.args
+        longer = {**carry, "weights": {**carry["weights"], 3: jnp.zeros(7)}}
+        self.assertNotEqual(self.path((longer, scale)), path)
+        self.source.write_text("kernel v2\n")
+        self.assertNotEqual(self.path(), path)
+
+    def test_rejects_an_output_tree_of_another_size(self) -> None:
+        with self.assertRaisesRegex(ValueError, "output tree"):
+            load_or_export(
+                step,
+                self.args,
+                self.path(),
+                out_tree=jax.tree_util.tree_structure((0, 0)),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Batched fuzzy matching against per-row rapidfuzz.process.extractOne."""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import polars as pl
+from rapidfuzz import fuzz, process, utils
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from h2a import fuzzy
+from h2a.fuzzy import best_fuzzy_matches, reference_digest
+
+REFERENCE = pl.DataFrame(
+    {
+        "state": ["IA", "IA", "IA", "IA", "NE", "NE", "VT"],
+        "name": ["AMES", "BOONE", "AMES HEIGHTS", "STORY CITY", "OMAHA", None, "BARRE"],
+        "fips": ["19169", "19015", "19169,19015", "19169", "31055", "31001", "50023"],
+    }
+)
+
+
+def extract_one(state: str | None, query: str | None) -> tuple[str, float, str]:
+    """The per-row search the batched matcher replaces."""
+    if not state or not query:
+        return ("", 0.0, "")
+    choices = REFERENCE.filter(pl.col("state") == state)
+    if not choices.height:
+        return ("", 0.0, "")
+    match = process.extractOne(
+        query,
+        choices["name"].to_list(),
+        processor=utils.default_process,
+        scorer=fuzz.partial_ratio,
+    )
+    if match is None:
+        return ("", 0.0, "")
+    _, score, index = match
+    return (choices["fips"][index], float(score), choices["name"][index])
+
+
+class BestFuzzyMatchesTests(unittest.TestCase):
+    def test_matches_extract_one_row_by_row(self) -> None:
+        rng = random.Random(11)
+        words = ["ames", "AMES ", "Boone!", "story", "omaha", "barre", "", "zz", "  "]
+        frame = pl.DataFrame(
+            {
+                "xstate": [
+                    rng.choice(["IA", "NE", "VT", "TX", "", None]) for _ in range(300)
+                ],
+                "xcity": [
+                    None if rng.random() < 0.05 else " ".join(rng.sample(words, 2))
+                    for _ in range(300)
+                ],
+            }
+        )
+        matched = best_fuzzy_matches(
+            frame, "xstate", "xcity", REFERENCE, workers=1, chunk_size=7
+        )
+        self.assertEqual(matched.columns, ["fips", "score", "name"])
+        self.assertEqual(
+            matched.rows(), [extract_one(*row) for row in frame.iter_rows()]
+        )
+
+    def test_cache_skips_scored_pairs_on_rerun(self) -> None:
+        frame = pl.DataFrame(
+            {"state": ["IA", "IA", "NE"], "city": ["Ames", "AMES", "Omaha"]}
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            cache_file = (
+                Path(directory) / f"places_{reference_digest(REFERENCE)}.parquet"
+            )
+            first = best_fuzzy_matches(
+                frame, "state", "city", REFERENCE, cache_file=cache_file
+            )
+            self.assertEqual(pl.read_parquet(cache_file).height, 2)
+            with mock.patch.object(fuzzy, "_score_state") as score_state:
+                rerun = best_fuzzy_matches(
+                    frame, "state", "city", REFERENCE, cache_file=cache_file
+                )
+            score_state.assert_not_called()
+        self.assertTrue(rerun.equals(first))
+        self.assertEqual(first["name"].to_list(), ["AMES", "AMES", "OMAHA"])
+
+    def test_digest_ignores_row_order(self) -> None:
+        self.assertEqual(
+            reference_digest(REFERENCE), reference_digest(REFERENCE.reverse())
+        )
+        self.assertNotEqual(
+            reference_digest(REFERENCE), reference_digest(REFERENCE.head(3))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
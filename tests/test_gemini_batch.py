@@ -0,0 +1,185 @@
+"""Gemini batch request building and bulk response parsing."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from h2a.gemini_batch import (
+    CLEANED_LOCATION_SCHEMA,
+    CleanedLocation,
+    append_batch_responses,
+    load_cleaned_locations,
+    location_hash,
+    parse_batch_responses,
+    write_batch_request_jsonl,
+)
+
+
+def row_hash(city: object, county: object, state: object, zip_code: object) -> str:
+    parts = [str(value) if value else "" for value in (city, county, state, zip_code)]
+    return hashlib.md5("|".join(parts).lower().encode("utf-8")).hexdigest()
+
+
+def row_by_row(content: str) -> list[dict[str, str | None]]:
+    """The per-line parse the bulk path replaces."""
+    rows = []
+    for line in content.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            batch_item = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        candidates = batch_item.get("response", {}).get("candidates", [])
+        if not candidates:
+            continue
+        for location in json.loads(candidates[0]["content"]["parts"][0]["text"]):
+            try:
+                rows.append(CleanedLocation(**location).model_dump())
+            except ValueError:
+                continue
+    return [
+        {
+            key: None if value is None else value.replace("null", "")
+            for key, value in row.items()
+        }
+        for row in rows
+    ]
+
+
+def batch_line(key: str, locations: object) -> str:
+    text = locations if isinstance(locations, str) else json.dumps(locations)
+    response = {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+    return json.dumps({"key": key, "response": response})
+
+
+def location(index: int, **fields: object) -> dict[str, object]:
+    return {
+        "location_hash": f"h{index}",
+        "city": f"Town {index}",
+        "county": None,
+        "state": "IA",
+        "zipcode": "50010",
+        "confidence": "High",
+        **fields,
+    }
+
+
+RESPONSES = "\n".join(
+    [
+        batch_line("request_chunk_0", [location(0), location(1, city="nullville")]),
+        "",
+        "{not json",
+        json.dumps({"key": "request_chunk_20", "status": {"code": 8}}),
+        json.dumps({"key": "request_chunk_40", "response": {"candidates": []}}),
+        batch_line("request_chunk_60", [location(2, confidence=None), location(3)]),
+        batch_line("request_chunk_80", [location(4, zipcode=50010), location(5)]),
+        batch_line("request_chunk_100", [{"location_hash": "h6", "confidence": "Low"}]),
+        batch_line("request_chunk_120", []),
+        "   " + batch_line("request_chunk_140", [location(7, extra="ignored")]),
+    ]
+)
+
+
+class LocationHashTests(unittest.TestCase):
+    def test_matches_hashing_each_row(self) -> None:
+        frame = pl.DataFrame(
+            {
+                "city": ["Ames", "AMES", None, "", "Boone"],
+                "county": ["Story", "story", None, "Story", None],
+                "state": ["IA", "ia", "IA", "", "IA"],
+                "zip": [50010, 50010, 0, None, 50036],
+            }
+        )
+        expected = [row_hash(*row) for row in frame.iter_rows()]
+        self.assertEqual(location_hash(frame).to_list(), expected)
+        self.assertEqual(expected[0], expected[1])
+
+
+class BatchRequestTests(unittest.TestCase):
+    def test_one_request_per_chunk(self) -> None:
+        frame = pl.DataFrame({"city": [f"Town {i}" for i in range(45)]})
+        frame = frame.with_columns(location_hash=pl.col("city").str.to_lowercase())
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "requests.jsonl"
+            with contextlib.redirect_stdout(io.StringIO()):
+                count = write_batch_request_jsonl(frame, "location_hash", {}, path, 20)
+            requests = [json.loads(line) for line in path.read_text().splitlines()]
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            [request["key"] for request in requests],
+            ["request_chunk_0", "request_chunk_20", "request_chunk_40"],
+        )
+        prompt = requests[2]["request"]["contents"][0]["parts"][0]["text"]
+        self.assertIn(json.dumps(frame.slice(40).to_dicts()), prompt)
+        self.assertIn("Preserve the 'location_hash'", prompt)
+
+    def test_missing_id_column_is_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Missing ID column"):
+            write_batch_request_jsonl(
+                pl.DataFrame({"city": ["Ames"]}), "id", {}, Path("x"), 5
+            )
+
+
+class ParseBatchResponsesTests(unittest.TestCase):
+    def parse(self, content: str) -> tuple[pl.DataFrame, str]:
+        messages = io.StringIO()
+        with contextlib.redirect_stdout(messages):
+            cleaned = parse_batch_responses(content)
+        return cleaned, messages.getvalue()
+
+    def test_bulk_parse_matches_row_by_row_validation(self) -> None:
+        cleaned, messages = self.parse(RESPONSES)
+        self.assertEqual(cleaned.schema, pl.Schema(CLEANED_LOCATION_SCHEMA))
+        self.assertEqual(cleaned.to_dicts(), row_by_row(RESPONSES))
+        self.assertEqual(
+            cleaned["location_hash"].to_list(), ["h0", "h1", "h3", "h5", "h6", "h7"]
+        )
+        self.assertEqual(cleaned["city"][1], "ville")
+        self.assertIn("Skipping invalid JSON line", messages)
+        self.assertIn("Skipping request_chunk_20: No response found", messages)
+        self.assertIn("Skipping request_chunk_40: No candidates returned.", messages)
+        self.assertIn("Validation error for ID h2", messages)
+        self.assertIn("Validation error for ID h4", messages)
+
+    def test_nothing_usable_gives_the_empty_schema(self) -> None:
+        cleaned, _ = self.parse("\n{not json\n")
+        self.assertEqual(cleaned.schema, pl.Schema(CLEANED_LOCATION_SCHEMA))
+        self.assertEqual(cleaned.height, 0)
+
+    def test_malformed_model_output_is_an_error(self) -> None:
+        content = "\n".join([batch_line("a", [location(0)]), batch_line("b", "[{")])
+        with self.assertRaises(json.JSONDecodeError):
+            self.parse(content)
+
+    def test_appends_parse_only_new_content(self) -> None:
+        first, second = RESPONSES.split("\n", 1)
+        with tempfile.TemporaryDirectory() as directory:
+            response_file = Path(directory) / "responses.txt"
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(load_cleaned_locations(response_file).height, 0)
+                append_batch_responses(response_file, first)
+                appended = append_batch_responses(response_file, second)
+                reloaded = load_cleaned_locations(response_file)
+                response_file.with_suffix(".parquet").unlink()
+                reparsed = load_cleaned_locations(response_file)
+        expected, _ = self.parse(RESPONSES)
+        self.assertTrue(appended.equals(expected))
+        self.assertTrue(reloaded.equals(expected))
+        self.assertTrue(reparsed.equals(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""Property checks that the vectorized geographic contract matches the scalar one."""
+
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from h2a import geography
+from h2a.geography import (
+    assert_geo_columns,
+    geo_expr,
+    harmonize_county_fips_2010,
+    normalize_geo_code,
+    normalize_geo_series,
+)
+
+NAMES = (
+    "state_fips",
+    "county_code",
+    "county_fips",
+    "neighbor_county_fips",
+    "cz_id",
+    "aewr_region_id",
+    "oews_area_code",
+    "not_a_geography",
+)
+# Digits, padding, the characters the cleaner removes, and near misses.
+ALPHABET = (
+    "0",
+    "0",
+    "1",
+    "4",
+    "6",
+    "7",
+    "9",
+    "2",
+    ".0",
+    ".",
+    '"',
+    " ",
+    "\t",
+    "　",
+    "\x1c",
+    "-",
+    "x",
+    "٣",
+    "²",
+)
+SPECIAL = ("46102", "046102", "17", "18", "0", "", " ", ".0", "12.0", "1.00")
+
+
+def _random_text(rng: random.Random) -> str | None:
+    if rng.random() < 0.08:
+        return None
+    if rng.random() < 0.15:
+        return rng.choice(SPECIAL)
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 7)))
+
+
+def _scalar(
+    values: list[object], name: str, vintage_2010: bool
+) -> list[str | None] | str:
+    """Return row-by-row scalar results, or the first error message."""
+    try:
+        return [
+            None
+            if value is None
+            else harmonize_county_fips_2010(value)
+            if vintage_2010
+            else normalize_geo_code(value, name)
+            for value in values
+        ]
+    except ValueError as error:
+        return str(error)
+
+
+def _vectorized(
+    values: pl.Series, name: str, vintage_2010: bool
+) -> list[str | None] | str:
+    try:
+        return normalize_geo_series(values, name, vintage_2010=vintage_2010).to_list()
+    except ValueError as error:
+        return str(error)
+
+
+class GeographicCodeTests(unittest.TestCase):
+    def test_whitespace_constant_matches_str_strip(self) -> None:
+        expected = "".join(
+            chr(point) for point in range(0x110000) if chr(point).isspace()
+        )
+        self.assertEqual(geography._WHITESPACE, expected)
+
+    def test_series_normalization_matches_scalar_functions(self) -> None:
+        rng = random.Random(20260812)
+        for _ in range(3000):
+            name = rng.choice(NAMES)
+            vintage_2010 = rng.random() < 0.2
+            values = [_random_text(rng) for _ in range(rng.randint(0, 6))]
+            expected = _scalar(values, name, vintage_2010)
+            actual = _vectorized(pl.Series(values, dtype=pl.String), name, vintage_2010)
+            self.assertEqual(actual, expected, msg=f"{name}, {values!r}")
+
+    def test_numeric_sources_match_their_string_form(self) -> None:
+        cases = {
+            "state_fips": [6, 48, None, 1],
+            "county_fips": [6037.0, 46102.0, 1001.0],
+            "cz_id": [100.0, 1.5],
+            "aewr_region_id": [17, 18],
+        }
+        for name, values in cases.items():
+            with self.subTest(name=name):
+                self.assertEqual(
+                    _vectorized(pl.Series(values), name, False),
+                    _scalar(values, name, False),
+                )
+
+    def test_expression_normalizes_and_reports_the_offending_value(self) -> None:
+        frame = pl.DataFrame({"fips": [" 6", '"46102"', "1001.0", None, ""]})
+        actual = frame.select(geo_expr("fips", "county_fips", vintage_2010=True))
+        self.assertEqual(
+            actual.get_column("county_fips").to_list(),
+            ["00006", "46113", "01001", None, None],
+        )
+        with self.assertRaisesRegex(ValueError, "must contain digits only: '6a'"):
+            pl.DataFrame({"fips": ["06", "6a"]}).lazy().select(
+                geo_expr("fips", "state_fips")
+            ).collect()
+
+    def test_contract_check_matches_the_scalar_round_trip(self) -> None:
+        rng = random.Random(20260813)
+        for _ in range(1000):
+            name = rng.choice(NAMES[:-1])
+            values = [_random_text(rng) for _ in range(rng.randint(1, 5))]
+            frame = pl.DataFrame({name: pl.Series(values, dtype=pl.String)})
+            vintage = name in {"county_fips", "neighbor_county_fips"}
+            expected_valid = True
+            try:
+                for value in {value for value in values if value is not None}:
+                    if (
+                        harmonize_county_fips_2010(value)
+                        if vintage
+                        else normalize_geo_code(value, name)
+                    ) != value:
+                        expected_valid = False
+            except ValueError:
+                expected_valid = False
+            with self.subTest(name=name, values=values):
+                if expected_valid:
+                    assert_geo_columns(frame, [name], allow_null=[name])
+                else:
+                    with self.assertRaises(ValueError):
+                        assert_geo_columns(frame, [name], allow_null=[name])
+
+    def test_contract_check_names_the_noncanonical_value(self) -> None:
+        frame = pl.DataFrame({"county_fips": ["01001", "46102"]})
+        with self.assertRaisesRegex(ValueError, "noncanonical value '46102'"):
+            assert_geo_columns(frame, ["county_fips"])
+        with self.assertRaisesRegex(ValueError, "contains missing values"):
+            assert_geo_columns(
+                pl.DataFrame({"state_fips": ["01", None]}), ["state_fips"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
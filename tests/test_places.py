@@ -0,0 +1,99 @@
+"""Places resolution with a fake backend standing in for the Google client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from h2a.places import PlacesCache, resolve_places, searchable_query
+
+
+class FakePlaces:
+    """Answers after a short delay and records every call."""
+
+    def __init__(self, fail: str | None = None) -> None:
+        self.calls: Counter[str] = Counter()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.fail = fail
+
+    async def search_text(self, query: str) -> list[str]:
+        self.calls[query] += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if query == self.fail:
+            raise RuntimeError(f"quota exceeded for {query}")
+        return [f"id:{query}"]
+
+
+class ResolvePlacesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "places.sqlite"
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def resolve(self, queries: list[str], backend: FakePlaces) -> dict[str, list[str]]:
+        with PlacesCache(self.path, "search_queries") as cache:
+            return asyncio.run(
+                resolve_places(
+                    queries,
+                    backend.search_text,
+                    cache,
+                    requests_per_minute=60_000,
+                    concurrency=4,
+                )
+            )
+
+    def test_duplicates_are_fetched_once_and_reruns_use_the_cache(self) -> None:
+        queries = [f"Town {index % 10}, Iowa" for index in range(40)]
+        backend = FakePlaces()
+        resolved = self.resolve(queries, backend)
+        self.assertEqual(set(backend.calls.values()), {1})
+        self.assertEqual(len(backend.calls), 10)
+        self.assertEqual(resolved["Town 3, Iowa"], ["id:Town 3, Iowa"])
+        self.assertGreater(backend.peak_in_flight, 1)
+        self.assertLessEqual(backend.peak_in_flight, 4)
+
+        rerun = FakePlaces()
+        self.assertEqual(self.resolve(queries, rerun), resolved)
+        self.assertEqual(rerun.calls, Counter())
+
+    def test_a_failed_call_keeps_completed_results(self) -> None:
+        queries = [f"Town {index}, Iowa" for index in range(12)]
+        with self.assertRaises(ExceptionGroup):
+            self.resolve(queries, FakePlaces(fail="Town 11, Iowa"))
+        with PlacesCache(self.path, "search_queries") as cache:
+            self.assertGreater(len(cache), 0)
+            self.assertNotIn("Town 11, Iowa", cache.get_many(queries))
+
+    def test_legacy_json_seeds_a_new_table(self) -> None:
+        legacy = Path(self.directory.name) / "legacy.json"
+        legacy.write_text(json.dumps({"Ames, Iowa": ["id:ames"]}), encoding="utf-8")
+        with PlacesCache(self.path, "search_queries", legacy_json=legacy) as cache:
+            self.assertEqual(cache.to_dict(), {"Ames, Iowa": ["id:ames"]})
+
+        backend = FakePlaces()
+        resolved = self.resolve(["Ames, Iowa", "Boone, Iowa"], backend)
+        self.assertEqual(resolved["Ames, Iowa"], ["id:ames"])
+        self.assertEqual(list(backend.calls), ["Boone, Iowa"])
+
+    def test_only_comma_separated_names_are_searched(self) -> None:
+        self.assertTrue(searchable_query("Ames, Iowa"))
+        self.assertFalse(searchable_query("Iowa"))
+        self.assertFalse(searchable_query(""))
+        self.assertFalse(searchable_query(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
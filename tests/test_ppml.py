@@ -0,0 +1,109 @@
+"""Summed-row PPML patch kernel against the per-combination formulation."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+try:
+    import jax
+    import jax.numpy as jnp
+
+    from h2a.ppml import compute_patch_log_worker
+except ImportError:  # JAX ships with the GPU modelling environment only.
+    jax = None
+
+COUNTY_WIDTH = 3
+PATCH_WIDTH = 2
+
+
+def reference_log_worker(params, feature_ids, X_county_cont, X_patch_cont, group_ids):
+    """The per-combination kernel the summed-row version replaces."""
+    num_county = X_county_cont.shape[1]
+    X_county_by_patch = X_county_cont[group_ids]
+    log_mu = jnp.full((group_ids.shape[0],), params["bias"], dtype=jnp.float32)
+    for order in sorted(feature_ids):
+        ids_for_order = feature_ids[order]
+        w_order = params["weights"][order]
+        for combo_idx in range(ids_for_order.shape[1]):
+            gathered = w_order[ids_for_order[:, combo_idx]]
+            log_mu += gathered[:, 0]
+            log_mu += jnp.sum(
+                gathered[:, 1 : 1 + num_county] * X_county_by_patch, axis=1
+            )
+            log_mu += jnp.sum(gathered[:, 1 + num_county :] * X_patch_cont, axis=1)
+    return jnp.clip(log_mu, max=15.0)
+
+
+@unittest.skipIf(jax is None, "JAX is not installed")
+class ComputePatchLogWorkerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(23)
+        patches, groups = 311, 12
+        feature_counts = {1: 7, 2: 15, 3: 20}
+        combos = {1: 3, 2: 3, 3: 1}
+        width = 1 + COUNTY_WIDTH + PATCH_WIDTH
+        self.params = {
+            "bias": jnp.array(-0.5, dtype=jnp.float32),
+            "weights": {
+                order: jnp.asarray(
+                    rng.normal(scale=0.3, size=(count, width)), dtype=jnp.float32
+                )
+                for order, count in feature_counts.items()
+            },
+        }
+        # One large intercept exercises the log-rate cap.
+        self.params["weights"][1] = self.params["weights"][1].at[0, 0].set(40.0)
+        self.feature_ids = {
+            order: jnp.asarray(
+                rng.integers(0, count, size=(patches, combos[order])), dtype=jnp.int32
+            )
+            for order, count in feature_counts.items()
+        }
+        self.X_county_cont = jnp.asarray(
+            rng.normal(size=(groups, COUNTY_WIDTH)), dtype=jnp.float32
+        )
+        self.X_patch_cont = jnp.asarray(
+            rng.normal(size=(patches, PATCH_WIDTH)), dtype=jnp.float32
+        )
+        self.group_ids = jnp.asarray(
+            np.sort(rng.integers(0, groups, size=patches)), dtype=jnp.int32
+        )
+        self.exposure = jnp.asarray(rng.uniform(size=patches), dtype=jnp.float32)
+
+    def arguments(self):
+        return (self.feature_ids, self.X_county_cont, self.X_patch_cont, self.group_ids)
+
+    def test_matches_per_combination_kernel(self) -> None:
+        expected = reference_log_worker(self.params, *self.arguments())
+        observed = jax.jit(compute_patch_log_worker)(self.params, *self.arguments())
+        self.assertEqual(observed.shape, expected.shape)
+        self.assertEqual(observed.dtype, jnp.float32)
+        np.testing.assert_allclose(observed, expected, rtol=1e-5, atol=1e-5)
+        self.assertEqual(float(observed.max()), 15.0)
+
+    def test_gradients_match_per_combination_kernel(self) -> None:
+        def predicted_workers(kernel):
+            def total(params):
+                log_rate = kernel(params, *self.arguments())
+                return jnp.sum(self.exposure * jnp.exp(jnp.minimum(log_rate, 5.0)))
+
+            return jax.grad(total)(self.params)
+
+        expected = predicted_workers(reference_log_worker)
+        observed = predicted_workers(compute_patch_log_worker)
+        for leaf, reference in zip(
+            jax.tree_util.tree_leaves(observed),
+            jax.tree_util.tree_leaves(expected),
+            strict=True,
+        ):
+            np.testing.assert_allclose(leaf, reference, rtol=1e-4, atol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
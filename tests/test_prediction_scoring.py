@@ -0,0 +1,125 @@
+"""Fused PPML scoring against the per-combination reference loop."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from h2a.prediction_scoring import categorical_design, pack_weights, score_cutoffs
+
+COUNTY_WIDTH = 3
+PATCH_WIDTH = 2
+
+
+def reference_counts(
+    weight_matrices: dict[int, np.ndarray],
+    bias: np.float32,
+    feature_ids: dict[int, np.ndarray],
+    county_values: np.ndarray,
+    patch_values: np.ndarray,
+    county_index: np.ndarray,
+    patch_exposure: np.ndarray,
+) -> np.ndarray:
+    """One cutoff scored one combination at a time."""
+    patch_log_rate = np.full(len(county_index), bias, dtype=np.float32)
+    county_slopes = np.zeros((len(county_index), COUNTY_WIDTH), dtype=np.float32)
+    for order in sorted(weight_matrices):
+        for ids in feature_ids[order].T:
+            gathered = weight_matrices[order][ids]
+            patch_log_rate += gathered[:, 0]
+            county_slopes += gathered[:, 1 : 1 + COUNTY_WIDTH]
+            patch_log_rate += np.sum(
+                gathered[:, 1 + COUNTY_WIDTH :] * patch_values, axis=1
+            )
+    log_rate = patch_log_rate + np.sum(
+        county_slopes * county_values[county_index], axis=1
+    )
+    np.minimum(log_rate, np.float32(15.0), out=log_rate)
+    counts = np.zeros(county_values.shape[0], dtype=np.float32)
+    np.add.at(counts, county_index, patch_exposure * np.exp(log_rate))
+    return counts
+
+
+class ScoreCutoffsTests(unittest.TestCase):
+    def test_matches_per_combination_scoring(self) -> None:
+        rng = np.random.default_rng(5)
+        patches, counties, cutoffs = 257, 9, 3
+        feature_counts = {1: 6, 2: 10}
+        feature_ids = {
+            1: rng.integers(0, 6, size=(patches, 3)).astype(np.int32),
+            2: rng.integers(0, 10, size=(patches, 2)).astype(np.int32),
+        }
+        width = 1 + COUNTY_WIDTH + PATCH_WIDTH
+        models = [
+            {
+                order: rng.normal(scale=0.3, size=(count, width)).astype(np.float32)
+                for order, count in feature_counts.items()
+            }
+            for _ in range(cutoffs)
+        ]
+        # One large intercept exercises the log-rate cap.
+        models[2][1][0, 0] = 40.0
+        biases = rng.normal(size=cutoffs).astype(np.float32)
+        county_values = rng.normal(size=(cutoffs, counties, COUNTY_WIDTH))
+        county_values = county_values.astype(np.float32)
+        raw = rng.normal(size=(patches, PATCH_WIDTH)).astype(np.float32)
+        raw[rng.random(raw.shape) < 0.1] = np.nan
+        transforms = np.stack(
+            [
+                [
+                    rng.normal(size=PATCH_WIDTH),
+                    rng.normal(size=PATCH_WIDTH),
+                    rng.uniform(0.5, 2.0, size=PATCH_WIDTH),
+                ]
+                for _ in range(cutoffs)
+            ]
+        ).astype(np.float32)
+        county_index = rng.integers(0, counties - 1, size=patches)
+        exposure = rng.uniform(0.0, 3.0, size=patches).astype(np.float32)
+
+        predicted = score_cutoffs(
+            categorical_design(feature_ids, feature_counts),
+            pack_weights(models),
+            biases,
+            county_values,
+            raw,
+            transforms,
+            county_index,
+            exposure,
+            chunk_size=50,
+        )
+
+        self.assertEqual(predicted.shape, (cutoffs, counties))
+        self.assertEqual(predicted.dtype, np.float32)
+        for cutoff in range(cutoffs):
+            imputation, center, scale = transforms[cutoff]
+            patch_values = (np.where(np.isnan(raw), imputation, raw) - center) / scale
+            expected = reference_counts(
+                models[cutoff],
+                biases[cutoff],
+                feature_ids,
+                county_values[cutoff],
+                patch_values,
+                county_index,
+                exposure,
+            )
+            np.testing.assert_allclose(predicted[cutoff], expected, rtol=1e-5)
+        self.assertEqual(predicted[:, -1].tolist(), [0.0] * cutoffs)
+
+    def test_design_rejects_ids_outside_the_weight_table(self) -> None:
+        feature_ids = {1: np.array([[0, 1], [2, 3]], dtype=np.int32)}
+        design = categorical_design(feature_ids, {1: 4})
+        self.assertEqual(design.toarray().tolist(), [[1, 1, 0, 0], [0, 0, 1, 1]])
+        with self.assertRaisesRegex(ValueError, "exceed the weight table"):
+            categorical_design(feature_ids, {1: 3})
+        with self.assertRaisesRegex(ValueError, "different interaction orders"):
+            categorical_design(feature_ids, {1: 4, 2: 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
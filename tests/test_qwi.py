@@ -0,0 +1,137 @@
+"""QWI downloads against a local stand-in for the Census endpoint."""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+from urllib.parse import parse_qs, urlparse
+
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from h2a.qwi import QWI_FIELDS, QWI_SCHEMA, QwiRequest, download_qwi
+from h2a.throttle import TokenBucket
+
+HEADER = [*QWI_FIELDS, "time", "state", "county", "industry", "ownercode", "seasonadj"]
+
+
+def payload(state: str, industry: str) -> list[list[str]]:
+    rows = [
+        [*("10", "8", "12", "1", "1", "1"), f"2001-Q{quarter}", state, county]
+        + [industry, "A05", "U"]
+        for county in ("001", "003")
+        for quarter in (1, 2)
+    ]
+    return [HEADER, *rows]
+
+
+class CensusStandIn(BaseHTTPRequestHandler):
+    """Serves QWI-shaped payloads; state 02 has no rows, state 04 fails once."""
+
+    hits: ClassVar[list[tuple[str, str]]] = []
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlparse(self.path).query)
+        state = query["in"][0].removeprefix("state:")
+        industry = query["industry"][0]
+        with self.lock:
+            self.hits.append((state, industry))
+            first_attempt = self.hits.count((state, industry)) == 1
+        if state == "04" and first_attempt:
+            self.send_response(503)
+            self.end_headers()
+            return
+        body = b"" if state == "02" else json.dumps(payload(state, industry)).encode()
+        self.send_response(200 if body else 204)
+        self.send_header("content-type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class DownloadQwiTests(unittest.TestCase):
+    def setUp(self) -> None:
+        CensusStandIn.hits = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), CensusStandIn)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}/qwi"
+        self.cache = tempfile.TemporaryDirectory()
+        self.cache_root = Path(self.cache.name)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache.cleanup()
+
+    def download(self, requests: list[QwiRequest]) -> pl.DataFrame:
+        return download_qwi(
+            requests,
+            endpoint=self.endpoint,
+            cache_root=self.cache_root,
+            workers=4,
+            requests_per_second=200,
+        )
+
+    def test_rows_follow_request_order_and_reruns_skip_the_network(self) -> None:
+        requests = [
+            QwiRequest(state, industry, 2001, 2001)
+            for state in ("01", "02", "04")
+            for industry in ("111", "112")
+        ]
+        qwi = self.download(requests)
+        self.assertEqual(qwi.schema, pl.Schema(QWI_SCHEMA))
+        self.assertEqual(
+            qwi.select("county_fips", "industry_code").unique(maintain_order=True).rows(),
+            [
+                (f"{state}{county}", industry)
+                for state in ("01", "04")
+                for industry in ("111", "112")
+                for county in ("001", "003")
+            ],
+        )
+        # Both state 04 requests were retried after the transient 503.
+        self.assertEqual(len(CensusStandIn.hits), 8)
+        for request in requests:
+            self.assertTrue(request.cache_file(self.cache_root).exists())
+
+        rerun = self.download(requests)
+        self.assertEqual(len(CensusStandIn.hits), 8)
+        self.assertTrue(rerun.equals(qwi))
+
+    def test_legacy_json_responses_are_converted_without_a_request(self) -> None:
+        request = QwiRequest("01", "111", 2001, 2001)
+        request.legacy_cache_file(self.cache_root).write_text(
+            json.dumps(payload("01", "111")), encoding="utf-8"
+        )
+        qwi = self.download([request])
+        self.assertEqual(CensusStandIn.hits, [])
+        self.assertEqual(qwi.height, 4)
+        self.assertTrue(request.cache_file(self.cache_root).exists())
+
+    def test_no_rows_anywhere_is_an_error(self) -> None:
+        with self.assertRaisesRegex(RuntimeError, "no county-quarter rows"):
+            self.download([QwiRequest("02", "111", 2001, 2001)])
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_acquisitions_beyond_capacity_wait_for_tokens(self) -> None:
+        bucket = TokenBucket(rate=50, capacity=2)
+        started = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 4 / 50 - 0.005)
+
+
+if __name__ == "__main__":
+    unittest.main()